@@ -14,82 +14,46 @@ st.set_page_config(
 
 # ==================== IMPORTS ====================
 import pandas as pd
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 import math
+import logging
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime
-import base64
-from io import BytesIO
-
-# ==================== PDF GENERATION ====================
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
-from reportlab.platypus import (SimpleDocTemplate, Table, TableStyle, Paragraph,
-                                Spacer, PageBreak, Image, PageTemplate, Frame,
-                                BaseDocTemplate, KeepTogether, Flowable)
-from reportlab.lib import colors as rl_colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-from reportlab.pdfgen import canvas
-
-class EquationBox(Flowable):
-    """Custom flowable for equation boxes with proper padding and no overlap"""
-    def __init__(self, text, width):
-        Flowable.__init__(self)
-        self.text = text
-        self.width = width
-        self.height = 0
-        
-    def wrap(self, availWidth, _availHeight):
-        # Calculate required height with padding
-        self.width = availWidth
-        # Estimate height based on text length (adjust as needed)
-        lines = len(self.text) / 80 + 1
-        self.height = max(30, lines * 15 + 20)  # Minimum 30pt, with padding
-        return (self.width, self.height)
-    
-    def draw(self):
-        # Draw blue background box
-        self.canv.setFillColor(rl_colors.HexColor('#E7F3FF'))
-        self.canv.setStrokeColor(rl_colors.HexColor('#2196F3'))
-        self.canv.setLineWidth(1)
-        self.canv.roundRect(0, 0, self.width, self.height, 5, fill=1, stroke=1)
-        
-        # Draw text with proper padding
-        self.canv.setFillColor(rl_colors.HexColor('#1565C0'))
-        self.canv.setFont('Courier', 9)
-        
-        # Word wrap text
-        words = self.text.split()
-        lines = []
-        current_line = []
-        current_width = 0
-        max_width = self.width - 20  # 10pt padding on each side
-        
-        for word in words:
-            word_width = self.canv.stringWidth(word + ' ', 'Courier', 9)
-            if current_width + word_width <= max_width:
-                current_line.append(word)
-                current_width += word_width
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-                current_width = word_width
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        # Draw lines
-        y_position = self.height - 15
-        for line in lines:
-            self.canv.drawString(10, y_position, line)
-            y_position -= 12
+import functools
+import uuid
+
+from steel_design import (
+    safe_scalar, safe_sqrt,
+    PDF_AVAILABLE, EXCEL_AVAILABLE, get_plotly_go, get_make_subplots,
+    SHAPE_FAMILIES, DESIGN_FAMILIES, DatabaseWatcher,
+    aisc_360_16_f2_flexural_design, aisc_360_16_e3_compression_design,
+    aisc_360_16_e3_max_effective_length, aisc_360_16_e3_max_effective_length_table,
+    aisc_360_16_h1_interaction, evaluate_section_design, grade_constant_row,
+    member_length, TAKEOFF_KEYS, quantity_takeoff, takeoff_delta,
+    optimize_grade_and_section, apply_design_choice,
+    get_section_properties_from_df, create_member_data,
+    SteelDesignReportGenerator, iter_parallel_full_report, iter_parallel_midas_text_report, FragmentCache,
+    ReportFile,
+    create_enhanced_plotly_config, get_enhanced_plotly_layout,
+    generate_calculation_report, generate_calculation_book, generate_enhanced_excel_report,
+    write_table_workbook, write_results_workbook,
+    DONE, FAILED, JobLimitError, get_report_job_queue,
+)
+
+class StreamlitErrorHandler(logging.Handler):
+    """Show errors logged by the steel_design engine on the page."""
+
+    streamlit_forwarder = True
+
+    def emit(self, record):
+        try:
+            st.error(record.getMessage())
+        except Exception:
+            self.handleError(record)
 
+_engine_logger = logging.getLogger("steel_design")
+if not any(getattr(h, "streamlit_forwarder", False) for h in _engine_logger.handlers):
+    _handler = StreamlitErrorHandler(level=logging.ERROR)
+    _engine_logger.addHandler(_handler)
 
 # Optional: AgGrid (only if installed)
 try:
@@ -98,98 +62,6 @@ try:
 except ImportError:
     AGGRID_AVAILABLE = False
 
-# PDF is already imported at the top level
-PDF_AVAILABLE = True
-
-# Excel Export Libraries
-try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-    from openpyxl.chart import BarChart, Reference, LineChart
-    from openpyxl.utils.dataframe import dataframe_to_rows
-    from openpyxl.utils import get_column_letter
-    EXCEL_AVAILABLE = True
-except ImportError:
-    EXCEL_AVAILABLE = False
-
-
-class NumberedCanvas(canvas.Canvas):
-    """Custom canvas for page numbers and headers"""
-    def __init__(self, *args, **kwargs):
-        canvas.Canvas.__init__(self, *args, **kwargs)
-        self._saved_page_states = []
-
-    def showPage(self):
-        self._saved_page_states.append(dict(self.__dict__))
-        self._startPage()
-
-    def save(self):
-        num_pages = len(self._saved_page_states)
-        for state in self._saved_page_states:
-            self.__dict__.update(state)
-            self.draw_page_number(num_pages)
-            canvas.Canvas.showPage(self)
-        canvas.Canvas.save(self)
-
-    def inkAnnotation(self, inkList, mediaBox=None):
-        return canvas.Canvas.inkAnnotation(self, inkList, mediaBox)
-
-    def draw_page_number(self, page_count):
-        page_w, page_h = self._pagesize
-        self.setFont("Helvetica", 9)
-        self.setFillColor(rl_colors.grey)
-
-        # Header
-        self.line(0.75*inch, page_h - 0.6*inch, page_w - 0.75*inch, page_h - 0.6*inch)
-        self.setFont("Helvetica-Bold", 10)
-        self.setFillColor(rl_colors.HexColor('#37474f'))
-        self.drawString(0.75*inch, page_h - 0.5*inch, "MIDAS GEN Style - Steel Design Calculation Report")
-
-        # Footer
-        self.setFont("Helvetica", 9)
-        self.setFillColor(rl_colors.grey)
-        self.line(0.75*inch, 0.6*inch, page_w - 0.75*inch, 0.6*inch)
-        self.drawRightString(page_w - 0.75*inch, 0.4*inch,
-                             f"Page {self._pageNumber} of {page_count}")
-        self.drawString(0.75*inch, 0.4*inch,
-                        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-# ==================== HELPER FUNCTIONS ====================
-
-def safe_scalar(value):
-    """
-    Standardized helper to extract a single float from pandas Series,
-    numpy arrays, or lists.
-    """
-    try:
-        if hasattr(value, 'iloc'):  # Handle Pandas Series
-            return float(value.iloc[0])
-        elif hasattr(value, 'item'):  # Handle Numpy scalars
-            return float(value.item())
-        elif hasattr(value, '__iter__') and not isinstance(value, (str, bytes)):
-            return float(value[0])
-        else:
-            return float(value)
-    except (ValueError, TypeError, IndexError):
-        return 0.0
-
-def format_number(value, decimals=2):
-    """Format number with specified decimal places"""
-    if value is None or (isinstance(value, float) and math.isnan(value)):
-        return "—"
-    try:
-        if decimals == 0:
-            return f"{int(round(value)):,}"
-        return f"{value:,.{decimals}f}"
-    except (ValueError, TypeError):
-        return str(value)
-
-def format_equation_result(value, decimals=2, unit=""):
-    """Format equation result with unit"""
-    formatted = format_number(value, decimals)
-    if unit:
-        return f"{formatted} {unit}"
-    return formatted
-
 def create_dropdown(label, options, default_index=0, key=None, on_change=None, help_text=None):
     """
     Creates a dropdown with proper state management.
@@ -233,5909 +105,395 @@ def create_dropdown(label, options, default_index=0, key=None, on_change=None, h
 
     return selected
 
-# ==================== SECTION CLASSIFICATION ====================
-
-def classify_section_flange(bf, tf, tw, _d, Fy, E=200000):
-    """
-    Classify section flange per AISC 360-16 Table B4.1b
-    Returns: 'Compact', 'Noncompact', or 'Slender'
-    """
-    # Flange slenderness ratio
-    lambda_f = bf / (2 * tf)
-    
-    # Limiting ratios (Table B4.1b Case 10 - I-shaped rolled sections)
-    lambda_pf = 0.38 * math.sqrt(E / Fy)  # Compact limit
-    lambda_rf = 1.0 * math.sqrt(E / Fy)   # Noncompact limit
-    
-    if lambda_f <= lambda_pf:
-        return 'Compact', lambda_f, lambda_pf, lambda_rf
-    elif lambda_f <= lambda_rf:
-        return 'Noncompact', lambda_f, lambda_pf, lambda_rf
-    else:
-        return 'Slender', lambda_f, lambda_pf, lambda_rf
-
-def classify_section_web(h, tw, Fy, E=200000):
-    """
-    Classify section web per AISC 360-16 Table B4.1b
-    Returns: 'Compact', 'Noncompact', or 'Slender'
-    """
-    # Web slenderness ratio
-    lambda_w = h / tw
-    
-    # Limiting ratios (Table B4.1b Case 15 - Webs in flexure)
-    lambda_pw = 3.76 * math.sqrt(E / Fy)  # Compact limit
-    lambda_rw = 5.70 * math.sqrt(E / Fy)  # Noncompact limit
+# ==================== ENHANCED CSS ====================
+st.markdown("""
+<style>
+    /* Import Font */
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
     
-    if lambda_w <= lambda_pw:
-        return 'Compact', lambda_w, lambda_pw, lambda_rw
-    elif lambda_w <= lambda_rw:
-        return 'Noncompact', lambda_w, lambda_pw, lambda_rw
-    else:
-        return 'Slender', lambda_w, lambda_pw, lambda_rw
-
-def get_overall_classification(flange_class, web_class):
-    """Get overall section classification"""
-    classes = ['Compact', 'Noncompact', 'Slender']
-    return classes[max(classes.index(flange_class), classes.index(web_class))]
-
-# ==================== FLEXURAL STRENGTH (AISC F2) ====================
-
-def calculate_flexural_strength(section_props, Lb, Cb=1.0, E=200000):
-    """
-    Calculate flexural strength per AISC 360-16 Chapter F2
-    Returns dict with all calculation steps
-    """
-    Fy = section_props['Fy']
-    Zx = section_props['Zx']
-    Sx = section_props['Sx']
-    Iy = section_props['Iy']
-    ry = section_props['ry']
-    J = section_props.get('J', 0)
-    Cw = section_props.get('Cw', 0)
-    ho = section_props.get('ho', section_props.get('d', 0) - section_props.get('tf', 0))
-    rts = section_props.get('rts', ry)
+    /* Global Styling */
+    * {
+        font-family: 'Inter', sans-serif;
+    }
     
-    # Convert units if needed (assuming cm to mm)
-    Zx_mm3 = Zx * 1000  # cm³ to mm³
-    Sx_mm3 = Sx * 1000
-    ry_mm = ry * 10
-    Lb_mm = Lb * 1000  # m to mm
-    J_mm4 = J * 10000 if J else 1
-    ho_mm = ho * 10 if ho else 1
-    rts_mm = rts * 10 if rts else ry_mm
-    c = 1.0  # For doubly symmetric I-shapes
+    .main {
+        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+    }
     
-    # Plastic moment
-    Mp = Fy * Zx_mm3 / 1e6  # kN·m
+    /* Enhanced Tab Styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 12px;
+        background: white;
+        padding: 1rem;
+        border-radius: 15px;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.07);
+    }
     
-    # Limiting lengths
-    Lp = 1.76 * ry_mm * math.sqrt(E / Fy)  # mm
+    .stTabs [data-baseweb="tab"] {
+        height: 60px;
+        padding: 0 30px;
+        background: #f8f9fa;
+        border-radius: 10px;
+        font-weight: 600;
+        font-size: 15px;
+        border: 2px solid transparent;
+        transition: all 0.3s ease;
+    }
     
-    # Lr calculation
-    try:
-        term1 = (J_mm4 * c) / (Sx_mm3 * ho_mm)
-        term2 = math.sqrt(term1**2 + 6.76 * (0.7 * Fy / E)**2)
-        Lr = 1.95 * rts_mm * (E / (0.7 * Fy)) * math.sqrt(term1 + term2)
-    except Exception:
-        Lr = Lp * 3  # Fallback estimate
+    .stTabs [data-baseweb="tab"]:hover {
+        background: #e9ecef;
+        transform: translateY(-2px);
+        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+    }
     
-    # Determine limit state
-    if Lb_mm <= Lp:
-        # Case (a): Yielding - Compact section, full plastic moment
-        Mn = Mp
-        limit_state = "Yielding (Lb ≤ Lp)"
-        case = "F2-1"
-        Fcr = Fy  # Not applicable but set for reference
-    elif Lb_mm <= Lr:
-        # Case (b): Inelastic LTB
-        Mn = Cb * (Mp - (Mp - 0.7 * Fy * Sx_mm3 / 1e6) * (Lb_mm - Lp) / (Lr - Lp))
-        Mn = min(Mn, Mp)
-        limit_state = "Inelastic LTB (Lp < Lb ≤ Lr)"
-        case = "F2-2"
-        Fcr = Cb * (Fy - (Fy - 0.7 * Fy) * (Lb_mm - Lp) / (Lr - Lp))
-    else:
-        # Case (c): Elastic LTB
-        try:
-            term_a = (Cb * math.pi**2 * E) / (Lb_mm / rts_mm)**2
-            term_b = math.sqrt(1 + 0.078 * (J_mm4 * c / (Sx_mm3 * ho_mm)) * (Lb_mm / rts_mm)**2)
-            Fcr = term_a * term_b
-        except Exception:
-            Fcr = 0.7 * Fy
-        Mn = Fcr * Sx_mm3 / 1e6
-        Mn = min(Mn, Mp)
-        limit_state = "Elastic LTB (Lb > Lr)"
-        case = "F2-3"
+    .stTabs [aria-selected="true"] {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white !important;
+        border-color: #667eea;
+        box-shadow: 0 6px 12px rgba(102, 126, 234, 0.4);
+    }
     
-    # Design strength
-    phi = 0.90
-    phi_Mn = phi * Mn
+    /* Headers */
+    .main-header {
+        font-size: 2.8rem;
+        font-weight: 800;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        text-align: center;
+        margin: 2rem 0;
+        letter-spacing: -1px;
+    }
     
-    return {
-        'Mp': Mp,
-        'Mn': Mn,
-        'phi': phi,
-        'phi_Mn': phi_Mn,
-        'Lp': Lp / 1000,  # Convert back to m
-        'Lr': Lr / 1000,
-        'Lb': Lb,
-        'Cb': Cb,
-        'Fcr': Fcr,
-        'limit_state': limit_state,
-        'case': case,
-        'Fy': Fy,
-        'Zx': Zx,
-        'Sx': Sx
+    .section-header {
+        font-size: 1.8rem;
+        font-weight: 700;
+        color: #2c3e50;
+        margin: 2rem 0 1.5rem 0;
+        padding-bottom: 0.75rem;
+        border-bottom: 3px solid #667eea;
+        position: relative;
     }
-
-# ==================== AXIAL STRENGTH (AISC E3) ====================
-
-def calculate_compression_strength(section_props, KL_x, KL_y, E=200000):
-    """
-    Calculate compression strength per AISC 360-16 Chapter E3
-    Returns dict with all calculation steps
-    """
-    Fy = section_props['Fy']
-    Ag = section_props['Ag']
-    rx = section_props['rx']
-    ry = section_props['ry']
     
-    # Convert units
-    Ag_mm2 = Ag * 100  # cm² to mm²
-    rx_mm = rx * 10  # cm to mm
-    ry_mm = ry * 10
-    KLx_mm = KL_x * 1000  # m to mm
-    KLy_mm = KL_y * 1000
+    .section-header::after {
+        content: '';
+        position: absolute;
+        bottom: -3px;
+        left: 0;
+        width: 100px;
+        height: 3px;
+        background: linear-gradient(90deg, #667eea, #764ba2);
+    }
     
-    # Slenderness ratios
-    lambda_x = KLx_mm / rx_mm
-    lambda_y = KLy_mm / ry_mm
-    lambda_governing = max(lambda_x, lambda_y)
-    governing_axis = 'x' if lambda_x >= lambda_y else 'y'
+    /* Enhanced Card Designs */
+    .metric-card {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 15px;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.07);
+        border-left: 5px solid #667eea;
+        margin: 1rem 0;
+        transition: transform 0.3s ease, box-shadow 0.3s ease;
+    }
     
-    # Elastic buckling stress
-    Fe = (math.pi**2 * E) / lambda_governing**2
+    .metric-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 8px 16px rgba(0,0,0,0.12);
+    }
     
-    # Limiting slenderness
-    lambda_limit = 4.71 * math.sqrt(E / Fy)
+    .evaluation-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 15px;
+        margin: 1.5rem 0;
+        box-shadow: 0 8px 16px rgba(102, 126, 234, 0.3);
+    }
     
-    # Critical stress
-    if lambda_governing <= lambda_limit:
-        # Inelastic buckling (E3-2)
-        Fcr = 0.658**(Fy / Fe) * Fy
-        buckling_mode = "Inelastic"
-        equation = "E3-2"
-    else:
-        # Elastic buckling (E3-3)
-        Fcr = 0.877 * Fe
-        buckling_mode = "Elastic"
-        equation = "E3-3"
+    .evaluation-card h3 {
+        color: white;
+        margin-bottom: 1rem;
+        font-weight: 700;
+    }
     
-    # Nominal and design strength
-    Pn = Fcr * Ag_mm2 / 1000  # kN
-    phi = 0.90
-    phi_Pn = phi * Pn
+    .critical-lengths-box {
+        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 12px;
+        margin: 1rem 0;
+        box-shadow: 0 6px 12px rgba(245, 87, 108, 0.3);
+    }
     
-    return {
-        'Pn': Pn,
-        'phi': phi,
-        'phi_Pn': phi_Pn,
-        'Fcr': Fcr,
-        'Fe': Fe,
-        'lambda_x': lambda_x,
-        'lambda_y': lambda_y,
-        'lambda_governing': lambda_governing,
-        'lambda_limit': lambda_limit,
-        'governing_axis': governing_axis,
-        'buckling_mode': buckling_mode,
-        'equation': equation,
-        'KL_x': KL_x,
-        'KL_y': KL_y,
-        'Ag': Ag,
-        'Fy': Fy
+    .design-summary {
+        background: white;
+        border: 3px solid #4caf50;
+        border-radius: 15px;
+        padding: 1.5rem;
+        margin: 1.5rem 0;
+        box-shadow: 0 4px 8px rgba(76, 175, 80, 0.2);
     }
-
-def calculate_tension_strength(section_props):
-    """
-    Calculate tension strength per AISC 360-16 Chapter D
-    Returns dict with all calculation steps
-    """
-    Fy = section_props['Fy']
-    Fu = section_props.get('Fu', 1.2 * Fy)  # Estimate if not provided
-    Ag = section_props['Ag']
-    Ae = section_props.get('Ae', 0.85 * Ag)  # Effective area, default 85%
     
-    # Convert units
-    Ag_mm2 = Ag * 100
-    Ae_mm2 = Ae * 100
+    /* Enhanced Status Boxes */
+    .info-box {
+        background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%);
+        border-left: 5px solid #2196f3;
+        padding: 1.25rem;
+        border-radius: 10px;
+        margin: 1rem 0;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+    }
     
-    # Yielding on gross section (D2-1)
-    Pn_yield = Fy * Ag_mm2 / 1000  # kN
-    phi_yield = 0.90
+    .success-box {
+        background: linear-gradient(135deg, #e8f5e9 0%, #c8e6c9 100%);
+        border-left: 5px solid #4caf50;
+        padding: 1.25rem;
+        border-radius: 10px;
+        margin: 1rem 0;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+    }
     
-    # Rupture on net section (D2-2)
-    Pn_rupture = Fu * Ae_mm2 / 1000  # kN
-    phi_rupture = 0.75
+    .warning-box {
+        background: linear-gradient(135deg, #fff3e0 0%, #ffe0b2 100%);
+        border-left: 5px solid #ff9800;
+        padding: 1.25rem;
+        border-radius: 10px;
+        margin: 1rem 0;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+    }
     
-    # Design strength (governing)
-    phi_Pn_yield = phi_yield * Pn_yield
-    phi_Pn_rupture = phi_rupture * Pn_rupture
+    .error-box {
+        background: linear-gradient(135deg, #ffebee 0%, #ffcdd2 100%);
+        border-left: 5px solid #f44336;
+        padding: 1.25rem;
+        border-radius: 10px;
+        margin: 1rem 0;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+    }
     
-    if phi_Pn_yield <= phi_Pn_rupture:
-        governing = "Yielding (D2-1)"
-        phi_Pn = phi_Pn_yield
-        Pn = Pn_yield
-        phi = phi_yield
-    else:
-        governing = "Rupture (D2-2)"
-        phi_Pn = phi_Pn_rupture
-        Pn = Pn_rupture
-        phi = phi_rupture
+    /* AISC Equation Styling */
+    .aisc-equation {
+        background: linear-gradient(135deg, #e7f3ff 0%, #d0e8ff 100%);
+        border-left: 5px solid #2196f3;
+        padding: 1.25rem;
+        margin: 1rem 0;
+        border-radius: 10px;
+        font-family: 'Courier New', monospace;
+        font-size: 0.95rem;
+        box-shadow: 0 2px 4px rgba(33, 150, 243, 0.1);
+    }
     
-    return {
-        'Pn_yield': Pn_yield,
-        'Pn_rupture': Pn_rupture,
-        'phi_yield': phi_yield,
-        'phi_rupture': phi_rupture,
-        'phi_Pn_yield': phi_Pn_yield,
-        'phi_Pn_rupture': phi_Pn_rupture,
-        'Pn': Pn,
-        'phi': phi,
-        'phi_Pn': phi_Pn,
-        'governing': governing,
-        'Ag': Ag,
-        'Ae': Ae,
-        'Fy': Fy,
-        'Fu': Fu
+    /* Enhanced Calculation Note */
+    .calculation-note {
+        background: #2c3e50;
+        color: #ecf0f1;
+        border: 2px solid #34495e;
+        padding: 1.5rem;
+        border-radius: 10px;
+        font-family: 'Courier New', monospace;
+        font-size: 0.9rem;
+        margin: 1rem 0;
+        box-shadow: 0 4px 8px rgba(0,0,0,0.2);
+        max-height: 600px;
+        overflow-y: auto;
     }
-
-# ==================== COMBINED FORCES (AISC H1) ====================
-
-def calculate_interaction(Pu, phi_Pn, Mux, phi_Mnx, Muy=0, phi_Mny=None, is_tension=False):
-    """
-    Calculate combined force interaction per AISC 360-16 Chapter H1
-    Returns dict with all calculation steps
-    """
-    if phi_Mny is None:
-        phi_Mny = phi_Mnx * 0.5  # Estimate for minor axis
     
-    Pr = abs(Pu)
-    Pc = phi_Pn
-    Mrx = abs(Mux)
-    Mcx = phi_Mnx
-    Mry = abs(Muy)
-    Mcy = phi_Mny
+    /* Data Tables */
+    .dataframe {
+        font-size: 14px !important;
+        border-radius: 10px;
+        overflow: hidden;
+    }
     
-    # Axial ratio
-    axial_ratio = Pr / Pc if Pc > 0 else 999
+    .dataframe thead tr th {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white !important;
+        font-weight: 600;
+        padding: 15px 12px !important;
+        text-align: center;
+        font-size: 15px;
+    }
     
-    if is_tension or Pu < 0:
-        # Tension + Bending: Linear interaction
-        moment_ratio_x = Mrx / Mcx if Mcx > 0 else 0
-        moment_ratio_y = Mry / Mcy if Mcy > 0 else 0
-        
-        interaction_ratio = axial_ratio + moment_ratio_x + moment_ratio_y
-        equation_used = "H1-1 (Modified for Tension)"
-        equation_text = "Pu/φPn + Mux/φMnx + Muy/φMny ≤ 1.0"
-    else:
-        # Compression + Bending: AISC H1
-        if axial_ratio >= 0.2:
-            # Equation H1-1a
-            moment_term = (Mrx / Mcx + Mry / Mcy) if Mcx > 0 and Mcy > 0 else 0
-            interaction_ratio = axial_ratio + (8.0 / 9.0) * moment_term
-            equation_used = "H1-1a"
-            equation_text = "Pu/φPn + (8/9)(Mux/φMnx + Muy/φMny) ≤ 1.0"
-        else:
-            # Equation H1-1b
-            moment_term = (Mrx / Mcx + Mry / Mcy) if Mcx > 0 and Mcy > 0 else 0
-            interaction_ratio = axial_ratio / 2.0 + moment_term
-            equation_used = "H1-1b"
-            equation_text = "Pu/(2φPn) + (Mux/φMnx + Muy/φMny) ≤ 1.0"
+    .dataframe tbody tr {
+        transition: background-color 0.2s ease;
+    }
     
-    design_ok = interaction_ratio <= 1.0
+    .dataframe tbody tr:hover {
+        background-color: #f5f7fa !important;
+    }
     
-    return {
-        'Pu': Pu,
-        'phi_Pn': phi_Pn,
-        'Mux': Mux,
-        'phi_Mnx': phi_Mnx,
-        'Muy': Muy,
-        'phi_Mny': phi_Mny,
-        'axial_ratio': axial_ratio,
-        'interaction_ratio': interaction_ratio,
-        'equation_used': equation_used,
-        'equation_text': equation_text,
-        'design_ok': design_ok,
-        'is_tension': is_tension or Pu < 0
+    .dataframe tbody tr td {
+        padding: 12px !important;
+        border-bottom: 1px solid #e9ecef;
+        text-align: center;
     }
-
-# ==================== HTML REPORT GENERATOR ====================
-
-
-class SteelDesignReportGenerator:
-    """Generate steel member design reports in HTML format"""
     
-    def __init__(self, project_info=None):
-        self.project_info = project_info or {}
-        self.members = []
-        self.report_date = datetime.now().strftime("%Y-%m-%d")
-        
-    def add_member(self, member_data):
-        """Add a member to the report"""
-        self.members.append(member_data)
-    
-    @staticmethod
-    def _get_css_styles():
-        """Return CSS styles for the report - optimized to prevent overlap"""
-        return """
-        <style>
-            /* ===== RESET & BASE ===== */
-            * { 
-                box-sizing: border-box; 
-                margin: 0;
-                padding: 0;
-            }
-            
-            body { 
-                font-family: 'Segoe UI', Tahoma, Arial, sans-serif; 
-                font-size: 10pt; 
-                line-height: 1.5;
-                color: #333;
-                max-width: 210mm;
-                margin: 0 auto;
-                padding: 15mm;
-                background: #fff;
-            }
-            
-            /* ===== REPORT HEADER ===== */
-            .report-header {
-                text-align: center;
-                border-bottom: 3px solid #2c3e50;
-                padding-bottom: 15px;
-                margin-bottom: 25px;
-            }
-            
-            .report-title { 
-                font-size: 18pt; 
-                font-weight: bold; 
-                color: #2c3e50;
-                margin: 0 0 5px 0;
-                letter-spacing: 1px;
-            }
-            
-            .report-subtitle {
-                font-size: 10pt;
-                color: #666;
-                margin: 5px 0;
-            }
-            
-            .report-info {
-                display: flex;
-                justify-content: center;
-                gap: 20px;
-                flex-wrap: wrap;
-                margin-top: 10px;
-                font-size: 9pt;
-            }
-            
-            .report-info span {
-                background: #ecf0f1;
-                padding: 4px 12px;
-                border-radius: 3px;
-            }
-            
-            /* ===== MEMBER SECTION ===== */
-            .member-section {
-                margin-bottom: 30px;
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                background: #fafafa;
-                overflow: hidden;
-                page-break-inside: avoid;
-                break-inside: avoid;
-            }
-            
-            .member-header {
-                background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                padding: 12px 15px;
-                font-size: 11pt;
-                font-weight: bold;
-                display: flex;
-                justify-content: space-between;
-                flex-wrap: wrap;
-                gap: 10px;
-            }
-            
-            .member-header-item {
-                display: flex;
-                align-items: center;
-                gap: 5px;
-            }
-            
-            .member-header-label {
-                opacity: 0.8;
-                font-weight: normal;
-                font-size: 9pt;
-            }
-            
-            .member-content {
-                padding: 15px;
-            }
-            
-            /* ===== SECTION TITLES ===== */
-            .section-title {
-                font-size: 11pt;
-                font-weight: bold;
-                color: #2c3e50;
-                border-bottom: 2px solid #3498db;
-                padding-bottom: 5px;
-                margin: 20px 0 12px 0;
-                display: flex;
-                align-items: center;
-                gap: 8px;
-            }
-            
-            .section-title:first-child {
-                margin-top: 0;
-            }
-            
-            .section-number {
-                background: #3498db;
-                color: white;
-                width: 22px;
-                height: 22px;
-                border-radius: 50%;
-                display: inline-flex;
-                align-items: center;
-                justify-content: center;
-                font-size: 9pt;
-            }
-            
-            /* ===== TABLES - FIXED LAYOUT TO PREVENT OVERLAP ===== */
-            table {
-                width: 100%;
-                border-collapse: collapse;
-                margin: 10px 0;
-                font-size: 9pt;
-                table-layout: fixed;
-            }
-            
-            th, td {
-                border: 1px solid #ddd;
-                padding: 8px 10px;
-                text-align: left;
-                vertical-align: middle;
-                overflow: hidden;
-                text-overflow: ellipsis;
-                word-wrap: break-word;
-                overflow-wrap: break-word;
-            }
-            
-            th {
-                background: #34495e;
-                color: white;
-                font-weight: 600;
-                font-size: 8.5pt;
-                text-transform: uppercase;
-                letter-spacing: 0.3px;
-            }
-            
-            tbody tr:nth-child(even) {
-                background: #f8f9fa;
-            }
-            
-            tbody tr:hover {
-                background: #e8f4f8;
-            }
-            
-            /* ===== PROPERTY TABLE (2x2 layout) ===== */
-            .prop-table th { width: 25%; }
-            .prop-table td { width: 25%; }
-            
-            /* ===== CALCULATION TABLE ===== */
-            .calc-table th:nth-child(1),
-            .calc-table td:nth-child(1) { width: 20%; }
-            
-            .calc-table th:nth-child(2),
-            .calc-table td:nth-child(2) { width: 25%; }
-            
-            .calc-table th:nth-child(3),
-            .calc-table td:nth-child(3) { width: 35%; }
-            
-            .calc-table th:nth-child(4),
-            .calc-table td:nth-child(4) { width: 20%; }
-            
-            .calc-table td:nth-child(2) {
-                font-family: 'Cambria Math', 'Times New Roman', Georgia, serif;
-                font-style: italic;
-                font-size: 9pt;
-            }
-            
-            .calc-table td:nth-child(3) {
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 8pt;
-                word-break: break-all;
-                line-height: 1.4;
-                color: #555;
-            }
-            
-            /* ===== INTERACTION TABLE ===== */
-            .interaction-table th:nth-child(1),
-            .interaction-table td:nth-child(1) { width: 10%; text-align: center; }
-            
-            .interaction-table th:nth-child(2),
-            .interaction-table td:nth-child(2) { width: 20%; }
-            
-            .interaction-table th:nth-child(3),
-            .interaction-table td:nth-child(3) { width: 40%; font-size: 8pt; }
-            
-            .interaction-table th:nth-child(4),
-            .interaction-table td:nth-child(4) { width: 15%; text-align: center; }
-            
-            .interaction-table th:nth-child(5),
-            .interaction-table td:nth-child(5) { width: 15%; text-align: center; }
-            
-            /* ===== LOAD TABLE ===== */
-            .load-table th,
-            .load-table td { 
-                text-align: center; 
-                width: 20%;
-            }
-            
-            /* ===== SPECIAL CELL STYLES ===== */
-            .equation { 
-                font-family: 'Cambria Math', 'Times New Roman', Georgia, serif;
-                font-style: italic;
-            }
-            
-            .result { 
-                font-weight: bold; 
-                color: #2c3e50;
-            }
-            
-            .result-box {
-                background: #e8f4f8;
-                padding: 2px 6px;
-                border-radius: 3px;
-                display: inline-block;
-            }
-            
-            .pass { 
-                background: #d4edda !important; 
-                color: #155724;
-                font-weight: bold;
-            }
-            
-            .fail { 
-                background: #f8d7da !important; 
-                color: #721c24;
-                font-weight: bold;
-            }
-            
-            .warning {
-                background: #fff3cd !important;
-                color: #856404;
-                font-weight: bold;
-            }
-            
-            .governing {
-                background: #cce5ff !important;
-                font-weight: bold;
-            }
-            
-            .text-center { text-align: center; }
-            .text-right { text-align: right; }
-            .text-bold { font-weight: bold; }
-            
-            /* ===== CONCLUSION BOX ===== */
-            .conclusion-box {
-                border: 2px solid #2c3e50;
-                border-radius: 8px;
-                padding: 15px;
-                margin-top: 20px;
-                background: #fff;
-            }
-            
-            .conclusion-pass {
-                border-color: #28a745;
-                background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-            }
-            
-            .conclusion-fail {
-                border-color: #dc3545;
-                background: linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%);
-            }
-            
-            .conclusion-title {
-                font-size: 12pt;
-                font-weight: bold;
-                color: #2c3e50;
-                margin-bottom: 10px;
-                text-align: center;
-            }
-            
-            .conclusion-grid {
-                display: grid;
-                grid-template-columns: repeat(2, 1fr);
-                gap: 10px;
-            }
-            
-            .conclusion-item {
-                display: flex;
-                justify-content: space-between;
-                padding: 8px 12px;
-                background: rgba(255,255,255,0.7);
-                border-radius: 4px;
-            }
-            
-            .conclusion-label {
-                color: #666;
-                font-size: 9pt;
-            }
-            
-            .conclusion-value {
-                font-weight: bold;
-                color: #2c3e50;
-            }
-            
-            .conclusion-status {
-                grid-column: span 2;
-                text-align: center;
-                padding: 12px;
-                font-size: 14pt;
-                font-weight: bold;
-                border-radius: 5px;
-                margin-top: 5px;
-            }
-            
-            .status-pass {
-                background: #28a745;
-                color: white;
-            }
-            
-            .status-fail {
-                background: #dc3545;
-                color: white;
-            }
-            
-            /* ===== NOTES ===== */
-            .note {
-                font-size: 8pt;
-                color: #666;
-                font-style: italic;
-                margin: 8px 0;
-                padding: 5px 10px;
-                background: #f8f9fa;
-                border-left: 3px solid #3498db;
-                border-radius: 0 3px 3px 0;
-            }
-            
-            .note-icon {
-                margin-right: 5px;
-            }
-            
-            /* ===== FOOTER ===== */
-            .report-footer {
-                margin-top: 30px;
-                padding-top: 15px;
-                border-top: 1px solid #ddd;
-                text-align: center;
-                font-size: 8pt;
-                color: #999;
-            }
-            
-            /* ===== PRINT STYLES ===== */
-            @media print {
-                body { 
-                    padding: 10mm;
-                    font-size: 9pt;
-                    -webkit-print-color-adjust: exact !important;
-                    print-color-adjust: exact !important;
-                }
-                
-                .member-section { 
-                    page-break-inside: avoid;
-                    break-inside: avoid;
-                    margin-bottom: 20px;
-                }
-                
-                .section-title {
-                    page-break-after: avoid;
-                }
-                
-                table { 
-                    font-size: 8pt;
-                    page-break-inside: avoid;
-                }
-                
-                .calc-table td:nth-child(3) {
-                    font-size: 7pt;
-                }
-                
-                th {
-                    background: #34495e !important;
-                    color: white !important;
-                }
-                
-                .pass { background: #d4edda !important; }
-                .fail { background: #f8d7da !important; }
-                .governing { background: #cce5ff !important; }
-                
-                .report-footer {
-                    position: fixed;
-                    bottom: 10mm;
-                    left: 0;
-                    right: 0;
-                }
-            }
-            
-            /* ===== RESPONSIVE ===== */
-            @media screen and (max-width: 800px) {
-                body {
-                    padding: 10px;
-                    font-size: 9pt;
-                }
-                
-                table {
-                    font-size: 8pt;
-                }
-                
-                .calc-table td:nth-child(3) {
-                    font-size: 7pt;
-                }
-                
-                .conclusion-grid {
-                    grid-template-columns: 1fr;
-                }
-                
-                .conclusion-status {
-                    grid-column: span 1;
-                }
-            }
-        </style>
-        """
-    
-    @staticmethod
-    def _format_substitution(parts, separator=" "):
-        """Format substitution string with line breaks for long expressions"""
-        if isinstance(parts, list):
-            return f'<span style="white-space: nowrap;">{separator}</span>'.join(parts)
-        return str(parts)
-    
-    @staticmethod
-    def _generate_member_geometry_table(member):
-        """Generate Member & Geometry Summary table"""
-        html = """
-        <div class="section-title">
-            <span class="section-number">1</span>
-            Member & Geometry Summary
-        </div>
-        <table class="prop-table">
-            <thead>
-                <tr>
-                    <th>Parameter</th>
-                    <th>Value</th>
-                    <th>Parameter</th>
-                    <th>Value</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        params = [
-            ('Member No.', member.get('member_no', '—')),
-            ('Member Type', member.get('member_type', '—')),
-            ('Length (m)', format_number(member.get('length', 0), 3)),
-            ('K Factor', format_number(member.get('K', 1.0), 2)),
-            ('KL (m)', format_number(member.get('KL', 0), 3)),
-            ('Lb (m)', format_number(member.get('Lb', 0), 3)),
-            ('Cb', format_number(member.get('Cb', 1.0), 2)),
-            ('Bracing', member.get('bracing', 'Unbraced')),
-        ]
-        
-        for i in range(0, len(params), 2):
-            p1 = params[i]
-            p2 = params[i+1] if i+1 < len(params) else ('', '')
-            html += f"""
-                <tr>
-                    <td class="text-bold">{p1[0]}</td>
-                    <td>{p1[1]}</td>
-                    <td class="text-bold">{p2[0]}</td>
-                    <td>{p2[1]}</td>
-                </tr>
-            """
-        
-        html += """
-            </tbody>
-        </table>
-        """
-        return html
-    
-    @staticmethod
-    def _generate_section_properties_table(member):
-        """Generate Section Properties & Classification table"""
-        section = member.get('section_props', {})
-        classification = member.get('classification', 'Compact')
-        
-        # Determine classification style
-        if classification == 'Compact':
-            class_style = 'pass'
-        elif classification == 'Noncompact':
-            class_style = 'warning'
-        else:
-            class_style = 'fail'
-        
-        html = """
-        <div class="section-title">
-            <span class="section-number">2</span>
-            Section Properties & Classification
-        </div>
-        <table class="prop-table">
-            <thead>
-                <tr>
-                    <th>Property</th>
-                    <th>Value</th>
-                    <th>Property</th>
-                    <th>Value</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        props = [
-            ('Section', f"<b>{member.get('section_name', '—')}</b>"),
-            ('Classification', f'<span class="{class_style}" style="padding: 2px 8px; border-radius: 3px;">{classification}</span>'),
-            ('Ag (cm²)', format_number(section.get('Ag', 0), 2)),
-            ('Weight (kg/m)', format_number(section.get('weight', 0), 2)),
-            ('Ix (cm⁴)', format_number(section.get('Ix', 0), 1)),
-            ('Iy (cm⁴)', format_number(section.get('Iy', 0), 1)),
-            ('Sx (cm³)', format_number(section.get('Sx', 0), 1)),
-            ('Sy (cm³)', format_number(section.get('Sy', 0), 1)),
-            ('Zx (cm³)', format_number(section.get('Zx', 0), 1)),
-            ('Zy (cm³)', format_number(section.get('Zy', 0), 1)),
-            ('rx (cm)', format_number(section.get('rx', 0), 2)),
-            ('ry (cm)', format_number(section.get('ry', 0), 2)),
-            ('J (cm⁴)', format_number(section.get('J', 0), 2)),
-            ('Cw (cm⁶)', format_number(section.get('Cw', 0), 0)),
-            ('Fy (MPa)', format_number(section.get('Fy', 0), 0)),
-            ('E (MPa)', '200,000'),
-        ]
-        
-        for i in range(0, len(props), 2):
-            p1 = props[i]
-            p2 = props[i+1] if i+1 < len(props) else ('', '')
-            html += f"""
-                <tr>
-                    <td class="text-bold">{p1[0]}</td>
-                    <td>{p1[1]}</td>
-                    <td class="text-bold">{p2[0]}</td>
-                    <td>{p2[1]}</td>
-                </tr>
-            """
-        
-        html += """
-            </tbody>
-        </table>
-        """
-        return html
-    
-    @staticmethod
-    def _generate_flexural_strength_table(member):
-        """Generate Flexural Strength Calculation table"""
-        flex = member.get('flexural_results', {})
-        section = member.get('section_props', {})
-        classification = member.get('classification', 'Compact')
-        
-        # Determine which section modulus to use
-        use_Zx = classification == 'Compact'
-
-        # Get values with defaults
-        ry_mm = section.get('ry', 0) * 10  # cm to mm
-        Fy = section.get('Fy', 345)
-        Zx_mm3 = section.get('Zx', 0) * 1000  # cm³ to mm³
-        Lp = flex.get('Lp', 0)
-        Lr = flex.get('Lr', 0)
-        Mp = flex.get('Mp', 0)
-        Mn = flex.get('Mn', 0)
-        phi_Mn = flex.get('phi_Mn', 0)
-        Lb = member.get('Lb', 0)
-        
-        # Determine limit state
-        if Lb <= Lp:
-            limit_state = "Yielding (Lb ≤ Lp)"
-            case = "F2-1"
-        elif Lb <= Lr:
-            limit_state = "Inelastic LTB (Lp < Lb ≤ Lr)"
-            case = "F2-2"
-        else:
-            limit_state = "Elastic LTB (Lb > Lr)"
-            case = "F2-3"
-        
-        html = f"""
-        <div class="section-title">
-            <span class="section-number">3</span>
-            Flexural Strength Calculation (AISC 360-16 Chapter F)
-        </div>
-        <div class="note">
-            <span class="note-icon">📋</span>
-            Limit State: <b>{limit_state}</b> | Governing Equation: <b>{case}</b>
-        </div>
-        <table class="calc-table">
-            <thead>
-                <tr>
-                    <th>Item</th>
-                    <th>Expression</th>
-                    <th>Calculation</th>
-                    <th>Result</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Lp</td>
-                    <td class="equation">1.76·ry·√(E/Fy)</td>
-                    <td>1.76 × {format_number(ry_mm, 1)} × √(200000/{format_number(Fy, 0)}) / 1000</td>
-                    <td class="result">{format_number(Lp, 3)} m</td>
-                </tr>
-                <tr>
-                    <td>Lr</td>
-                    <td class="equation">Per AISC F2-6</td>
-                    <td>Function of section properties</td>
-                    <td class="result">{format_number(Lr, 3)} m</td>
-                </tr>
-                <tr>
-                    <td>Lb</td>
-                    <td class="equation">Unbraced length</td>
-                    <td>Given</td>
-                    <td class="result">{format_number(Lb, 3)} m</td>
-                </tr>
-                <tr>
-                    <td>Mp</td>
-                    <td class="equation">Fy × Zx</td>
-                    <td>{format_number(Fy, 0)} × {format_number(Zx_mm3, 0)} / 10⁶</td>
-                    <td class="result">{format_number(Mp, 2)} kN·m</td>
-                </tr>
-                <tr>
-                    <td>Mn</td>
-                    <td class="equation">Per {case}</td>
-                    <td>{limit_state}</td>
-                    <td class="result">{format_number(Mn, 2)} kN·m</td>
-                </tr>
-                <tr>
-                    <td>φb</td>
-                    <td class="equation">Resistance factor</td>
-                    <td>AISC F1</td>
-                    <td class="result">0.90</td>
-                </tr>
-                <tr class="governing">
-                    <td><b>φMn</b></td>
-                    <td class="equation"><b>φb × Mn</b></td>
-                    <td><b>0.90 × {format_number(Mn, 2)}</b></td>
-                    <td class="result"><span class="result-box"><b>{format_number(phi_Mn, 2)} kN·m</b></span></td>
-                </tr>
-            </tbody>
-        </table>
-        """
-        return html
-    
-    @staticmethod
-    def _generate_compression_strength_table(member):
-        """Generate Compression Strength Calculation table"""
-        comp = member.get('compression_results', {})
-        section = member.get('section_props', {})
-        
-        # Get values with defaults
-        KL_mm = member.get('KL', 0) * 1000  # m to mm
-        rx_mm = section.get('rx', 0) * 10  # cm to mm
-        ry_mm = section.get('ry', 0) * 10  # cm to mm
-        Ag_mm2 = section.get('Ag', 0) * 100  # cm² to mm²
-        Fy = section.get('Fy', 345)
-        
-        lambda_x = comp.get('lambda_x', 0)
-        lambda_y = comp.get('lambda_y', 0)
-        lambda_limit = comp.get('lambda_limit', 0)
-        lambda_gov = comp.get('lambda_governing', max(lambda_x, lambda_y) if lambda_x > 0 or lambda_y > 0 else 0)
-        Fe = comp.get('Fe', 0)
-        Fcr = comp.get('Fcr', 0)
-        Pn = comp.get('Pn', 0)
-        phi_Pn = comp.get('phi_Pn', 0)
-        
-        # Determine governing axis
-        gov_axis = 'Y-axis' if lambda_y > lambda_x else 'X-axis'
-        
-        # Determine buckling mode
-        if lambda_gov <= lambda_limit:
-            buckling_mode = "Inelastic Buckling"
-            equation = "E3-2"
-        else:
-            buckling_mode = "Elastic Buckling"
-            equation = "E3-3"
-        
-        html = f"""
-        <div class="section-title">
-            <span class="section-number">4</span>
-            Compression Strength Calculation (AISC 360-16 Chapter E)
-        </div>
-        <div class="note">
-            <span class="note-icon">📋</span>
-            Buckling Mode: <b>{buckling_mode}</b> | Equation: <b>{equation}</b> | Governing: <b>{gov_axis}</b>
-        </div>
-        <table class="calc-table">
-            <thead>
-                <tr>
-                    <th>Item</th>
-                    <th>Expression</th>
-                    <th>Calculation</th>
-                    <th>Result</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>KL/rx</td>
-                    <td class="equation">KLx / rx</td>
-                    <td>{format_number(KL_mm, 0)} / {format_number(rx_mm, 1)}</td>
-                    <td class="result">{format_number(lambda_x, 1)}</td>
-                </tr>
-                <tr>
-                    <td>KL/ry</td>
-                    <td class="equation">KLy / ry</td>
-                    <td>{format_number(KL_mm, 0)} / {format_number(ry_mm, 1)}</td>
-                    <td class="result">{format_number(lambda_y, 1)}</td>
-                </tr>
-                <tr>
-                    <td>λ (governing)</td>
-                    <td class="equation">max(KL/rx, KL/ry)</td>
-                    <td>{gov_axis}</td>
-                    <td class="result">{format_number(lambda_gov, 1)}</td>
-                </tr>
-                <tr>
-                    <td>4.71√(E/Fy)</td>
-                    <td class="equation">Limiting λ</td>
-                    <td>4.71 × √(200000/{format_number(Fy, 0)})</td>
-                    <td class="result">{format_number(lambda_limit, 1)}</td>
-                </tr>
-                <tr>
-                    <td>Fe</td>
-                    <td class="equation">π²E / λ²</td>
-                    <td>π² × 200000 / {format_number(lambda_gov, 1)}²</td>
-                    <td class="result">{format_number(Fe, 1)} MPa</td>
-                </tr>
-                <tr>
-                    <td>Fcr</td>
-                    <td class="equation">Per {equation}</td>
-                    <td>{buckling_mode}</td>
-                    <td class="result">{format_number(Fcr, 1)} MPa</td>
-                </tr>
-                <tr>
-                    <td>Pn</td>
-                    <td class="equation">Fcr × Ag</td>
-                    <td>{format_number(Fcr, 1)} × {format_number(Ag_mm2, 0)} / 1000</td>
-                    <td class="result">{format_number(Pn, 1)} kN</td>
-                </tr>
-                <tr>
-                    <td>φc</td>
-                    <td class="equation">Resistance factor</td>
-                    <td>AISC E1</td>
-                    <td class="result">0.90</td>
-                </tr>
-                <tr class="governing">
-                    <td><b>φPn</b></td>
-                    <td class="equation"><b>φc × Pn</b></td>
-                    <td><b>0.90 × {format_number(Pn, 1)}</b></td>
-                    <td class="result"><span class="result-box"><b>{format_number(phi_Pn, 1)} kN</b></span></td>
-                </tr>
-            </tbody>
-        </table>
-        """
-        return html
-    
-    @staticmethod
-    def _generate_tension_strength_table(member):
-        """Generate Tension Strength Calculation table"""
-        tens = member.get('tension_results', {})
-        section = member.get('section_props', {})
-        
-        Fy = section.get('Fy', 345)
-        Fu = tens.get('Fu', 450)
-        Ag_mm2 = section.get('Ag', 0) * 100
-        Ae_mm2 = tens.get('Ae', section.get('Ag', 0)) * 100
-        
-        Pn_yield = tens.get('Pn_yield', 0)
-        Pn_rupture = tens.get('Pn_rupture', 0)
-        phi_Pn_yield = tens.get('phi_Pn_yield', 0)
-        phi_Pn_rupture = tens.get('phi_Pn_rupture', 0)
-        phi_Pn = tens.get('phi_Pn', 0)
-        governing = tens.get('governing', 'Yielding')
-        
-        yield_class = 'governing' if governing == 'Yielding' else ''
-        rupture_class = 'governing' if governing == 'Rupture' else ''
-        
-        html = f"""
-        <div class="section-title">
-            <span class="section-number">4</span>
-            Tension Strength Calculation (AISC 360-16 Chapter D)
-        </div>
-        <div class="note">
-            <span class="note-icon">📋</span>
-            Governing Limit State: <b>{governing}</b>
-        </div>
-        <table class="calc-table">
-            <thead>
-                <tr>
-                    <th>Item</th>
-                    <th>Expression</th>
-                    <th>Calculation</th>
-                    <th>Result</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr class="{yield_class}">
-                    <td>Pn (Yield)</td>
-                    <td class="equation">Fy × Ag</td>
-                    <td>{format_number(Fy, 0)} × {format_number(Ag_mm2, 0)} / 1000</td>
-                    <td class="result">{format_number(Pn_yield, 1)} kN</td>
-                </tr>
-                <tr class="{yield_class}">
-                    <td>φPn (Yield)</td>
-                    <td class="equation">0.90 × Pn</td>
-                    <td>0.90 × {format_number(Pn_yield, 1)}</td>
-                    <td class="result">{format_number(phi_Pn_yield, 1)} kN</td>
-                </tr>
-                <tr class="{rupture_class}">
-                    <td>Pn (Rupture)</td>
-                    <td class="equation">Fu × Ae</td>
-                    <td>{format_number(Fu, 0)} × {format_number(Ae_mm2, 0)} / 1000</td>
-                    <td class="result">{format_number(Pn_rupture, 1)} kN</td>
-                </tr>
-                <tr class="{rupture_class}">
-                    <td>φPn (Rupture)</td>
-                    <td class="equation">0.75 × Pn</td>
-                    <td>0.75 × {format_number(Pn_rupture, 1)}</td>
-                    <td class="result">{format_number(phi_Pn_rupture, 1)} kN</td>
-                </tr>
-                <tr class="governing">
-                    <td><b>φPn</b></td>
-                    <td class="equation"><b>min(φPn)</b></td>
-                    <td><b>Governing: {governing}</b></td>
-                    <td class="result"><span class="result-box"><b>{format_number(phi_Pn, 1)} kN</b></span></td>
-                </tr>
-            </tbody>
-        </table>
-        """
-        return html
-    
-    @staticmethod
-    def _generate_shear_strength_table(member):
-        """Generate Shear Strength Calculation table"""
-        shear = member.get('shear_results', {})
-        section = member.get('section_props', {})
-        
-        if not shear:
-            return ""
-        
-        Fy = section.get('Fy', 345)
-        Aw = shear.get('Aw', 0)
-        Cv1 = shear.get('Cv1', 1.0)
-        Vn = shear.get('Vn', 0)
-        phi_Vn = shear.get('phi_Vn', 0)
-        
-        html = f"""
-        <div class="section-title">
-            <span class="section-number">5</span>
-            Shear Strength Calculation (AISC 360-16 Chapter G)
-        </div>
-        <table class="calc-table">
-            <thead>
-                <tr>
-                    <th>Item</th>
-                    <th>Expression</th>
-                    <th>Calculation</th>
-                    <th>Result</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Aw</td>
-                    <td class="equation">d × tw</td>
-                    <td>Web area</td>
-                    <td class="result">{format_number(Aw, 2)} cm²</td>
-                </tr>
-                <tr>
-                    <td>Cv1</td>
-                    <td class="equation">Web shear coefficient</td>
-                    <td>Per AISC G2.1</td>
-                    <td class="result">{format_number(Cv1, 3)}</td>
-                </tr>
-                <tr>
-                    <td>Vn</td>
-                    <td class="equation">0.6 × Fy × Aw × Cv1</td>
-                    <td>0.6 × {format_number(Fy, 0)} × {format_number(Aw * 100, 0)} × {format_number(Cv1, 3)} / 1000</td>
-                    <td class="result">{format_number(Vn, 1)} kN</td>
-                </tr>
-                <tr>
-                    <td>φv</td>
-                    <td class="equation">Resistance factor</td>
-                    <td>AISC G1</td>
-                    <td class="result">1.00</td>
-                </tr>
-                <tr class="governing">
-                    <td><b>φVn</b></td>
-                    <td class="equation"><b>φv × Vn</b></td>
-                    <td><b>1.00 × {format_number(Vn, 1)}</b></td>
-                    <td class="result"><span class="result-box"><b>{format_number(phi_Vn, 1)} kN</b></span></td>
-                </tr>
-            </tbody>
-        </table>
-        """
-        return html
-    
-    @staticmethod
-    def _generate_load_combination_table(member):
-        """Generate Load Combination Summary table"""
-        loads = member.get('loads', [])
-        
-        if not loads:
-            return ""
-        
-        html = """
-        <div class="section-title">
-            <span class="section-number">5</span>
-            Load Combination Summary
-        </div>
-        <table class="load-table">
-            <thead>
-                <tr>
-                    <th>Load Comb.</th>
-                    <th>Pu (kN)</th>
-                    <th>Mux (kN·m)</th>
-                    <th>Muy (kN·m)</th>
-                    <th>Vu (kN)</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        for load in loads:
-            Pu = load.get('Pu', 0)
-            # Highlight tension loads
-            pu_class = '' if Pu >= 0 else 'warning'
-            
-            html += f"""
-                <tr>
-                    <td><b>{load.get('LC', '—')}</b></td>
-                    <td class="{pu_class}">{format_number(Pu, 1)}</td>
-                    <td>{format_number(load.get('Mux', 0), 2)}</td>
-                    <td>{format_number(load.get('Muy', 0), 2)}</td>
-                    <td>{format_number(load.get('Vu', 0), 1)}</td>
-                </tr>
-            """
-        
-        html += """
-            </tbody>
-        </table>
-        <div class="note">
-            <span class="note-icon">💡</span>
-            Positive Pu = Compression, Negative Pu = Tension
-        </div>
-        """
-        return html
-    
-    @staticmethod
-    def _generate_interaction_table(member):
-        """Generate Combined Force Check table"""
-        interactions = member.get('interaction_results', [])
-        
-        if not interactions:
-            return ""
-        
-        html = """
-        <div class="section-title">
-            <span class="section-number">6</span>
-            Combined Force Check (AISC 360-16 Chapter H)
-        </div>
-        <table class="interaction-table">
-            <thead>
-                <tr>
-                    <th>LC</th>
-                    <th>Equation</th>
-                    <th>Calculation</th>
-                    <th>Ratio</th>
-                    <th>Status</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        # Find governing (max ratio)
-        max_ratio = max(i.get('interaction_ratio', 0) for i in interactions) if interactions else 0
-        
-        for inter in interactions:
-            ratio = inter.get('interaction_ratio', 0)
-            is_governing = abs(ratio - max_ratio) < 0.0001
-            status_class = 'pass' if ratio <= 1.0 else 'fail'
-            row_class = 'governing' if is_governing else ''
-            status = "OK" if ratio <= 1.0 else "NG"
-            
-            # Build calculation string
-            Pu = inter.get('Pu', 0)
-            phi_Pn = inter.get('phi_Pn', 1)
-            Mux = inter.get('Mux', 0)
-            phi_Mnx = inter.get('phi_Mnx', 1)
-            Muy = inter.get('Muy', 0)
-            phi_Mny = inter.get('phi_Mny', 1)
-            
-            equation = inter.get('equation_used', 'H1-1a')
-            
-            # Format calculation based on equation type
-            if 'H1-1a' in equation:
-                calc = f"({format_number(abs(Pu), 1)}/{format_number(phi_Pn, 1)}) + (8/9)[({format_number(abs(Mux), 2)}/{format_number(phi_Mnx, 2)}) + ({format_number(abs(Muy), 2)}/{format_number(phi_Mny, 2)})]"
-            else:  # H1-1b
-                calc = f"({format_number(abs(Pu), 1)}/{format_number(2 * phi_Pn, 1)}) + ({format_number(abs(Mux), 2)}/{format_number(phi_Mnx, 2)}) + ({format_number(abs(Muy), 2)}/{format_number(phi_Mny, 2)})"
-            
-            gov_marker = " ★" if is_governing else ""
-            
-            html += f"""
-                <tr class="{row_class}">
-                    <td><b>{inter.get('LC', '—')}{gov_marker}</b></td>
-                    <td class="equation">{equation}</td>
-                    <td>{calc}</td>
-                    <td class="result text-center"><b>{format_number(ratio, 3)}</b></td>
-                    <td class="{status_class} text-center">{status}</td>
-                </tr>
-            """
-        
-        html += """
-            </tbody>
-        </table>
-        <div class="note">
-            <span class="note-icon">★</span>
-            Governing Load Combination | H1-1a: Pr/Pc ≥ 0.2 | H1-1b: Pr/Pc &lt; 0.2
-        </div>
-        """
-        return html
-    
-    @staticmethod
-    def _generate_conclusion(member):
-        """Generate Design Conclusion section"""
-        interactions = member.get('interaction_results', [])
-        flex = member.get('flexural_results', {})
-        comp = member.get('compression_results', {})
-        
-        if interactions:
-            max_idx = max(range(len(interactions)), key=lambda i: interactions[i].get('interaction_ratio', 0))
-            max_inter = interactions[max_idx]
-            max_ratio = max_inter.get('interaction_ratio', 0)
-            governing_lc = max_inter.get('LC', '—')
-            governing_state = max_inter.get('equation_used', '—')
-        else:
-            max_ratio = 0
-            governing_lc = "—"
-            governing_state = "—"
-        
-        design_ok = max_ratio <= 1.0
-        status_class = 'conclusion-pass' if design_ok else 'conclusion-fail'
-        status_style = 'status-pass' if design_ok else 'status-fail'
-        status_text = '✓ DESIGN ADEQUATE' if design_ok else '✗ DESIGN INADEQUATE'
-        
-        # Calculate utilization percentage
-        utilization = max_ratio * 100
-        
-        html = f"""
-        <div class="section-title">
-            <span class="section-number">7</span>
-            Design Summary & Conclusion
-        </div>
-        <div class="conclusion-box {status_class}">
-            <div class="conclusion-grid">
-                <div class="conclusion-item">
-                    <span class="conclusion-label">Section Used</span>
-                    <span class="conclusion-value">{member.get('section_name', '—')}</span>
-                </div>
-                <div class="conclusion-item">
-                    <span class="conclusion-label">Member Type</span>
-                    <span class="conclusion-value">{member.get('member_type', '—')}</span>
-                </div>
-                <div class="conclusion-item">
-                    <span class="conclusion-label">Governing LC</span>
-                    <span class="conclusion-value">{governing_lc}</span>
-                </div>
-                <div class="conclusion-item">
-                    <span class="conclusion-label">Limit State</span>
-                    <span class="conclusion-value">{governing_state}</span>
-                </div>
-                <div class="conclusion-item">
-                    <span class="conclusion-label">φMn</span>
-                    <span class="conclusion-value">{format_number(flex.get('phi_Mn', 0), 2)} kN·m</span>
-                </div>
-                <div class="conclusion-item">
-                    <span class="conclusion-label">φPn</span>
-                    <span class="conclusion-value">{format_number(comp.get('phi_Pn', 0), 1)} kN</span>
-                </div>
-                <div class="conclusion-item">
-                    <span class="conclusion-label">Max Ratio</span>
-                    <span class="conclusion-value">{format_number(max_ratio, 3)}</span>
-                </div>
-                <div class="conclusion-item">
-                    <span class="conclusion-label">Utilization</span>
-                    <span class="conclusion-value">{format_number(utilization, 1)}%</span>
-                </div>
-                <div class="conclusion-status {status_style}">
-                    {status_text}
-                </div>
-            </div>
-        </div>
-        """
-        return html
-    
-    def generate_member_report(self, member):
-        """Generate complete report section for one member"""
-        member_type = member.get('member_type', 'Beam-Column')
-        
-        html = f"""
-        <div class="member-section">
-            <div class="member-header">
-                <div class="member-header-item">
-                    <span class="member-header-label">Member:</span>
-                    <span>{member.get('member_no', '—')}</span>
-                </div>
-                <div class="member-header-item">
-                    <span class="member-header-label">Section:</span>
-                    <span>{member.get('section_name', '—')}</span>
-                </div>
-                <div class="member-header-item">
-                    <span class="member-header-label">Type:</span>
-                    <span>{member_type}</span>
-                </div>
-            </div>
-            <div class="member-content">
-        """
-        
-        # 1. Member & Geometry Summary
-        html += self._generate_member_geometry_table(member)
-        
-        # 2. Section Properties & Classification
-        html += self._generate_section_properties_table(member)
-        
-        # 3. Flexural Strength (if applicable)
-        if member_type in ['Beam', 'Beam-Column']:
-            html += self._generate_flexural_strength_table(member)
-        
-        # 4. Axial Strength
-        if member_type in ['Column', 'Beam-Column']:
-            html += self._generate_compression_strength_table(member)
-        elif member_type == 'Tension Member':
-            html += self._generate_tension_strength_table(member)
-        
-        # 5. Shear Strength (optional)
-        html += self._generate_shear_strength_table(member)
-        
-        # 5/6. Load Combination Summary
-        html += self._generate_load_combination_table(member)
-        
-        # 6/7. Combined Force Check (if beam-column)
-        if member_type in ['Beam-Column', 'Column']:
-            html += self._generate_interaction_table(member)
-        
-        # 7/8. Design Conclusion
-        html += self._generate_conclusion(member)
-        
-        html += """
-            </div>
-        </div>
-        """
-        return html
-    
-    def generate_full_report(self):
-        """Generate complete HTML report for all members"""
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Steel Design Report - {self.project_info.get('name', 'Project')}</title>
-    {self._get_css_styles()}
-</head>
-<body>
-    <div class="report-header">
-        <h1 class="report-title">STEEL MEMBER DESIGN REPORT</h1>
-        <p class="report-subtitle">Per AISC 360-16 Specification for Structural Steel Buildings</p>
-        <div class="report-info">
-            <span><b>Project:</b> {self.project_info.get('name', '—')}</span>
-            <span><b>Date:</b> {self.report_date}</span>
-            <span><b>Engineer:</b> {self.project_info.get('engineer', '—')}</span>
-            <span><b>Checker:</b> {self.project_info.get('checker', '—')}</span>
-        </div>
-    </div>
-"""
-        
-        # Generate report for each member
-        for member in self.members:
-            html += self.generate_member_report(member)
-        
-        # Footer
-        html += f"""
-    <div class="report-footer">
-        <p>Generated by Steel Design Application | AISC 360-16 | {self.report_date}</p>
-        <p>Thai Obayashi Corporation Limited - Design Service (Structure) Department</p>
-    </div>
-</body>
-</html>
-"""
-        
-        return html
-
-
-def generate_midas_gen_text_report(members, project_info=None, code_name="AISC(15th)-LRFD16"):
-    """Generate MIDAS GEN-style plain text calculation report."""
-    project_info = project_info or {}
-    now_str = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-    def line(ch='-', n=98):
-        return ch * n
-
-    def fmt(v, w=10, d=3):
-        try:
-            return f"{float(v):>{w}.{d}f}"
-        except Exception:
-            return f"{str(v):>{w}}"
-
-    report = []
-    report.append(line('-'))
-    report.append(f" midas Gen - Steel Code Checking[ {code_name} ]{'Gen 2025':>44}")
-    report.append(line('='))
-    report.append("")
-    report.append(f" *.PROJECT     : {project_info.get('name', '')}")
-    report.append(" *.UNIT SYSTEM : kN, m")
-    report.append(f" *.GENERATED   : {now_str}")
-    report.append(line('='))
-    report.append(f"   [ {code_name} ]  CODE CHECKING SUMMARY SHEET --- SELECTED MEMBERS")
-    report.append(line('-'))
-    report.append("  MEMB     SECTION                  TYPE         GOV.LC     MAX RATIO     STATUS")
-    report.append(line('='))
-
-    for m in members:
-        interactions = m.get('interaction_results', [])
-        if interactions:
-            gov = max(interactions, key=lambda x: x.get('interaction_ratio', 0))
-            gov_lc = gov.get('LC', '-')
-            gov_ratio = gov.get('interaction_ratio', 0)
-            ok = gov_ratio <= 1.0
-        else:
-            gov_lc = '-'
-            gov_ratio = 0.0
-            ok = True
-        report.append(
-            f"  {str(m.get('member_no','-')):<8} {str(m.get('section_name','-')):<24} {str(m.get('member_type','-')):<12} "
-            f"{str(gov_lc):>6} {gov_ratio:>13.3f}     {'OK' if ok else 'NG'}"
-        )
-
-    report.append(line('-'))
-    report.append("\f")
-
-    for m in members:
-        section = m.get('section_props', {})
-        loads = m.get('loads', [])
-        interactions = m.get('interaction_results', [])
-
-        report.append(line('-'))
-        report.append(f" midas Gen - Steel Code Checking[ {code_name} ]{'Gen 2025':>44}")
-        report.append(line('='))
-        report.append("")
-        report.append(f" *. MEMBER NO   = {m.get('member_no','-')},  ELEMENT TYPE = {m.get('member_type','-')}")
-        report.append(f" *. SECTION     = {m.get('section_name','-')}")
-        report.append(f" *. MATERIAL Fy = {section.get('Fy', 0):.3f},  E = {section.get('E', 0):.1f}")
-        report.append(f" *. LENGTH(m)   = L={m.get('length',0):.3f}, KL={m.get('KL',0):.3f}, Lb={m.get('Lb',0):.3f}")
-        report.append("")
-
-        report.append(line('='))
-        report.append("   [[[*]]]   DEFINITION OF LOAD COMBINATIONS")
-        report.append(line('='))
-        report.append("    LC        Pu(kN)         Mux(kN·m)      Muy(kN·m)")
-        report.append(line('-'))
-        for ld in loads:
-            report.append(
-                f"    {str(ld.get('LC','-')):>2} {fmt(ld.get('Pu',0),14,3)} {fmt(ld.get('Mux',0),16,3)} {fmt(ld.get('Muy',0),14,3)}"
-            )
-        if not loads:
-            report.append("    (no load combinations)")
-        report.append("")
-
-        report.append(line('='))
-        report.append("   [[[*]]]   LRFD STRENGTH CHECK RESULTS")
-        report.append(line('='))
-        report.append("    LC      Eqn                      Ratio       Result")
-        report.append(line('-'))
-        for r in interactions:
-            ratio = r.get('interaction_ratio', 0)
-            report.append(
-                f"    {str(r.get('LC','-')):>2}   {str(r.get('equation_used','H1')):<20} {ratio:>8.3f}     {'O.K.' if ratio <= 1.0 else 'N.G.'}"
-            )
-        if not interactions:
-            report.append("    (no check results)")
-
-        max_ratio = max((x.get('interaction_ratio', 0) for x in interactions), default=0)
-        report.append(line('-'))
-        report.append(f"    Governing Ratio = {max_ratio:.3f}  --->  {'O.K.' if max_ratio <= 1.0 else 'N.G.'}")
-        report.append("\f")
-
-    return "\n".join(report)
-
-
-# ==================== STREAMLIT INTEGRATION FUNCTIONS ====================
-
-def create_member_data(member_no, section_name, section_props, member_type, 
-                       length, K, KL, Lb, loads, classification='Compact'):
-    """
-    Create a complete member data dictionary for report generation
-    
-    Parameters:
-    - member_no: Member identifier
-    - section_name: Section designation (e.g., "W14x22")
-    - section_props: Dict with section properties (Ag, Ix, Iy, Sx, Zx, rx, ry, Fy, etc.)
-    - member_type: 'Beam', 'Column', 'Beam-Column', or 'Tension Member'
-    - length: Member length (m)
-    - K: Effective length factor
-    - KL: Effective length (m)
-    - Lb: Unbraced length for flexure (m)
-    - loads: List of dicts with 'LC', 'Pu', 'Mux', 'Muy'
-    - classification: 'Compact', 'Noncompact', or 'Slender'
-    
-    Returns complete member dict with all calculations
-    """
-    
-    member = {
-        'member_no': member_no,
-        'section_name': section_name,
-        'section_props': section_props,
-        'member_type': member_type,
-        'length': length,
-        'K': K,
-        'KL': KL,
-        'Lb': Lb,
-        'loads': loads,
-        'classification': classification
-    }
-    
-    # Calculate flexural strength
-    if member_type in ['Beam', 'Beam-Column']:
-        member['flexural_results'] = calculate_flexural_strength(
-            section_props, Lb, Cb=1.0
-        )
-    
-    # Calculate axial strength
-    if member_type in ['Column', 'Beam-Column']:
-        member['compression_results'] = calculate_compression_strength(
-            section_props, KL, KL
-        )
-    elif member_type == 'Tension Member':
-        member['tension_results'] = calculate_tension_strength(section_props)
-    
-    # Calculate interaction for each load combination
-    interaction_results = []
-    
-    for load in loads:
-        LC = load.get('LC', 1)
-        Pu = load.get('Pu', 0)  # kN
-        Mux = load.get('Mux', 0)  # kN·m
-        Muy = load.get('Muy', 0)  # kN·m
-        
-        # Get capacities
-        if member_type == 'Tension Member':
-            phi_Pn = member.get('tension_results', {}).get('phi_Pn', 1)
-            phi_Mnx = 0
-            phi_Mny = 0
-            is_tension = True
-        else:
-            phi_Pn = member.get('compression_results', {}).get('phi_Pn', 1)
-            phi_Mnx = member.get('flexural_results', {}).get('phi_Mn', 1)
-            phi_Mny = phi_Mnx * 0.5  # Estimate for minor axis
-            is_tension = Pu < 0
-        
-        if member_type in ['Beam-Column', 'Column', 'Tension Member']:
-            inter = calculate_interaction(
-                Pu, phi_Pn, Mux, phi_Mnx, Muy, phi_Mny, is_tension
-            )
-            inter['LC'] = LC
-            interaction_results.append(inter)
-        elif member_type == 'Beam':
-            # Beam only - check moment ratio
-            ratio = abs(Mux) / phi_Mnx if phi_Mnx > 0 else 999
-            interaction_results.append({
-                'LC': LC,
-                'Pu': 0,
-                'phi_Pn': 0,
-                'Mux': Mux,
-                'phi_Mnx': phi_Mnx,
-                'Muy': Muy,
-                'phi_Mny': phi_Mny,
-                'interaction_ratio': ratio,
-                'equation_used': 'Mu/φMn',
-                'equation_text': 'Mu/φMn ≤ 1.0',
-                'design_ok': ratio <= 1.0,
-                'is_tension': False
-            })
-    
-    member['interaction_results'] = interaction_results
-    
-    return member
-
-
-# ==================== EXAMPLE USAGE / DEMO ====================
-
-def demo_report():
-    """Generate a demo report"""
-    
-    # Sample section properties (W14x22 equivalent in metric)
-    section_props = {
-        'Ag': 41.8,      # cm²
-        'Ix': 8247,      # cm⁴
-        'Iy': 533,       # cm⁴
-        'Sx': 467,       # cm³
-        'Zx': 524,       # cm³
-        'rx': 14.0,      # cm
-        'ry': 3.57,      # cm
-        'Fy': 345,       # MPa (Gr. 50)
-        'Fu': 450,       # MPa
-        'J': 16.4,       # cm⁴
-        'd': 35.0,       # cm
-        'tf': 1.07,      # cm
-        'ho': 33.9,      # cm
-        'rts': 3.91      # cm
-    }
-    
-    # Sample loads for a beam-column
-    loads = [
-        {'LC': 1, 'Pu': 450, 'Mux': 85, 'Muy': 0},
-        {'LC': 2, 'Pu': 520, 'Mux': 95, 'Muy': 0},
-        {'LC': 3, 'Pu': -180, 'Mux': 65, 'Muy': 0},  # Tension case
-        {'LC': 4, 'Pu': 580, 'Mux': 110, 'Muy': 0},
-        {'LC': 5, 'Pu': 490, 'Mux': 88, 'Muy': 0},
-    ]
-    
-    # Create member data
-    member1 = create_member_data(
-        member_no='B-101',
-        section_name='W14x22',
-        section_props=section_props,
-        member_type='Beam-Column',
-        length=4.0,
-        K=1.0,
-        KL=4.0,
-        Lb=2.0,
-        loads=loads,
-        classification='Compact'
-    )
-    
-    # Create tension member
-    tension_loads = [
-        {'LC': 1, 'Pu': -320, 'Mux': 0, 'Muy': 0},
-        {'LC': 2, 'Pu': -410, 'Mux': 0, 'Muy': 0},
-        {'LC': 3, 'Pu': -285, 'Mux': 0, 'Muy': 0},
-    ]
-    
-    member2 = create_member_data(
-        member_no='T-201',
-        section_name='W8x18',
-        section_props={
-            'Ag': 34.2, 'Ix': 3040, 'Iy': 310, 'Sx': 278, 'Zx': 316,
-            'rx': 9.42, 'ry': 3.00, 'Fy': 345, 'Fu': 450, 'Ae': 29.1
-        },
-        member_type='Tension Member',
-        length=6.0,
-        K=1.0,
-        KL=6.0,
-        Lb=6.0,
-        loads=tension_loads,
-        classification='Compact'
-    )
-    
-    # Generate report
-    generator = SteelDesignReportGenerator(
-        project_info={
-            'name': 'Sample Steel Building',
-            'engineer': 'Design Engineer'
-        }
-    )
-    
-    generator.add_member(member1)
-    generator.add_member(member2)
-    
-    return generator.generate_full_report()
-
-
-if __name__ == "__main__":
-    # Generate demo report and save
-    html_report = demo_report()
-    
-    with open('steel_design_report_demo.html', 'w', encoding='utf-8') as f:
-        f.write(html_report)
-    
-    print("Demo report generated: steel_design_report_demo.html")
-
-# ==================== AISC CLASSIFICATION FUNCTIONS ====================
-def classify_section_flexure(df, df_mat, section, material):
-    """
-    Classify section elements for flexural design per AISC 360-16 Table B4.1b
-    Returns: dict with flange and web classifications
-    """
-    try:
-        # Get section properties
-        bf = safe_scalar(df.loc[section, 'bf [mm]'])
-        tf = safe_scalar(df.loc[section, 'tf [mm]'])
-        
-        # For web
-        if 'ho [mm]' in df.columns:
-            h = safe_scalar(df.loc[section, 'ho [mm]'])
-        else:
-            d = safe_scalar(df.loc[section, 'd [mm]'])
-            h = d - 2 * tf
-        
-        tw = safe_scalar(df.loc[section, 'tw [mm]'])
-        
-        # Material properties
-        Fy = safe_scalar(df_mat.loc[material, "Yield Point (ksc)"])
-        E = safe_scalar(df_mat.loc[material, "E"])
-        
-        # Flange slenderness (AISC Table B4.1b Case 10 - Flanges of I-sections)
-        lambda_f = (bf / 2.0) / tf
-        lambda_pf = 0.38 * safe_sqrt(E / Fy)
-        lambda_rf = 1.0 * safe_sqrt(E / Fy)
-        
-        if lambda_f <= lambda_pf:
-            flange_class = "Compact"
-        elif lambda_f <= lambda_rf:
-            flange_class = "Non-compact"
-        else:
-            flange_class = "Slender"
-        
-        # Web slenderness (AISC Table B4.1b Case 15 - Webs in flexural compression)
-        lambda_w = h / tw
-        lambda_pw = 3.76 * safe_sqrt(E / Fy)
-        lambda_rw = 5.70 * safe_sqrt(E / Fy)
-        
-        if lambda_w <= lambda_pw:
-            web_class = "Compact"
-        elif lambda_w <= lambda_rw:
-            web_class = "Non-compact"
-        else:
-            web_class = "Slender"
-        
-        return {
-            'flange_class': flange_class,
-            'flange_lambda': lambda_f,
-            'flange_lambda_p': lambda_pf,
-            'flange_lambda_r': lambda_rf,
-            'web_class': web_class,
-            'web_lambda': lambda_w,
-            'web_lambda_p': lambda_pw,
-            'web_lambda_r': lambda_rw
-        }
-        
-    except Exception as e:
-        st.error(f"Error in flexural classification: {e}")
-        return None
-
-def classify_section_compression(df, df_mat, section, material):
-    """
-    Classify section elements for compression design per AISC 360-16 Table B4.1a
-    Returns: dict with overall classification
-    """
-    try:
-        # Get section properties
-        bf = safe_scalar(df.loc[section, 'bf [mm]'])
-        tf = safe_scalar(df.loc[section, 'tf [mm]'])
-        
-        d = safe_scalar(df.loc[section, 'd [mm]'])
-        tw = safe_scalar(df.loc[section, 'tw [mm]'])
-        h = d - 2 * tf
-        
-        # Material properties
-        Fy = safe_scalar(df_mat.loc[material, "Yield Point (ksc)"])
-        E = safe_scalar(df_mat.loc[material, "E"])
-        
-        # Flange slenderness (AISC Table B4.1a Case 1 - Flanges of I-sections)
-        lambda_f = (bf / 2.0) / tf
-        lambda_r_flange = 0.56 * safe_sqrt(E / Fy)
-        
-        # Web slenderness (AISC Table B4.1a Case 5 - Webs of doubly symmetric I-sections)
-        lambda_w = h / tw
-        lambda_r_web = 1.49 * safe_sqrt(E / Fy)
-        
-        flange_slender = lambda_f > lambda_r_flange
-        web_slender = lambda_w > lambda_r_web
-        
-        if flange_slender or web_slender:
-            overall_class = "Slender"
-            limiting_element = []
-            if flange_slender:
-                limiting_element.append("Flange")
-            if web_slender:
-                limiting_element.append("Web")
-            limiting = " & ".join(limiting_element)
-        else:
-            overall_class = "Non-slender"
-            limiting = "N/A"
-        
-        return {
-            'overall_class': overall_class,
-            'limiting_element': limiting,
-            'flange_lambda': lambda_f,
-            'flange_lambda_r': lambda_r_flange,
-            'flange_slender': flange_slender,
-            'web_lambda': lambda_w,
-            'web_lambda_r': lambda_r_web,
-            'web_slender': web_slender
-        }
-        
-    except Exception as e:
-        st.error(f"Error in compression classification: {e}")
-        return None
-
-def generate_excel_report(df, df_mat, section, material, analysis_results, design_params):
-    """Generate comprehensive Excel calculation report with formatting"""
-    if not EXCEL_AVAILABLE:
-        return None
-    
-    buffer = BytesIO()
-    wb = Workbook()
-    
-    # Define styles
-    header_fill = PatternFill(start_color="667EEA", end_color="667EEA", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF", size=12)
-    title_font = Font(bold=True, size=16, color="667EEA")
-    subtitle_font = Font(bold=True, size=14, color="2c3e50")
-    center_align = Alignment(horizontal="center", vertical="center")
-    left_align = Alignment(horizontal="left", vertical="center")
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # Compact/Non-compact fill colors
-    compact_fill = PatternFill(start_color="C8E6C9", end_color="C8E6C9", fill_type="solid")
-    noncompact_fill = PatternFill(start_color="FFF9C4", end_color="FFF9C4", fill_type="solid")
-    slender_fill = PatternFill(start_color="FFCDD2", end_color="FFCDD2", fill_type="solid")
-    
-    # Get classifications
-    flex_class = classify_section_flexure(df, df_mat, section, material)
-    comp_class = classify_section_compression(df, df_mat, section, material)
-    
-    # Sheet 1: Summary
-    ws_summary = wb.active
-    ws_summary.title = "Design Summary"
-    
-    # Title
-    ws_summary['A1'] = "AISC 360-16 STEEL DESIGN CALCULATION REPORT"
-    ws_summary['A1'].font = title_font
-    ws_summary['A1'].alignment = center_align
-    ws_summary.merge_cells('A1:D1')
-    
-    # Header Info
-    row = 3
-    ws_summary[f'A{row}'] = "Report Generated:"
-    ws_summary[f'B{row}'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    row += 1
-    ws_summary[f'A{row}'] = "Section:"
-    ws_summary[f'B{row}'] = section
-    row += 1
-    ws_summary[f'A{row}'] = "Material Grade:"
-    ws_summary[f'B{row}'] = material
-    
-    # Format header
-    for r in range(3, 6):
-        ws_summary[f'A{r}'].font = Font(bold=True)
-        ws_summary[f'A{r}'].fill = PatternFill(start_color="E3F2FD", end_color="E3F2FD", fill_type="solid")
-    
-    # Material Properties
-    row = 8
-    ws_summary[f'A{row}'] = "MATERIAL PROPERTIES"
-    ws_summary[f'A{row}'].font = subtitle_font
-    ws_summary.merge_cells(f'A{row}:C{row}')
-    
-    row += 1
-    headers = ['Property', 'Value', 'Unit']
-    for col, header in enumerate(headers, start=1):
-        cell = ws_summary.cell(row=row, column=col)
-        cell.value = header
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = center_align
-        cell.border = border
-    
-    Fy = safe_scalar(df_mat.loc[material, "Yield Point (ksc)"])
-    Fu = safe_scalar(df_mat.loc[material, "Tensile Strength (ksc)"])
-    E = safe_scalar(df_mat.loc[material, "E"])
-    
-    mat_props = [
-        ['Yield Strength (Fy)', f'{Fy:.1f}', 'kgf/cm²'],
-        ['Tensile Strength (Fu)', f'{Fu:.1f}', 'kgf/cm²'],
-        ['Modulus of Elasticity (E)', f'{E:.0f}', 'kgf/cm²']
-    ]
-    
-    for prop_row in mat_props:
-        row += 1
-        for col, value in enumerate(prop_row, start=1):
-            cell = ws_summary.cell(row=row, column=col)
-            cell.value = value
-            cell.border = border
-            cell.alignment = center_align if col > 1 else left_align
-    
-    # ========== COMPREHENSIVE SECTION PROPERTIES ==========
-    row += 3
-    ws_summary[f'A{row}'] = "COMPLETE SECTION PROPERTIES"
-    ws_summary[f'A{row}'].font = subtitle_font
-    ws_summary.merge_cells(f'A{row}:C{row}')
-    
-    row += 1
-    for col, header in enumerate(headers, start=1):
-        cell = ws_summary.cell(row=row, column=col)
-        cell.value = header
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = center_align
-        cell.border = border
-    
-    # Comprehensive property list
-    property_list = [
-        ('d [mm]', 'Overall Depth'),
-        ('bf [mm]', 'Flange Width'),
-        ('tw [mm]', 'Web Thickness'),
-        ('tf [mm]', 'Flange Thickness'),
-        ('r [mm]', 'Fillet Radius'),
-        ('A [cm2]', 'Cross-sectional Area'),
-        ('Ix [cm4]', 'Moment of Inertia X-axis'),
-        ('Iy [cm4]', 'Moment of Inertia Y-axis'),
-        ('rx [cm]', 'Radius of Gyration X-axis'),
-        ('ry [cm]', 'Radius of Gyration Y-axis'),
-        ('Sx [cm3]', 'Elastic Section Modulus X'),
-        ('Sy [cm3]', 'Elastic Section Modulus Y'),
-        ('Zx [cm3]', 'Plastic Section Modulus X'),
-        ('Zy [cm3]', 'Plastic Section Modulus Y'),
-        ('h/tw', 'Web Slenderness Ratio'),
-        ('0.5bf/tf', 'Flange Slenderness Ratio'),
-        ('ho [mm]', 'Distance Between Flange Centroids'),
-        ('j [cm4]', 'Torsional Constant'),
-        ('cw [10^6 cm6]', 'Warping Constant'),
-        ('rts [cm6]', 'Effective Radius'),
-        ('Lp [cm]', 'Limiting Length for Plastic'),
-        ('Lr [cm]', 'Limiting Length for Inelastic LTB')
-    ]
-    
-    weight_col = 'Unit Weight [kg/m]' if 'Unit Weight [kg/m]' in df.columns else 'w [kg/m]'
-    if weight_col in df.columns:
-        weight = safe_scalar(df.loc[section, weight_col])
-        row += 1
-        ws_summary[f'A{row}'] = "Unit Weight"
-        ws_summary[f'B{row}'] = f'{weight:.2f}'
-        ws_summary[f'C{row}'] = 'kg/m'
-        for col in range(1, 4):
-            cell = ws_summary.cell(row=row, column=col)
-            cell.border = border
-            cell.alignment = center_align if col > 1 else left_align
-    
-    for prop_key, prop_description in property_list:
-        if prop_key in df.columns:
-            row += 1
-            value = safe_scalar(df.loc[section, prop_key])
-            unit = prop_key.split('[')[1].replace(']', '') if '[' in prop_key else ''
-            
-            ws_summary[f'A{row}'] = prop_description
-            ws_summary[f'B{row}'] = f'{value:.3f}' if value < 100 else f'{value:.2f}'
-            ws_summary[f'C{row}'] = unit
-            
-            for col in range(1, 4):
-                cell = ws_summary.cell(row=row, column=col)
-                cell.border = border
-                cell.alignment = center_align if col > 1 else left_align
-    
-    # ========== FLEXURAL CLASSIFICATION ==========
-    if flex_class:
-        row += 3
-        ws_summary[f'A{row}'] = "FLEXURAL MEMBER CLASSIFICATION (AISC Table B4.1b)"
-        ws_summary[f'A{row}'].font = subtitle_font
-        ws_summary.merge_cells(f'A{row}:C{row}')
-        
-        row += 1
-        ws_summary[f'A{row}'] = "Element"
-        ws_summary[f'B{row}'] = "Classification"
-        ws_summary[f'C{row}'] = "Details"
-        for col in range(1, 4):
-            cell = ws_summary.cell(row=row, column=col)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = border
-        
-        # Flange classification
-        row += 1
-        ws_summary[f'A{row}'] = "Flange"
-        ws_summary[f'B{row}'] = flex_class['flange_class']
-        ws_summary[f'C{row}'] = f"λ={flex_class['flange_lambda']:.2f}, λp={flex_class['flange_lambda_p']:.2f}, λr={flex_class['flange_lambda_r']:.2f}"
-        
-        for col in range(1, 4):
-            cell = ws_summary.cell(row=row, column=col)
-            cell.border = border
-            cell.alignment = center_align if col > 1 else left_align
-            
-            if col == 2:  # Classification column
-                if flex_class['flange_class'] == "Compact":
-                    cell.fill = compact_fill
-                    cell.font = Font(bold=True, color="2E7D32")
-                elif flex_class['flange_class'] == "Non-compact":
-                    cell.fill = noncompact_fill
-                    cell.font = Font(bold=True, color="F57C00")
-                else:
-                    cell.fill = slender_fill
-                    cell.font = Font(bold=True, color="C62828")
-        
-        # Web classification
-        row += 1
-        ws_summary[f'A{row}'] = "Web"
-        ws_summary[f'B{row}'] = flex_class['web_class']
-        ws_summary[f'C{row}'] = f"λ={flex_class['web_lambda']:.2f}, λp={flex_class['web_lambda_p']:.2f}, λr={flex_class['web_lambda_r']:.2f}"
-        
-        for col in range(1, 4):
-            cell = ws_summary.cell(row=row, column=col)
-            cell.border = border
-            cell.alignment = center_align if col > 1 else left_align
-            
-            if col == 2:  # Classification column
-                if flex_class['web_class'] == "Compact":
-                    cell.fill = compact_fill
-                    cell.font = Font(bold=True, color="2E7D32")
-                elif flex_class['web_class'] == "Non-compact":
-                    cell.fill = noncompact_fill
-                    cell.font = Font(bold=True, color="F57C00")
-                else:
-                    cell.fill = slender_fill
-                    cell.font = Font(bold=True, color="C62828")
-    
-    # ========== COMPRESSION CLASSIFICATION ==========
-    if comp_class:
-        row += 3
-        ws_summary[f'A{row}'] = "COMPRESSION MEMBER CLASSIFICATION (AISC Table B4.1a)"
-        ws_summary[f'A{row}'].font = subtitle_font
-        ws_summary.merge_cells(f'A{row}:C{row}')
-        
-        row += 1
-        ws_summary[f'A{row}'] = "Element"
-        ws_summary[f'B{row}'] = "Classification"
-        ws_summary[f'C{row}'] = "Details"
-        for col in range(1, 4):
-            cell = ws_summary.cell(row=row, column=col)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = border
-        
-        # Overall classification
-        row += 1
-        ws_summary[f'A{row}'] = "Overall Section"
-        ws_summary[f'B{row}'] = comp_class['overall_class']
-        
-        if comp_class['overall_class'] == "Slender":
-            ws_summary[f'C{row}'] = f"Limiting: {comp_class['limiting_element']}"
-        else:
-            ws_summary[f'C{row}'] = "All elements within limits"
-        
-        for col in range(1, 4):
-            cell = ws_summary.cell(row=row, column=col)
-            cell.border = border
-            cell.alignment = center_align if col > 1 else left_align
-            
-            if col == 2:  # Classification column
-                if comp_class['overall_class'] == "Non-slender":
-                    cell.fill = compact_fill
-                    cell.font = Font(bold=True, color="2E7D32")
-                else:
-                    cell.fill = slender_fill
-                    cell.font = Font(bold=True, color="C62828")
-        
-        # Flange details
-        row += 1
-        ws_summary[f'A{row}'] = "Flange"
-        ws_summary[f'B{row}'] = "Slender" if comp_class['flange_slender'] else "Non-slender"
-        ws_summary[f'C{row}'] = f"λ={comp_class['flange_lambda']:.2f}, λr={comp_class['flange_lambda_r']:.2f}"
-        
-        for col in range(1, 4):
-            cell = ws_summary.cell(row=row, column=col)
-            cell.border = border
-            cell.alignment = center_align if col > 1 else left_align
-        
-        # Web details
-        row += 1
-        ws_summary[f'A{row}'] = "Web"
-        ws_summary[f'B{row}'] = "Slender" if comp_class['web_slender'] else "Non-slender"
-        ws_summary[f'C{row}'] = f"λ={comp_class['web_lambda']:.2f}, λr={comp_class['web_lambda_r']:.2f}"
-        
-        for col in range(1, 4):
-            cell = ws_summary.cell(row=row, column=col)
-            cell.border = border
-            cell.alignment = center_align if col > 1 else left_align
-    
-    # Auto-size columns for Summary sheet
-    try:
-        for col_idx in range(1, ws_summary.max_column + 1):
-            column_letter = get_column_letter(col_idx)
-            max_length = 0
-            for row_idx in range(1, ws_summary.max_row + 1):
-                cell = ws_summary.cell(row=row_idx, column=col_idx)
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except Exception:
-                    pass
-            adjusted_width = min(max_length + 2, 60)
-            ws_summary.column_dimensions[column_letter].width = adjusted_width
-    except Exception:
-        ws_summary.column_dimensions['A'].width = 40
-        ws_summary.column_dimensions['B'].width = 25
-        ws_summary.column_dimensions['C'].width = 30
-        ws_summary.column_dimensions['D'].width = 15
-    
-    # Sheet 2: Analysis Results
-    if analysis_results:
-        ws_results = wb.create_sheet("Analysis Results")
-        
-        row = 1
-        ws_results['A1'] = "DESIGN ANALYSIS RESULTS"
-        ws_results['A1'].font = title_font
-        ws_results.merge_cells('A1:D1')
-        
-        # Flexural Analysis
-        if 'flexural' in analysis_results:
-            row = 3
-            ws_results[f'A{row}'] = "FLEXURAL ANALYSIS (AISC F2)"
-            ws_results[f'A{row}'].font = subtitle_font
-            ws_results.merge_cells(f'A{row}:B{row}')
-            
-            row += 1
-            ws_results[f'A{row}'] = "Parameter"
-            ws_results[f'B{row}'] = "Value"
-            for col in range(1, 3):
-                cell = ws_results.cell(row=row, column=col)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center_align
-                cell.border = border
-            
-            flex_data = [
-                ['Design Moment (φMn)', f"{analysis_results['flexural']['phi_Mn']:.2f} t·m"],
-                ['Nominal Moment (Mn)', f"{analysis_results['flexural']['Mn']:.2f} t·m"],
-                ['Plastic Moment (Mp)', f"{analysis_results['flexural']['Mp']:.2f} t·m"],
-                ['Critical Length (Lp)', f"{analysis_results['flexural']['Lp']:.3f} m"],
-                ['Critical Length (Lr)', f"{analysis_results['flexural']['Lr']:.3f} m"],
-                ['Design Case', analysis_results['flexural']['case']],
-                ['Design Zone', analysis_results['flexural']['zone']],
-                ['Utilization Ratio', f"{analysis_results['flexural']['ratio']:.3f}"],
-                ['Status', '✓ ADEQUATE' if analysis_results['flexural']['adequate'] else '✗ INADEQUATE']
-            ]
-            
-            for data_row in flex_data:
-                row += 1
-                ws_results[f'A{row}'] = data_row[0]
-                ws_results[f'B{row}'] = data_row[1]
-                for col in range(1, 3):
-                    cell = ws_results.cell(row=row, column=col)
-                    cell.border = border
-                    cell.alignment = left_align if col == 1 else center_align
-                    
-                    # Color code status
-                    if col == 2 and data_row[0] == 'Status':
-                        if '✓' in str(data_row[1]):
-                            cell.fill = compact_fill
-                            cell.font = Font(bold=True, color="2E7D32")
-                        else:
-                            cell.fill = slender_fill
-                            cell.font = Font(bold=True, color="C62828")
-        
-        # Compression Analysis
-        if 'compression' in analysis_results:
-            row += 3
-            ws_results[f'A{row}'] = "COMPRESSION ANALYSIS (AISC E3)"
-            ws_results[f'A{row}'].font = subtitle_font
-            ws_results.merge_cells(f'A{row}:B{row}')
-            
-            row += 1
-            ws_results[f'A{row}'] = "Parameter"
-            ws_results[f'B{row}'] = "Value"
-            for col in range(1, 3):
-                cell = ws_results.cell(row=row, column=col)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center_align
-                cell.border = border
-            
-            comp_data = [
-                ['Design Strength (φPn)', f"{analysis_results['compression']['phi_Pn']:.2f} tons"],
-                ['Nominal Strength (Pn)', f"{analysis_results['compression']['Pn']:.2f} tons"],
-                ['Critical Stress (Fcr)', f"{analysis_results['compression']['Fcr']:.1f} kgf/cm²"],
-                ['Slenderness Ratio (λc)', f"{analysis_results['compression']['lambda_c']:.1f}"],
-                ['Buckling Mode', analysis_results['compression']['mode']],
-                ['Utilization Ratio', f"{analysis_results['compression']['ratio']:.3f}"],
-                ['Status', '✓ ADEQUATE' if analysis_results['compression']['adequate'] else '✗ INADEQUATE']
-            ]
-            
-            for data_row in comp_data:
-                row += 1
-                ws_results[f'A{row}'] = data_row[0]
-                ws_results[f'B{row}'] = data_row[1]
-                for col in range(1, 3):
-                    cell = ws_results.cell(row=row, column=col)
-                    cell.border = border
-                    cell.alignment = left_align if col == 1 else center_align
-                    
-                    # Color code status
-                    if col == 2 and data_row[0] == 'Status':
-                        if '✓' in str(data_row[1]):
-                            cell.fill = compact_fill
-                            cell.font = Font(bold=True, color="2E7D32")
-                        else:
-                            cell.fill = slender_fill
-                            cell.font = Font(bold=True, color="C62828")
-        
-        # Design Parameters Sheet
-        ws_params = wb.create_sheet("Design Parameters")
-        
-        row = 1
-        ws_params['A1'] = "DESIGN INPUT PARAMETERS"
-        ws_params['A1'].font = title_font
-        ws_params.merge_cells('A1:B1')
-        
-        row = 3
-        ws_params[f'A{row}'] = "Parameter"
-        ws_params[f'B{row}'] = "Value"
-        for col in range(1, 3):
-            cell = ws_params.cell(row=row, column=col)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = border
-        
-        if design_params:
-            param_data = []
-            if 'Mu' in design_params:
-                param_data.append(['Applied Moment (Mu)', f"{design_params['Mu']:.2f} t·m"])
-            if 'Pu' in design_params:
-                param_data.append(['Applied Axial Load (Pu)', f"{design_params['Pu']:.2f} tons"])
-            if 'Lb' in design_params:
-                param_data.append(['Unbraced Length (Lb)', f"{design_params['Lb']:.2f} m"])
-            if 'KL' in design_params:
-                param_data.append(['Effective Length (KL)', f"{design_params['KL']:.2f} m"])
-            if 'KLx' in design_params:
-                param_data.append(['Effective Length X (KLx)', f"{design_params['KLx']:.2f} m"])
-            if 'KLy' in design_params:
-                param_data.append(['Effective Length Y (KLy)', f"{design_params['KLy']:.2f} m"])
-            if 'Cb' in design_params:
-                param_data.append(['Moment Gradient Factor (Cb)', f"{design_params['Cb']:.2f}"])
-            
-            for data_row in param_data:
-                row += 1
-                ws_params[f'A{row}'] = data_row[0]
-                ws_params[f'B{row}'] = data_row[1]
-                for col in range(1, 3):
-                    cell = ws_params.cell(row=row, column=col)
-                    cell.border = border
-                    cell.alignment = left_align if col == 1 else center_align
-        
-        # Auto-size columns for all sheets
-        for ws in [ws_results, ws_params]:
-            try:
-                for col_idx in range(1, ws.max_column + 1):
-                    column_letter = get_column_letter(col_idx)
-                    max_length = 0
-                    for row_idx in range(1, ws.max_row + 1):
-                        cell = ws.cell(row=row_idx, column=col_idx)
-                        try:
-                            if cell.value:
-                                max_length = max(max_length, len(str(cell.value)))
-                        except Exception:
-                            pass
-                    adjusted_width = min(max_length + 2, 60)
-                    ws.column_dimensions[column_letter].width = adjusted_width
-            except Exception:
-                ws.column_dimensions['A'].width = 40
-                ws.column_dimensions['B'].width = 30
-    
-    # Save to buffer
-    wb.save(buffer)
-    buffer.seek(0)
-    return buffer
-def generate_calculation_report(df, df_mat, section, material, analysis_results, design_params, project_info):
-    """
-    Generate engineering calculation report with:
-    - Project information header
-    - Hand calculation style (detailed step-by-step)
-    - Summary tables
-    - Graphs/Charts
-    - formatting
-    """
-    if not PDF_AVAILABLE:
-        return None
-    
-    buffer = BytesIO()
-    
-    # Create document
-    doc = BaseDocTemplate(
-        buffer, 
-        pagesize=A4,
-        rightMargin=0.6*inch, 
-        leftMargin=0.6*inch,
-        topMargin=1.2*inch,
-        bottomMargin=0.8*inch,
-        title="AISC 360-16 Structural Calculation"
-    )
-    
-    # Define frame
-    frame = Frame(
-        doc.leftMargin, 
-        doc.bottomMargin, 
-        doc.width, 
-        doc.height - 0.2*inch,
-        id='normal',
-        topPadding=10,
-        bottomPadding=10
-    )
-    template = PageTemplate(id='main', frames=frame, onPage=lambda c, d: None)
-    doc.addPageTemplates([template])
-    
-    story = []
-    styles = getSampleStyleSheet()
-    page_width = doc.width
-    
-    # ==================== CUSTOM STYLES ====================
-    title_style = ParagraphStyle(
-        'CalcTitle',
-        parent=styles['Heading1'],
-        fontSize=15,
-        textColor=rl_colors.HexColor('#263238'),
-        spaceAfter=8,
-        spaceBefore=6,
-        alignment=TA_LEFT,
-        fontName='Helvetica-Bold',
-        leading=18
-    )
-    
-    heading1_style = ParagraphStyle(
-        'CalcHeading1',
-        parent=styles['Heading1'],
-        fontSize=11,
-        textColor=rl_colors.HexColor('#263238'),
-        spaceAfter=8,
-        spaceBefore=14,
-        fontName='Helvetica-Bold',
-        backColor=rl_colors.HexColor('#eceff1'),
-        borderPadding=6,
-        borderWidth=0.5,
-        borderColor=rl_colors.HexColor('#b0bec5'),
-        leading=14
-    )
-    
-    heading2_style = ParagraphStyle(
-        'CalcHeading2',
-        parent=styles['Heading2'],
-        fontSize=10,
-        textColor=rl_colors.HexColor('#37474f'),
-        spaceAfter=6,
-        spaceBefore=10,
-        fontName='Helvetica-Bold',
-        borderWidth=0,
-        borderColor=rl_colors.HexColor('#90a4ae'),
-        borderPadding=4,
-        leading=13
-    )
-    
-    body_style = ParagraphStyle(
-        'CalcBody',
-        parent=styles['Normal'],
-        fontSize=10,
-        leading=13,
-        spaceAfter=4,
-        spaceBefore=2,
-        alignment=TA_LEFT,
-        wordWrap='CJK'
-    )
-    
-    equation_style = ParagraphStyle(
-        'CalcEquation',
-        parent=styles['Code'],
-        fontSize=10,
-        textColor=rl_colors.HexColor('#263238'),
-        backColor=rl_colors.HexColor('#f5f5f5'),
-        borderWidth=0.6,
-        borderColor=rl_colors.HexColor('#b0bec5'),
-        borderPadding=10,
-        leftIndent=20,
-        rightIndent=20,
-        spaceAfter=8,
-        spaceBefore=6,
-        fontName='Courier',
-        leading=14,
-        alignment=TA_CENTER,
-        wordWrap='CJK'
-    )
-    
-    result_style = ParagraphStyle(
-        'CalcResult',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=rl_colors.HexColor('#1b5e20'),
-        backColor=rl_colors.HexColor('#e8f5e9'),
-        borderWidth=2,
-        borderColor=rl_colors.HexColor('#4caf50'),
-        borderPadding=10,
-        spaceAfter=10,
-        spaceBefore=6,
-        fontName='Helvetica-Bold',
-        leading=16,
-        alignment=TA_CENTER
-    )
-    
-    reference_style = ParagraphStyle(
-        'CalcReference',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=rl_colors.HexColor('#616161'),
-        fontName='Helvetica-Oblique',
-        leading=12,
-        leftIndent=30,
-        wordWrap='CJK'
-    )
-
-    table_cell_style = ParagraphStyle(
-        'CalcTableCell',
-        parent=body_style,
-        fontSize=9,
-        leading=11,
-        spaceAfter=0,
-        spaceBefore=0,
-        wordWrap='CJK'
-    )
-
-    def _cell(val):
-        return Paragraph(str(val), table_cell_style)
-    
-    # ==================== PROJECT HEADER TABLE (MIDAS GEN STYLE) ====================
-    story.append(Spacer(1, 0.1*inch))
-    story.append(Paragraph("MIDAS GEN - STRUCTURAL DESIGN CALCULATION SHEET", title_style))
-    story.append(Spacer(1, 0.05*inch))
-    
-    # Project info table (engineering header)
-    header_data = [
-        [Paragraph('<b>STRUCTURAL CALCULATION SHEET</b>', 
-                  ParagraphStyle('header', fontSize=14, alignment=TA_CENTER, textColor=rl_colors.white)),
-         '', '', ''],
-        ['Project:', project_info.get('project_name', 'N/A'), 
-         'Project No.:', project_info.get('project_no', 'N/A')],
-        ['Subject:', f'Steel Design - {section}', 
-         'Date:', project_info.get('date', datetime.now().strftime('%Y-%m-%d'))],
-        ['Designer:', project_info.get('designer', 'N/A'), 
-         'Checker:', project_info.get('checker', 'N/A')],
-        ['Reference:', 'AISC 360-16', 
-         'Revision:', project_info.get('revision', '0')],
-    ]
-    for r in range(1, len(header_data)):
-        for c in range(4):
-            header_data[r][c] = _cell(header_data[r][c])
-    
-    header_table = Table(header_data, colWidths=[1.2*inch, page_width - 4.2*inch, 1.0*inch, 2.0*inch])
-    header_table.setStyle(TableStyle([
-        # Title row
-        ('SPAN', (0, 0), (-1, 0)),
-        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#455a64')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('TOPPADDING', (0, 0), (-1, 0), 12),
-        
-        # Data rows
-        ('BACKGROUND', (0, 1), (0, -1), rl_colors.HexColor('#e8eaf6')),
-        ('BACKGROUND', (2, 1), (2, -1), rl_colors.HexColor('#e8eaf6')),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 1), (2, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('WORDWRAP', (0, 0), (-1, -1), 'CJK'),
-        ('GRID', (0, 0), (-1, -1), 0.6, rl_colors.HexColor('#78909c')),
-    ]))
-    story.append(header_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # ==================== TABLE OF CONTENTS ====================
-    story.append(Paragraph("TABLE OF CONTENTS", heading1_style))
-    story.append(Spacer(1, 6))
-    
-    toc_data = [
-        ['1.', 'Design Data & Material Properties', ''],
-        ['2.', 'Section Properties', ''],
-        ['3.', 'Section Classification (AISC Table B4.1)', ''],
-        ['4.', 'Flexural Design (AISC Chapter F2)', ''],
-        ['5.', 'Compression Design (AISC Chapter E3)', ''],
-        ['6.', 'Design Summary & Conclusion', ''],
-    ]
-    toc_data = [[_cell(r[0]), _cell(r[1]), _cell(r[2])] for r in toc_data]
-    
-    toc_table = Table(toc_data, colWidths=[0.5*inch, page_width - 1.5*inch, 1*inch])
-    toc_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-    ]))
-    story.append(toc_table)
-    story.append(Spacer(1, 0.15*inch))
-    
-    # ==================== 1. DESIGN DATA ====================
-    story.append(Paragraph("1. DESIGN DATA & MATERIAL PROPERTIES", heading1_style))
-    story.append(Spacer(1, 8))
-    
-    # Get material properties
-    Fy = safe_scalar(df_mat.loc[material, "Yield Point (ksc)"])
-    Fu = safe_scalar(df_mat.loc[material, "Tensile Strength (ksc)"])
-    E = safe_scalar(df_mat.loc[material, "E"])
-    
-    story.append(Paragraph("<b>1.1 Material Properties</b>", heading2_style))
-    story.append(Paragraph(f"Steel Grade: <b>{material}</b>", body_style))
-    story.append(Spacer(1, 4))
-    
-    mat_table_data = [
-        ['Property', 'Symbol', 'Value', 'Unit'],
-        ['Yield Strength', 'Fy', f'{Fy:.1f}', 'kgf/cm²'],
-        ['Tensile Strength', 'Fu', f'{Fu:.1f}', 'kgf/cm²'],
-        ['Modulus of Elasticity', 'E', f'{E:,.0f}', 'kgf/cm²'],
-        ['Poisson\'s Ratio', 'ν', '0.30', '-'],
-        ['Shear Modulus', 'G', f'{E/(2*1.3):,.0f}', 'kgf/cm²'],
-    ]
-    for r in range(1, len(mat_table_data)):
-        for c in range(4):
-            mat_table_data[r][c] = _cell(mat_table_data[r][c])
-    
-    mat_table = Table(mat_table_data, colWidths=[2.2*inch, 0.9*inch, 1.5*inch, page_width - 4.6*inch])
-    mat_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#607d8b')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('WORDWRAP', (0, 0), (-1, -1), 'CJK'),
-        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#f5f7f8')])
-    ]))
-    story.append(mat_table)
-    story.append(Spacer(1, 10))
-    
-    # Design Parameters
-    story.append(Paragraph("<b>1.2 Design Parameters (Input)</b>", heading2_style))
-    
-    design_table_data = [['Parameter', 'Symbol', 'Value', 'Unit']]
-    
-    if 'Mu' in design_params:
-        design_table_data.append(['Required Moment Strength', 'Mu', f"{design_params['Mu']:.2f}", 't·m'])
-    if 'Pu' in design_params:
-        design_table_data.append(['Required Axial Strength', 'Pu', f"{design_params['Pu']:.2f}", 'tons'])
-    if 'Lb' in design_params:
-        design_table_data.append(['Unbraced Length', 'Lb', f"{design_params['Lb']:.2f}", 'm'])
-    if 'KL' in design_params:
-        design_table_data.append(['Effective Length', 'KL', f"{design_params['KL']:.2f}", 'm'])
-    if 'Cb' in design_params:
-        design_table_data.append(['Moment Gradient Factor', 'Cb', f"{design_params['Cb']:.2f}", '-'])
-    for r in range(1, len(design_table_data)):
-        for c in range(4):
-            design_table_data[r][c] = _cell(design_table_data[r][c])
-    
-    design_table = Table(design_table_data, colWidths=[2.2*inch, 0.9*inch, 1.5*inch, page_width - 4.6*inch])
-    design_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#546e7a')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('WORDWRAP', (0, 0), (-1, -1), 'CJK'),
-        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.HexColor('#90a4ae')),
-    ]))
-    story.append(design_table)
-    
-    # ==================== 2. SECTION PROPERTIES ====================
-    story.append(Paragraph("2. SECTION PROPERTIES", heading1_style))
-    story.append(Spacer(1, 8))
-    
-    story.append(Paragraph(f"<b>Selected Section: {section}</b>", heading2_style))
-    story.append(Spacer(1, 4))
-    
-    # Get all section properties
-    d = safe_scalar(df.loc[section, 'd [mm]'])
-    bf = safe_scalar(df.loc[section, 'bf [mm]'])
-    tf = safe_scalar(df.loc[section, 'tf [mm]'])
-    tw = safe_scalar(df.loc[section, 'tw [mm]'])
-    r = safe_scalar(df.loc[section, 'r [mm]']) if 'r [mm]' in df.columns else 0
-    A = safe_scalar(df.loc[section, 'A [cm2]'])
-    Ix = safe_scalar(df.loc[section, 'Ix [cm4]'])
-    Iy = safe_scalar(df.loc[section, 'Iy [cm4]'])
-    rx = safe_scalar(df.loc[section, 'rx [cm]'])
-    ry = safe_scalar(df.loc[section, 'ry [cm]'])
-    Sx = safe_scalar(df.loc[section, 'Sx [cm3]'])
-    Sy = safe_scalar(df.loc[section, 'Sy [cm3]'])
-    Zx_val = safe_scalar(df.loc[section, 'Zx [cm3]'])
-    Zy_val = safe_scalar(df.loc[section, 'Zy [cm3]'])
-    J = safe_scalar(df.loc[section, 'j [cm4]']) if 'j [cm4]' in df.columns else 1.0
-    ho = safe_scalar(df.loc[section, 'ho [mm]']) if 'ho [mm]' in df.columns else (d - tf)
-    rts = safe_scalar(df.loc[section, 'rts [cm]']) if 'rts [cm]' in df.columns else ry * 1.2
-    
-    weight_col = 'Unit Weight [kg/m]' if 'Unit Weight [kg/m]' in df.columns else 'w [kg/m]'
-    weight = safe_scalar(df.loc[section, weight_col])
-    
-    # Section properties in two columns
-    props_data_1 = [
-        ['Geometric Properties', '', ''],
-        ['Overall Depth', 'd', f'{d:.0f} mm'],
-        ['Flange Width', 'bf', f'{bf:.0f} mm'],
-        ['Flange Thickness', 'tf', f'{tf:.1f} mm'],
-        ['Web Thickness', 'tw', f'{tw:.1f} mm'],
-        ['Fillet Radius', 'r', f'{r:.1f} mm'],
-        ['Unit Weight', 'w', f'{weight:.1f} kg/m'],
-    ]
-    
-    props_data_2 = [
-        ['Section Properties', '', ''],
-        ['Cross-sectional Area', 'A', f'{A:.2f} cm²'],
-        ['Moment of Inertia (x)', 'Ix', f'{Ix:,.0f} cm⁴'],
-        ['Moment of Inertia (y)', 'Iy', f'{Iy:,.0f} cm⁴'],
-        ['Radius of Gyration (x)', 'rx', f'{rx:.2f} cm'],
-        ['Radius of Gyration (y)', 'ry', f'{ry:.2f} cm'],
-        ['Torsional Constant', 'J', f'{J:.2f} cm⁴'],
-    ]
-    
-    props_data_3 = [
-        ['Section Moduli', '', ''],
-        ['Elastic Modulus (x)', 'Sx', f'{Sx:,.1f} cm³'],
-        ['Elastic Modulus (y)', 'Sy', f'{Sy:,.1f} cm³'],
-        ['Plastic Modulus (x)', 'Zx', f'{Zx_val:,.1f} cm³'],
-        ['Plastic Modulus (y)', 'Zy', f'{Zy_val:,.1f} cm³'],
-        ['Distance b/w flanges', 'ho', f'{ho:.1f} mm'],
-        ['Effective radius (LTB)', 'rts', f'{rts:.2f} cm'],
-    ]
-    
-    # Create combined table
-    def create_props_table(data):
-        table = Table(data, colWidths=[2.0*inch, 0.8*inch, 0.5 * page_width - 2.8*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#455a64')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('SPAN', (0, 0), (-1, 0)),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('WORDWRAP', (0, 0), (-1, -1), 'CJK'),
-            ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.HexColor('#90a4ae')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#fafafa')])
-        ]))
-        return table
-    
-    # Create a combined layout
-    combined_data = [[create_props_table(props_data_1), create_props_table(props_data_2)]]
-    combined_table = Table(combined_data, colWidths=[0.5 * page_width, 0.5 * page_width])
-    combined_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 5),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-    ]))
-    story.append(combined_table)
-    story.append(Spacer(1, 8))
-    story.append(create_props_table(props_data_3))
-    
-    # Section visualization removed by request
-
-    # ==================== 3. SECTION CLASSIFICATION ====================
-    story.append(PageBreak())
-    story.append(Paragraph("3. SECTION CLASSIFICATION (AISC Table B4.1)", heading1_style))
-    story.append(Spacer(1, 8))
-    
-    # Get classifications
-    flex_class = classify_section_flexure(df, df_mat, section, material)
-    comp_class = classify_section_compression(df, df_mat, section, material)
-    
-    if flex_class:
-        story.append(Paragraph("<b>3.1 Flexural Member Classification (Table B4.1b)</b>", heading2_style))
-        story.append(Spacer(1, 4))
-        
-        # Flange Classification - Hand Calculation Style
-        story.append(Paragraph("<b>Flange Classification (Case 10: Flanges of I-shaped sections)</b>", body_style))
-        story.append(Paragraph("<i>Reference: AISC 360-16, Table B4.1b</i>", reference_style))
-        story.append(Spacer(1, 4))
-        
-        story.append(Paragraph(
-            f"<font face='Courier'>λf = bf / (2·tf) = {bf:.1f} / (2 × {tf:.1f}) = <b>{flex_class['flange_lambda']:.2f}</b></font>",
-            equation_style
-        ))
-        
-        story.append(Paragraph(
-            f"<font face='Courier'>λpf = 0.38·√(E/Fy) = 0.38 × √({E:,.0f}/{Fy:.1f}) = <b>{flex_class['flange_lambda_p']:.2f}</b></font>",
-            equation_style
-        ))
-        
-        story.append(Paragraph(
-            f"<font face='Courier'>λrf = 1.0·√(E/Fy) = 1.0 × √({E:,.0f}/{Fy:.1f}) = <b>{flex_class['flange_lambda_r']:.2f}</b></font>",
-            equation_style
-        ))
-        
-        # Classification check
-        if flex_class['flange_lambda'] <= flex_class['flange_lambda_p']:
-            check_text = f"λf = {flex_class['flange_lambda']:.2f} ≤ λpf = {flex_class['flange_lambda_p']:.2f}"
-            result_text = "FLANGE: COMPACT ✓"
-            result_color = '#4caf50'
-        elif flex_class['flange_lambda'] <= flex_class['flange_lambda_r']:
-            check_text = f"λpf = {flex_class['flange_lambda_p']:.2f} < λf = {flex_class['flange_lambda']:.2f} ≤ λrf = {flex_class['flange_lambda_r']:.2f}"
-            result_text = "FLANGE: NON-COMPACT"
-            result_color = '#ff9800'
-        else:
-            check_text = f"λf = {flex_class['flange_lambda']:.2f} > λrf = {flex_class['flange_lambda_r']:.2f}"
-            result_text = "FLANGE: SLENDER ✗"
-            result_color = '#f44336'
-        
-        story.append(Paragraph(f"<font face='Courier'>Check: {check_text}</font>", equation_style))
-        story.append(Paragraph(
-            f"<b>{result_text}</b>",
-            ParagraphStyle('FlgResult', parent=result_style, textColor=rl_colors.HexColor(result_color))
-        ))
-        story.append(Spacer(1, 10))
-        
-        # Web Classification - Hand Calculation Style
-        story.append(Paragraph("<b>Web Classification (Case 15: Webs in flexural compression)</b>", body_style))
-        story.append(Paragraph("<i>Reference: AISC 360-16, Table B4.1b</i>", reference_style))
-        story.append(Spacer(1, 4))
-        
-        h_web = ho if 'ho [mm]' in df.columns else (d - 2*tf)
-        story.append(Paragraph(
-            f"<font face='Courier'>λw = h / tw = {h_web:.1f} / {tw:.1f} = <b>{flex_class['web_lambda']:.2f}</b></font>",
-            equation_style
-        ))
-        
-        story.append(Paragraph(
-            f"<font face='Courier'>λpw = 3.76·√(E/Fy) = 3.76 × √({E:,.0f}/{Fy:.1f}) = <b>{flex_class['web_lambda_p']:.2f}</b></font>",
-            equation_style
-        ))
-        
-        story.append(Paragraph(
-            f"<font face='Courier'>λrw = 5.70·√(E/Fy) = 5.70 × √({E:,.0f}/{Fy:.1f}) = <b>{flex_class['web_lambda_r']:.2f}</b></font>",
-            equation_style
-        ))
-        
-        # Web classification check
-        if flex_class['web_lambda'] <= flex_class['web_lambda_p']:
-            check_text = f"λw = {flex_class['web_lambda']:.2f} ≤ λpw = {flex_class['web_lambda_p']:.2f}"
-            result_text = "WEB: COMPACT ✓"
-            result_color = '#4caf50'
-        elif flex_class['web_lambda'] <= flex_class['web_lambda_r']:
-            check_text = f"λpw = {flex_class['web_lambda_p']:.2f} < λw = {flex_class['web_lambda']:.2f} ≤ λrw = {flex_class['web_lambda_r']:.2f}"
-            result_text = "WEB: NON-COMPACT"
-            result_color = '#ff9800'
-        else:
-            check_text = f"λw = {flex_class['web_lambda']:.2f} > λrw = {flex_class['web_lambda_r']:.2f}"
-            result_text = "WEB: SLENDER ✗"
-            result_color = '#f44336'
-        
-        story.append(Paragraph(f"<font face='Courier'>Check: {check_text}</font>", equation_style))
-        story.append(Paragraph(
-            f"<b>{result_text}</b>",
-            ParagraphStyle('WebResult', parent=result_style, textColor=rl_colors.HexColor(result_color))
-        ))
-    
-    # ==================== 4. FLEXURAL DESIGN ====================
-    if analysis_results and 'flexural' in analysis_results:
-        story.append(PageBreak())
-        story.append(Paragraph("4. FLEXURAL DESIGN (AISC Chapter F2)", heading1_style))
-        story.append(Spacer(1, 8))
-        
-        flex = analysis_results['flexural']
-        Lb = design_params.get('Lb', 0)
-        Cb = design_params.get('Cb', 1.0)
-        
-        # Step 1: Plastic Moment
-        story.append(Paragraph("<b>Step 1: Calculate Plastic Moment Capacity (Mp)</b>", heading2_style))
-        story.append(Paragraph("<i>Reference: AISC 360-16, Equation F2-1</i>", reference_style))
-        story.append(Spacer(1, 4))
-        
-        Mp_kgcm = Fy * Zx_val
-        Mp_tm = Mp_kgcm / 100000
-
-        story.append(Paragraph(
-            "<font face='Courier'>Mp = Fy × Zx</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>Mp = {Fy:.1f} × {Zx_val:,.1f}</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>Mp = {Mp_kgcm:,.0f} kgf·cm = <b>{Mp_tm:.2f} t·m</b></font>",
-            equation_style
-        ))
-        story.append(Spacer(1, 8))
-        
-        # Step 2: Limiting Lengths
-        story.append(Paragraph("<b>Step 2: Calculate Limiting Laterally Unbraced Lengths</b>", heading2_style))
-        story.append(Spacer(1, 4))
-        
-        # Lp calculation
-        story.append(Paragraph("<b>Compact Limit Lp (Equation F2-5):</b>", body_style))
-        story.append(Paragraph("<i>Reference: AISC 360-16, Equation F2-5</i>", reference_style))
-        
-        Lp_cm = 1.76 * ry * math.sqrt(E / Fy)
-        story.append(Paragraph(
-            "<font face='Courier'>Lp = 1.76 × ry × √(E/Fy)</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>Lp = 1.76 × {ry:.2f} × √({E:,.0f}/{Fy:.1f})</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>Lp = {Lp_cm:.1f} cm = <b>{flex['Lp']:.3f} m</b></font>",
-            equation_style
-        ))
-        story.append(Spacer(1, 6))
-        
-        # Lr calculation
-        story.append(Paragraph("<b>Inelastic Limit Lr (Equation F2-6):</b>", body_style))
-        story.append(Paragraph("<i>Reference: AISC 360-16, Equation F2-6</i>", reference_style))
-        
-        story.append(Paragraph(
-            "<font face='Courier'>Lr = 1.95 × rts × (E/0.7Fy) × √(Jc/Sxho) × √(1 + √(1 + 6.76(0.7Fy/E)²(Sxho/Jc)²))</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>where: rts = {rts:.2f} cm, J = {J:.2f} cm⁴, ho = {ho:.1f} mm, c = 1.0</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>Lr = <b>{flex['Lr']:.3f} m</b></font>",
-            equation_style
-        ))
-        story.append(Spacer(1, 8))
-        
-        # Step 3: Determine Nominal Moment
-        story.append(Paragraph(f"<b>Step 3: Determine Nominal Moment (Lb = {Lb:.2f} m)</b>", heading2_style))
-        story.append(Spacer(1, 4))
-        
-        if Lb <= flex['Lp']:
-            story.append(Paragraph(
-                f"<font face='Courier'>Lb = {Lb:.2f} m ≤ Lp = {flex['Lp']:.3f} m</font>",
-                equation_style
-            ))
-            story.append(Paragraph("<b>→ YIELDING CONTROLS (F2.1) - LTB does not apply</b>", body_style))
-            story.append(Paragraph("<i>Reference: AISC 360-16, Equation F2-1</i>", reference_style))
-            story.append(Paragraph(
-                f"<font face='Courier'>Mn = Mp = <b>{flex['Mn']:.2f} t·m</b></font>",
-                equation_style
-            ))
-            
-        elif Lb <= flex['Lr']:
-            story.append(Paragraph(
-                f"<font face='Courier'>Lp = {flex['Lp']:.3f} m < Lb = {Lb:.2f} m ≤ Lr = {flex['Lr']:.3f} m</font>",
-                equation_style
-            ))
-            story.append(Paragraph("<b>→ INELASTIC LATERAL-TORSIONAL BUCKLING (F2.2)</b>", body_style))
-            story.append(Paragraph("<i>Reference: AISC 360-16, Equation F2-2</i>", reference_style))
-            
-            Mr = 0.7 * Fy * Sx / 100000
-            story.append(Paragraph(
-                "<font face='Courier'>Mn = Cb × [Mp - (Mp - 0.7FySx) × ((Lb-Lp)/(Lr-Lp))] ≤ Mp</font>",
-                equation_style
-            ))
-            story.append(Paragraph(
-                f"<font face='Courier'>Mn = {Cb:.2f} × [{Mp_tm:.2f} - ({Mp_tm:.2f} - {Mr:.2f}) × (({Lb:.2f}-{flex['Lp']:.3f})/({flex['Lr']:.3f}-{flex['Lp']:.3f}))]</font>",
-                equation_style
-            ))
-            story.append(Paragraph(
-                f"<font face='Courier'>Mn = <b>{flex['Mn']:.2f} t·m</b></font>",
-                equation_style
-            ))
-            
-        else:
-            story.append(Paragraph(
-                f"<font face='Courier'>Lb = {Lb:.2f} m > Lr = {flex['Lr']:.3f} m</font>",
-                equation_style
-            ))
-            story.append(Paragraph("<b>→ ELASTIC LATERAL-TORSIONAL BUCKLING (F2.3)</b>", body_style))
-            story.append(Paragraph("<i>Reference: AISC 360-16, Equations F2-3 and F2-4</i>", reference_style))
-            
-            story.append(Paragraph(
-                "<font face='Courier'>Fcr = (Cb×π²×E)/((Lb/rts)²) × √(1 + 0.078(Jc/Sxho)(Lb/rts)²)</font>",
-                equation_style
-            ))
-            story.append(Paragraph(
-                "<font face='Courier'>Mn = Fcr × Sx ≤ Mp</font>",
-                equation_style
-            ))
-            story.append(Paragraph(
-                f"<font face='Courier'>Mn = <b>{flex['Mn']:.2f} t·m</b></font>",
-                equation_style
-            ))
-        
-        story.append(Spacer(1, 8))
-        
-        # Step 4: Design Strength
-        story.append(Paragraph("<b>Step 4: Calculate Design Flexural Strength</b>", heading2_style))
-        story.append(Paragraph("<i>Reference: AISC 360-16, Section F1</i>", reference_style))
-        story.append(Spacer(1, 4))
-        
-        story.append(Paragraph(
-            "<font face='Courier'>φb = 0.90 (LRFD)</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>φbMn = 0.90 × {flex['Mn']:.2f} = <b>{flex['phi_Mn']:.2f} t·m</b></font>",
-            equation_style
-        ))
-        story.append(Spacer(1, 8))
-        
-        # Step 5: Adequacy Check
-        story.append(Paragraph("<b>Step 5: Adequacy Check</b>", heading2_style))
-        story.append(Spacer(1, 4))
-        
-        Mu = design_params.get('Mu', 0)
-        ratio = flex['ratio']
-        
-        story.append(Paragraph(
-            f"<font face='Courier'>Mu = {Mu:.2f} t·m</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>φbMn = {flex['phi_Mn']:.2f} t·m</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>Ratio = Mu / φbMn = {Mu:.2f} / {flex['phi_Mn']:.2f} = <b>{ratio:.3f}</b></font>",
-            equation_style
-        ))
-        
-        if flex['adequate']:
-            story.append(Paragraph(
-                f"<font face='Courier'>Check: {ratio:.3f} ≤ 1.0 → <b>OK ✓</b></font>",
-                equation_style
-            ))
-            story.append(Paragraph("<b>FLEXURAL DESIGN: ADEQUATE ✓</b>", result_style))
-        else:
-            story.append(Paragraph(
-                f"<font face='Courier'>Check: {ratio:.3f} > 1.0 → <b>NG ✗</b></font>",
-                equation_style
-            ))
-            story.append(Paragraph(
-                "<b>FLEXURAL DESIGN: INADEQUATE ✗</b>",
-                ParagraphStyle('FailResult', parent=result_style, 
-                              textColor=rl_colors.HexColor('#c62828'),
-                              backColor=rl_colors.HexColor('#ffebee'),
-                              borderColor=rl_colors.HexColor('#f44336'))
-            ))
-        
-    # ==================== 5. COMPRESSION DESIGN ====================
-    if analysis_results and 'compression' in analysis_results:
-        story.append(PageBreak())
-        story.append(Paragraph("5. COMPRESSION DESIGN (AISC Chapter E3)", heading1_style))
-        story.append(Spacer(1, 8))
-        
-        comp = analysis_results['compression']
-        KL = design_params.get('KL', 0)
-        
-        # Step 1: Slenderness Ratio
-        story.append(Paragraph("<b>Step 1: Calculate Slenderness Ratio</b>", heading2_style))
-        story.append(Paragraph("<i>Reference: AISC 360-16, Section E2</i>", reference_style))
-        story.append(Spacer(1, 4))
-        
-        KL_cm = KL * 100
-        lambda_x = KL_cm / rx
-        lambda_y = KL_cm / ry
-        lambda_c = max(lambda_x, lambda_y)
-        
-        story.append(Paragraph(
-            f"<font face='Courier'>KL = {KL:.2f} m = {KL_cm:.0f} cm</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>(KL/r)x = {KL_cm:.0f} / {rx:.2f} = <b>{lambda_x:.1f}</b></font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>(KL/r)y = {KL_cm:.0f} / {ry:.2f} = <b>{lambda_y:.1f}</b></font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>Governing: (KL/r)max = <b>{lambda_c:.1f}</b> {'(X-axis)' if lambda_x >= lambda_y else '(Y-axis)'}</font>",
-            equation_style
-        ))
-        
-        # Check slenderness limit
-        if lambda_c <= 200:
-            story.append(Paragraph(
-                f"<font face='Courier'>Check: {lambda_c:.1f} ≤ 200 → OK (AISC E2)</font>",
-                equation_style
-            ))
-        else:
-            story.append(Paragraph(
-                f"<font face='Courier'>Check: {lambda_c:.1f} > 200 → Exceeds preferred limit (AISC E2)</font>",
-                equation_style
-            ))
-        story.append(Spacer(1, 8))
-        
-        # Step 2: Elastic Buckling Stress
-        story.append(Paragraph("<b>Step 2: Calculate Elastic Buckling Stress (Fe)</b>", heading2_style))
-        story.append(Paragraph("<i>Reference: AISC 360-16, Equation E3-4</i>", reference_style))
-        story.append(Spacer(1, 4))
-        
-        Fe = (math.pi**2 * E) / (lambda_c**2)
-        
-        story.append(Paragraph(
-            "<font face='Courier'>Fe = π²E / (KL/r)²</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>Fe = π² × {E:,.0f} / {lambda_c:.1f}²</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>Fe = <b>{Fe:,.1f} kgf/cm²</b></font>",
-            equation_style
-        ))
-        story.append(Spacer(1, 8))
-        
-        # Step 3: Critical Stress
-        story.append(Paragraph("<b>Step 3: Determine Critical Stress (Fcr)</b>", heading2_style))
-        story.append(Spacer(1, 4))
-        
-        lambda_limit = 4.71 * math.sqrt(E / Fy)
-        
-        story.append(Paragraph(
-            f"<font face='Courier'>Limiting Slenderness = 4.71 × √(E/Fy) = 4.71 × √({E:,.0f}/{Fy:.1f}) = {lambda_limit:.1f}</font>",
-            equation_style
-        ))
-        
-        if lambda_c <= lambda_limit:
-            story.append(Paragraph(
-                f"<font face='Courier'>(KL/r) = {lambda_c:.1f} ≤ {lambda_limit:.1f}</font>",
-                equation_style
-            ))
-            story.append(Paragraph("<b>→ INELASTIC BUCKLING CONTROLS (E3-2)</b>", body_style))
-            story.append(Paragraph("<i>Reference: AISC 360-16, Equation E3-2</i>", reference_style))
-            
-            story.append(Paragraph(
-                "<font face='Courier'>Fcr = [0.658^(Fy/Fe)] × Fy</font>",
-                equation_style
-            ))
-            story.append(Paragraph(
-                f"<font face='Courier'>Fcr = [0.658^({Fy:.1f}/{Fe:.1f})] × {Fy:.1f}</font>",
-                equation_style
-            ))
-        else:
-            story.append(Paragraph(
-                f"<font face='Courier'>(KL/r) = {lambda_c:.1f} > {lambda_limit:.1f}</font>",
-                equation_style
-            ))
-            story.append(Paragraph("<b>→ ELASTIC BUCKLING CONTROLS (E3-3)</b>", body_style))
-            story.append(Paragraph("<i>Reference: AISC 360-16, Equation E3-3</i>", reference_style))
-            
-            story.append(Paragraph(
-                "<font face='Courier'>Fcr = 0.877 × Fe</font>",
-                equation_style
-            ))
-            story.append(Paragraph(
-                f"<font face='Courier'>Fcr = 0.877 × {Fe:.1f}</font>",
-                equation_style
-            ))
-        
-        story.append(Paragraph(
-            f"<font face='Courier'>Fcr = <b>{comp['Fcr']:,.1f} kgf/cm²</b></font>",
-            equation_style
-        ))
-        story.append(Spacer(1, 8))
-        
-        # Step 4: Nominal and Design Strength
-        story.append(Paragraph("<b>Step 4: Calculate Nominal and Design Strength</b>", heading2_style))
-        story.append(Paragraph("<i>Reference: AISC 360-16, Equation E3-1</i>", reference_style))
-        story.append(Spacer(1, 4))
-        
-        story.append(Paragraph(
-            "<font face='Courier'>Pn = Fcr × Ag</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>Pn = {comp['Fcr']:,.1f} × {A:.2f} = {comp['Fcr']*A:,.0f} kgf = <b>{comp['Pn']:.2f} tons</b></font>",
-            equation_style
-        ))
-        story.append(Spacer(1, 4))
-        
-        story.append(Paragraph(
-            "<font face='Courier'>φc = 0.90 (LRFD)</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>φcPn = 0.90 × {comp['Pn']:.2f} = <b>{comp['phi_Pn']:.2f} tons</b></font>",
-            equation_style
-        ))
-        story.append(Spacer(1, 8))
-        
-        # Step 5: Adequacy Check
-        story.append(Paragraph("<b>Step 5: Adequacy Check</b>", heading2_style))
-        story.append(Spacer(1, 4))
-        
-        Pu = design_params.get('Pu', 0)
-        ratio = comp['ratio']
-        
-        story.append(Paragraph(
-            f"<font face='Courier'>Pu = {Pu:.2f} tons</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>φcPn = {comp['phi_Pn']:.2f} tons</font>",
-            equation_style
-        ))
-        story.append(Paragraph(
-            f"<font face='Courier'>Ratio = Pu / φcPn = {Pu:.2f} / {comp['phi_Pn']:.2f} = <b>{ratio:.3f}</b></font>",
-            equation_style
-        ))
-        
-        if comp['adequate']:
-            story.append(Paragraph(
-                f"<font face='Courier'>Check: {ratio:.3f} ≤ 1.0 → <b>OK ✓</b></font>",
-                equation_style
-            ))
-            story.append(Paragraph("<b>COMPRESSION DESIGN: ADEQUATE ✓</b>", result_style))
-        else:
-            story.append(Paragraph(
-                f"<font face='Courier'>Check: {ratio:.3f} > 1.0 → <b>NG ✗</b></font>",
-                equation_style
-            ))
-            story.append(Paragraph(
-                "<b>COMPRESSION DESIGN: INADEQUATE ✗</b>",
-                ParagraphStyle('FailResult', parent=result_style, 
-                              textColor=rl_colors.HexColor('#c62828'),
-                              backColor=rl_colors.HexColor('#ffebee'),
-                              borderColor=rl_colors.HexColor('#f44336'))
-            ))
-        
-    # ==================== 6. DESIGN SUMMARY ====================
-    story.append(PageBreak())
-    story.append(Paragraph("6. DESIGN SUMMARY & CONCLUSION", heading1_style))
-    story.append(Spacer(1, 10))
-    
-    # Summary Table
-    summary_data = [
-        ['CHECK', 'CAPACITY', 'DEMAND', 'RATIO', 'STATUS'],
-    ]
-    
-    if 'flexural' in analysis_results:
-        flex = analysis_results['flexural']
-        Mu = design_params.get('Mu', 0)
-        status = '✓ PASS' if flex['adequate'] else '✗ FAIL'
-        summary_data.append(['Flexural (φbMn)', f"{flex['phi_Mn']:.2f} t·m", 
-                           f"{Mu:.2f} t·m", f"{flex['ratio']:.3f}", status])
-    
-    if 'compression' in analysis_results:
-        comp = analysis_results['compression']
-        Pu = design_params.get('Pu', 0)
-        status = '✓ PASS' if comp['adequate'] else '✗ FAIL'
-        summary_data.append(['Compression (φcPn)', f"{comp['phi_Pn']:.2f} tons",
-                           f"{Pu:.2f} tons", f"{comp['ratio']:.3f}", status])
-    
-    summary_table = Table(summary_data, colWidths=[1.6*inch, 1.3*inch, 1.2*inch, 0.9*inch, 1*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#1a237e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, rl_colors.HexColor('#1a237e')),
-    ]))
-    
-    # Color code status column
-    for i, row in enumerate(summary_data[1:], start=1):
-        if '✓' in row[-1]:
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (-1, i), (-1, i), rl_colors.HexColor('#c8e6c9')),
-                ('TEXTCOLOR', (-1, i), (-1, i), rl_colors.HexColor('#2e7d32')),
-                ('FONTNAME', (-1, i), (-1, i), 'Helvetica-Bold'),
-            ]))
-        else:
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (-1, i), (-1, i), rl_colors.HexColor('#ffcdd2')),
-                ('TEXTCOLOR', (-1, i), (-1, i), rl_colors.HexColor('#c62828')),
-                ('FONTNAME', (-1, i), (-1, i), 'Helvetica-Bold'),
-            ]))
-    
-    story.append(summary_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Overall Conclusion
-    overall_adequate = True
-    if 'flexural' in analysis_results:
-        overall_adequate = overall_adequate and analysis_results['flexural']['adequate']
-    if 'compression' in analysis_results:
-        overall_adequate = overall_adequate and analysis_results['compression']['adequate']
-    
-    if overall_adequate:
-        conclusion_style = ParagraphStyle(
-            'Conclusion',
-            parent=result_style,
-            fontSize=14,
-            textColor=rl_colors.HexColor('#1b5e20'),
-            backColor=rl_colors.HexColor('#c8e6c9'),
-            borderColor=rl_colors.HexColor('#4caf50'),
-            borderWidth=3
-        )
-        story.append(Paragraph(
-            f"<b>CONCLUSION: SECTION {section} IS ADEQUATE FOR THE DESIGN LOADS ✓</b>",
-            conclusion_style
-        ))
-    else:
-        conclusion_style = ParagraphStyle(
-            'Conclusion',
-            parent=result_style,
-            fontSize=14,
-            textColor=rl_colors.HexColor('#b71c1c'),
-            backColor=rl_colors.HexColor('#ffcdd2'),
-            borderColor=rl_colors.HexColor('#f44336'),
-            borderWidth=3
-        )
-        story.append(Paragraph(
-            f"<b>CONCLUSION: SECTION {section} IS INADEQUATE - REVISE DESIGN ✗</b>",
-            conclusion_style
-        ))
-    
-    # Signature Block
-    story.append(Spacer(1, 0.5*inch))
-    
-    sig_data = [
-        ['PREPARED BY:', '', 'CHECKED BY:', ''],
-        ['', '', '', ''],
-        ['', '', '', ''],
-        [f"Name: {project_info.get('designer', '_______________')}", '',
-         f"Name: {project_info.get('checker', '_______________')}", ''],
-        ['Date: _____________', '', 'Date: _____________', ''],
-        ['Signature: _____________', '', 'Signature: _____________', ''],
-    ]
-    
-    sig_table = Table(sig_data, colWidths=[2*inch, 0.7*inch, 2*inch, 0.7*inch])
-    sig_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-    ]))
-    story.append(sig_table)
-    
-    # Build PDF
-    doc.build(story, canvasmaker=NumberedCanvas)
-    buffer.seek(0)
-    return buffer
-
-# ==================== ENHANCED CSS ====================
-st.markdown("""
-<style>
-    /* Import Font */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Global Styling */
-    * {
-        font-family: 'Inter', sans-serif;
-    }
-    
-    .main {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-    }
-    
-    /* Enhanced Tab Styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 12px;
-        background: white;
-        padding: 1rem;
-        border-radius: 15px;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.07);
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        height: 60px;
-        padding: 0 30px;
-        background: #f8f9fa;
-        border-radius: 10px;
-        font-weight: 600;
-        font-size: 15px;
-        border: 2px solid transparent;
-        transition: all 0.3s ease;
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background: #e9ecef;
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white !important;
-        border-color: #667eea;
-        box-shadow: 0 6px 12px rgba(102, 126, 234, 0.4);
-    }
-    
-    /* Headers */
-    .main-header {
-        font-size: 2.8rem;
-        font-weight: 800;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin: 2rem 0;
-        letter-spacing: -1px;
-    }
-    
-    .section-header {
-        font-size: 1.8rem;
-        font-weight: 700;
-        color: #2c3e50;
-        margin: 2rem 0 1.5rem 0;
-        padding-bottom: 0.75rem;
-        border-bottom: 3px solid #667eea;
-        position: relative;
-    }
-    
-    .section-header::after {
-        content: '';
-        position: absolute;
-        bottom: -3px;
-        left: 0;
-        width: 100px;
-        height: 3px;
-        background: linear-gradient(90deg, #667eea, #764ba2);
-    }
-    
-    /* Enhanced Card Designs */
-    .metric-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.07);
-        border-left: 5px solid #667eea;
-        margin: 1rem 0;
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 8px 16px rgba(0,0,0,0.12);
-    }
-    
-    .evaluation-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 15px;
-        margin: 1.5rem 0;
-        box-shadow: 0 8px 16px rgba(102, 126, 234, 0.3);
-    }
-    
-    .evaluation-card h3 {
-        color: white;
-        margin-bottom: 1rem;
-        font-weight: 700;
-    }
-    
-    .critical-lengths-box {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        box-shadow: 0 6px 12px rgba(245, 87, 108, 0.3);
-    }
-    
-    .design-summary {
-        background: white;
-        border: 3px solid #4caf50;
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin: 1.5rem 0;
-        box-shadow: 0 4px 8px rgba(76, 175, 80, 0.2);
-    }
-    
-    /* Enhanced Status Boxes */
-    .info-box {
-        background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%);
-        border-left: 5px solid #2196f3;
-        padding: 1.25rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    }
-    
-    .success-box {
-        background: linear-gradient(135deg, #e8f5e9 0%, #c8e6c9 100%);
-        border-left: 5px solid #4caf50;
-        padding: 1.25rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    }
-    
-    .warning-box {
-        background: linear-gradient(135deg, #fff3e0 0%, #ffe0b2 100%);
-        border-left: 5px solid #ff9800;
-        padding: 1.25rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    }
-    
-    .error-box {
-        background: linear-gradient(135deg, #ffebee 0%, #ffcdd2 100%);
-        border-left: 5px solid #f44336;
-        padding: 1.25rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    }
-    
-    /* AISC Equation Styling */
-    .aisc-equation {
-        background: linear-gradient(135deg, #e7f3ff 0%, #d0e8ff 100%);
-        border-left: 5px solid #2196f3;
-        padding: 1.25rem;
-        margin: 1rem 0;
-        border-radius: 10px;
-        font-family: 'Courier New', monospace;
-        font-size: 0.95rem;
-        box-shadow: 0 2px 4px rgba(33, 150, 243, 0.1);
-    }
-    
-    /* Enhanced Calculation Note */
-    .calculation-note {
-        background: #2c3e50;
-        color: #ecf0f1;
-        border: 2px solid #34495e;
-        padding: 1.5rem;
-        border-radius: 10px;
-        font-family: 'Courier New', monospace;
-        font-size: 0.9rem;
-        margin: 1rem 0;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        max-height: 600px;
-        overflow-y: auto;
-    }
-    
-    /* Data Tables */
-    .dataframe {
-        font-size: 14px !important;
-        border-radius: 10px;
-        overflow: hidden;
-    }
-    
-    .dataframe thead tr th {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white !important;
-        font-weight: 600;
-        padding: 15px 12px !important;
-        text-align: center;
-        font-size: 15px;
-    }
-    
-    .dataframe tbody tr {
-        transition: background-color 0.2s ease;
-    }
-    
-    .dataframe tbody tr:hover {
-        background-color: #f5f7fa !important;
-    }
-    
-    .dataframe tbody tr td {
-        padding: 12px !important;
-        border-bottom: 1px solid #e9ecef;
-        text-align: center;
-    }
-    
-    /* Enhanced Metrics */
-    [data-testid="stMetricValue"] {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #667eea;
-    }
-    
-    [data-testid="stMetricLabel"] {
-        font-size: 1rem;
-        font-weight: 600;
-        color: #2c3e50;
-    }
-    
-    /* Buttons */
-    .stButton>button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        padding: 12px 30px;
-        border-radius: 10px;
-        font-weight: 600;
-        font-size: 15px;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 8px rgba(102, 126, 234, 0.3);
-    }
-    
-    .stButton>button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 12px rgba(102, 126, 234, 0.4);
-    }
-    
-    /* Download Buttons */
-    .stDownloadButton>button {
-        background: linear-gradient(135deg, #4caf50 0%, #45a049 100%);
-        color: white;
-        border: none;
-        padding: 12px 30px;
-        border-radius: 10px;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    
-    .stDownloadButton>button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 12px rgba(76, 175, 80, 0.4);
-    }
-    
-    /* Sidebar Styling */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #ffffff 0%, #f8f9fa 100%);
-        border-right: 2px solid #e9ecef;
-    }
-    
-    /* Input Fields */
-    .stNumberInput>div>div>input,
-    .stTextInput>div>div>input {
-        border-radius: 8px;
-        border: 2px solid #e9ecef;
-        padding: 10px;
-        font-size: 15px;
-        transition: border-color 0.3s ease;
-    }
-
-    /* Selectbox styling (container + selected text + dropdown options) */
-    .stSelectbox [data-baseweb="select"] > div {
-        border-radius: 8px;
-        border: 2px solid #e9ecef;
-        min-height: 44px;
-        padding: 0 10px;
-        background-color: #ffffff;
-        color: #2c3e50 !important;
-        font-family: 'Inter', sans-serif !important;
-        font-size: 15px;
-        line-height: 1.35;
-        font-weight: 500;
-    }
-
-    .stSelectbox [data-baseweb="select"] [id$="-value"],
-    .stSelectbox [data-baseweb="select"] span,
-    .stSelectbox [data-baseweb="select"] p,
-    .stSelectbox [data-baseweb="select"] input {
-        color: #2c3e50 !important;
-        -webkit-text-fill-color: #2c3e50 !important;
-        font-family: 'Inter', sans-serif !important;
-        font-size: 15px !important;
-        line-height: 1.35 !important;
-        opacity: 1 !important;
-        white-space: nowrap;
-        overflow: hidden;
-        text-overflow: ellipsis;
-    }
-
-    .stSelectbox [data-baseweb="select"] input::placeholder {
-        color: #6c757d !important;
-        -webkit-text-fill-color: #6c757d !important;
-        opacity: 1 !important;
-    }
-
-    .stSelectbox [data-baseweb="select"] svg {
-        fill: #2c3e50 !important;
-    }
-
-    .stSelectbox [data-baseweb="select"] > div:focus-within {
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.12);
-    }
-
-    div[data-baseweb="popover"] div[role="listbox"] div[role="option"] {
-        color: #2c3e50 !important;
-        background-color: #ffffff;
-        font-family: 'Inter', sans-serif !important;
-        font-size: 14px;
-        line-height: 1.35;
-    }
-
-    div[data-baseweb="popover"] div[role="listbox"] div[role="option"][aria-selected="true"] {
-        background-color: #eef2ff;
-        color: #1f2a44 !important;
-    }
-
-    div[data-baseweb="popover"] div[role="listbox"] div[role="option"]:hover {
-        background-color: #f5f7ff;
-        color: #1f2a44 !important;
-    }
-
-    .stNumberInput>div>div>input:focus,
-    .stTextInput>div>div>input:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-    }
-    
-    /* Slider Styling */
-    .stSlider>div>div>div>div {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    /* Expander */
-    .streamlit-expanderHeader {
-        background: #f8f9fa;
-        border-radius: 10px;
-        font-weight: 600;
-        font-size: 16px;
-        padding: 12px;
-    }
-    
-    /* Scrollbar Styling */
-    ::-webkit-scrollbar {
-        width: 10px;
-        height: 10px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #f1f1f1;
-        border-radius: 10px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 10px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
-    }
-</style>
-""", unsafe_allow_html=True)
-
-def create_detailed_section_diagram(d, bf, tf, tw, section_name):
-    """Create a detailed I-beam cross-section diagram with dimensions"""
-    fig, ax = plt.subplots(figsize=(6, 5))
-    
-    # Scale for visualization
-    scale = 1.0
-    d_s, bf_s, tf_s, tw_s = d*scale, bf*scale, tf*scale, tw*scale
-    
-    # Center
-    cx, cy = 0, 0
-    
-    # Draw I-beam
-    # Top flange
-    ax.add_patch(patches.Rectangle(
-        (cx - bf_s/2, cy + d_s/2 - tf_s), bf_s, tf_s,
-        linewidth=2, edgecolor='#1a237e', facecolor='#e8eaf6'
-    ))
-    
-    # Bottom flange
-    ax.add_patch(patches.Rectangle(
-        (cx - bf_s/2, cy - d_s/2), bf_s, tf_s,
-        linewidth=2, edgecolor='#1a237e', facecolor='#e8eaf6'
-    ))
-    
-    # Web
-    ax.add_patch(patches.Rectangle(
-        (cx - tw_s/2, cy - d_s/2 + tf_s), tw_s, d_s - 2*tf_s,
-        linewidth=2, edgecolor='#1a237e', facecolor='#e8eaf6'
-    ))
-    
-    # Dimension lines
-    arrow_props = dict(arrowstyle='<->', color='#d32f2f', lw=1.5)
-    
-    # Overall height (d)
-    offset_d = bf_s * 0.25
-    ax.annotate('', xy=(bf_s/2 + offset_d, d_s/2),
-                xytext=(bf_s/2 + offset_d, -d_s/2),
-                arrowprops=arrow_props)
-    ax.text(bf_s/2 + offset_d*1.8, 0, f'd = {d:.0f} mm',
-            fontsize=10, color='#d32f2f', va='center', fontweight='bold')
-    
-    # Flange width (bf)
-    offset_bf = d_s * 0.15
-    ax.annotate('', xy=(-bf_s/2, d_s/2 + offset_bf),
-                xytext=(bf_s/2, d_s/2 + offset_bf),
-                arrowprops=arrow_props)
-    ax.text(0, d_s/2 + offset_bf*2, f'bf = {bf:.0f} mm',
-            fontsize=10, color='#d32f2f', ha='center', fontweight='bold')
-    
-    # Flange thickness (tf)
-    ax.annotate('', xy=(-bf_s/2 - offset_d*0.5, d_s/2),
-                xytext=(-bf_s/2 - offset_d*0.5, d_s/2 - tf_s),
-                arrowprops=dict(arrowstyle='<->', color='#1976d2', lw=1.2))
-    ax.text(-bf_s/2 - offset_d*1.5, d_s/2 - tf_s/2, f'tf = {tf:.1f}',
-            fontsize=9, color='#1976d2', va='center', ha='right')
-    
-    # Web thickness (tw)
-    ax.annotate('', xy=(-tw_s/2, -d_s/2 + tf_s + offset_bf*0.5),
-                xytext=(tw_s/2, -d_s/2 + tf_s + offset_bf*0.5),
-                arrowprops=dict(arrowstyle='<->', color='#388e3c', lw=1.2))
-    ax.text(0, -d_s/2 + tf_s - offset_bf*0.8, f'tw = {tw:.1f}',
-            fontsize=9, color='#388e3c', ha='center')
-    
-    # Styling
-    ax.set_xlim(-bf_s * 1.0, bf_s * 1.3)
-    ax.set_ylim(-d_s * 0.75, d_s * 0.85)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    ax.set_title(f'{section_name}\nCross-Section', fontsize=12, fontweight='bold', color='#1a237e')
-    
-    # Add axis labels
-    ax.plot([cx, cx], [-d_s*0.6, d_s*0.6], 'k--', lw=0.5, alpha=0.5)
-    ax.plot([-bf_s*0.6, bf_s*0.6], [cy, cy], 'k--', lw=0.5, alpha=0.5)
-    ax.text(bf_s*0.65, 0, 'X', fontsize=8, va='center')
-    ax.text(0, d_s*0.65, 'Y', fontsize=8, ha='center')
-    
-    plt.tight_layout()
-    return fig
-
-
-def create_flexural_capacity_chart(df, df_mat, section, material, Lb, Cb, flex_result):
-    """Create flexural capacity curve for PDF report"""
-    fig, ax = plt.subplots(figsize=(8, 5))
-    
-    # Generate capacity curve
-    Lb_points = np.linspace(0.1, 15, 200)
-    Mn_points = []
-    
-    for lb in Lb_points:
-        r = aisc_360_16_f2_flexural_design(df, df_mat, section, material, lb, Cb)
-        Mn_points.append(0.9 * r['Mn'] if r else 0)
-    
-    # Plot capacity curve
-    ax.plot(Lb_points, Mn_points, 'b-', linewidth=2.5, label='φbMn Capacity')
-    
-    # Zone shading
-    ax.axvspan(0, flex_result['Lp'], alpha=0.15, color='green', label='Yielding Zone (F2.1)')
-    ax.axvspan(flex_result['Lp'], flex_result['Lr'], alpha=0.15, color='orange', label='Inelastic LTB (F2.2)')
-    ax.axvspan(flex_result['Lr'], 15, alpha=0.15, color='red', label='Elastic LTB (F2.3)')
-    
-    # Vertical lines
-    ax.axvline(x=flex_result['Lp'], color='green', linestyle='--', linewidth=1.5)
-    ax.axvline(x=flex_result['Lr'], color='orange', linestyle='--', linewidth=1.5)
-    
-    # Add labels
-    ax.text(flex_result['Lp'], ax.get_ylim()[1]*0.95, f'Lp={flex_result["Lp"]:.2f}m',
-            fontsize=9, color='green', ha='center', fontweight='bold')
-    ax.text(flex_result['Lr'], ax.get_ylim()[1]*0.95, f'Lr={flex_result["Lr"]:.2f}m',
-            fontsize=9, color='orange', ha='center', fontweight='bold')
-    
-    # Design point
-    ax.plot([Lb], [flex_result['phi_Mn']], 'r*', markersize=15, 
-            label=f'Design Point (Lb={Lb:.2f}m)', zorder=5)
-    
-    # Styling
-    ax.set_xlabel('Unbraced Length, Lb (m)', fontsize=11, fontweight='bold')
-    ax.set_ylabel('Design Moment, φbMn (t·m)', fontsize=11, fontweight='bold')
-    ax.set_title(f'AISC F2: Flexural Capacity Curve - {section}', fontsize=12, fontweight='bold')
-    ax.grid(True, alpha=0.3, linestyle=':')
-    ax.legend(loc='upper right', fontsize=9, framealpha=0.95)
-    ax.set_xlim(0, 15)
-    ax.set_ylim(0, None)
-    
-    plt.tight_layout()
-    return fig
-
-
-def create_compression_capacity_chart(E, Fy, Ag, _lambda_c, lambda_limit, comp_result, Pu):
-    """Create compression capacity curve for PDF report"""
-    fig, ax = plt.subplots(figsize=(8, 5))
-    
-    # Generate capacity curve
-    lambda_points = np.linspace(1, 250, 250)
-    Pn_points = []
-    
-    for lc in lambda_points:
-        Fe = (math.pi**2 * E) / (lc**2)
-        if lc <= lambda_limit:
-            Fcr = (0.658**(Fy/Fe)) * Fy
-        else:
-            Fcr = 0.877 * Fe
-        Pn_points.append(0.9 * Fcr * Ag / 1000.0)
-    
-    # Plot capacity curve
-    ax.plot(lambda_points, Pn_points, 'b-', linewidth=2.5, label='φcPn Capacity')
-    
-    # Zone shading
-    ax.axvspan(0, lambda_limit, alpha=0.15, color='green', label='Inelastic Buckling (E3-2)')
-    ax.axvspan(lambda_limit, 250, alpha=0.15, color='orange', label='Elastic Buckling (E3-3)')
-    
-    # Vertical line at limit
-    ax.axvline(x=lambda_limit, color='orange', linestyle='--', linewidth=1.5)
-    ax.text(lambda_limit, ax.get_ylim()[1]*0.95 if ax.get_ylim()[1] > 0 else Pn_points[0]*0.95, 
-            f'λ limit={lambda_limit:.1f}',
-            fontsize=9, color='orange', ha='center', fontweight='bold')
-    
-    # Design point
-    ax.plot([comp_result['lambda_c']], [comp_result['phi_Pn']], 'r*', markersize=15,
-            label=f'Design Point (λ={comp_result["lambda_c"]:.1f})', zorder=5)
-    
-    # Demand line
-    if Pu > 0:
-        ax.axhline(y=Pu, color='red', linestyle='--', linewidth=1.5, label=f'Pu = {Pu:.1f} tons')
-    
-    # Styling
-    ax.set_xlabel('Slenderness Ratio (KL/r)', fontsize=11, fontweight='bold')
-    ax.set_ylabel('Design Strength, φcPn (tons)', fontsize=11, fontweight='bold')
-    ax.set_title('AISC E3: Column Capacity Curve', fontsize=12, fontweight='bold')
-    ax.grid(True, alpha=0.3, linestyle=':')
-    ax.legend(loc='upper right', fontsize=9, framealpha=0.95)
-    ax.set_xlim(0, 250)
-    ax.set_ylim(0, None)
-    
-    plt.tight_layout()
-    return fig
-
-def safe_sqrt(value):
-    """Safe square root that ensures non-negative input"""
-    val = safe_scalar(value)
-    return math.sqrt(abs(val)) if val >= 0 else 0.0
-
-# ==================== AISC 360-16 DESIGN FUNCTIONS ====================
-def aisc_360_16_f2_flexural_design(df, df_mat, section, material, Lb_input, Cb=1.0):
-    """AISC 360-16 F2 - Lateral-Torsional Buckling Analysis"""
-    try:
-        Sx = safe_scalar(df.loc[section, "Sx [cm3]"])
-        Zx = safe_scalar(df.loc[section, 'Zx [cm3]'])
-        ry = safe_scalar(df.loc[section, 'ry [cm]'])
-        
-        if 'rts [cm]' in df.columns:
-            rts = safe_scalar(df.loc[section, 'rts [cm]'])
-        else:
-            rts = ry * 1.2
-        
-        J = safe_scalar(df.loc[section, 'j [cm4]']) if 'j [cm4]' in df.columns else 1.0
-        
-        if 'ho [mm]' in df.columns:
-            ho = safe_scalar(df.loc[section, 'ho [mm]']) / 10.0
-        else:
-            ho = safe_scalar(df.loc[section, 'd [mm]']) / 10.0
-        
-        Fy = safe_scalar(df_mat.loc[material, "Yield Point (ksc)"])
-        E = safe_scalar(df_mat.loc[material, "E"])
-        
-        Lb = safe_scalar(Lb_input)
-        Cb = safe_scalar(Cb)
-        
-        # AISC 360-16 Equation F2.5
-        Lp = 1.76 * ry * safe_sqrt(E / Fy) / 100.0
-        
-        # AISC 360-16 Equation F2.6
-        c = 1.0
-        term1 = 1.95 * rts * E / (0.7 * Fy)
-        inner_sqrt = J * c / (Sx * ho)
-        term2 = safe_sqrt(inner_sqrt)
-        
-        ratio_term = (0.7 * Fy / E) ** 2
-        geometry_term = (Sx * ho / (J * c)) ** 2
-        complex_inner = 1.0 + 6.76 * ratio_term * geometry_term
-        term3 = safe_sqrt(1.0 + safe_sqrt(complex_inner))
-        
-        Lr = term1 * term2 * term3 / 100.0
-        
-        Mp = Fy * Zx
-        
-        if Lb <= Lp:
-            Case = "F2.1 - Yielding"
-            Mn = Mp
-        elif Lb <= Lr:
-            Case = "F2.2 - Inelastic LTB"
-            Lb_cm = Lb * 100.0
-            Lp_cm = Lp * 100.0  
-            Lr_cm = Lr * 100.0
-            
-            Mp_minus_Mr = Mp - 0.7 * Fy * Sx
-            denom = Lr_cm - Lp_cm
-            length_ratio = (Lb_cm - Lp_cm) / denom if denom != 0 else 1.0
-            Mn = Cb * (Mp - Mp_minus_Mr * length_ratio)
-            Mn = min(Mp, Mn)
-        else:
-            Case = "F2.3 - Elastic LTB"
-            Lb_cm = Lb * 100.0
-            Lb_rts_ratio = Lb_cm / rts
-            
-            term_1 = (Cb * math.pi**2 * E) / (Lb_rts_ratio**2)
-            term_2 = 0.078 * (J * c / (Sx * ho)) * (Lb_rts_ratio**2)
-            Fcr = term_1 * safe_sqrt(1.0 + term_2)
-            
-            Mn = Fcr * Sx
-            Mn = min(Mp, Mn)
-        
-        Mn_tm = Mn / 100000.0
-        Mp_tm = Mp / 100000.0
-        
-        return {
-            'Mn': Mn_tm,
-            'Mp': Mp_tm,
-            'Lp': Lp,
-            'Lr': Lr, 
-            'Case': Case,
-            'Cb': Cb
-        }
-        
-    except Exception as e:
-        st.error(f"Error in AISC 360-16 F2 calculation: {str(e)}")
-        return None
-
-def aisc_360_16_e3_compression_design(df, df_mat, section, material, KLx, KLy):
-    """AISC 360-16 E3 - Flexural Buckling Analysis"""
-    try:
-        Fy = safe_scalar(df_mat.loc[material, "Yield Point (ksc)"])
-        E = safe_scalar(df_mat.loc[material, "E"])
-        
-        Ag = safe_scalar(df.loc[section, 'A [cm2]'])
-        rx = safe_scalar(df.loc[section, 'rx [cm]'])
-        ry = safe_scalar(df.loc[section, 'ry [cm]'])
-        
-        KLx_scalar = safe_scalar(KLx) * 100.0
-        KLy_scalar = safe_scalar(KLy) * 100.0
-        
-        lambda_x = KLx_scalar / rx
-        lambda_y = KLy_scalar / ry
-        lambda_c = max(lambda_x, lambda_y)
-        
-        Fe = (math.pi**2 * E) / (lambda_c**2)
-        
-        lambda_limit = 4.71 * safe_sqrt(E / Fy)
-        
-        if lambda_c <= lambda_limit:
-            buckling_mode = "Inelastic"
-            exponent = Fy / Fe
-            Fcr = (0.658 ** exponent) * Fy
-        else:
-            buckling_mode = "Elastic"
-            Fcr = 0.877 * Fe
-        
-        Pn = Fcr * Ag / 1000.0
-        phi_c = 0.90
-        phi_Pn = phi_c * Pn
-        
-        slenderness_ok = lambda_c <= 200.0
-        
-        return {
-            'Pn': Pn,
-            'phi_Pn': phi_Pn,
-            'Fcr': Fcr,
-            'Fe': Fe,
-            'lambda_x': lambda_x,
-            'lambda_y': lambda_y,
-            'lambda_c': lambda_c,
-            'lambda_limit': lambda_limit,
-            'buckling_mode': buckling_mode,
-            'slenderness_ok': slenderness_ok,
-            'phi_c': phi_c
-        }
-        
-    except Exception as e:
-        st.error(f"Error in AISC 360-16 E3 compression analysis: {e}")
-        return None
-
-def aisc_360_16_h1_interaction(Pu, phi_Pn, Mux, phi_Mnx, Muy, phi_Mny):
-    """AISC 360-16 H1 - Combined Forces Analysis"""
-    try:
-        Pu = safe_scalar(Pu)
-        phi_Pn = safe_scalar(phi_Pn) 
-        Mux = safe_scalar(Mux)
-        phi_Mnx = safe_scalar(phi_Mnx)
-        Muy = safe_scalar(Muy)
-        phi_Mny = safe_scalar(phi_Mny)
-        
-        if phi_Pn <= 0.0 or phi_Mnx <= 0.0 or phi_Mny <= 0.0:
-            return None
-        
-        Pr_Pc = Pu / phi_Pn
-        Mrx_Mcx = Mux / phi_Mnx
-        Mry_Mcy = Muy / phi_Mny
-        
-        if Pr_Pc >= 0.2:
-            interaction_ratio = Pr_Pc + (8.0/9.0) * (Mrx_Mcx + Mry_Mcy)
-            equation = "H1-1a"
-        else:
-            interaction_ratio = Pr_Pc/2.0 + (Mrx_Mcx + Mry_Mcy)
-            equation = "H1-1b"
-        
-        design_ok = interaction_ratio <= 1.0
-        safety_margin = (1.0 - interaction_ratio) if design_ok else None
-        
-        return {
-            'interaction_ratio': interaction_ratio,
-            'equation': equation,
-            'design_ok': design_ok,
-            'Pr_Pc': Pr_Pc,
-            'Mrx_Mcx': Mrx_Mcx,
-            'Mry_Mcy': Mry_Mcy,
-            'safety_margin': safety_margin
-        }
-        
-    except Exception as e:
-        st.error(f"Error in AISC 360-16 H1 interaction calculation: {e}")
-        return None
-
-# ==================== ENHANCED PLOTLY CHART CONFIGURATIONS ====================
-def create_enhanced_plotly_config():
-    """Standard configuration for all Plotly charts with improved readability"""
-    return {
-        'displayModeBar': True,
-        'displaylogo': False,
-        'modeBarButtonsToRemove': ['pan2d', 'lasso2d', 'select2d'],
-        'toImageButtonOptions': {
-            'format': 'png',
-            'filename': 'aisc_chart',
-            'height': 800,
-            'width': 1200,
-            'scale': 2
-        }
-    }
-
-def get_enhanced_plotly_layout():
-    """Standard layout settings for enhanced readability"""
-    return {
-        'template': 'plotly_white',
-        'font': {
-            'family': 'Inter, sans-serif',
-            'size': 14,
-            'color': '#2c3e50'
-        },
-        'title': {
-            'font': {'size': 20, 'color': '#2c3e50', 'family': 'Inter'},
-            'x': 0.5,
-            'xanchor': 'center'
-        },
-        'xaxis': {
-            'title': {'font': {'size': 16, 'color': '#34495e'}},
-            'tickfont': {'size': 13},
-            'gridcolor': '#ecf0f1',
-            'showgrid': True,
-            'zeroline': True,
-            'zerolinecolor': '#bdc3c7',
-            'showline': True,
-            'linecolor': '#bdc3c7'
-        },
-        'yaxis': {
-            'title': {'font': {'size': 16, 'color': '#34495e'}},
-            'tickfont': {'size': 13},
-            'gridcolor': '#ecf0f1',
-            'showgrid': True,
-            'zeroline': True,
-            'zerolinecolor': '#bdc3c7',
-            'showline': True,
-            'linecolor': '#bdc3c7'
-        },
-        'margin': {'l': 80, 'r': 80, 't': 100, 'b': 80},
-        'hovermode': 'closest',
-        'plot_bgcolor': 'white',
-        'paper_bgcolor': 'white'
-    }
-
-def generate_pdf_report(df, df_mat, section, material, analysis_results, design_params):
-    """Generate PDF report with perfect formatting - NO OVERLAP"""
-    if not PDF_AVAILABLE:
-        return None
-    
-    buffer = BytesIO()
-    
-    # Create document with proper margins
-    doc = BaseDocTemplate(
-        buffer, 
-        pagesize=letter,
-        rightMargin=0.75*inch, 
-        leftMargin=0.75*inch,
-        topMargin=1.1*inch,  # Increased for header
-        bottomMargin=0.9*inch,  # Increased for footer
-        title="AISC 360-16 Steel Design Report"
-    )
-    
-    # Define frame for content with proper margins
-    frame = Frame(
-        doc.leftMargin, 
-        doc.bottomMargin, 
-        doc.width, 
-        doc.height - 0.3*inch,  # Account for header/footer space
-        id='normal',
-        topPadding=12,
-        bottomPadding=12
-    )
-    template = PageTemplate(id='main', frames=frame, onPage=lambda c, d: None)
-    doc.addPageTemplates([template])
-    
-    story = []
-    styles = getSampleStyleSheet()
-    
-    # ==================== ENHANCED CUSTOM STYLES - NO OVERLAP ====================
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=rl_colors.HexColor('#667eea'),
-        spaceAfter=18,
-        spaceBefore=6,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold',
-        leading=24
-    )
-    
-    heading1_style = ParagraphStyle(
-        'CustomHeading1',
-        parent=styles['Heading1'],
-        fontSize=14,
-        textColor=rl_colors.HexColor('#2c3e50'),
-        spaceAfter=10,
-        spaceBefore=16,
-        fontName='Helvetica-Bold',
-        borderWidth=0,  # Remove border to prevent overlap
-        backColor=rl_colors.HexColor('#f0f3ff'),
-        borderPadding=6,
-        leftIndent=0,
-        rightIndent=0,
-        keepWithNext=True,
-        leading=18
-    )
-    
-    heading2_style = ParagraphStyle(
-        'CustomHeading2',
-        parent=styles['Heading2'],
-        fontSize=12,
-        textColor=rl_colors.HexColor('#34495e'),
-        spaceAfter=8,
-        spaceBefore=12,
-        fontName='Helvetica-Bold',
-        keepWithNext=True,
-        leading=16
-    )
-    
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=9,
-        leading=13,
-        spaceAfter=4,
-        spaceBefore=2,
-        alignment=TA_LEFT,
-        wordWrap='CJK'  # Better word wrapping
-    )
-    
-    # Improved equation style - no overlap
-    equation_style = ParagraphStyle(
-        'EquationStyle',
-        parent=styles['Code'],
-        fontSize=9,
-        textColor=rl_colors.HexColor('#1565C0'),
-        backColor=rl_colors.HexColor('#E7F3FF'),
-        borderWidth=1,
-        borderColor=rl_colors.HexColor('#2196F3'),
-        borderPadding=8,
-        leftIndent=12,
-        rightIndent=12,
-        spaceAfter=8,
-        spaceBefore=8,
-        fontName='Courier',
-        leading=12,
-        borderRadius=5
-    )
-    
-    # ==================== TITLE PAGE ====================
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("AISC 360-16 STEEL DESIGN", title_style))
-    story.append(Paragraph("COMPREHENSIVE CALCULATION REPORT", title_style))
-    story.append(Spacer(1, 0.4*inch))
-    
-    # Report Info with proper table
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    header_data = [
-        ['Report Generated:', timestamp],
-        ['Section:', section],
-        ['Material Grade:', material],
-        ['Analysis Type:', 'Comprehensive Design Evaluation']
-    ]
-    
-    header_table = Table(header_data, colWidths=[2.3*inch, 4.2*inch])
-    header_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), rl_colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (0, -1), rl_colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, rl_colors.grey),
-        ('ROWBACKGROUNDS', (0, 0), (-1, -1), [rl_colors.HexColor('#f5f5f5'), rl_colors.white])
-    ]))
-    story.append(KeepTogether(header_table))
-    story.append(Spacer(1, 0.25*inch))
-    
-    # Get material properties
-    Fy = safe_scalar(df_mat.loc[material, "Yield Point (ksc)"])
-    Fu = safe_scalar(df_mat.loc[material, "Tensile Strength (ksc)"])
-    E = safe_scalar(df_mat.loc[material, "E"])
-    
-    # ==================== MATERIAL PROPERTIES ====================
-    story.append(Paragraph("1. MATERIAL PROPERTIES", heading1_style))
-    story.append(Spacer(1, 6))
-    
-    mat_data = [
-        ['Property', 'Value', 'Unit', 'Description'],
-        ['Fy', f'{Fy:.1f}', 'kgf/cm²', 'Yield Strength'],
-        ['Fu', f'{Fu:.1f}', 'kgf/cm²', 'Tensile Strength'],
-        ['E', f'{E:.0f}', 'kgf/cm²', 'Modulus of Elasticity']
-    ]
-    
-    mat_table = Table(mat_data, colWidths=[1.3*inch, 1.2*inch, 1.3*inch, 2.7*inch])
-    mat_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#f9f9f9')])
-    ]))
-    story.append(KeepTogether(mat_table))
-    story.append(Spacer(1, 0.2*inch))
-    
-    # ==================== SECTION PROPERTIES ====================
-    story.append(PageBreak())
-    story.append(Paragraph("2. SECTION PROPERTIES", heading1_style))
-    story.append(Spacer(1, 6))
-    
-    # Build properties table with proper column widths
-    props_data = [['Property', 'Symbol', 'Value', 'Unit']]
-    
-    property_list = [
-        ('d [mm]', 'd', 'mm'),
-        ('bf [mm]', 'bf', 'mm'),
-        ('tw [mm]', 'tw', 'mm'),
-        ('tf [mm]', 'tf', 'mm'),
-        ('A [cm2]', 'A', 'cm²'),
-        ('Ix [cm4]', 'Ix', 'cm⁴'),
-        ('Iy [cm4]', 'Iy', 'cm⁴'),
-        ('rx [cm]', 'rx', 'cm'),
-        ('ry [cm]', 'ry', 'cm'),
-        ('Sx [cm3]', 'Sx', 'cm³'),
-        ('Sy [cm3]', 'Sy', 'cm³'),
-        ('Zx [cm3]', 'Zx', 'cm³'),
-        ('Zy [cm3]', 'Zy', 'cm³'),
-    ]
-    
-    weight_col = 'Unit Weight [kg/m]' if 'Unit Weight [kg/m]' in df.columns else 'w [kg/m]'
-    
-    for prop_key, symbol, unit in property_list:
-        if prop_key in df.columns:
-            value = safe_scalar(df.loc[section, prop_key])
-            description = prop_key.split('[')[0].strip()
-            formatted_value = f'{value:.2f}' if value < 1000 else f'{value:.1f}'
-            props_data.append([description, symbol, formatted_value, unit])
-    
-    # Create table with word wrap
-    props_table = Table(props_data, colWidths=[2.2*inch, 0.9*inch, 1.4*inch, 1*inch])
-    props_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#f9f9f9')]),
-        ('WORDWRAP', (0, 0), (-1, -1), True)
-    ]))
-    story.append(KeepTogether(props_table))
-    story.append(Spacer(1, 0.15*inch))
-    
-    # Add slenderness ratios
-    bf = safe_scalar(df.loc[section, 'bf [mm]'])
-    tf = safe_scalar(df.loc[section, 'tf [mm]'])
-    d = safe_scalar(df.loc[section, 'd [mm]'])
-    tw = safe_scalar(df.loc[section, 'tw [mm]'])
-    h = safe_scalar(df.loc[section, 'ho [mm]']) if 'ho [mm]' in df.columns else (d - 2*tf)
-    
-    slender_data = [
-        ['Parameter', 'Value'],
-        ['Flange Slenderness (bf/2tf)', f'{(bf/2.0)/tf:.2f}'],
-        ['Web Slenderness (h/tw)', f'{h/tw:.2f}']
-    ]
-    
-    slender_table = Table(slender_data, colWidths=[3.5*inch, 2*inch])
-    slender_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#2196f3')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
-    ]))
-    story.append(KeepTogether(slender_table))
-    
-    # ==================== SECTION CLASSIFICATION ====================
-    story.append(PageBreak())
-    story.append(Paragraph("3. SECTION CLASSIFICATION", heading1_style))
-    story.append(Spacer(1, 8))
-    
-    flex_class = classify_section_flexure(df, df_mat, section, material)
-    comp_class = classify_section_compression(df, df_mat, section, material)
-    
-    if flex_class:
-        story.append(Paragraph("3.1 Flexural Classification (AISC Table B4.1b)", heading2_style))
-        story.append(Spacer(1, 6))
-        
-        # Flange - Use equation box for formulas
-        story.append(Paragraph("<b>Flange (Case 10: I-shaped sections)</b>", body_style))
-        story.append(Spacer(1, 4))
-        
-        # Use custom equation box instead of paragraph
-        eq_text = f"λp = 0.38√(E/Fy) = 0.38√({E:.0f}/{Fy:.1f}) = {flex_class['flange_lambda_p']:.2f}"
-        story.append(EquationBox(eq_text, doc.width))
-        story.append(Spacer(1, 4))
-        
-        eq_text = f"λr = 1.0√(E/Fy) = 1.0√({E:.0f}/{Fy:.1f}) = {flex_class['flange_lambda_r']:.2f}"
-        story.append(EquationBox(eq_text, doc.width))
-        story.append(Spacer(1, 6))
-        
-        story.append(Paragraph(
-            f"<b>Actual λ = (bf/2)/tf = {flex_class['flange_lambda']:.2f}</b>",
-            body_style
-        ))
-        story.append(Paragraph(
-            f"<b>Classification: {flex_class['flange_class']}</b>",
-            body_style
-        ))
-        story.append(Spacer(1, 12))
-        
-        # Web
-        story.append(Paragraph("<b>Web (Case 15: Webs in flexure)</b>", body_style))
-        story.append(Spacer(1, 4))
-        
-        eq_text = f"λpw = 3.76√(E/Fy) = {flex_class['web_lambda_p']:.2f}"
-        story.append(EquationBox(eq_text, doc.width))
-        story.append(Spacer(1, 4))
-        
-        eq_text = f"λrw = 5.70√(E/Fy) = {flex_class['web_lambda_r']:.2f}"
-        story.append(EquationBox(eq_text, doc.width))
-        story.append(Spacer(1, 6))
-        
-        story.append(Paragraph(
-            f"<b>Actual λ = h/tw = {flex_class['web_lambda']:.2f}</b>",
-            body_style
-        ))
-        story.append(Paragraph(
-            f"<b>Classification: {flex_class['web_class']}</b>",
-            body_style
-        ))
-        story.append(Spacer(1, 0.15*inch))
-    
-    if comp_class:
-        story.append(Paragraph("3.2 Compression Classification (AISC Table B4.1a)", heading2_style))
-        story.append(Spacer(1, 6))
-        
-        comp_summary = [
-            ['Element', 'λ', 'λr', 'Status'],
-            ['Flange', f'{comp_class["flange_lambda"]:.2f}', 
-             f'{comp_class["flange_lambda_r"]:.2f}', 
-             'Slender' if comp_class['flange_slender'] else 'Non-slender'],
-            ['Web', f'{comp_class["web_lambda"]:.2f}',
-             f'{comp_class["web_lambda_r"]:.2f}',
-             'Slender' if comp_class['web_slender'] else 'Non-slender'],
-        ]
-        
-        comp_table = Table(comp_summary, colWidths=[1.5*inch, 1.3*inch, 1.3*inch, 1.4*inch])
-        comp_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#667eea')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
-        ]))
-        story.append(KeepTogether(comp_table))
-        
-        story.append(Spacer(1, 8))
-        story.append(Paragraph(
-            f"<b>Overall: {comp_class['overall_class']}</b>",
-            body_style
-        ))
-    
-    # ==================== DESIGN ANALYSIS ====================
-    if analysis_results:
-        story.append(PageBreak())
-        story.append(Paragraph("4. DESIGN ANALYSIS", heading1_style))
-        story.append(Spacer(1, 10))
-        
-        # FLEXURAL ANALYSIS
-        if 'flexural' in analysis_results:
-            story.append(Paragraph("4.1 Flexural Design (AISC Chapter F2)", heading2_style))
-            story.append(Spacer(1, 6))
-            
-            flex = analysis_results['flexural']
-            Lb = design_params.get('Lb', 0)
-            Cb = design_params.get('Cb', 1.0)
-            
-            Sx = safe_scalar(df.loc[section, "Sx [cm3]"])
-            Zx = safe_scalar(df.loc[section, 'Zx [cm3]'])
-            ry = safe_scalar(df.loc[section, 'ry [cm]'])
-            
-            # Step 1
-            story.append(Paragraph("<b>Step 1: Plastic Moment</b>", body_style))
-            story.append(Spacer(1, 4))
-            
-            eq_text = f"Mp = Fy × Zx = {Fy:.1f} × {Zx:.2f} = {flex['Mp']:.2f} t·m"
-            story.append(EquationBox(eq_text, doc.width))
-            story.append(Spacer(1, 10))
-            
-            # Step 2
-            story.append(Paragraph("<b>Step 2: Limiting Lengths</b>", body_style))
-            story.append(Spacer(1, 4))
-            
-            eq_text = f"Lp = 1.76 × ry × √(E/Fy) = 1.76 × {ry:.2f} × √({E:.0f}/{Fy:.1f}) = {flex['Lp']:.3f} m"
-            story.append(EquationBox(eq_text, doc.width))
-            story.append(Spacer(1, 4))
-            
-            eq_text = f"Lr = {flex['Lr']:.3f} m (AISC Eq. F2-6)"
-            story.append(EquationBox(eq_text, doc.width))
-            story.append(Spacer(1, 10))
-            
-            # Step 3
-            story.append(Paragraph(f"<b>Step 3: Nominal Moment (Lb = {Lb:.2f} m)</b>", body_style))
-            story.append(Spacer(1, 4))
-            
-            if Lb <= flex['Lp']:
-                story.append(Paragraph(
-                    f"Lb ({Lb:.2f}m) ≤ Lp ({flex['Lp']:.3f}m) → <b>Yielding (F2.1)</b>",
-                    body_style
-                ))
-                eq_text = f"Mn = Mp = {flex['Mn']:.2f} t·m"
-            elif Lb <= flex['Lr']:
-                story.append(Paragraph(
-                    f"Lp < Lb ({Lb:.2f}m) ≤ Lr → <b>Inelastic LTB (F2.2)</b>",
-                    body_style
-                ))
-                eq_text = f"Mn = Cb[Mp - ...] = {flex['Mn']:.2f} t·m"
-            else:
-                story.append(Paragraph(
-                    f"Lb ({Lb:.2f}m) > Lr → <b>Elastic LTB (F2.3)</b>",
-                    body_style
-                ))
-                eq_text = f"Mn = Fcr × Sx = {flex['Mn']:.2f} t·m"
-            
-            story.append(Spacer(1, 4))
-            story.append(EquationBox(eq_text, doc.width))
-            story.append(Spacer(1, 10))
-            
-            # Step 4
-            story.append(Paragraph("<b>Step 4: Design Strength</b>", body_style))
-            story.append(Spacer(1, 4))
-            
-            eq_text = f"φMn = 0.90 × {flex['Mn']:.2f} = {flex['phi_Mn']:.2f} t·m"
-            story.append(EquationBox(eq_text, doc.width))
-            story.append(Spacer(1, 12))
-            
-            # Summary table
-            flex_summary = [
-                ['Parameter', 'Value'],
-                ['Design Capacity (φMn)', f"{flex['phi_Mn']:.2f} t·m"],
-                ['Nominal Moment (Mn)', f"{flex['Mn']:.2f} t·m"],
-                ['Plastic Moment (Mp)', f"{flex['Mp']:.2f} t·m"],
-                ['Design Case', flex['case']],
-                ['Design Zone', flex['zone']],
-                ['Utilization', f"{flex['ratio']:.3f}"],
-                ['Status', '✓ ADEQUATE' if flex['adequate'] else '✗ INADEQUATE']
-            ]
-            
-            flex_table = Table(flex_summary, colWidths=[3*inch, 2.5*inch])
-            flex_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#4caf50')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
-            ]))
-            story.append(KeepTogether(flex_table))
-            
-            # Add chart
-            story.append(Spacer(1, 0.15*inch))
-            story.append(Paragraph("<b>Flexural Capacity Curve:</b>", body_style))
-            story.append(Spacer(1, 6))
-            
-            # Generate chart with better formatting
-            fig, ax = plt.subplots(figsize=(6.5, 4))
-            Lb_points = np.linspace(0.1, 15, 200)
-            Mn_points = []
-            
-            for lb in Lb_points:
-                r = aisc_360_16_f2_flexural_design(df, df_mat, section, material, lb, Cb)
-                Mn_points.append(0.9 * r['Mn'] if r else 0)
-            
-            ax.plot(Lb_points, Mn_points, 'b-', linewidth=2.5, label='φM$_n$')
-            ax.axvline(x=flex['Lp'], color='g', linestyle='--', linewidth=1.5, 
-                      label=f'L$_p$ = {flex["Lp"]:.2f}m')
-            ax.axvline(x=flex['Lr'], color='orange', linestyle='--', linewidth=1.5,
-                      label=f'L$_r$ = {flex["Lr"]:.2f}m')
-            ax.plot([Lb], [flex['phi_Mn']], 'r*', markersize=15, 
-                   label='Design Point', zorder=5)
-            
-            ax.set_xlabel('Unbraced Length, L$_b$ (m)', fontsize=10, fontweight='bold')
-            ax.set_ylabel('Design Moment, φM$_n$ (t·m)', fontsize=10, fontweight='bold')
-            ax.set_title(f'Flexural Capacity - {section}', fontsize=11, fontweight='bold')
-            ax.grid(True, alpha=0.3, linestyle=':', linewidth=0.7)
-            ax.legend(loc='best', framealpha=0.9, fontsize=8)
-            ax.tick_params(labelsize=8)
-            
-            # Save with proper margins
-            img_buffer = BytesIO()
-            plt.tight_layout(pad=0.5)
-            plt.savefig(img_buffer, format='png', dpi=120, bbox_inches='tight')
-            plt.close()
-            img_buffer.seek(0)
-            
-            img = Image(img_buffer, width=5.5*inch, height=3.4*inch)
-            story.append(img)
-        
-        # COMPRESSION ANALYSIS
-        if 'compression' in analysis_results:
-            story.append(PageBreak())
-            story.append(Paragraph("4.2 Compression Design (AISC Chapter E3)", heading2_style))
-            story.append(Spacer(1, 6))
-            
-            comp = analysis_results['compression']
-            KL = design_params.get('KL', 0)
-            
-            Ag = safe_scalar(df.loc[section, 'A [cm2]'])
-            rx = safe_scalar(df.loc[section, 'rx [cm]'])
-            ry = safe_scalar(df.loc[section, 'ry [cm]'])
-            
-            # Step 1
-            story.append(Paragraph("<b>Step 1: Slenderness Ratio</b>", body_style))
-            story.append(Spacer(1, 4))
-            
-            KL_cm = KL * 100
-            lambda_x = KL_cm / rx
-            lambda_y = KL_cm / ry
-            lambda_c = max(lambda_x, lambda_y)
-            
-            eq_text = f"λc = max(KL/rx, KL/ry) = max({lambda_x:.1f}, {lambda_y:.1f}) = {lambda_c:.1f}"
-            story.append(EquationBox(eq_text, doc.width))
-            story.append(Spacer(1, 10))
-            
-            # Step 2
-            story.append(Paragraph("<b>Step 2: Elastic Buckling Stress</b>", body_style))
-            story.append(Spacer(1, 4))
-            
-            Fe = (math.pi**2 * E) / (lambda_c**2)
-            eq_text = f"Fe = π²E/(λc)² = π² × {E:.0f} / {lambda_c:.1f}² = {Fe:.1f} kgf/cm²"
-            story.append(EquationBox(eq_text, doc.width))
-            story.append(Spacer(1, 10))
-            
-            # Step 3
-            story.append(Paragraph("<b>Step 3: Critical Stress</b>", body_style))
-            story.append(Spacer(1, 4))
-            
-            lambda_limit = 4.71 * safe_sqrt(E / Fy)
-            
-            if lambda_c <= lambda_limit:
-                story.append(Paragraph(
-                    f"λc ({lambda_c:.1f}) ≤ {lambda_limit:.1f} → <b>Inelastic (E3-2)</b>",
-                    body_style
-                ))
-                exponent = Fy / Fe
-                Fcr = (0.658 ** exponent) * Fy
-                eq_text = f"Fcr = [0.658^(Fy/Fe)] × Fy = {Fcr:.1f} kgf/cm²"
-            else:
-                story.append(Paragraph(
-                    f"λc ({lambda_c:.1f}) > {lambda_limit:.1f} → <b>Elastic (E3-3)</b>",
-                    body_style
-                ))
-                Fcr = 0.877 * Fe
-                eq_text = f"Fcr = 0.877 × Fe = {Fcr:.1f} kgf/cm²"
-            
-            story.append(Spacer(1, 4))
-            story.append(EquationBox(eq_text, doc.width))
-            story.append(Spacer(1, 10))
-            
-            # Step 4
-            story.append(Paragraph("<b>Step 4: Design Strength</b>", body_style))
-            story.append(Spacer(1, 4))
-            
-            Pn = Fcr * Ag / 1000
-            eq_text = f"Pn = Fcr × Ag = {Fcr:.1f} × {Ag:.2f} / 1000 = {Pn:.2f} tons"
-            story.append(EquationBox(eq_text, doc.width))
-            story.append(Spacer(1, 4))
-            
-            eq_text = f"φPn = 0.90 × {Pn:.2f} = {comp['phi_Pn']:.2f} tons"
-            story.append(EquationBox(eq_text, doc.width))
-            story.append(Spacer(1, 12))
-            
-            # Summary table
-            comp_summary = [
-                ['Parameter', 'Value'],
-                ['Design Strength (φPn)', f"{comp['phi_Pn']:.2f} tons"],
-                ['Nominal Strength (Pn)', f"{comp['Pn']:.2f} tons"],
-                ['Critical Stress (Fcr)', f"{comp['Fcr']:.1f} kgf/cm²"],
-                ['Slenderness (λc)', f"{comp['lambda_c']:.1f}"],
-                ['Buckling Mode', comp['mode']],
-                ['Utilization', f"{comp['ratio']:.3f}"],
-                ['Status', '✓ ADEQUATE' if comp['adequate'] else '✗ INADEQUATE']
-            ]
-            
-            comp_table = Table(comp_summary, colWidths=[3*inch, 2.5*inch])
-            comp_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#2196f3')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
-            ]))
-            story.append(KeepTogether(comp_table))
-            
-            # Add chart
-            story.append(Spacer(1, 0.15*inch))
-            story.append(Paragraph("<b>Column Capacity Curve:</b>", body_style))
-            story.append(Spacer(1, 6))
-            
-            fig, ax = plt.subplots(figsize=(6.5, 4))
-            lambda_points = np.linspace(1, 250, 250)
-            Pn_points = []
-            
-            for lc in lambda_points:
-                Fe_temp = (math.pi**2 * E) / (lc**2)
-                if lc <= lambda_limit:
-                    Fcr_temp = (0.658**(Fy/Fe_temp)) * Fy
-                else:
-                    Fcr_temp = 0.877 * Fe_temp
-                Pn_points.append(0.9 * Fcr_temp * Ag / 1000.0)
-            
-            ax.plot(lambda_points, Pn_points, 'b-', linewidth=2.5, label='φP$_n$')
-            ax.axvline(x=lambda_limit, color='orange', linestyle='--', linewidth=1.5,
-                      label=f'λ limit = {lambda_limit:.1f}')
-            ax.plot([comp['lambda_c']], [comp['phi_Pn']], 'r*', markersize=15,
-                   label='Design Point', zorder=5)
-            
-            if 'Pu' in design_params and design_params['Pu'] > 0:
-                ax.axhline(y=design_params['Pu'], color='g', linestyle='--',
-                          linewidth=1.5, label=f'P$_u$ = {design_params["Pu"]:.1f} tons')
-            
-            ax.set_xlabel('Slenderness Ratio (KL/r)', fontsize=10, fontweight='bold')
-            ax.set_ylabel('Design Strength, φP$_n$ (tons)', fontsize=10, fontweight='bold')
-            ax.set_title(f'Column Capacity - {section}', fontsize=11, fontweight='bold')
-            ax.grid(True, alpha=0.3, linestyle=':', linewidth=0.7)
-            ax.legend(loc='best', framealpha=0.9, fontsize=8)
-            ax.tick_params(labelsize=8)
-            
-            img_buffer = BytesIO()
-            plt.tight_layout(pad=0.5)
-            plt.savefig(img_buffer, format='png', dpi=120, bbox_inches='tight')
-            plt.close()
-            img_buffer.seek(0)
-            
-            img = Image(img_buffer, width=5.5*inch, height=3.4*inch)
-            story.append(img)
-    
-    # Footer
-    story.append(PageBreak())
-    story.append(Spacer(1, 2*inch))
-    footer_text = """
-    <para align=center>
-    <b>AISC 360-16 Steel Design v7.0</b><br/>
-    All calculations comply with AISC 360-16 specifications.<br/>
-    <br/>
-    © 2024 - Structural Engineering Tool
-    </para>
-    """
-    story.append(Paragraph(footer_text, body_style))
+    /* Enhanced Metrics */
+    [data-testid="stMetricValue"] {
+        font-size: 2rem;
+        font-weight: 700;
+        color: #667eea;
+    }
     
-    # Build PDF with custom canvas
-    doc.build(story, canvasmaker=NumberedCanvas)
-    buffer.seek(0)
-    return buffer
-
-
-# ==================== ENHANCED EXCEL EXPORT WITH DETAILED CALCULATIONS ====================
-def generate_enhanced_excel_report(df, df_mat, section, material, analysis_results, design_params):
-    """Generate comprehensive Excel calculation report with detailed AISC equations and charts"""
-    if not EXCEL_AVAILABLE:
-        return None
+    [data-testid="stMetricLabel"] {
+        font-size: 1rem;
+        font-weight: 600;
+        color: #2c3e50;
+    }
     
-    buffer = BytesIO()
-    wb = Workbook()
+    /* Buttons */
+    .stButton>button {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        padding: 12px 30px;
+        border-radius: 10px;
+        font-weight: 600;
+        font-size: 15px;
+        transition: all 0.3s ease;
+        box-shadow: 0 4px 8px rgba(102, 126, 234, 0.3);
+    }
     
-    # ==================== DEFINE ENHANCED STYLES ====================
-    # Title styles
-    title_font = Font(bold=True, size=20, color="667EEA")
-    title_fill = PatternFill(start_color="F0F3FF", end_color="F0F3FF", fill_type="solid")
+    .stButton>button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 12px rgba(102, 126, 234, 0.4);
+    }
     
-    # Header styles
-    header_fill = PatternFill(start_color="667EEA", end_color="667EEA", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF", size=12)
+    /* Download Buttons */
+    .stDownloadButton>button {
+        background: linear-gradient(135deg, #4caf50 0%, #45a049 100%);
+        color: white;
+        border: none;
+        padding: 12px 30px;
+        border-radius: 10px;
+        font-weight: 600;
+        transition: all 0.3s ease;
+    }
     
-    # Subheader styles
-    subheader_fill = PatternFill(start_color="2196F3", end_color="2196F3", fill_type="solid")
-    subheader_font = Font(bold=True, color="FFFFFF", size=11)
+    .stDownloadButton>button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 12px rgba(76, 175, 80, 0.4);
+    }
     
-    # Section header styles
-    section_fill = PatternFill(start_color="E3F2FD", end_color="E3F2FD", fill_type="solid")
-    section_font = Font(bold=True, size=14, color="2c3e50")
+    /* Sidebar Styling */
+    [data-testid="stSidebar"] {
+        background: linear-gradient(180deg, #ffffff 0%, #f8f9fa 100%);
+        border-right: 2px solid #e9ecef;
+    }
     
-    # Equation styles
-    equation_fill = PatternFill(start_color="E7F3FF", end_color="E7F3FF", fill_type="solid")
+    /* Input Fields */
+    .stNumberInput>div>div>input,
+    .stTextInput>div>div>input {
+        border-radius: 8px;
+        border: 2px solid #e9ecef;
+        padding: 10px;
+        font-size: 15px;
+        transition: border-color 0.3s ease;
+    }
 
-    # Calculation styles
-    calc_fill = PatternFill(start_color="F5F5F5", end_color="F5F5F5", fill_type="solid")
-    
-    # Result styles
-    result_fill = PatternFill(start_color="C8E6C9", end_color="C8E6C9", fill_type="solid")
-    result_font = Font(bold=True, color="2E7D32", size=11)
-    
-    # Status styles
-    adequate_fill = PatternFill(start_color="C8E6C9", end_color="C8E6C9", fill_type="solid")
-    adequate_font = Font(bold=True, color="2E7D32")
-    inadequate_fill = PatternFill(start_color="FFCDD2", end_color="FFCDD2", fill_type="solid")
-    inadequate_font = Font(bold=True, color="C62828")
-    
-    # Classification styles
-    compact_fill = PatternFill(start_color="C8E6C9", end_color="C8E6C9", fill_type="solid")
-    compact_font = Font(bold=True, color="2E7D32")
-    noncompact_fill = PatternFill(start_color="FFF9C4", end_color="FFF9C4", fill_type="solid")
-    noncompact_font = Font(bold=True, color="F57C00")
-    slender_fill = PatternFill(start_color="FFCDD2", end_color="FFCDD2", fill_type="solid")
-    slender_font = Font(bold=True, color="C62828")
-    
-    # Alignment
-    center_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    left_align = Alignment(horizontal="left", vertical="center", wrap_text=True)
-    right_align = Alignment(horizontal="right", vertical="center")
-    
-    # Borders
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    thick_border = Border(
-        left=Side(style='medium'),
-        right=Side(style='medium'),
-        top=Side(style='medium'),
-        bottom=Side(style='medium')
-    )
-    
-    # ==================== SHEET 1: COVER & SUMMARY ====================
-    ws_cover = wb.active
-    ws_cover.title = "Cover & Summary"
-    
-    # Title
-    ws_cover['A1'] = "AISC 360-16 STEEL DESIGN"
-    ws_cover['A1'].font = title_font
-    ws_cover['A1'].fill = title_fill
-    ws_cover['A1'].alignment = center_align
-    ws_cover.merge_cells('A1:F1')
-    ws_cover.row_dimensions[1].height = 30
-    
-    ws_cover['A2'] = "COMPREHENSIVE CALCULATION REPORT"
-    ws_cover['A2'].font = Font(bold=True, size=16, color="764ba2")
-    ws_cover['A2'].fill = title_fill
-    ws_cover['A2'].alignment = center_align
-    ws_cover.merge_cells('A2:F2')
-    ws_cover.row_dimensions[2].height = 25
-    
-    # Report information
-    row = 4
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    info_data = [
-        ['Report Generated:', timestamp],
-        ['Section:', section],
-        ['Material Grade:', material],
-        ['Analysis Type:', 'Comprehensive Design Evaluation'],
-    ]
-    
-    for label, value in info_data:
-        ws_cover[f'A{row}'] = label
-        ws_cover[f'A{row}'].font = Font(bold=True, size=11)
-        ws_cover[f'A{row}'].fill = PatternFill(start_color="E3F2FD", end_color="E3F2FD", fill_type="solid")
-        ws_cover[f'A{row}'].border = thin_border
-        ws_cover[f'B{row}'] = value
-        ws_cover[f'B{row}'].border = thin_border
-        ws_cover.merge_cells(f'B{row}:D{row}')
-        row += 1
-    
-    # Material Properties Summary
-    row += 2
-    ws_cover[f'A{row}'] = "MATERIAL PROPERTIES"
-    ws_cover[f'A{row}'].font = section_font
-    ws_cover[f'A{row}'].fill = section_fill
-    ws_cover[f'A{row}'].alignment = center_align
-    ws_cover.merge_cells(f'A{row}:D{row}')
-    
-    row += 1
-    mat_headers = ['Property', 'Value', 'Unit', 'Description']
-    for col, header in enumerate(mat_headers, start=1):
-        cell = ws_cover.cell(row=row, column=col)
-        cell.value = header
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = center_align
-        cell.border = thin_border
-    
-    Fy = safe_scalar(df_mat.loc[material, "Yield Point (ksc)"])
-    Fu = safe_scalar(df_mat.loc[material, "Tensile Strength (ksc)"])
-    E = safe_scalar(df_mat.loc[material, "E"])
-    
-    mat_data = [
-        ['Fy', f'{Fy:.1f}', 'kgf/cm²', 'Yield Strength'],
-        ['Fu', f'{Fu:.1f}', 'kgf/cm²', 'Tensile Strength'],
-        ['E', f'{E:.0f}', 'kgf/cm²', 'Modulus of Elasticity']
-    ]
-    
-    for mat_row in mat_data:
-        row += 1
-        for col, value in enumerate(mat_row, start=1):
-            cell = ws_cover.cell(row=row, column=col)
-            cell.value = value
-            cell.border = thin_border
-            cell.alignment = center_align if col > 1 else left_align
-    
-    # Design Parameters
-    if design_params:
-        row += 2
-        ws_cover[f'A{row}'] = "DESIGN PARAMETERS"
-        ws_cover[f'A{row}'].font = section_font
-        ws_cover[f'A{row}'].fill = section_fill
-        ws_cover[f'A{row}'].alignment = center_align
-        ws_cover.merge_cells(f'A{row}:C{row}')
-        
-        row += 1
-        param_headers = ['Parameter', 'Value', 'Unit']
-        for col, header in enumerate(param_headers, start=1):
-            cell = ws_cover.cell(row=row, column=col)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = thin_border
-        
-        param_data = []
-        if 'Mu' in design_params:
-            param_data.append(['Applied Moment (Mu)', f"{design_params['Mu']:.2f}", 't·m'])
-        if 'Pu' in design_params:
-            param_data.append(['Applied Axial Load (Pu)', f"{design_params['Pu']:.2f}", 'tons'])
-        if 'Lb' in design_params:
-            param_data.append(['Unbraced Length (Lb)', f"{design_params['Lb']:.2f}", 'm'])
-        if 'KL' in design_params:
-            param_data.append(['Effective Length (KL)', f"{design_params['KL']:.2f}", 'm'])
-        if 'Cb' in design_params:
-            param_data.append(['Moment Gradient Factor (Cb)', f"{design_params['Cb']:.2f}", ''])
-        
-        for data_row in param_data:
-            row += 1
-            for col, value in enumerate(data_row, start=1):
-                cell = ws_cover.cell(row=row, column=col)
-                cell.value = value
-                cell.border = thin_border
-                cell.alignment = center_align if col > 1 else left_align
-    
-    # Overall Status
-    if analysis_results:
-        row += 2
-        ws_cover[f'A{row}'] = "DESIGN STATUS"
-        ws_cover[f'A{row}'].font = section_font
-        ws_cover[f'A{row}'].fill = section_fill
-        ws_cover[f'A{row}'].alignment = center_align
-        ws_cover.merge_cells(f'A{row}:D{row}')
-        
-        row += 1
-        overall_adequate = True
-        status_data = []
-        
-        if 'flexural' in analysis_results:
-            flex = analysis_results['flexural']
-            status_data.append(['Flexural Check', f"{flex['ratio']:.3f}", 
-                              '✓ PASS' if flex['adequate'] else '✗ FAIL'])
-            overall_adequate = overall_adequate and flex['adequate']
-        
-        if 'compression' in analysis_results:
-            comp = analysis_results['compression']
-            status_data.append(['Compression Check', f"{comp['ratio']:.3f}",
-                              '✓ PASS' if comp['adequate'] else '✗ FAIL'])
-            overall_adequate = overall_adequate and comp['adequate']
-        
-        if 'interaction' in analysis_results:
-            inter = analysis_results['interaction']
-            status_data.append(['Interaction Check', f"{inter['interaction_ratio']:.3f}",
-                              '✓ PASS' if inter['design_ok'] else '✗ FAIL'])
-            overall_adequate = overall_adequate and inter['design_ok']
-        
-        for check_name, ratio, status in status_data:
-            row += 1
-            ws_cover[f'A{row}'] = check_name
-            ws_cover[f'A{row}'].border = thin_border
-            ws_cover[f'A{row}'].alignment = left_align
-            
-            ws_cover[f'B{row}'] = ratio
-            ws_cover[f'B{row}'].border = thin_border
-            ws_cover[f'B{row}'].alignment = center_align
-            
-            ws_cover[f'C{row}'] = status
-            ws_cover[f'C{row}'].border = thin_border
-            ws_cover[f'C{row}'].alignment = center_align
-            if '✓' in status:
-                ws_cover[f'C{row}'].fill = adequate_fill
-                ws_cover[f'C{row}'].font = adequate_font
-            else:
-                ws_cover[f'C{row}'].fill = inadequate_fill
-                ws_cover[f'C{row}'].font = inadequate_font
-        
-        row += 1
-        ws_cover[f'A{row}'] = "OVERALL STATUS"
-        ws_cover[f'A{row}'].font = Font(bold=True, size=12)
-        ws_cover[f'A{row}'].border = thick_border
-        ws_cover[f'A{row}'].alignment = center_align
-        ws_cover.merge_cells(f'A{row}:B{row}')
-        
-        ws_cover[f'C{row}'] = '✓ ADEQUATE' if overall_adequate else '✗ INADEQUATE'
-        ws_cover[f'C{row}'].border = thick_border
-        ws_cover[f'C{row}'].alignment = center_align
-        ws_cover[f'C{row}'].font = Font(bold=True, size=12, color="FFFFFF")
-        if overall_adequate:
-            ws_cover[f'C{row}'].fill = PatternFill(start_color="4CAF50", end_color="4CAF50", fill_type="solid")
-        else:
-            ws_cover[f'C{row}'].fill = PatternFill(start_color="F44336", end_color="F44336", fill_type="solid")
-    
-    # Auto-size columns
-    for col in ['A', 'B', 'C', 'D']:
-        ws_cover.column_dimensions[col].width = 25
-    
-    # ==================== SHEET 2: COMPLETE SECTION PROPERTIES ====================
-    ws_props = wb.create_sheet("Section Properties")
-    
-    row = 1
-    ws_props['A1'] = "COMPLETE SECTION PROPERTIES"
-    ws_props['A1'].font = title_font
-    ws_props['A1'].fill = title_fill
-    ws_props['A1'].alignment = center_align
-    ws_props.merge_cells('A1:E1')
-    ws_props.row_dimensions[1].height = 25
-    
-    row = 3
-    ws_props[f'A{row}'] = "Geometric Properties"
-    ws_props[f'A{row}'].font = section_font
-    ws_props[f'A{row}'].fill = section_fill
-    ws_props.merge_cells(f'A{row}:E{row}')
-    
-    row += 1
-    prop_headers = ['Property Description', 'Symbol', 'Value', 'Unit', 'AISC Reference']
-    for col, header in enumerate(prop_headers, start=1):
-        cell = ws_props.cell(row=row, column=col)
-        cell.value = header
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = center_align
-        cell.border = thin_border
-    
-    # Comprehensive property list with AISC references
-    property_definitions = [
-        ('Unit Weight [kg/m]', 'w', 'Weight per unit length', 'Table 1-1'),
-        ('d [mm]', 'd', 'Overall depth', 'Table 1-1'),
-        ('bf [mm]', 'bf', 'Flange width', 'Table 1-1'),
-        ('tw [mm]', 'tw', 'Web thickness', 'Table 1-1'),
-        ('tf [mm]', 'tf', 'Flange thickness', 'Table 1-1'),
-        ('r [mm]', 'r', 'Fillet radius', 'Table 1-1'),
-        ('A [cm2]', 'A', 'Cross-sectional area', 'Table 1-1'),
-        ('Ix [cm4]', 'Ix', 'Moment of inertia, X-axis', 'Table 1-1'),
-        ('Iy [cm4]', 'Iy', 'Moment of inertia, Y-axis', 'Table 1-1'),
-        ('rx [cm]', 'rx', 'Radius of gyration, X-axis', 'Table 1-1'),
-        ('ry [cm]', 'ry', 'Radius of gyration, Y-axis', 'Table 1-1'),
-        ('Sx [cm3]', 'Sx', 'Elastic section modulus, X-axis', 'Table 1-1'),
-        ('Sy [cm3]', 'Sy', 'Elastic section modulus, Y-axis', 'Table 1-1'),
-        ('Zx [cm3]', 'Zx', 'Plastic section modulus, X-axis', 'Table 1-1'),
-        ('Zy [cm3]', 'Zy', 'Plastic section modulus, Y-axis', 'Table 1-1'),
-        ('ho [mm]', 'ho', 'Distance between flange centroids', 'Table 1-1'),
-        ('j [cm4]', 'J', 'Torsional constant', 'Table 1-1'),
-        ('cw [10^6 cm6]', 'Cw', 'Warping constant', 'Table 1-1'),
-        ('rts [cm6]', 'rts', 'Effective radius for LTB', 'Eq. F2-7'),
-    ]
-    
-    weight_col = 'Unit Weight [kg/m]' if 'Unit Weight [kg/m]' in df.columns else 'w [kg/m]'
-    
-    for prop_key, symbol, description, reference in property_definitions:
-        # Handle weight column name variation
-        check_key = weight_col if prop_key == 'Unit Weight [kg/m]' else prop_key
-        
-        if check_key in df.columns:
-            row += 1
-            value = safe_scalar(df.loc[section, check_key])
-            unit = check_key.split('[')[1].replace(']', '') if '[' in check_key else ''
-            
-            ws_props[f'A{row}'] = description
-            ws_props[f'B{row}'] = symbol
-            ws_props[f'C{row}'] = f'{value:.3f}' if value < 100 else f'{value:.2f}'
-            ws_props[f'D{row}'] = unit
-            ws_props[f'E{row}'] = reference
-            
-            for col in range(1, 6):
-                cell = ws_props.cell(row=row, column=col)
-                cell.border = thin_border
-                cell.alignment = center_align if col > 1 else left_align
-    
-    # Add calculated slenderness ratios
-    row += 2
-    ws_props[f'A{row}'] = "Calculated Slenderness Ratios"
-    ws_props[f'A{row}'].font = section_font
-    ws_props[f'A{row}'].fill = section_fill
-    ws_props.merge_cells(f'A{row}:E{row}')
-    
-    row += 1
-    for col, header in enumerate(prop_headers, start=1):
-        cell = ws_props.cell(row=row, column=col)
-        cell.value = header
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = center_align
-        cell.border = thin_border
-    
-    bf = safe_scalar(df.loc[section, 'bf [mm]'])
-    tf = safe_scalar(df.loc[section, 'tf [mm]'])
-    d = safe_scalar(df.loc[section, 'd [mm]'])
-    tw = safe_scalar(df.loc[section, 'tw [mm]'])
-    
-    if 'ho [mm]' in df.columns:
-        h = safe_scalar(df.loc[section, 'ho [mm]'])
-    else:
-        h = d - 2 * tf
-    
-    flange_slenderness = (bf / 2.0) / tf
-    web_slenderness = h / tw
-    
-    slenderness_data = [
-        ['Flange slenderness', 'bf/2tf', f'{flange_slenderness:.2f}', '', 'Table B4.1'],
-        ['Web slenderness', 'h/tw', f'{web_slenderness:.2f}', '', 'Table B4.1']
-    ]
-    
-    for data_row in slenderness_data:
-        row += 1
-        for col, value in enumerate(data_row, start=1):
-            cell = ws_props.cell(row=row, column=col)
-            cell.value = value
-            cell.border = thin_border
-            cell.alignment = center_align if col > 1 else left_align
-    
-    # Auto-size columns
-    for col in ['A', 'B', 'C', 'D', 'E']:
-        ws_props.column_dimensions[col].width = 25
-    
-    # ==================== SHEET 3: SECTION CLASSIFICATION ====================
-    ws_class = wb.create_sheet("Section Classification")
-    
-    row = 1
-    ws_class['A1'] = "SECTION CLASSIFICATION PER AISC 360-16"
-    ws_class['A1'].font = title_font
-    ws_class['A1'].fill = title_fill
-    ws_class['A1'].alignment = center_align
-    ws_class.merge_cells('A1:F1')
-    ws_class.row_dimensions[1].height = 25
-    
-    # Get classifications
-    flex_class = classify_section_flexure(df, df_mat, section, material)
-    comp_class = classify_section_compression(df, df_mat, section, material)
-    
-    if flex_class:
-        row = 3
-        ws_class[f'A{row}'] = "FLEXURAL MEMBER CLASSIFICATION (Table B4.1b)"
-        ws_class[f'A{row}'].font = section_font
-        ws_class[f'A{row}'].fill = section_fill
-        ws_class.merge_cells(f'A{row}:F{row}')
-        
-        # Flange Classification
-        row += 2
-        ws_class[f'A{row}'] = "FLANGE CLASSIFICATION"
-        ws_class[f'A{row}'].font = Font(bold=True, size=11, color="2c3e50")
-        ws_class.merge_cells(f'A{row}:F{row}')
-        
-        row += 1
-        ws_class[f'A{row}'] = "Case 10: Flanges of I-shaped sections in flexure"
-        ws_class[f'A{row}'].font = Font(italic=True, size=10)
-        ws_class.merge_cells(f'A{row}:F{row}')
-        
-        row += 2
-        flange_data = [
-            ['Parameter', 'Equation', 'Value', ''],
-            ['λ (Actual)', f'(bf/2)/tf = ({bf:.1f}/2)/{tf:.1f}', f'{flex_class["flange_lambda"]:.2f}', ''],
-            ['λp (Compact limit)', f'0.38√(E/Fy) = 0.38√({E:.0f}/{Fy:.1f})', f'{flex_class["flange_lambda_p"]:.2f}', 'Eq. B4-1a'],
-            ['λr (Non-compact limit)', f'1.0√(E/Fy) = 1.0√({E:.0f}/{Fy:.1f})', f'{flex_class["flange_lambda_r"]:.2f}', 'Eq. B4-1b'],
-        ]
-        
-        for data_row in flange_data:
-            row += 1
-            ws_class[f'A{row}'] = data_row[0]
-            ws_class[f'A{row}'].font = Font(bold=True) if 'Parameter' in data_row[0] else Font()
-            ws_class[f'A{row}'].border = thin_border
-            ws_class[f'A{row}'].alignment = left_align
-            
-            ws_class.merge_cells(f'B{row}:C{row}')
-            ws_class[f'B{row}'] = data_row[1]
-            ws_class[f'B{row}'].border = thin_border
-            ws_class[f'B{row}'].alignment = left_align
-            if 'Eq.' in data_row[0] or 'λp' in data_row[0] or 'λr' in data_row[0]:
-                ws_class[f'B{row}'].fill = equation_fill
-            
-            ws_class[f'D{row}'] = data_row[2]
-            ws_class[f'D{row}'].border = thin_border
-            ws_class[f'D{row}'].alignment = center_align
-            
-            ws_class[f'E{row}'] = data_row[3]
-            ws_class[f'E{row}'].border = thin_border
-            ws_class[f'E{row}'].alignment = center_align
-            ws_class[f'E{row}'].font = Font(italic=True, size=9)
-        
-        row += 1
-        ws_class[f'A{row}'] = "CLASSIFICATION:"
-        ws_class[f'A{row}'].font = Font(bold=True, size=11)
-        ws_class[f'A{row}'].border = thin_border
-        
-        ws_class.merge_cells(f'B{row}:D{row}')
-        ws_class[f'B{row}'] = flex_class['flange_class'].upper()
-        ws_class[f'B{row}'].border = thin_border
-        ws_class[f'B{row}'].alignment = center_align
-        
-        if flex_class['flange_class'] == 'Compact':
-            ws_class[f'B{row}'].fill = compact_fill
-            ws_class[f'B{row}'].font = compact_font
-        elif flex_class['flange_class'] == 'Non-compact':
-            ws_class[f'B{row}'].fill = noncompact_fill
-            ws_class[f'B{row}'].font = noncompact_font
-        else:
-            ws_class[f'B{row}'].fill = slender_fill
-            ws_class[f'B{row}'].font = slender_font
-        
-        # Web Classification
-        row += 3
-        ws_class[f'A{row}'] = "WEB CLASSIFICATION"
-        ws_class[f'A{row}'].font = Font(bold=True, size=11, color="2c3e50")
-        ws_class.merge_cells(f'A{row}:F{row}')
-        
-        row += 1
-        ws_class[f'A{row}'] = "Case 15: Webs of doubly symmetric I-shaped members in flexure"
-        ws_class[f'A{row}'].font = Font(italic=True, size=10)
-        ws_class.merge_cells(f'A{row}:F{row}')
-        
-        row += 2
-        web_data = [
-            ['Parameter', 'Equation', 'Value', ''],
-            ['λ (Actual)', f'h/tw = {h:.1f}/{tw:.1f}', f'{flex_class["web_lambda"]:.2f}', ''],
-            ['λpw (Compact limit)', f'3.76√(E/Fy) = 3.76√({E:.0f}/{Fy:.1f})', f'{flex_class["web_lambda_p"]:.2f}', 'Eq. B4-1a'],
-            ['λrw (Non-compact limit)', f'5.70√(E/Fy) = 5.70√({E:.0f}/{Fy:.1f})', f'{flex_class["web_lambda_r"]:.2f}', 'Eq. B4-1b'],
-        ]
-        
-        for data_row in web_data:
-            row += 1
-            ws_class[f'A{row}'] = data_row[0]
-            ws_class[f'A{row}'].font = Font(bold=True) if 'Parameter' in data_row[0] else Font()
-            ws_class[f'A{row}'].border = thin_border
-            ws_class[f'A{row}'].alignment = left_align
-            
-            ws_class.merge_cells(f'B{row}:C{row}')
-            ws_class[f'B{row}'] = data_row[1]
-            ws_class[f'B{row}'].border = thin_border
-            ws_class[f'B{row}'].alignment = left_align
-            if 'Eq.' in data_row[0] or 'λp' in data_row[0] or 'λr' in data_row[0]:
-                ws_class[f'B{row}'].fill = equation_fill
-            
-            ws_class[f'D{row}'] = data_row[2]
-            ws_class[f'D{row}'].border = thin_border
-            ws_class[f'D{row}'].alignment = center_align
-            
-            ws_class[f'E{row}'] = data_row[3]
-            ws_class[f'E{row}'].border = thin_border
-            ws_class[f'E{row}'].alignment = center_align
-            ws_class[f'E{row}'].font = Font(italic=True, size=9)
-        
-        row += 1
-        ws_class[f'A{row}'] = "CLASSIFICATION:"
-        ws_class[f'A{row}'].font = Font(bold=True, size=11)
-        ws_class[f'A{row}'].border = thin_border
-        
-        ws_class.merge_cells(f'B{row}:D{row}')
-        ws_class[f'B{row}'] = flex_class['web_class'].upper()
-        ws_class[f'B{row}'].border = thin_border
-        ws_class[f'B{row}'].alignment = center_align
-        
-        if flex_class['web_class'] == 'Compact':
-            ws_class[f'B{row}'].fill = compact_fill
-            ws_class[f'B{row}'].font = compact_font
-        elif flex_class['web_class'] == 'Non-compact':
-            ws_class[f'B{row}'].fill = noncompact_fill
-            ws_class[f'B{row}'].font = noncompact_font
-        else:
-            ws_class[f'B{row}'].fill = slender_fill
-            ws_class[f'B{row}'].font = slender_font
-    
-    if comp_class:
-        row += 4
-        ws_class[f'A{row}'] = "COMPRESSION MEMBER CLASSIFICATION (Table B4.1a)"
-        ws_class[f'A{row}'].font = section_font
-        ws_class[f'A{row}'].fill = section_fill
-        ws_class.merge_cells(f'A{row}:F{row}')
-        
-        row += 2
-        comp_data = [
-            ['Element', 'Case', 'λ (Actual)', 'λr (Limit)', 'Status'],
-            ['Flange', 'Case 1: Flanges of I-shaped sections', f'{comp_class["flange_lambda"]:.2f}', 
-             f'{comp_class["flange_lambda_r"]:.2f}', 'Slender' if comp_class['flange_slender'] else 'Non-slender'],
-            ['Web', 'Case 5: Webs of doubly symmetric I-sections', f'{comp_class["web_lambda"]:.2f}',
-             f'{comp_class["web_lambda_r"]:.2f}', 'Slender' if comp_class['web_slender'] else 'Non-slender'],
-        ]
-        
-        for data_row in comp_data:
-            row += 1
-            for col, value in enumerate(data_row, start=1):
-                cell = ws_class.cell(row=row, column=col)
-                cell.value = value
-                cell.border = thin_border
-                cell.alignment = center_align if col > 2 else left_align
-                
-                if row > (len(comp_data) + row - len(comp_data)) and col == 1:
-                    cell.font = Font(bold=True)
-                elif 'Parameter' in str(value) or 'Element' in str(value):
-                    cell.font = header_font
-                    cell.fill = header_fill
-                elif col == 5 and 'Slender' in str(value):
-                    cell.fill = slender_fill
-                    cell.font = slender_font
-                elif col == 5 and 'Non-slender' in str(value):
-                    cell.fill = compact_fill
-                    cell.font = compact_font
-        
-        row += 1
-        ws_class[f'A{row}'] = "OVERALL CLASSIFICATION:"
-        ws_class[f'A{row}'].font = Font(bold=True, size=11)
-        ws_class[f'A{row}'].border = thick_border
-        ws_class.merge_cells(f'A{row}:C{row}')
-        
-        ws_class.merge_cells(f'D{row}:E{row}')
-        ws_class[f'D{row}'] = comp_class['overall_class'].upper()
-        ws_class[f'D{row}'].border = thick_border
-        ws_class[f'D{row}'].alignment = center_align
-        
-        if comp_class['overall_class'] == 'Non-slender':
-            ws_class[f'D{row}'].fill = compact_fill
-            ws_class[f'D{row}'].font = compact_font
-        else:
-            ws_class[f'D{row}'].fill = slender_fill
-            ws_class[f'D{row}'].font = slender_font
-        
-        if comp_class['overall_class'] == 'Slender':
-            row += 1
-            ws_class[f'A{row}'] = f"Limiting Element: {comp_class['limiting_element']}"
-            ws_class[f'A{row}'].font = Font(italic=True, color="C62828")
-            ws_class.merge_cells(f'A{row}:E{row}')
-    
-    # Auto-size columns
-    for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-        ws_class.column_dimensions[col].width = 20
-    ws_class.column_dimensions['B'].width = 35
-    
-    # ==================== SHEET 4: FLEXURAL ANALYSIS ====================
-    if analysis_results and 'flexural' in analysis_results:
-        ws_flex = wb.create_sheet("Flexural Analysis")
-        
-        row = 1
-        ws_flex['A1'] = "AISC 360-16 CHAPTER F2: FLEXURAL DESIGN"
-        ws_flex['A1'].font = title_font
-        ws_flex['A1'].fill = title_fill
-        ws_flex['A1'].alignment = center_align
-        ws_flex.merge_cells('A1:E1')
-        ws_flex.row_dimensions[1].height = 25
-        
-        flex = analysis_results['flexural']
-        Lb = design_params.get('Lb', 0)
-        Cb = design_params.get('Cb', 1.0)
-        
-        Sx = safe_scalar(df.loc[section, "Sx [cm3]"])
-        Zx = safe_scalar(df.loc[section, 'Zx [cm3]'])
-        ry = safe_scalar(df.loc[section, 'ry [cm]'])
-        rts = safe_scalar(df.loc[section, 'rts [cm]']) if 'rts [cm]' in df.columns else ry * 1.2
-        J = safe_scalar(df.loc[section, 'j [cm4]']) if 'j [cm4]' in df.columns else 1.0
-        ho = safe_scalar(df.loc[section, 'ho [mm]']) / 10.0 if 'ho [mm]' in df.columns else d / 10.0
-        
-        # Step 1: Calculate Plastic Moment
-        row = 3
-        ws_flex[f'A{row}'] = "STEP 1: CALCULATE PLASTIC MOMENT Mp"
-        ws_flex[f'A{row}'].font = section_font
-        ws_flex[f'A{row}'].fill = section_fill
-        ws_flex.merge_cells(f'A{row}:E{row}')
-        
-        row += 2
-        ws_flex[f'A{row}'] = "AISC Equation F2-1:"
-        ws_flex[f'A{row}'].font = Font(bold=True, italic=True)
-        ws_flex[f'A{row}'].fill = equation_fill
-        ws_flex.merge_cells(f'A{row}:E{row}')
-        
-        row += 1
-        ws_flex[f'A{row}'] = "Mp = Fy × Zx"
-        ws_flex.merge_cells(f'A{row}:E{row}')
-        
-        row += 1
-        ws_flex[f'A{row}'] = f"Mp = {Fy:.1f} × {Zx:.2f}"
-        ws_flex.merge_cells(f'A{row}:B{row}')
-        ws_flex[f'C{row}'] = f"{flex['Mp']*100000:.0f} kgf·cm"
-        ws_flex[f'D{row}'] = "="
-        ws_flex[f'D{row}'].alignment = center_align
-        ws_flex[f'E{row}'] = f"{flex['Mp']:.2f} t·m"
-        ws_flex[f'E{row}'].fill = result_fill
-        ws_flex[f'E{row}'].font = result_font
-        
-        # Step 2: Limiting Lengths
-        row += 3
-        ws_flex[f'A{row}'] = "STEP 2: CALCULATE LIMITING LATERALLY UNBRACED LENGTHS"
-        ws_flex[f'A{row}'].font = section_font
-        ws_flex[f'A{row}'].fill = section_fill
-        ws_flex.merge_cells(f'A{row}:E{row}')
-        
-        row += 2
-        ws_flex[f'A{row}'] = "Compact Limit Lp (AISC Equation F2-5):"
-        ws_flex[f'A{row}'].font = Font(bold=True, italic=True)
-        ws_flex[f'A{row}'].fill = equation_fill
-        ws_flex.merge_cells(f'A{row}:E{row}')
-        
-        row += 1
-        ws_flex[f'A{row}'] = "Lp = 1.76 × ry × √(E/Fy)"
-        ws_flex.merge_cells(f'A{row}:E{row}')
-        
-        row += 1
-        ws_flex[f'A{row}'] = f"Lp = 1.76 × {ry:.2f} × √({E:.0f}/{Fy:.1f})"
-        ws_flex.merge_cells(f'A{row}:B{row}')
-        ws_flex[f'C{row}'] = f"{flex['Lp']*100:.2f} cm"
-        ws_flex[f'D{row}'] = "="
-        ws_flex[f'D{row}'].alignment = center_align
-        ws_flex[f'E{row}'] = f"{flex['Lp']:.3f} m"
-        ws_flex[f'E{row}'].fill = result_fill
-        ws_flex[f'E{row}'].font = result_font
-        
-        row += 2
-        ws_flex[f'A{row}'] = "Inelastic Limit Lr (AISC Equation F2-6):"
-        ws_flex[f'A{row}'].font = Font(bold=True, italic=True)
-        ws_flex[f'A{row}'].fill = equation_fill
-        ws_flex.merge_cells(f'A{row}:E{row}')
-        
-        row += 1
-        ws_flex[f'A{row}'] = "Lr = 1.95 × rts × (E/(0.7Fy)) × √(Jc/(Sx×ho)) × √(1 + √(1 + 6.76×((0.7Fy)/E)²×((Sx×ho)/(Jc))²))"
-        ws_flex[f'A{row}'].alignment = Alignment(wrap_text=True)
-        ws_flex.merge_cells(f'A{row}:E{row}')
-        ws_flex.row_dimensions[row].height = 30
-        
-        row += 1
-        ws_flex[f'A{row}'] = "Where:"
-        row += 1
-        ws_flex[f'A{row}'] = f"  rts = {rts:.2f} cm"
-        row += 1
-        ws_flex[f'A{row}'] = f"  J = {J:.2f} cm⁴"
-        row += 1
-        ws_flex[f'A{row}'] = f"  ho = {ho:.2f} cm"
-        row += 1
-        ws_flex[f'A{row}'] = "  c = 1.0 (for doubly symmetric I-shapes)"
-        
-        row += 1
-        ws_flex[f'A{row}'] = "Result:"
-        ws_flex.merge_cells(f'A{row}:D{row}')
-        ws_flex[f'E{row}'] = f"{flex['Lr']:.3f} m"
-        ws_flex[f'E{row}'].fill = result_fill
-        ws_flex[f'E{row}'].font = result_font
-        
-        # Step 3: Determine Nominal Moment
-        row += 3
-        ws_flex[f'A{row}'] = f"STEP 3: DETERMINE NOMINAL MOMENT Mn (Lb = {Lb:.2f} m)"
-        ws_flex[f'A{row}'].font = section_font
-        ws_flex[f'A{row}'].fill = section_fill
-        ws_flex.merge_cells(f'A{row}:E{row}')
-        
-        row += 2
-        if Lb <= flex['Lp']:
-            ws_flex[f'A{row}'] = f"Lb ({Lb:.2f}m) ≤ Lp ({flex['Lp']:.3f}m)"
-            ws_flex[f'A{row}'].font = Font(bold=True, size=11)
-            ws_flex.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            ws_flex[f'A{row}'] = "AISC Equation F2-1 applies (Yielding - Limit State of Lateral-Torsional Buckling does not apply)"
-            ws_flex[f'A{row}'].fill = equation_fill
-            ws_flex.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            ws_flex[f'A{row}'] = "Mn = Mp"
-            ws_flex.merge_cells(f'A{row}:D{row}')
-            ws_flex[f'E{row}'] = f"{flex['Mn']:.2f} t·m"
-            ws_flex[f'E{row}'].fill = result_fill
-            ws_flex[f'E{row}'].font = result_font
-            
-        elif Lb <= flex['Lr']:
-            ws_flex[f'A{row}'] = f"Lp ({flex['Lp']:.3f}m) < Lb ({Lb:.2f}m) ≤ Lr ({flex['Lr']:.3f}m)"
-            ws_flex[f'A{row}'].font = Font(bold=True, size=11)
-            ws_flex.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            ws_flex[f'A{row}'] = "AISC Equation F2-2 applies (Inelastic Lateral-Torsional Buckling)"
-            ws_flex[f'A{row}'].fill = equation_fill
-            ws_flex.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            ws_flex[f'A{row}'] = "Mn = Cb[Mp - (Mp - 0.7FySx)((Lb-Lp)/(Lr-Lp))] ≤ Mp"
-            ws_flex[f'A{row}'].alignment = Alignment(wrap_text=True)
-            ws_flex.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            Mr = 0.7 * Fy * Sx / 100000
-            ws_flex[f'A{row}'] = f"Mn = {Cb:.2f}[{flex['Mp']:.2f} - ({flex['Mp']:.2f} - {Mr:.2f}) × (({Lb:.2f}-{flex['Lp']:.3f})/({flex['Lr']:.3f}-{flex['Lp']:.3f}))]"
-            ws_flex.merge_cells(f'A{row}:D{row}')
-            ws_flex[f'E{row}'] = f"{flex['Mn']:.2f} t·m"
-            ws_flex[f'E{row}'].fill = result_fill
-            ws_flex[f'E{row}'].font = result_font
-            
-        else:
-            ws_flex[f'A{row}'] = f"Lb ({Lb:.2f}m) > Lr ({flex['Lr']:.3f}m)"
-            ws_flex[f'A{row}'].font = Font(bold=True, size=11)
-            ws_flex.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            ws_flex[f'A{row}'] = "AISC Equation F2-3 applies (Elastic Lateral-Torsional Buckling)"
-            ws_flex[f'A{row}'].fill = equation_fill
-            ws_flex.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            ws_flex[f'A{row}'] = "Fcr = (Cbπ²E)/((Lb/rts)²) × √(1 + 0.078(Jc/(Sxho))×(Lb/rts)²)"
-            ws_flex[f'A{row}'].alignment = Alignment(wrap_text=True)
-            ws_flex.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            ws_flex[f'A{row}'] = "Mn = Fcr × Sx ≤ Mp"
-            ws_flex.merge_cells(f'A{row}:D{row}')
-            ws_flex[f'E{row}'] = f"{flex['Mn']:.2f} t·m"
-            ws_flex[f'E{row}'].fill = result_fill
-            ws_flex[f'E{row}'].font = result_font
-        
-        # Step 4: Design Strength
-        row += 3
-        ws_flex[f'A{row}'] = "STEP 4: CALCULATE DESIGN STRENGTH"
-        ws_flex[f'A{row}'].font = section_font
-        ws_flex[f'A{row}'].fill = section_fill
-        ws_flex.merge_cells(f'A{row}:E{row}')
-        
-        row += 2
-        ws_flex[f'A{row}'] = "Resistance Factor (AISC Section F1):"
-        ws_flex[f'A{row}'].font = Font(bold=True)
-        
-        row += 1
-        ws_flex[f'A{row}'] = "φb = 0.90"
-        ws_flex[f'A{row}'].fill = equation_fill
-        
-        row += 2
-        ws_flex[f'A{row}'] = "φMn = φb × Mn"
-        ws_flex.merge_cells(f'A{row}:B{row}')
-        ws_flex[f'C{row}'] = f"= 0.90 × {flex['Mn']:.2f}"
-        ws_flex[f'D{row}'] = "="
-        ws_flex[f'D{row}'].alignment = center_align
-        ws_flex[f'E{row}'] = f"{flex['phi_Mn']:.2f} t·m"
-        ws_flex[f'E{row}'].fill = result_fill
-        ws_flex[f'E{row}'].font = result_font
-        ws_flex[f'E{row}'].border = thick_border
-        
-        # Summary Table
-        row += 3
-        ws_flex[f'A{row}'] = "FLEXURAL DESIGN SUMMARY"
-        ws_flex[f'A{row}'].font = section_font
-        ws_flex[f'A{row}'].fill = section_fill
-        ws_flex.merge_cells(f'A{row}:C{row}')
-        
-        row += 1
-        summary_data = [
-            ['Parameter', 'Value', 'Status'],
-            ['Design Moment Capacity (φMn)', f"{flex['phi_Mn']:.2f} t·m", ''],
-            ['Nominal Moment (Mn)', f"{flex['Mn']:.2f} t·m", ''],
-            ['Plastic Moment (Mp)', f"{flex['Mp']:.2f} t·m", ''],
-            ['Limiting Length Lp', f"{flex['Lp']:.3f} m", ''],
-            ['Limiting Length Lr', f"{flex['Lr']:.3f} m", ''],
-            ['Design Case', flex['case'], ''],
-            ['Design Zone', flex['zone'], ''],
-            ['Utilization Ratio', f"{flex['ratio']:.3f}", '✓ PASS' if flex['adequate'] else '✗ FAIL'],
-        ]
-        
-        for data_row in summary_data:
-            row += 1
-            for col, value in enumerate(data_row, start=1):
-                cell = ws_flex.cell(row=row, column=col)
-                cell.value = value
-                cell.border = thin_border
-                cell.alignment = center_align if col > 1 else left_align
-                
-                if 'Parameter' in str(value):
-                    cell.font = header_font
-                    cell.fill = header_fill
-                elif col == 3 and '✓' in str(value):
-                    cell.fill = adequate_fill
-                    cell.font = adequate_font
-                elif col == 3 and '✗' in str(value):
-                    cell.fill = inadequate_fill
-                    cell.font = inadequate_font
-        
-        # Auto-size columns
-        for col in ['A', 'B', 'C', 'D', 'E']:
-            ws_flex.column_dimensions[col].width = 25
+    /* Selectbox styling (container + selected text + dropdown options) */
+    .stSelectbox [data-baseweb="select"] > div {
+        border-radius: 8px;
+        border: 2px solid #e9ecef;
+        min-height: 44px;
+        padding: 0 10px;
+        background-color: #ffffff;
+        color: #2c3e50 !important;
+        font-family: 'Inter', sans-serif !important;
+        font-size: 15px;
+        line-height: 1.35;
+        font-weight: 500;
+    }
+
+    .stSelectbox [data-baseweb="select"] [id$="-value"],
+    .stSelectbox [data-baseweb="select"] span,
+    .stSelectbox [data-baseweb="select"] p,
+    .stSelectbox [data-baseweb="select"] input {
+        color: #2c3e50 !important;
+        -webkit-text-fill-color: #2c3e50 !important;
+        font-family: 'Inter', sans-serif !important;
+        font-size: 15px !important;
+        line-height: 1.35 !important;
+        opacity: 1 !important;
+        white-space: nowrap;
+        overflow: hidden;
+        text-overflow: ellipsis;
+    }
+
+    .stSelectbox [data-baseweb="select"] input::placeholder {
+        color: #6c757d !important;
+        -webkit-text-fill-color: #6c757d !important;
+        opacity: 1 !important;
+    }
+
+    .stSelectbox [data-baseweb="select"] svg {
+        fill: #2c3e50 !important;
+    }
+
+    .stSelectbox [data-baseweb="select"] > div:focus-within {
+        border-color: #667eea;
+        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.12);
+    }
+
+    div[data-baseweb="popover"] div[role="listbox"] div[role="option"] {
+        color: #2c3e50 !important;
+        background-color: #ffffff;
+        font-family: 'Inter', sans-serif !important;
+        font-size: 14px;
+        line-height: 1.35;
+    }
+
+    div[data-baseweb="popover"] div[role="listbox"] div[role="option"][aria-selected="true"] {
+        background-color: #eef2ff;
+        color: #1f2a44 !important;
+    }
+
+    div[data-baseweb="popover"] div[role="listbox"] div[role="option"]:hover {
+        background-color: #f5f7ff;
+        color: #1f2a44 !important;
+    }
+
+    .stNumberInput>div>div>input:focus,
+    .stTextInput>div>div>input:focus {
+        border-color: #667eea;
+        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
+    }
     
-    # ==================== SHEET 5: COMPRESSION ANALYSIS ====================
-    if analysis_results and 'compression' in analysis_results:
-        ws_comp = wb.create_sheet("Compression Analysis")
-        
-        row = 1
-        ws_comp['A1'] = "AISC 360-16 CHAPTER E3: COMPRESSION DESIGN"
-        ws_comp['A1'].font = title_font
-        ws_comp['A1'].fill = title_fill
-        ws_comp['A1'].alignment = center_align
-        ws_comp.merge_cells('A1:E1')
-        ws_comp.row_dimensions[1].height = 25
-        
-        comp = analysis_results['compression']
-        KL = design_params.get('KL', 0)
-        
-        Ag = safe_scalar(df.loc[section, 'A [cm2]'])
-        rx = safe_scalar(df.loc[section, 'rx [cm]'])
-        ry = safe_scalar(df.loc[section, 'ry [cm]'])
-        
-        # Step 1: Slenderness Ratio
-        row = 3
-        ws_comp[f'A{row}'] = "STEP 1: CALCULATE SLENDERNESS RATIO"
-        ws_comp[f'A{row}'].font = section_font
-        ws_comp[f'A{row}'].fill = section_fill
-        ws_comp.merge_cells(f'A{row}:E{row}')
-        
-        row += 2
-        KL_cm = KL * 100
-        lambda_x = KL_cm / rx
-        lambda_y = KL_cm / ry
-        lambda_c = max(lambda_x, lambda_y)
-        
-        ws_comp[f'A{row}'] = f"KL/rx = {KL_cm:.1f} / {rx:.2f}"
-        ws_comp.merge_cells(f'A{row}:D{row}')
-        ws_comp[f'E{row}'] = f"{lambda_x:.1f}"
-        ws_comp[f'E{row}'].fill = calc_fill
-        
-        row += 1
-        ws_comp[f'A{row}'] = f"KL/ry = {KL_cm:.1f} / {ry:.2f}"
-        ws_comp.merge_cells(f'A{row}:D{row}')
-        ws_comp[f'E{row}'] = f"{lambda_y:.1f}"
-        ws_comp[f'E{row}'].fill = calc_fill
-        
-        row += 1
-        ws_comp[f'A{row}'] = "λc = max(KL/rx, KL/ry)"
-        ws_comp.merge_cells(f'A{row}:D{row}')
-        ws_comp[f'E{row}'] = f"{lambda_c:.1f}"
-        ws_comp[f'E{row}'].fill = result_fill
-        ws_comp[f'E{row}'].font = result_font
-        
-        # Step 2: Elastic Buckling Stress
-        row += 3
-        ws_comp[f'A{row}'] = "STEP 2: CALCULATE ELASTIC BUCKLING STRESS Fe"
-        ws_comp[f'A{row}'].font = section_font
-        ws_comp[f'A{row}'].fill = section_fill
-        ws_comp.merge_cells(f'A{row}:E{row}')
-        
-        row += 2
-        ws_comp[f'A{row}'] = "AISC Equation E3-4:"
-        ws_comp[f'A{row}'].font = Font(bold=True, italic=True)
-        ws_comp[f'A{row}'].fill = equation_fill
-        ws_comp.merge_cells(f'A{row}:E{row}')
-        
-        row += 1
-        ws_comp[f'A{row}'] = "Fe = π²E / (KL/r)²"
-        ws_comp.merge_cells(f'A{row}:E{row}')
-        
-        row += 1
-        Fe = (math.pi**2 * E) / (lambda_c**2)
-        ws_comp[f'A{row}'] = f"Fe = π² × {E:.0f} / {lambda_c:.1f}²"
-        ws_comp.merge_cells(f'A{row}:D{row}')
-        ws_comp[f'E{row}'] = f"{Fe:.1f} kgf/cm²"
-        ws_comp[f'E{row}'].fill = result_fill
-        ws_comp[f'E{row}'].font = result_font
-        
-        # Step 3: Determine Critical Stress
-        row += 3
-        ws_comp[f'A{row}'] = "STEP 3: DETERMINE CRITICAL STRESS Fcr"
-        ws_comp[f'A{row}'].font = section_font
-        ws_comp[f'A{row}'].fill = section_fill
-        ws_comp.merge_cells(f'A{row}:E{row}')
-        
-        row += 2
-        lambda_limit = 4.71 * safe_sqrt(E / Fy)
-        ws_comp[f'A{row}'] = "Limiting Slenderness:"
-        ws_comp[f'A{row}'].font = Font(bold=True)
-        
-        row += 1
-        ws_comp[f'A{row}'] = f"4.71√(E/Fy) = 4.71√({E:.0f}/{Fy:.1f})"
-        ws_comp.merge_cells(f'A{row}:D{row}')
-        ws_comp[f'E{row}'] = f"{lambda_limit:.1f}"
-        ws_comp[f'E{row}'].fill = calc_fill
-        
-        row += 2
-        if lambda_c <= lambda_limit:
-            ws_comp[f'A{row}'] = f"λc ({lambda_c:.1f}) ≤ {lambda_limit:.1f}"
-            ws_comp[f'A{row}'].font = Font(bold=True, size=11)
-            ws_comp.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            ws_comp[f'A{row}'] = "INELASTIC BUCKLING - AISC Equation E3-2:"
-            ws_comp[f'A{row}'].fill = equation_fill
-            ws_comp.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            ws_comp[f'A{row}'] = "Fcr = [0.658^(Fy/Fe)] × Fy"
-            ws_comp.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            exponent = Fy / Fe
-            Fcr = (0.658 ** exponent) * Fy
-            ws_comp[f'A{row}'] = f"Fcr = [0.658^({Fy:.1f}/{Fe:.1f})] × {Fy:.1f}"
-            ws_comp.merge_cells(f'A{row}:D{row}')
-            ws_comp[f'E{row}'] = f"{Fcr:.1f} kgf/cm²"
-            ws_comp[f'E{row}'].fill = result_fill
-            ws_comp[f'E{row}'].font = result_font
-        else:
-            ws_comp[f'A{row}'] = f"λc ({lambda_c:.1f}) > {lambda_limit:.1f}"
-            ws_comp[f'A{row}'].font = Font(bold=True, size=11)
-            ws_comp.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            ws_comp[f'A{row}'] = "ELASTIC BUCKLING - AISC Equation E3-3:"
-            ws_comp[f'A{row}'].fill = equation_fill
-            ws_comp.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            ws_comp[f'A{row}'] = "Fcr = 0.877 × Fe"
-            ws_comp.merge_cells(f'A{row}:E{row}')
-            
-            row += 1
-            Fcr = 0.877 * Fe
-            ws_comp[f'A{row}'] = f"Fcr = 0.877 × {Fe:.1f}"
-            ws_comp.merge_cells(f'A{row}:D{row}')
-            ws_comp[f'E{row}'] = f"{Fcr:.1f} kgf/cm²"
-            ws_comp[f'E{row}'].fill = result_fill
-            ws_comp[f'E{row}'].font = result_font
-        
-        # Step 4: Calculate Strength
-        row += 3
-        ws_comp[f'A{row}'] = "STEP 4: CALCULATE NOMINAL AND DESIGN STRENGTH"
-        ws_comp[f'A{row}'].font = section_font
-        ws_comp[f'A{row}'].fill = section_fill
-        ws_comp.merge_cells(f'A{row}:E{row}')
-        
-        row += 2
-        ws_comp[f'A{row}'] = "AISC Equation E3-1:"
-        ws_comp[f'A{row}'].font = Font(bold=True, italic=True)
-        ws_comp[f'A{row}'].fill = equation_fill
-        ws_comp.merge_cells(f'A{row}:E{row}')
-        
-        row += 1
-        ws_comp[f'A{row}'] = "Pn = Fcr × Ag"
-        ws_comp.merge_cells(f'A{row}:E{row}')
-        
-        row += 1
-        Pn = Fcr * Ag / 1000
-        ws_comp[f'A{row}'] = f"Pn = {Fcr:.1f} × {Ag:.2f} / 1000"
-        ws_comp.merge_cells(f'A{row}:D{row}')
-        ws_comp[f'E{row}'] = f"{Pn:.2f} tons"
-        ws_comp[f'E{row}'].fill = result_fill
-        ws_comp[f'E{row}'].font = result_font
-        
-        row += 2
-        ws_comp[f'A{row}'] = "Resistance Factor (AISC Section E1):"
-        ws_comp[f'A{row}'].font = Font(bold=True)
-        
-        row += 1
-        ws_comp[f'A{row}'] = "φc = 0.90"
-        ws_comp[f'A{row}'].fill = equation_fill
-        
-        row += 2
-        ws_comp[f'A{row}'] = "φPn = φc × Pn"
-        ws_comp.merge_cells(f'A{row}:B{row}')
-        ws_comp[f'C{row}'] = f"= 0.90 × {Pn:.2f}"
-        ws_comp[f'D{row}'] = "="
-        ws_comp[f'D{row}'].alignment = center_align
-        ws_comp[f'E{row}'] = f"{comp['phi_Pn']:.2f} tons"
-        ws_comp[f'E{row}'].fill = result_fill
-        ws_comp[f'E{row}'].font = result_font
-        ws_comp[f'E{row}'].border = thick_border
-        
-        # Summary Table
-        row += 3
-        ws_comp[f'A{row}'] = "COMPRESSION DESIGN SUMMARY"
-        ws_comp[f'A{row}'].font = section_font
-        ws_comp[f'A{row}'].fill = section_fill
-        ws_comp.merge_cells(f'A{row}:C{row}')
-        
-        row += 1
-        summary_data = [
-            ['Parameter', 'Value', 'Status'],
-            ['Design Strength (φPn)', f"{comp['phi_Pn']:.2f} tons", ''],
-            ['Nominal Strength (Pn)', f"{comp['Pn']:.2f} tons", ''],
-            ['Critical Stress (Fcr)', f"{comp['Fcr']:.1f} kgf/cm²", ''],
-            ['Elastic Buckling Stress (Fe)', f"{Fe:.1f} kgf/cm²", ''],
-            ['Slenderness Ratio (λc)', f"{comp['lambda_c']:.1f}", ''],
-            ['Buckling Mode', comp['mode'], ''],
-            ['Utilization Ratio', f"{comp['ratio']:.3f}", '✓ PASS' if comp['adequate'] else '✗ FAIL'],
-        ]
-        
-        for data_row in summary_data:
-            row += 1
-            for col, value in enumerate(data_row, start=1):
-                cell = ws_comp.cell(row=row, column=col)
-                cell.value = value
-                cell.border = thin_border
-                cell.alignment = center_align if col > 1 else left_align
-                
-                if 'Parameter' in str(value):
-                    cell.font = header_font
-                    cell.fill = header_fill
-                elif col == 3 and '✓' in str(value):
-                    cell.fill = adequate_fill
-                    cell.font = adequate_font
-                elif col == 3 and '✗' in str(value):
-                    cell.fill = inadequate_fill
-                    cell.font = inadequate_font
-        
-        # Auto-size columns
-        for col in ['A', 'B', 'C', 'D', 'E']:
-            ws_comp.column_dimensions[col].width = 25
+    /* Slider Styling */
+    .stSlider>div>div>div>div {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    }
+    
+    /* Expander */
+    .streamlit-expanderHeader {
+        background: #f8f9fa;
+        border-radius: 10px;
+        font-weight: 600;
+        font-size: 16px;
+        padding: 12px;
+    }
+    
+    /* Scrollbar Styling */
+    ::-webkit-scrollbar {
+        width: 10px;
+        height: 10px;
+    }
+    
+    ::-webkit-scrollbar-track {
+        background: #f1f1f1;
+        border-radius: 10px;
+    }
+    
+    ::-webkit-scrollbar-thumb {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-radius: 10px;
+    }
     
-    # Save to buffer
-    wb.save(buffer)
-    buffer.seek(0)
-    return buffer
+    ::-webkit-scrollbar-thumb:hover {
+        background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
+    }
+</style>
+""", unsafe_allow_html=True)
 
 # ==================== CSS STYLES ====================
 
@@ -6193,79 +551,144 @@ def get_tab_styles():
     """
 
 
-# ==================== HELPER FUNCTIONS ====================
+# ==================== REPORT DOWNLOADS ====================
+# Reports larger than this are not previewed unless asked for
+REPORT_PREVIEW_MAX_SIZE = 5 << 20
 
-def get_section_properties_from_df(df_sections, df_materials, section_name, material_name):
+REPORT_EXPIRED_MESSAGE = "⌛ The generated report has expired. Generate it again in the 'Generate Report' tab."
+
+def report_download_button(label, read, file_name, mime, key, **kwargs):
     """
-    Extract section properties from dataframes
-    
-    Parameters:
-    - df_sections: DataFrame with section properties
-    - df_materials: DataFrame with material properties
-    - section_name: Name/index of section
-    - material_name: Name/index of material
-    
-    Returns dict with section properties
+    st.download_button for a report whose bytes come from read().
+
+    read is only called when the button is clicked (on a server thread),
+    so the report is not read or sent to the browser on every rerun.
+    """
+    return st.download_button(label=label, data=read, file_name=file_name, mime=mime, key=key, **kwargs)
+
+def set_generated_report(key, job):
+    """Keep a report job's id under a session key, discarding the job it replaces"""
+    previous = st.session_state.get(key)
+    if previous is not None and (job is None or previous != job.id):
+        get_report_job_queue().discard(previous)
+    st.session_state[key] = job.id if job is not None else None
+    st.session_state.generated_report_expired = False
+
+def generated_report_job(key):
     """
+    The ReportJob kept under a session key, or None. A job that has expired
+    is dropped and flagged in generated_report_expired for the page.
+    """
+    job_id = st.session_state.get(key)
+    job = get_report_job_queue().get(job_id) if job_id is not None else None
+    if job is None:
+        if job_id is not None:
+            st.session_state.generated_report_expired = True
+        st.session_state[key] = None
+    return job
+
+def read_generated_report(job):
+    """A kept report's text, or None (flagged as expired) when its file is gone meanwhile"""
     try:
-        sec = df_sections.loc[section_name]
-        mat = df_materials.loc[material_name]
-        
-        # Map column names (adjust based on your actual column names)
-        props = {
-            'Ag': float(sec.get('A [cm2]', sec.get('Ag', 0))),
-            'Ix': float(sec.get('Ix [cm4]', sec.get('Ix', 0))),
-            'Iy': float(sec.get('Iy [cm4]', sec.get('Iy', 0))),
-            'Sx': float(sec.get('Sx [cm3]', sec.get('Sx', 0))),
-            'Zx': float(sec.get('Zx [cm3]', sec.get('Zx', 0))),
-            'Sy': float(sec.get('Sy [cm3]', sec.get('Sy', 0))),
-            'Zy': float(sec.get('Zy [cm3]', sec.get('Zy', 0))),
-            'rx': float(sec.get('rx [cm]', sec.get('rx', 0))),
-            'ry': float(sec.get('ry [cm]', sec.get('ry', 0))),
-            'J': float(sec.get('j [cm4]', sec.get('J [cm4]', sec.get('J', 1)))),
-            'd': float(sec.get('d [mm]', sec.get('d', 0))) / 10,  # Convert mm to cm
-            'bf': float(sec.get('bf [mm]', sec.get('bf', 0))) / 10,
-            'tf': float(sec.get('tf [mm]', sec.get('tf', 0))) / 10,
-            'tw': float(sec.get('tw [mm]', sec.get('tw', 0))) / 10,
-            'Fy': float(mat.get('Yield Point (ksc)', mat.get('Fy', 2500))) / 10.197,  # ksc to MPa
-            'Fu': float(mat.get('Tensile Strength (ksc)', mat.get('Fu', 4000))) / 10.197,
-        }
-        
-        # Calculate derived properties if needed
-        if props['d'] > 0 and props['tf'] > 0:
-            props['ho'] = props['d'] - props['tf']
-        else:
-            props['ho'] = props['d'] * 0.9
-        
-        # Effective area for tension (assume 85% if not specified)
-        props['Ae'] = props['Ag'] * 0.85
-        
-        # rts approximation
-        props['rts'] = props['ry'] * 1.1 if props['ry'] > 0 else 1
-        
-        # Cw approximation
-        if props['Iy'] > 0 and props['d'] > 0:
-            props['Cw'] = props['Iy'] * (props['d'] - props['tf'])**2 / 4
-        else:
-            props['Cw'] = 1
-        
-        return props
-        
-    except Exception as e:
-        st.error(f"Error extracting section properties: {e}")
+        return get_report_job_queue().read(job.id).decode("utf-8")
+    except FileNotFoundError:
+        st.session_state.generated_report_expired = True
         return None
 
 
-def get_html_download_link(html_content, filename="report.html"):
-    """Generate a download link for HTML content"""
-    b64 = base64.b64encode(html_content.encode()).decode()
-    href = f'<a href="data:text/html;base64,{b64}" download="{filename}" class="download-btn">📥 Download HTML Report</a>'
-    return href
+# ==================== REPORT JOBS ====================
+# Seconds between status polls while this session has reports in progress
+REPORT_JOB_POLL_SECONDS = 2
+
+def report_job_owner():
+    """Job queue owner id of this browser session"""
+    if 'report_job_owner' not in st.session_state:
+        st.session_state.report_job_owner = uuid.uuid4().hex
+    return st.session_state.report_job_owner
 
+def submit_report_job(label, render, *args, file_name, mime, keep=False, **kwargs):
+    """
+    Queue render(*args, **kwargs) for the background workers.
+
+    Returns the ReportJob, or None when this session is at its job limit.
+    The job is listed under Report Jobs in the sidebar, which offers the
+    download; with keep=True the calling page shows the finished report
+    itself and the panel only reports its status.
+    """
+    try:
+        job = get_report_job_queue().submit(report_job_owner(), label, render, *args,
+                                            file_name=file_name, mime=mime, keep=keep, **kwargs)
+    except JobLimitError as e:
+        st.warning(f"⏳ {e}")
+        return None
+    if not keep:
+        st.info(f"⏳ {label} queued. Download it from 'Report Jobs' in the sidebar when it is ready.")
+    return job
+
+def _report_jobs_panel(polling):
+    queue = get_report_job_queue()
+    jobs = queue.jobs(report_job_owner())
+    if polling and not any(job.active for job in jobs):
+        # Everything finished: redraw the app once so the panel stops polling
+        st.rerun()
+
+    st.markdown("### 📥 Report Jobs")
+    st.dataframe(pd.DataFrame({
+        'Report': [job.label for job in jobs],
+        'Status': [job.status for job in jobs],
+        'Time (s)': [round(job.elapsed, 1) for job in jobs]
+    }), width="stretch", hide_index=True)
+
+    for job in jobs:
+        if job.status == DONE:
+            if job.keep:
+                st.caption(f"✅ {job.label} is ready under 'Preview & Export'.")
+            else:
+                # The file is read, then removed, only when the download is served,
+                # so the button costs nothing on the panel's polling runs
+                report_download_button(f"📥 {job.file_name}", functools.partial(queue.take, job.id),
+                                       file_name=job.file_name, mime=job.mime,
+                                       key=f"report_job_download_{job.id}")
+        elif job.status == FAILED:
+            st.error(f"{job.label}: {job.error}")
+            st.button("Dismiss", key=f"report_job_dismiss_{job.id}", on_click=queue.discard, args=(job.id,))
+
+@st.fragment(run_every=REPORT_JOB_POLL_SECONDS)
+def _report_jobs_polling():
+    _report_jobs_panel(polling=True)
+
+@st.fragment
+def _report_jobs_idle():
+    _report_jobs_panel(polling=False)
+
+@st.fragment(run_every=REPORT_JOB_POLL_SECONDS)
+def _generated_report_progress(keys):
+    """Status of the report jobs kept under keys; redraws the app once none is running"""
+    jobs = [job for job in map(generated_report_job, keys) if job is not None]
+    if not any(job.active for job in jobs):
+        st.rerun()
+    for job in jobs:
+        st.info(f"⏳ {job.label}: {job.status} ({job.elapsed:.0f} s)")
+
+def render_report_jobs():
+    """This session's report jobs; polls for status while any are queued or running"""
+    jobs = get_report_job_queue().jobs(report_job_owner())
+    if not jobs:
+        return
+    if any(job.active for job in jobs):
+        _report_jobs_polling()
+    else:
+        _report_jobs_idle()
 
 # ==================== MAIN TAB FUNCTION ====================
 
-def render_design_report_tab(df_sections, df_materials, loaded_data=None, member_groups=None, analysis_results=None):
+@st.cache_resource
+def get_report_fragment_cache():
+    """Rendered member fragments shared by every session, so regenerating re-renders only edited members"""
+    return FragmentCache(maxsize=2048)
+
+def render_design_report_tab(df_sections, df_materials, loaded_data=None, member_groups=None, analysis_results=None,
+                             section_index=None, material_index=None):
     """
     Render the Steel Design Report tab in Streamlit
     
@@ -6275,8 +698,14 @@ def render_design_report_tab(df_sections, df_materials, loaded_data=None, member
     - loaded_data: DataFrame with load data (optional, from Tab 5)
     - member_groups: Dict with member configurations (optional, from Tab 5)
     - analysis_results: Dict with analysis results (optional, from Tab 5)
+    - section_index / material_index: cached NameIndex of the two tables
+      (optional, e.g. the database snapshot's), so the name lists are not
+      rebuilt on every rerun
     """
     
+    section_names = section_index.names if section_index is not None else tuple(df_sections.index)
+    material_names = material_index.names if material_index is not None else tuple(df_materials.index)
+
     st.markdown(get_tab_styles(), unsafe_allow_html=True)
     st.markdown("## 📄 Steel Design Report Generator")
     st.markdown("Generate equation-based design reports per AISC 360-16")
@@ -6288,6 +717,8 @@ def render_design_report_tab(df_sections, df_materials, loaded_data=None, member
         st.session_state.generated_report = None
     if 'generated_text_report' not in st.session_state:
         st.session_state.generated_text_report = None
+    if 'generated_report_expired' not in st.session_state:
+        st.session_state.generated_report_expired = False
     
     # Create sub-tabs
     subtab1, subtab2, subtab3 = st.tabs([
@@ -6312,8 +743,8 @@ def render_design_report_tab(df_sections, df_materials, loaded_data=None, member
                     results_df = data.get('results', pd.DataFrame())
                     
                     # Get section properties
-                    section_name = config.get('section', list(df_sections.index)[0])
-                    material_name = config.get('material', list(df_materials.index)[0])
+                    section_name = config.get('section', section_names[0])
+                    material_name = config.get('material', material_names[0])
                     
                     section_props = get_section_properties_from_df(
                         df_sections, df_materials, section_name, material_name
@@ -6376,8 +807,8 @@ def render_design_report_tab(df_sections, df_materials, loaded_data=None, member
         
         with col1:
             new_member_no = st.text_input("Member No.", value="M-001", key="new_member_no")
-            new_section = st.selectbox("Section", list(df_sections.index), key="new_section")
-            new_material = st.selectbox("Material", list(df_materials.index), key="new_material")
+            new_section = st.selectbox("Section", section_names, key="new_section")
+            new_material = st.selectbox("Material", material_names, key="new_material")
             new_type = st.selectbox("Member Type", 
                                    ["Beam", "Column", "Beam-Column", "Tension Member"],
                                    key="new_type")
@@ -6592,76 +1023,87 @@ def render_design_report_tab(df_sections, df_materials, loaded_data=None, member
                 })
             
             df_summary = pd.DataFrame(summary_data)
-            st.dataframe(df_summary, use_container_width=True)
+            st.dataframe(df_summary, width="stretch")
             
             # Generate button
             st.markdown("---")
             
             if st.button("🚀 Generate Report", type="primary", key="generate_report"):
-                with st.spinner("Generating report..."):
-                    # Create report generator
-                    generator = SteelDesignReportGenerator(
-                        project_info={
-                            'name': project_name,
-                            'engineer': engineer_name,
-                            'date': report_date.strftime("%Y-%m-%d")
-                        }
-                    )
-                    
-                    # Add members
-                    for member in st.session_state.report_members:
-                        generator.add_member(member)
-                    
-                    # Generate HTML
-                    html_report = generator.generate_full_report()
-                    st.session_state.generated_report = html_report
-
-                    # Generate MIDAS-style plain text report (LRFD format)
-                    st.session_state.generated_text_report = generate_midas_gen_text_report(
-                        st.session_state.report_members,
-                        project_info={
-                            'name': project_name,
-                            'engineer': engineer_name,
-                            'date': report_date.strftime("%Y-%m-%d")
-                        },
-                        code_name="AISC(15th)-LRFD16"
-                    )
-                    
-                st.success("✅ Report generated successfully!")
-                st.info("Go to 'Preview & Export' tab to view and download")
+                project_info = {
+                    'name': project_name,
+                    'engineer': engineer_name,
+                    'date': report_date.strftime("%Y-%m-%d")
+                }
+
+                # Create report generator
+                generator = SteelDesignReportGenerator(project_info=project_info)
+
+                # Add members
+                for member in st.session_state.report_members:
+                    generator.add_member(member)
+
+                # Both reports are rendered by the background workers (members in
+                # parallel) and streamed straight into their job files
+                stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                html_job = submit_report_job(
+                    "HTML design report", iter_parallel_full_report, generator,
+                    file_name=f"Steel_Design_Report_{stamp}.html", mime="text/html",
+                    keep=True, cache=get_report_fragment_cache()
+                )
+
+                # MIDAS-style plain text report (LRFD format)
+                text_job = submit_report_job(
+                    "MIDAS text report", iter_parallel_midas_text_report, list(st.session_state.report_members),
+                    file_name=f"Steel_Design_Report_{stamp}.txt", mime="text/plain",
+                    keep=True, project_info=project_info, code_name="AISC(15th)-LRFD16",
+                    cache=get_report_fragment_cache()
+                )
+
+                if html_job is not None:
+                    set_generated_report('generated_report', html_job)
+                if text_job is not None:
+                    set_generated_report('generated_text_report', text_job)
+                if html_job is not None or text_job is not None:
+                    st.info("⏳ Generating the report. It appears in the 'Preview & Export' tab when ready.")
     
     # ==================== SUB-TAB 3: PREVIEW & EXPORT ====================
     with subtab3:
         st.markdown("### Report Preview & Export")
-        
-        if st.session_state.generated_report is None and st.session_state.generated_text_report is None:
-            st.warning("⚠️ No report generated yet. Go to 'Generate Report' tab.")
+
+        queue = get_report_job_queue()
+        html_job = generated_report_job('generated_report')
+        text_job = generated_report_job('generated_text_report')
+        report_jobs = [job for job in (html_job, text_job) if job is not None]
+
+        if not report_jobs:
+            if st.session_state.generated_report_expired:
+                st.warning(REPORT_EXPIRED_MESSAGE)
+            else:
+                st.warning("⚠️ No report generated yet. Go to 'Generate Report' tab.")
+        elif any(job.active for job in report_jobs):
+            _generated_report_progress(('generated_report', 'generated_text_report'))
         else:
+            for job in report_jobs:
+                if job.status == FAILED:
+                    st.error(f"❌ {job.label} failed: {job.error}")
+            html_job = html_job if html_job is not None and html_job.status == DONE else None
+            text_job = text_job if text_job is not None and text_job.status == DONE else None
+
             # Export buttons
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                # HTML download
-                b64 = base64.b64encode(st.session_state.generated_report.encode()).decode()
-                filename = f"Steel_Design_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-                
-                st.download_button(
-                    label="📥 Download HTML",
-                    data=st.session_state.generated_report,
-                    file_name=filename,
-                    mime="text/html",
-                    key="download_html"
-                )
+                if html_job is not None:
+                    report_download_button(
+                        "📥 Download HTML", functools.partial(queue.read, html_job.id),
+                        file_name=html_job.file_name, mime=html_job.mime, key="download_html"
+                    )
             
             with col2:
-                if st.session_state.generated_text_report:
-                    txt_name = f"Steel_Design_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                    st.download_button(
-                        label="📥 Download Text (MIDAS)",
-                        data=st.session_state.generated_text_report,
-                        file_name=txt_name,
-                        mime="text/plain",
-                        key="download_txt"
+                if text_job is not None:
+                    report_download_button(
+                        "📥 Download Text (MIDAS)", functools.partial(queue.read, text_job.id),
+                        file_name=text_job.file_name, mime=text_job.mime, key="download_txt"
                     )
 
             with col3:
@@ -6669,36 +1111,49 @@ def render_design_report_tab(df_sections, df_materials, loaded_data=None, member
             
             with col4:
                 if st.button("🔄 Regenerate", key="regenerate"):
-                    st.session_state.generated_report = None
-                    st.session_state.generated_text_report = None
+                    set_generated_report('generated_report', None)
+                    set_generated_report('generated_text_report', None)
                     st.rerun()
             
             st.markdown("---")
             
-            # Preview
+            # Preview (read from the job files and sent to the page only when shown)
             st.markdown("### 📄 Report Preview")
-            preview_html_tab, preview_text_tab = st.tabs(["HTML Preview", "Text Editor (MIDAS Style)"])
-
-            with preview_html_tab:
-                if st.session_state.generated_report:
-                    st.components.v1.html(
-                        st.session_state.generated_report,
-                        height=800,
-                        scrolling=True
-                    )
-                else:
-                    st.info("No HTML report generated in this session.")
-
-            with preview_text_tab:
-                if st.session_state.generated_text_report:
-                    st.text_area(
-                        "MIDAS-style LRFD Text Report",
-                        value=st.session_state.generated_text_report,
-                        height=800,
-                        key="midas_text_preview"
-                    )
-                else:
-                    st.info("No text report generated in this session.")
+            report_size = max((job.size for job in (html_job, text_job) if job is not None), default=0)
+            show_preview = st.checkbox(
+                "Show preview", value=report_size <= REPORT_PREVIEW_MAX_SIZE, key="show_report_preview",
+                help=f"Off by default for reports over {REPORT_PREVIEW_MAX_SIZE >> 20} MB; use the downloads instead"
+            )
+
+            if show_preview:
+                preview_html_tab, preview_text_tab = st.tabs(["HTML Preview", "Text Editor (MIDAS Style)"])
+
+                with preview_html_tab:
+                    html_preview = read_generated_report(html_job) if html_job is not None else None
+                    if html_preview is not None:
+                        st.components.v1.html(
+                            html_preview,
+                            height=800,
+                            scrolling=True
+                        )
+                    elif st.session_state.generated_report_expired:
+                        st.warning(REPORT_EXPIRED_MESSAGE)
+                    elif html_job is None:
+                        st.info("No HTML report generated in this session.")
+
+                with preview_text_tab:
+                    text_preview = read_generated_report(text_job) if text_job is not None else None
+                    if text_preview is not None:
+                        st.text_area(
+                            "MIDAS-style LRFD Text Report",
+                            value=text_preview,
+                            height=800,
+                            key="midas_text_preview"
+                        )
+                    elif st.session_state.generated_report_expired:
+                        st.warning(REPORT_EXPIRED_MESSAGE)
+                    elif text_job is None:
+                        st.info("No text report generated in this session.")
 
 
 # ==================== STANDALONE TAB CODE ====================
@@ -6725,7 +1180,9 @@ with tab_report:  # Change to your tab variable name
         df_materials=df_mat,     # Your materials DataFrame
         loaded_data=loaded_data,
         member_groups=member_groups,
-        analysis_results=analysis_results
+        analysis_results=analysis_results,
+        section_index=section_index,     # The snapshot's cached name indexes
+        material_index=material_index
     )
 '''
 
@@ -6758,95 +1215,41 @@ if __name__ == "__main__":
     # When imported as part of the main app, this section is skipped
     st.info("ℹ️ Running in demo mode with sample data")
 
-# ==================== EVALUATION FUNCTION ====================
-def evaluate_section_design(df, df_mat, section, material, design_loads, design_lengths):
-    """Comprehensive section evaluation"""
-    try:
-        weight_col = 'Unit Weight [kg/m]' if 'Unit Weight [kg/m]' in df.columns else 'w [kg/m]'
-        weight = safe_scalar(df.loc[section, weight_col])
-        
-        flex_result = aisc_360_16_f2_flexural_design(df, df_mat, section, material, design_lengths['Lb'])
-        comp_result = aisc_360_16_e3_compression_design(df, df_mat, section, material, 
-                                                       design_lengths['KLx'], design_lengths['KLy'])
-        
-        if flex_result and comp_result:
-            phi_Mn = 0.9 * flex_result['Mn']
-            phi_Pn = comp_result['phi_Pn']
-            
-            moment_ratio = design_loads['Mu'] / phi_Mn if phi_Mn > 0 else 999
-            axial_ratio = design_loads['Pu'] / phi_Pn if phi_Pn > 0 else 999
-            
-            flexural_adequate = moment_ratio <= 1.0
-            compression_adequate = axial_ratio <= 1.0
-            overall_adequate = flexural_adequate and compression_adequate
-            
-            Lp = flex_result['Lp']
-            Lr = flex_result['Lr'] 
-            current_Lb = design_lengths['Lb']
-            
-            if current_Lb <= Lp:
-                flexural_zone = "Yielding (F2.1)"
-            elif current_Lb <= Lr:
-                flexural_zone = "Inelastic LTB (F2.2)"
-            else:
-                flexural_zone = "Elastic LTB (F2.3)"
-            
-            return {
-                'section': section,
-                'material': material,
-                'weight': weight,
-                'flexural': {
-                    'Mn': flex_result['Mn'],
-                    'phi_Mn': phi_Mn,
-                    'Mp': flex_result['Mp'],
-                    'Lp': Lp,
-                    'Lr': Lr,
-                    'case': flex_result['Case'],
-                    'zone': flexural_zone,
-                    'ratio': moment_ratio,
-                    'adequate': flexural_adequate,
-                },
-                'compression': {
-                    'Pn': comp_result['Pn'],
-                    'phi_Pn': phi_Pn,
-                    'Fcr': comp_result['Fcr'],
-                    'lambda_c': comp_result['lambda_c'],
-                    'mode': comp_result['buckling_mode'],
-                    'ratio': axial_ratio,
-                    'adequate': compression_adequate,
-                },
-                'design_check': {
-                    'overall_adequate': overall_adequate,
-                    'moment_utilization': moment_ratio,
-                    'axial_utilization': axial_ratio,
-                }
-            }
-    except Exception as e:
-        st.error(f"Error in section evaluation: {e}")
-        return None
+@st.cache_resource
+def get_database_watcher():
+    """Databases shared by every session, rebuilt in the background when the files change"""
+    return DatabaseWatcher()
 
-# ==================== LOAD DATA ====================
-@st.cache_data
 def load_data():
-    """Load steel section and material databases"""
+    """Current database snapshot and whether it could be loaded"""
     try:
-        file_path = "https://raw.githubusercontent.com/Thana-site/Steel_Design_2003/main/2003-Steel-Beam-DataBase-H-Shape.csv"
-        file_path_mat = "https://raw.githubusercontent.com/Thana-site/Steel_Design_2003/main/2003-Steel-Beam-DataBase-Material.csv"
-        
-        df = pd.read_csv(file_path, index_col=0, encoding='ISO-8859-1')
-        df_mat = pd.read_csv(file_path_mat, index_col=0, encoding="utf-8")
-        return df, df_mat, True
+        return get_database_watcher().snapshot, True
     except Exception:
-        return pd.DataFrame(), pd.DataFrame(), False
+        return None, False
 
 # Load data immediately
-df, df_mat, data_loaded = load_data()
+snapshot, data_loaded = load_data()
 
 # Stop if data failed to load
 if not data_loaded:
-    st.error("❌ Failed to load data. Please check your internet connection.")
+    st.error("❌ Failed to load the section and material databases. Keep the bundled CSV files next to "
+             "Function.py or set STEEL_DESIGN_DATA_SOURCE to their directory or URL.")
     st.stop()
 
+# One snapshot per run, so a reload never mixes two database versions
+df, df_mat, catalog = snapshot.df, snapshot.df_mat, snapshot.catalog
+
+# Picker lists and search structures, built once per database version
+section_index = snapshot.section_index
+material_index = snapshot.material_index
+
+if get_database_watcher().last_error is not None:
+    st.warning(f"⚠️ Reloading the databases failed, still using version {snapshot.version}: "
+               f"{get_database_watcher().last_error}")
+if st.session_state.get('database_version', snapshot.version) != snapshot.version:
+    st.toast(f"🔄 Section and material databases updated (version {snapshot.version})")
+st.session_state.database_version = snapshot.version
+
 # ==================== NOW SAFE TO INITIALIZE SESSION STATE ====================
 # Initialize with cleaned values (strip whitespace) to match dropdown options
 if 'selected_material' not in st.session_state:
@@ -6889,6 +1292,10 @@ if 'member_groups' not in st.session_state:
 if 'analysis_results_tab5' not in st.session_state:
     st.session_state.analysis_results_tab5 = {}
 
+# Bumped whenever analysis_results_tab5 is replaced; keys the prepared exports
+if 'analysis_results_tab5_version' not in st.session_state:
+    st.session_state.analysis_results_tab5_version = 0
+
 # ==================== LIBRARY STATUS WARNINGS ====================
 if not PDF_AVAILABLE:
     st.sidebar.warning("⚠️ PDF export unavailable. Install: `pip install reportlab`")
@@ -6905,9 +1312,8 @@ with st.sidebar:
     st.markdown("---")
 
     # ========== MATERIAL SELECTION ==========
-    # Clean material list - nuclear option to remove duplicates and hidden chars
-    material_options = df_mat.index.astype(str).str.strip().unique().tolist()
-    material_options = sorted(list(set(material_options)))
+    # Stripped, de-duplicated and sorted once in the cached name index
+    material_options = material_index.sorted_names
 
     # Use reusable dropdown component
     selected_material = create_dropdown(
@@ -6933,10 +1339,32 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("### 📐 Section Selection")
 
+    # ========== SECTION FILTER ==========
+    with st.expander("🔎 Filter Sections", expanded=False):
+        st.caption("Catalog: " + ", ".join(
+            f"{len(catalog.sections(family))} {SHAPE_FAMILIES[family][0]}" for family in catalog.families))
+        d_min, d_max = catalog.dimension_range('H', 'd')
+        depth_range = st.slider("Depth d (mm):", d_min, d_max, (d_min, d_max), 1.0,
+                                key="section_filter_depth")
+        w_min, w_max = catalog.dimension_range('H', 'w')
+        weight_range = st.slider("Weight w (kg/m):", w_min, w_max, (w_min, w_max), 0.1,
+                                 key="section_filter_weight")
+        section_query = st.text_input("Search:", key="section_search",
+                                      placeholder="e.g. 400x200, W-*45, 94",
+                                      help="Prefix of the name, nominal size or weight; d×bf matches exactly")
+
     # ========== SECTION SELECTION ==========
-    # Clean section list - nuclear option to remove duplicates and hidden chars
-    section_options = df.index.astype(str).str.strip().unique().tolist()
-    section_options = sorted(list(set(section_options)))
+    # Stripped, de-duplicated and sorted once in the cached name index
+    section_options = section_index.sorted_names
+    if section_query or depth_range != (d_min, d_max) or weight_range != (w_min, w_max):
+        filtered_sections = catalog.filter(DESIGN_FAMILIES, d=depth_range, w=weight_range)
+        if section_query:
+            matches = set(section_index.search(section_query))
+            filtered_sections = [name for name in filtered_sections if name in matches]
+        if filtered_sections:
+            section_options = sorted({name.strip() for name in section_index.select(filtered_sections)})
+        else:
+            st.warning("⚠️ No section matches the filter; showing all sections")
 
     # Use reusable dropdown component
     selected_section = create_dropdown(
@@ -7048,6 +1476,7 @@ tab1, tab2, tab3, tab4, tab5 = st.tabs([
 
 # ==================== TAB 1: DESIGN ANALYSIS ====================
 with tab1:
+    go = get_plotly_go()
     st.markdown('<h2 class="section-header">📊 Comprehensive Design Analysis</h2>', unsafe_allow_html=True)
     
     if selected_section and selected_material:
@@ -7126,7 +1555,7 @@ with tab1:
                     layout['height'] = 600
                     
                     fig.update_layout(layout)
-                    st.plotly_chart(fig, use_container_width=True, config=create_enhanced_plotly_config())
+                    st.plotly_chart(fig, width="stretch", config=create_enhanced_plotly_config())
         
         elif analysis_type == "Column Design (E3)":
             col1, col2 = st.columns([1, 2])
@@ -7143,10 +1572,29 @@ with tab1:
                     st.metric("φPn", f"{comp_result['phi_Pn']:.2f} tons")
                     st.metric("Buckling Mode", comp_result['buckling_mode'])
                     ratio = Pu / comp_result['phi_Pn']
-                    st.metric("Utilization", f"{ratio:.3f}", 
+                    st.metric("Utilization", f"{ratio:.3f}",
                              delta="✓ PASS" if ratio <= 1.0 else "✗ FAIL")
                     st.markdown('</div>', unsafe_allow_html=True)
-            
+
+                kl_result = aisc_360_16_e3_max_effective_length(df, df_mat, section, selected_material, Pu)
+
+                if kl_result:
+                    if not kl_result['adequate']:
+                        kl_text = f"Pu exceeds φPy = {kl_result['phi_Py']:.2f} tons"
+                    elif math.isinf(kl_result['KL_max']):
+                        kl_text = "No compression demand"
+                    else:
+                        kl_text = (f"KL max = {kl_result['KL_max']:.3f} m<br>"
+                                   f"KLx max = {kl_result['KLx_max']:.3f} m<br>"
+                                   f"KLy max = {kl_result['KLy_max']:.3f} m<br>"
+                                   f"(KL/r)max = {kl_result['lambda_max']:.1f}, {kl_result['buckling_mode']}")
+                    st.markdown(f"""
+                    <div class="critical-lengths-box">
+                    <b>Maximum Effective Length for Pu:</b><br>
+                    {kl_text}
+                    </div>
+                    """, unsafe_allow_html=True)
+
             with col2:
                 if comp_result:
                     # Generate capacity curve
@@ -7156,7 +1604,7 @@ with tab1:
                     Fy = safe_scalar(df_mat.loc[selected_material, "Yield Point (ksc)"])
                     E = safe_scalar(df_mat.loc[selected_material, "E"])
                     Ag = safe_scalar(df.loc[section, 'A [cm2]'])
-                    lambda_limit = 4.71 * safe_sqrt(E / Fy)
+                    lambda_limit = grade_constant_row(df_mat, selected_material)['lambda_e3']
                     
                     for lc in lambda_points:
                         Fe = (math.pi**2 * E) / (lc**2)
@@ -7194,9 +1642,34 @@ with tab1:
                     layout['xaxis']['title'] = "Slenderness Ratio (KL/r)"
                     layout['yaxis']['title'] = "Design Strength, φPn (tons)"
                     layout['height'] = 600
-                    
+
                     fig.update_layout(layout)
-                    st.plotly_chart(fig, use_container_width=True, config=create_enhanced_plotly_config())
+                    st.plotly_chart(fig, width="stretch", config=create_enhanced_plotly_config())
+
+            with st.expander("📏 Maximum Effective Length for All Sections", expanded=False):
+                kl_col1, kl_col2 = st.columns(2)
+                with kl_col1:
+                    kl_materials = st.multiselect("Materials:", material_index.names,
+                                                  default=[selected_material], key="kl_max_materials")
+                with kl_col2:
+                    kl_limit_200 = st.checkbox("Limit KL/r to 200", value=True, key="kl_max_limit")
+
+                if kl_materials:
+                    kl_table = aisc_360_16_e3_max_effective_length_table(
+                        df, df_mat, Pu, materials=kl_materials,
+                        max_slenderness=200.0 if kl_limit_200 else None
+                    )
+                    kl_table = kl_table[kl_table['Adequate']].sort_values(['Material', 'w [kg/m]'])
+
+                    st.dataframe(kl_table.drop(columns=['Adequate']).round(3),
+                                 width="stretch", hide_index=True)
+                    st.download_button(
+                        label="📥 Download KL max Table (CSV)",
+                        data=kl_table.to_csv(index=False),
+                        file_name=f"kl_max_Pu_{Pu:g}t.csv",
+                        mime="text/csv",
+                        key="kl_max_download"
+                    )
         
         else:  # Beam-Column H1
             col1, col2 = st.columns([1, 2])
@@ -7282,12 +1755,14 @@ with tab1:
                     layout['height'] = 600
                     
                     fig.update_layout(layout)
-                    st.plotly_chart(fig, use_container_width=True, config=create_enhanced_plotly_config())
+                    st.plotly_chart(fig, width="stretch", config=create_enhanced_plotly_config())
     else:
         st.warning("⚠️ Please select a section from the sidebar")
 
 # ==================== TAB 2: SECTION COMPARISON ====================
 with tab2:
+    go = get_plotly_go()
+    make_subplots = get_make_subplots()
     st.markdown('<h2 class="section-header">📈 Advanced Section Comparison</h2>', unsafe_allow_html=True)
     
     # Selection interface
@@ -7296,8 +1771,8 @@ with tab2:
     with col1:
         sections_to_compare = st.multiselect(
             "Select Sections to Compare:",
-            list(df.index),
-            default=list(df.index)[:5] if len(df.index) >= 5 else list(df.index)
+            section_index.names,
+            default=section_index.names[:5]
         )
     
     with col2:
@@ -7384,7 +1859,7 @@ with tab2:
             layout['title'] = "AISC 360-16 Multi-Section Comparison"
             fig.update_layout(layout)
             
-            st.plotly_chart(fig, use_container_width=True, config=create_enhanced_plotly_config())
+            st.plotly_chart(fig, width="stretch", config=create_enhanced_plotly_config())
             
             # Enhanced Comparison Table
             st.markdown("### 📊 Detailed Comparison Table")
@@ -7400,7 +1875,7 @@ with tab2:
                 'Compression Efficiency': '{:.3f}'
             }).background_gradient(cmap='Blues', subset=['φMn (t·m)', 'φPn (tons)'])
             
-            st.dataframe(styled_df, use_container_width=True, height=400)
+            st.dataframe(styled_df, width="stretch", height=400)
     else:
         st.warning("⚠️ Please select sections to compare")
 
@@ -7495,24 +1970,16 @@ with tab3:
                         'revision': '0'
                     })
                     
-                    with st.spinner('Generating calculation report...'):
-                        pdf_buffer = generate_calculation_report(
-                            df, df_mat, section, selected_material, 
-                            st.session_state.evaluation_results, design_params, project_info
-                        )
-                    
-                    if pdf_buffer:
-                        # Create filename with project info
-                        proj_name = project_info.get('project_name', 'Project').replace(' ', '_')[:20]
-                        filename = f"Calc_{proj_name}_{section}_{datetime.now().strftime('%Y%m%d')}.pdf"
-                        
-                        st.download_button(
-                            label="📥 Download Calculation Report (PDF)",
-                            data=pdf_buffer,
-                            file_name=filename,
-                            mime="application/pdf"
-                        )
-                        st.success("✅ calculation report generated!")
+                    # Create filename with project info
+                    proj_name = project_info.get('project_name', 'Project').replace(' ', '_')[:20]
+                    filename = f"Calc_{proj_name}_{section}_{datetime.now().strftime('%Y%m%d')}.pdf"
+
+                    submit_report_job(
+                        f"Calculation report {section}", generate_calculation_report,
+                        df, df_mat, section, selected_material,
+                        st.session_state.evaluation_results, design_params, dict(project_info),
+                        file_name=filename, mime="application/pdf"
+                    )
             else:
                 st.warning("⚠️ PDF export requires reportlab library")
                 st.code("pip install reportlab")
@@ -7527,20 +1994,13 @@ with tab3:
                         'Cb': 1.0
                     }
                     
-                    with st.spinner('Generating enhanced Excel report...'):
-                        excel_buffer = generate_enhanced_excel_report(
-                            df, df_mat, section, selected_material, 
-                            st.session_state.evaluation_results, design_params
-                        )
-                    
-                    if excel_buffer:
-                        st.download_button(
-                            label="📥 Download Enhanced Excel Report",
-                            data=excel_buffer,
-                            file_name=f"AISC_Enhanced_Report_{section}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                        )
-                        st.success("✅ Enhanced Excel report with detailed calculations generated successfully!")
+                    submit_report_job(
+                        f"Excel report {section}", generate_enhanced_excel_report,
+                        df, df_mat, section, selected_material,
+                        st.session_state.evaluation_results, design_params,
+                        file_name=f"AISC_Enhanced_Report_{section}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                    )
             else:
                 st.warning("⚠️ Excel export requires openpyxl library")
                 st.code("pip install openpyxl")
@@ -7624,8 +2084,70 @@ with tab4:
 # 3. Sub-Tab 5.3: Design Check - Run analysis for all load combinations
 # 4. Sub-Tab 5.4: Summary Report - Export results and visualizations
 
+# ==================== TAB 5 EXPORTS ====================
+def build_tab5_csv_exports(all_results, df_summary):
+    """Summary and detailed CSV of the Tab 5 results, written into ReportFiles"""
+    # Detailed CSV (all load combinations)
+    all_detailed = []
+    for member, data in all_results.items():
+        df_result = data['results'].copy()
+        df_result['Member'] = member
+        df_result['Section'] = data['config']['section']
+        df_result['Material'] = data['config']['material']
+        df_result['Type'] = data['config']['member_type']
+        all_detailed.append(df_result)
+
+    exports = {'summary_csv': ReportFile(), 'detailed_csv': ReportFile()}
+    df_summary.to_csv(exports['summary_csv'], index=False)
+    pd.concat(all_detailed, ignore_index=True).to_csv(exports['detailed_csv'], index=False)
+    return exports
+
+def close_tab5_exports(exports):
+    """Release the spooled files of prepared Tab 5 exports"""
+    for name in ('summary_csv', 'detailed_csv'):
+        exports[name].close()
+
+def tab5_takeoffs(df, all_results, version, optimizer_results=None, prices=None):
+    """
+    Quantity takeoff of the checked design and, after an Optimizer run, of
+    the optimized one (else None). Kept in the session until the results
+    (version), the Optimizer run or the database change.
+    """
+    cached = st.session_state.get('tab5_takeoffs')
+    if (cached is not None and cached['version'] == version and cached['df'] is df
+            and cached['optimizer_results'] is optimizer_results and cached['prices'] is prices):
+        return cached['takeoff'], cached['alternative']
+
+    design_configs = {member: data['config'] for member, data in all_results.items()}
+    takeoff = quantity_takeoff(df, design_configs, prices=prices)
+    alternative = None
+    if optimizer_results:
+        optimized_configs = apply_design_choice(design_configs, optimizer_results[0])
+        alternative = quantity_takeoff(df, optimized_configs, prices=prices)
+
+    st.session_state.tab5_takeoffs = {
+        'version': version, 'df': df, 'optimizer_results': optimizer_results, 'prices': prices,
+        'takeoff': takeoff, 'alternative': alternative
+    }
+    return takeoff, alternative
+
+def build_tab5_workbook(all_results, df_summary, takeoff_sheets, excel_layout):
+    """Excel workbook of the Tab 5 results (run as a report job)"""
+    if excel_layout == "Single results table":
+        return write_results_workbook(all_results, summary=df_summary, extra_sheets=takeoff_sheets)
+
+    # Summary, one sheet per member, then the quantity takeoff
+    def excel_sheets():
+        yield 'Summary', df_summary
+        for member, data in all_results.items():
+            yield member, data['results']
+        yield from takeoff_sheets
+
+    return write_table_workbook(excel_sheets())
+
 # ==================== TAB 5: LOAD IMPORT & MEMBER CHECK (ENHANCED) ====================
 with tab5:
+    go = get_plotly_go()
     st.markdown('<h2 class="section-header">📦 Load Data Import & Member-Based Design Check</h2>', unsafe_allow_html=True)
     
     # Initialize session state for Tab 5
@@ -7637,11 +2159,12 @@ with tab5:
         st.session_state.analysis_results_tab5 = {}
     
     # Create sub-tabs for organization
-    subtab1, subtab2, subtab3, subtab4 = st.tabs([
+    subtab1, subtab2, subtab3, subtab4, subtab5 = st.tabs([
         "📁 Data Import",
         "👥 Member Groups",
         "🔍 Design Check",
-        "📊 Summary Report"
+        "📊 Summary Report",
+        "💰 Optimizer"
     ])
     
     # ==================== SUB-TAB 1: DATA IMPORT ====================
@@ -7746,7 +2269,7 @@ T301,5,0.0,-55.0"""
                     
                     # Preview data
                     with st.expander("👁️ Preview Raw Load Data", expanded=True):
-                        st.dataframe(df_loads, use_container_width=True, height=300)
+                        st.dataframe(df_loads, width="stretch", height=300)
                     
                     # Member summary
                     with st.expander("📊 Member Summary", expanded=True):
@@ -7764,7 +2287,7 @@ T301,5,0.0,-55.0"""
                             axis=1
                         )
                         
-                        st.dataframe(member_summary, use_container_width=True)
+                        st.dataframe(member_summary, width="stretch")
                     
                     # Auto-create member groups button
                     if st.button("🔄 Auto-Create Member Groups", type="primary", key="auto_create_groups"):
@@ -7787,12 +2310,13 @@ T301,5,0.0,-55.0"""
                                     default_type = "Beam (Flexure Only)"
                                 
                                 st.session_state.member_groups[member] = {
-                                    'section': list(df.index)[0] if len(df.index) > 0 else None,
-                                    'material': list(df_mat.index)[0] if len(df_mat.index) > 0 else None,
+                                    'section': section_index.names[0] if len(section_index) > 0 else None,
+                                    'material': material_index.names[0] if len(material_index) > 0 else None,
                                     'member_type': default_type,
                                     'Lb': 3.0,
                                     'KL': 3.0,
-                                    'Cb': 1.0
+                                    'Cb': 1.0,
+                                    'length': 3.0
                                 }
                         st.success(f"✅ Created {len(members)} member groups. Go to 'Member Groups' tab to configure.")
                         st.rerun()
@@ -7812,7 +2336,7 @@ T301,5,0.0,-55.0"""
                     'Mu': [45.5, 52.8, 38.2, 12.5, 15.8, 0.0, 0.0],
                     'Pu': [120.3, 135.7, -98.5, 250.3, 285.7, -45.5, -52.8]
                 }
-                st.dataframe(pd.DataFrame(example_data), use_container_width=True)
+                st.dataframe(pd.DataFrame(example_data), width="stretch")
                 
                 st.markdown("""
                 <div class="info-box">
@@ -7848,14 +2372,14 @@ T301,5,0.0,-55.0"""
                     
                     batch_section = st.selectbox(
                         "Section:",
-                        list(df.index),
+                        section_index.names,
                         index=0,
                         key="batch_section"
                     )
                     
                     batch_material = st.selectbox(
                         "Material:",
-                        list(df_mat.index),
+                        material_index.names,
                         index=0,
                         key="batch_material"
                     )
@@ -7871,6 +2395,9 @@ T301,5,0.0,-55.0"""
                     batch_Lb = st.number_input("Lb (m):", 0.1, 20.0, 3.0, 0.1, key="batch_lb")
                     batch_KL = st.number_input("KL (m):", 0.1, 20.0, 3.0, 0.1, key="batch_kl")
                     batch_Cb = st.number_input("Cb:", 1.0, 3.0, 1.0, 0.1, key="batch_cb")
+                    batch_length = st.number_input("Member Length (m):", 0.1, 100.0, 3.0, 0.1, key="batch_length")
+                    batch_group = st.text_input("Group:", "", key="batch_group",
+                                                help="Label used to roll up tonnage (e.g. level or frame line)")
                 
                 if st.button("✅ Apply to Selected Members", key="apply_batch"):
                     for member in selected_members_batch:
@@ -7880,7 +2407,9 @@ T301,5,0.0,-55.0"""
                             'member_type': batch_type,
                             'Lb': batch_Lb,
                             'KL': batch_KL,
-                            'Cb': batch_Cb
+                            'Cb': batch_Cb,
+                            'length': batch_length,
+                            'group': batch_group.strip()
                         }
                     st.success(f"✅ Applied settings to {len(selected_members_batch)} members")
                     st.rerun()
@@ -7903,12 +2432,13 @@ T301,5,0.0,-55.0"""
             if selected_member_edit:
                 # Get current config or create default
                 current_config = st.session_state.member_groups.get(selected_member_edit, {
-                    'section': list(df.index)[0],
-                    'material': list(df_mat.index)[0],
+                    'section': section_index.names[0],
+                    'material': material_index.names[0],
                     'member_type': "Beam-Column (Compression)",
                     'Lb': 3.0,
                     'KL': 3.0,
-                    'Cb': 1.0
+                    'Cb': 1.0,
+                    'length': 3.0
                 })
                 
                 col_edit1, col_edit2, col_edit3 = st.columns(3)
@@ -7916,15 +2446,15 @@ T301,5,0.0,-55.0"""
                 with col_edit1:
                     edit_section = st.selectbox(
                         "Section:",
-                        list(df.index),
-                        index=list(df.index).index(current_config['section']) if current_config['section'] in df.index else 0,
+                        section_index.names,
+                        index=section_index.index_of(current_config['section']),
                         key="edit_section"
                     )
                     
                     edit_material = st.selectbox(
                         "Material:",
-                        list(df_mat.index),
-                        index=list(df_mat.index).index(current_config['material']) if current_config['material'] in df_mat.index else 0,
+                        material_index.names,
+                        index=material_index.index_of(current_config['material']),
                         key="edit_material"
                     )
                 
@@ -7943,6 +2473,9 @@ T301,5,0.0,-55.0"""
                 with col_edit3:
                     edit_KL = st.number_input("KL (m):", 0.1, 20.0, current_config['KL'], 0.1, key="edit_kl")
                     edit_Cb = st.number_input("Cb:", 1.0, 3.0, current_config['Cb'], 0.1, key="edit_cb")
+                    edit_length = st.number_input("Member Length (m):", 0.1, 100.0,
+                                                  member_length(current_config), 0.1, key="edit_length")
+                    edit_group = st.text_input("Group:", current_config.get('group', ""), key="edit_group")
                 
                 if st.button("💾 Save Member Configuration", key="save_member_config"):
                     st.session_state.member_groups[selected_member_edit] = {
@@ -7951,14 +2484,16 @@ T301,5,0.0,-55.0"""
                         'member_type': edit_type,
                         'Lb': edit_Lb,
                         'KL': edit_KL,
-                        'Cb': edit_Cb
+                        'Cb': edit_Cb,
+                        'length': edit_length,
+                        'group': edit_group.strip()
                     }
                     st.success(f"✅ Saved configuration for Member {selected_member_edit}")
                 
                 # Show member load data
                 with st.expander(f"📊 Load Data for Member {selected_member_edit}", expanded=True):
                     member_data = df_loads[df_loads['Member No.'] == selected_member_edit]
-                    st.dataframe(member_data, use_container_width=True)
+                    st.dataframe(member_data, width="stretch")
             
             # Member groups summary table
             st.markdown("---")
@@ -7973,6 +2508,8 @@ T301,5,0.0,-55.0"""
                         'Section': config['section'],
                         'Material': config['material'],
                         'Type': config['member_type'],
+                        'Group': config.get('group') or "Ungrouped",
+                        'Length (m)': member_length(config),
                         'Lb (m)': config['Lb'],
                         'KL (m)': config['KL'],
                         '# LCs': len(member_loads),
@@ -7983,12 +2520,13 @@ T301,5,0.0,-55.0"""
                 
                 df_summary = pd.DataFrame(summary_data)
                 st.dataframe(df_summary.style.format({
+                    'Length (m)': '{:.2f}',
                     'Lb (m)': '{:.2f}',
                     'KL (m)': '{:.2f}',
                     'Max |Mu|': '{:.2f}',
                     'Max Pu': '{:.2f}',
                     'Min Pu': '{:.2f}'
-                }), use_container_width=True, height=400)
+                }), width="stretch", height=400)
             else:
                 st.info("No member groups configured yet.")
     
@@ -8244,17 +2782,19 @@ T301,5,0.0,-55.0"""
                                     'Mode': str(e)[:30]
                                 })
                         
-                        # Store results
+                        # Store results with a copy of the configuration, so later edits
+                        # to the member groups do not rewrite results already checked
                         df_results = pd.DataFrame(results)
                         all_results[member] = {
                             'results': df_results,
-                            'config': config
+                            'config': dict(config)
                         }
                         
                         progress_bar.progress((i + 1) / len(members_to_analyze))
                     
                     status_text.text("✅ Analysis Complete!")
                     st.session_state.analysis_results_tab5 = all_results
+                    st.session_state.analysis_results_tab5_version += 1
                     st.success(f"✅ Completed analysis for {len(all_results)} members")
             
             # Display Results
@@ -8358,7 +2898,7 @@ T301,5,0.0,-55.0"""
                     }).applymap(style_status, subset=['Status'])\
                       .applymap(style_ratio, subset=['Ratio'])
                     
-                    st.dataframe(styled_results, use_container_width=True, height=350)
+                    st.dataframe(styled_results, width="stretch", height=350)
                     
                     # Strength ratio chart
                     st.markdown("#### 📊 Strength Ratio Chart")
@@ -8393,7 +2933,7 @@ T301,5,0.0,-55.0"""
                         layout['height'] = 450
                         
                         fig.update_layout(layout)
-                        st.plotly_chart(fig, use_container_width=True, config=create_enhanced_plotly_config())
+                        st.plotly_chart(fig, width="stretch", config=create_enhanced_plotly_config())
             else:
                 st.info("💡 Run the design analysis to see results")
     
@@ -8470,7 +3010,7 @@ T301,5,0.0,-55.0"""
                 'Max Ratio': '{:.3f}'
             }).applymap(style_summary_status, subset=['Status'])
             
-            st.dataframe(styled_summary, use_container_width=True, height=400)
+            st.dataframe(styled_summary, width="stretch", height=400)
             
             # Visualization
             st.markdown("#### 📊 Summary Visualization")
@@ -8503,7 +3043,7 @@ T301,5,0.0,-55.0"""
                         template='plotly_white'
                     )
                     
-                    st.plotly_chart(fig_bar, use_container_width=True)
+                    st.plotly_chart(fig_bar, width="stretch")
             
             with col_chart2:
                 # Pie chart of pass/fail
@@ -8520,93 +3060,259 @@ T301,5,0.0,-55.0"""
                     height=400
                 )
                 
-                st.plotly_chart(fig_pie, use_container_width=True)
-            
+                st.plotly_chart(fig_pie, width="stretch")
+
+            # Quantity takeoff
+            st.markdown("---")
+            st.markdown("#### 🏗️ Quantity Takeoff")
+
+            takeoff, alternative = tab5_takeoffs(
+                df, all_results, st.session_state.analysis_results_tab5_version,
+                st.session_state.get('optimizer_results'), st.session_state.get('optimizer_prices_used')
+            )
+            takeoff_tables = {TAKEOFF_KEYS[key]: takeoff[key] for key in TAKEOFF_KEYS}
+
+            col_q1, col_q2, col_q3 = st.columns(3)
+            with col_q1:
+                st.metric("Total Tonnage", f"{takeoff['totals']['tonnage']:,.3f} t")
+            with col_q2:
+                st.metric("Total Length", f"{takeoff['totals']['length']:,.1f} m")
+            with col_q3:
+                st.metric("Total Cost", f"{takeoff['totals']['cost']:,.2f}"
+                          if takeoff['totals']['cost'] is not None else "—",
+                          help="Uses the unit prices of the last Optimizer run")
+
+            takeoff_by = st.radio("Roll up by:", list(takeoff_tables.keys()), horizontal=True,
+                                  key="takeoff_rollup")
+            st.dataframe(takeoff_tables[takeoff_by].style.format({
+                'Total Length (m)': '{:,.2f}',
+                'Tonnage (t)': '{:,.3f}',
+                'Cost': '{:,.2f}'
+            }, na_rep="—"), width="stretch", hide_index=True)
+
+            takeoff_delta_table = None
+            if alternative is not None:
+                takeoff_key = next(key for key, label in TAKEOFF_KEYS.items() if label == takeoff_by)
+                takeoff_delta_table = takeoff_delta(takeoff, alternative, key=takeoff_key)
+
+                st.markdown("##### Current vs Optimized Design")
+                st.dataframe(takeoff_delta_table.style.format({
+                    'Current (t)': '{:,.3f}',
+                    'Alternative (t)': '{:,.3f}',
+                    'Δ (t)': '{:+,.3f}',
+                    'Δ (%)': '{:+.1f}'
+                }, na_rep="—"), width="stretch", hide_index=True)
+
+            report_download_button(
+                "📥 Quantity Takeoff (CSV)", functools.partial(takeoff['members'].to_csv, index=False),
+                file_name=f"Quantity_Takeoff_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv",
+                key="export_takeoff_csv"
+            )
+
             # Export options
             st.markdown("---")
             st.markdown("#### 💾 Export Results")
-            
+
+            takeoff_sheets = [(f"Takeoff by {label}", table) for label, table in takeoff_tables.items()]
+            if takeoff_delta_table is not None:
+                takeoff_sheets.append(("Takeoff Delta", takeoff_delta_table))
+
+            excel_layout = st.radio(
+                "Excel layout:", ["Single results table", "Sheet per member"],
+                key="excel_layout", horizontal=True,
+                help="A single table with an index sheet opens quickly for large models"
+            )
+
+            # CSV files are built on request and kept until the results change
+            export_key = st.session_state.analysis_results_tab5_version
+            exports = st.session_state.get('tab5_exports')
+            if exports is not None and exports['key'] != export_key:
+                close_tab5_exports(exports)
+                exports = st.session_state.tab5_exports = None
+
+            if exports is None:
+                st.caption("CSV files are built when you prepare them.")
+                if st.button("⚙️ Prepare CSV Files", key="prepare_exports"):
+                    with st.spinner(f"Preparing CSV files for {len(all_results)} members..."):
+                        exports = build_tab5_csv_exports(all_results, df_summary)
+                    exports['key'] = export_key
+                    st.session_state.tab5_exports = exports
+
             col_exp1, col_exp2, col_exp3 = st.columns(3)
-            
-            with col_exp1:
-                # Summary CSV
-                csv_summary = df_summary.to_csv(index=False)
-                st.download_button(
-                    label="📥 Summary (CSV)",
-                    data=csv_summary,
-                    file_name=f"Design_Summary_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv",
-                    key="export_summary_csv"
-                )
-            
-            with col_exp2:
-                # Detailed CSV (all load combinations)
-                all_detailed = []
-                for member, data in all_results.items():
-                    df_result = data['results'].copy()
-                    df_result['Member'] = member
-                    df_result['Section'] = data['config']['section']
-                    df_result['Material'] = data['config']['material']
-                    df_result['Type'] = data['config']['member_type']
-                    all_detailed.append(df_result)
-                
-                df_all_detailed = pd.concat(all_detailed, ignore_index=True)
-                csv_detailed = df_all_detailed.to_csv(index=False)
-                
-                st.download_button(
-                    label="📥 Detailed (CSV)",
-                    data=csv_detailed,
-                    file_name=f"Design_Detailed_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv",
-                    key="export_detailed_csv"
-                )
-            
+
+            if exports is not None:
+                with col_exp1:
+                    report_download_button(
+                        "📥 Summary (CSV)", exports['summary_csv'].read,
+                        file_name=f"Design_Summary_{datetime.now().strftime('%Y%m%d')}.csv",
+                        mime="text/csv",
+                        key="export_summary_csv"
+                    )
+
+                with col_exp2:
+                    report_download_button(
+                        "📥 Detailed (CSV)", exports['detailed_csv'].read,
+                        file_name=f"Design_Detailed_{datetime.now().strftime('%Y%m%d')}.csv",
+                        mime="text/csv",
+                        key="export_detailed_csv"
+                    )
+
             with col_exp3:
-                # Excel export
                 if EXCEL_AVAILABLE:
-                    buffer = BytesIO()
-                    with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                        # Summary sheet
-                        df_summary.to_excel(writer, sheet_name='Summary', index=False)
-                        
-                        # Individual member sheets
-                        for member, data in all_results.items():
-                            sheet_name = str(member)[:31]  # Excel limit
-                            data['results'].to_excel(writer, sheet_name=sheet_name, index=False)
-                        
-                        # Format sheets
-                        wb = writer.book
-                        for ws_name in wb.sheetnames:
-                            ws = wb[ws_name]
-                            # Header formatting
-                            for cell in ws[1]:
-                                cell.font = Font(bold=True, color="FFFFFF")
-                                cell.fill = PatternFill(start_color="667EEA", end_color="667EEA", fill_type="solid")
-                                cell.alignment = Alignment(horizontal="center", vertical="center")
-                            
-                            # Auto-width
-                            for column in ws.columns:
-                                max_length = 0
-                                column_letter = get_column_letter(column[0].column)
-                                for cell in column:
-                                    try:
-                                        if cell.value:
-                                            max_length = max(max_length, len(str(cell.value)))
-                                    except Exception:
-                                        pass
-                                ws.column_dimensions[column_letter].width = min(max_length + 2, 30)
-                    
-                    buffer.seek(0)
-                    st.download_button(
-                        label="📥 Full Report (Excel)",
-                        data=buffer,
-                        file_name=f"Design_Report_{datetime.now().strftime('%Y%m%d')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key="export_excel"
-                    )
+                    if st.button("📊 Generate Full Report (Excel)", key="export_excel"):
+                        submit_report_job(
+                            f"Results workbook ({len(all_results)} members)", build_tab5_workbook,
+                            dict(all_results), df_summary, list(takeoff_sheets), excel_layout,
+                            file_name=f"Design_Report_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                        )
                 else:
                     st.warning("⚠️ Excel export requires openpyxl")
 
+            # Calculation book (one calculation sheet per member)
+            if PDF_AVAILABLE:
+                if st.button("📕 Generate Calculation Book (PDF)", key="generate_calc_book"):
+                    project_info = dict(st.session_state.get('project_info', {}))
+                    proj_name = (project_info.get('project_name') or 'Project').replace(' ', '_')[:20]
+                    submit_report_job(
+                        f"Calculation book ({len(all_results)} members)", generate_calculation_book,
+                        df, df_mat, dict(all_results), project_info,
+                        file_name=f"Calc_Book_{proj_name}_{datetime.now().strftime('%Y%m%d')}.pdf",
+                        mime="application/pdf"
+                    )
+            else:
+                st.warning("⚠️ PDF export requires reportlab library")
+
+    # ==================== SUB-TAB 5: GRADE & SECTION OPTIMIZER ====================
+    with subtab5:
+        st.markdown("### 💰 Cheapest Grade & Section")
+
+        if st.session_state.loaded_data is None:
+            st.warning("⚠️ Please upload load data first in the 'Data Import' tab")
+        elif len(st.session_state.member_groups) == 0:
+            st.warning("⚠️ Please configure member groups first in the 'Member Groups' tab")
+        else:
+            df_loads = st.session_state.loaded_data
+
+            col_opt1, col_opt2 = st.columns([1, 1])
+
+            with col_opt1:
+                st.markdown("#### 🏷️ Unit Prices")
+                price_table = st.data_editor(
+                    pd.DataFrame({
+                        'Grade': list(material_index.names),
+                        'Price (/kg)': [1.0] * len(material_index),
+                        'Include': [True] * len(material_index)
+                    }),
+                    column_config={
+                        'Grade': st.column_config.TextColumn(disabled=True),
+                        'Price (/kg)': st.column_config.NumberColumn(min_value=0.0, step=0.5, format="%.2f"),
+                        'Include': st.column_config.CheckboxColumn()
+                    },
+                    hide_index=True,
+                    width="stretch",
+                    key="optimizer_prices"
+                )
+
+            with col_opt2:
+                st.markdown("#### ⚙️ Options")
+                optimizer_scope = st.radio(
+                    "Optimization Scope:",
+                    ["Single Member", "All Configured Members"],
+                    horizontal=True,
+                    key="optimizer_scope"
+                )
+                configured_members = list(st.session_state.member_groups.keys())
+                if optimizer_scope == "Single Member":
+                    optimizer_members = [st.selectbox("Select Member:", configured_members,
+                                                      key="optimizer_member_select")]
+                else:
+                    optimizer_members = configured_members
+
+                optimizer_max_ratio = st.number_input("Target Max Ratio:", 0.5, 1.0, 1.0, 0.05,
+                                                      key="optimizer_max_ratio")
+                opt_d_min, opt_d_max = catalog.dimension_range('H', 'd')
+                optimizer_depth = st.slider("Section Depth d (mm):", opt_d_min, opt_d_max,
+                                            (opt_d_min, opt_d_max), 1.0, key="optimizer_depth")
+                optimizer_sections = [name for name in catalog.filter(DESIGN_FAMILIES, d=optimizer_depth)
+                                      if name in df.index]
+
+                st.markdown("""
+                <div class="info-box">
+                Every grade × section is checked against all load combinations of each member
+                using the Design Check equations. The adequate combination with the lowest
+                cost (w × length × price) is selected; ties go to the lighter section.
+                </div>
+                """, unsafe_allow_html=True)
+
+            if st.button("🚀 Find Cheapest Design", type="primary", key="run_optimizer"):
+                prices = {
+                    row['Grade']: row['Price (/kg)']
+                    for _, row in price_table.iterrows()
+                    if row['Include'] and pd.notna(row['Price (/kg)'])
+                }
+                if not prices:
+                    st.warning("⚠️ Include at least one grade with a price")
+                elif not optimizer_sections:
+                    st.warning("⚠️ No section in the selected depth range")
+                else:
+                    with st.spinner(f"Checking {len(optimizer_sections) * len(prices):,} grade × section combinations..."):
+                        st.session_state.optimizer_results = optimize_grade_and_section(
+                            df, df_mat, st.session_state.member_groups, df_loads, prices,
+                            members=optimizer_members, sections=optimizer_sections,
+                            max_ratio=optimizer_max_ratio,
+                            section_arrays=snapshot.section_arrays,
+                            grade_arrays=snapshot.grade_arrays
+                        )
+                        st.session_state.optimizer_prices_used = prices
+
+            if st.session_state.get('optimizer_results'):
+                df_choice, totals = st.session_state.optimizer_results
+
+                col_t1, col_t2, col_t3, col_t4 = st.columns(4)
+                with col_t1:
+                    st.metric("Members", totals['members'])
+                with col_t2:
+                    st.metric("Adequate", totals['adequate'],
+                              delta=f"{totals['members'] - totals['adequate']} without solution"
+                              if totals['adequate'] < totals['members'] else None,
+                              delta_color="inverse")
+                with col_t3:
+                    st.metric("Total Tonnage", f"{totals['tonnage']:,.3f} t")
+                with col_t4:
+                    st.metric("Total Cost", f"{totals['cost']:,.2f}")
+
+                st.dataframe(df_choice.style.format({
+                    'Ratio': '{:.3f}',
+                    'w [kg/m]': '{:.1f}',
+                    'Length (m)': '{:.2f}',
+                    'Weight (kg)': '{:,.1f}',
+                    'Price (/kg)': '{:.2f}',
+                    'Cost': '{:,.2f}'
+                }, na_rep="—"), width="stretch", height=400, hide_index=True)
+
+                col_a1, col_a2 = st.columns(2)
+                with col_a1:
+                    report_download_button(
+                        "📥 Optimizer Results (CSV)", functools.partial(df_choice.to_csv, index=False),
+                        file_name=f"Optimized_Design_{datetime.now().strftime('%Y%m%d')}.csv",
+                        mime="text/csv",
+                        key="export_optimizer"
+                    )
+                with col_a2:
+                    if st.button("✅ Apply to Member Groups", key="apply_optimizer"):
+                        applied = int(df_choice['Section'].notna().sum())
+                        st.session_state.member_groups = apply_design_choice(
+                            st.session_state.member_groups, df_choice
+                        )
+                        st.success(f"✅ Applied optimized design to {applied} members. Re-run the Design Check to update results.")
+
+# ==================== REPORT JOBS PANEL ====================
+# Drawn last so jobs submitted during this run are already listed
+with st.sidebar:
+    render_report_jobs()
+
 # ==================== FOOTER ====================
 st.markdown("---")
 st.markdown("""
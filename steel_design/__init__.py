@@ -0,0 +1,61 @@
+"""AISC 360-16 steel design engine, data loading and report writers.
+
+Everything here is importable without Streamlit: the web app in
+``Function.py`` is a thin UI layer over this package.  Errors are reported
+through the ``steel_design`` logger instead of ``st.error`` so the engine
+can run from scripts and batch jobs; the app forwards them to the page.
+Heavy optional dependencies (matplotlib, plotly, reportlab, openpyxl) are
+imported on first use.
+"""
+
+from .utils import safe_scalar, format_number, format_equation_result, safe_sqrt
+from .lazy import (PDF_AVAILABLE, PDF_MERGE_AVAILABLE, EXCEL_AVAILABLE, get_pyplot, get_mpl_patches,
+                   get_plotly_go, get_make_subplots)
+from .properties import (DERIVED_COLUMNS, TABULATED_COLUMNS, h_shape_properties,
+                         complete_section_properties)
+from .data import (DATA_DIR, DATA_URL, SECTION_DB_FILE, MATERIAL_DB_FILE,
+                   DATA_CACHE_FILE, DATA_CACHE_VERSION, load_databases)
+from .aisc import (GRADE_CONSTANTS, grade_constant_arrays, grade_constants, grade_constant_row,
+                   classify_section_flexure, classify_section_compression,
+                   aisc_360_16_f2_flexural_design, aisc_360_16_e3_compression_design,
+                   e3_max_slenderness, aisc_360_16_e3_max_effective_length,
+                   aisc_360_16_e3_max_effective_length_table,
+                   aisc_360_16_h1_interaction, MEMBER_TYPES,
+                   SECTION_CLASSES, section_property_arrays, material_property_arrays,
+                   section_class_arrays,
+                   f2_flexural_capacity_arrays, e3_compression_capacity_arrays,
+                   member_ratio_envelope, evaluate_section_design, evaluate_member_design)
+from .names import normalize_name, NameIndex
+from .catalog import (SHAPE_FAMILIES, DESIGN_FAMILIES, DIMENSION_COLUMNS, SectionCatalog,
+                      load_catalog)
+from .snapshot import database_files, DatabaseSnapshot, build_snapshot, DatabaseWatcher
+from .takeoff import member_length, TAKEOFF_KEYS, quantity_takeoff, takeoff_delta
+from .optimize import optimize_grade_and_section, apply_design_choice
+from .report_checks import (classify_section_flange, classify_section_web,
+                            get_overall_classification, calculate_flexural_strength,
+                            calculate_compression_strength, calculate_tension_strength,
+                            calculate_interaction, get_section_properties_from_df,
+                            create_member_data)
+from .html_report import (SteelDesignReportGenerator, generate_midas_gen_text_report,
+                          iter_midas_gen_text_report, write_midas_gen_text_report,
+                          midas_governing, midas_report_header, midas_member_page, MIDAS_BLOCK_SIZE)
+from .fragment_cache import member_digest, FragmentCache
+from .parallel_report import (report_workers, map_members, render_members, shutdown_report_pool,
+                              iter_parallel_full_report, parallel_full_report,
+                              iter_parallel_midas_text_report, parallel_midas_text_report)
+from .shared import SharedTables, publish_tables, attach_tables
+from .report_file import SPOOL_MAX_SIZE, ReportFile
+from .charts import (create_detailed_section_diagram, create_flexural_capacity_chart,
+                     create_compression_capacity_chart, create_enhanced_plotly_config,
+                     get_enhanced_plotly_layout, CHART_DPI, figure_png, overlay_design_point,
+                     flexural_capacity_chart_png, compression_capacity_chart_png, clear_chart_cache)
+from .pdf_charts import (flexural_capacity_curve, compression_capacity_curve, interaction_curve,
+                         flexural_capacity_drawing, compression_capacity_drawing, interaction_drawing,
+                         section_drawing)
+from .pdf_report import (get_pdf_flowables, calculation_document, calculation_story,
+                         generate_calculation_report, generate_pdf_report)
+from .pdf_book import book_members, generate_calculation_book
+from .report_jobs import (QUEUED, RUNNING, DONE, FAILED, JobLimitError, ReportJob, ReportJobQueue,
+                          report_job_workers, get_report_job_queue, shutdown_report_jobs)
+from .excel_report import (generate_excel_report, generate_enhanced_excel_report, sheet_title,
+                           write_table_workbook, results_long_table, write_results_workbook)
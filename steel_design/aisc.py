@@ -0,0 +1,894 @@
+"""
+AISC 360-16 design engine (F2, E3, H1) in ksc, tons and t·m.
+
+Scalar functions take the section/material DataFrames and names; the
+*_arrays functions are their vectorized forms over whole catalogs.
+Calculation errors are logged on the "steel_design" logger and the
+function returns None.
+"""
+
+import logging
+import math
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from .utils import safe_scalar, safe_sqrt
+
+logger = logging.getLogger(__name__)
+
+# ==================== PER-GRADE CONSTANTS ====================
+GRADE_CONSTANTS = ('Fy', 'E', 'sqrt_E_Fy', 'lambda_pf', 'lambda_rf', 'lambda_pw', 'lambda_rw',
+                   'lambda_e3', 'lambda_rf_c', 'lambda_rw_c', 'Fr')
+
+_grade_constant_tables = {}
+
+def grade_constant_arrays(Fy, E):
+    """
+    Material constants of the F2/E3/B4 checks for broadcastable Fy, E (ksc).
+
+    sqrt_E_Fy is √(E/Fy); lambda_pf/lambda_rf and lambda_pw/lambda_rw are
+    the Table B4.1b flange and web limits for flexure, lambda_rf_c and
+    lambda_rw_c the Table B4.1a limits for compression, lambda_e3 the
+    4.71√(E/Fy) E3 transition and Fr = 0.7Fy.
+    """
+    Fy = np.asarray(Fy, dtype=float)
+    E = np.asarray(E, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sqrt_E_Fy = np.sqrt(E / Fy)
+    return {
+        'Fy': Fy,
+        'E': E,
+        'sqrt_E_Fy': sqrt_E_Fy,
+        'lambda_pf': 0.38 * sqrt_E_Fy,
+        'lambda_rf': 1.0 * sqrt_E_Fy,
+        'lambda_pw': 3.76 * sqrt_E_Fy,
+        'lambda_rw': 5.70 * sqrt_E_Fy,
+        'lambda_e3': 4.71 * sqrt_E_Fy,
+        'lambda_rf_c': 0.56 * sqrt_E_Fy,
+        'lambda_rw_c': 1.49 * sqrt_E_Fy,
+        'Fr': 0.7 * Fy
+    }
+
+def _build_grade_constants(df_mat):
+    Fy = np.array([safe_scalar(v) for v in df_mat["Yield Point (ksc)"]], dtype=float)
+    E = np.array([safe_scalar(v) for v in df_mat["E"]], dtype=float)
+    table = pd.DataFrame(grade_constant_arrays(Fy, E), index=df_mat.index, columns=list(GRADE_CONSTANTS))
+    # Scalar lookups use the first row of a grade, as df_mat.loc + safe_scalar does
+    rows = {}
+    for grade, values in zip(table.index, table.itertuples(index=False, name=None)):
+        rows.setdefault(grade, dict(zip(GRADE_CONSTANTS, values)))
+    return table, rows
+
+def _grade_constant_entry(df_mat):
+    key = id(df_mat)
+    entry = _grade_constant_tables.get(key)
+    if entry is None or entry[0]() is not df_mat:
+        ref = weakref.ref(df_mat, lambda _, key=key: _grade_constant_tables.pop(key, None))
+        entry = (ref, *_build_grade_constants(df_mat))
+        _grade_constant_tables[key] = entry
+    return entry
+
+def grade_constants(df_mat):
+    """
+    Per-grade constants table of a material database (columns GRADE_CONSTANTS).
+
+    Built once per loaded df_mat and shared by every classification and
+    capacity call on it; the material table is treated as read-only.
+    """
+    return _grade_constant_entry(df_mat)[1]
+
+def grade_constant_row(df_mat, material):
+    """The precomputed constants of one grade as a dict of floats"""
+    return _grade_constant_entry(df_mat)[2][material]
+
+# ==================== AISC CLASSIFICATION FUNCTIONS ====================
+def classify_section_flexure(df, df_mat, section, material):
+    """
+    Classify section elements for flexural design per AISC 360-16 Table B4.1b
+    Returns: dict with flange and web classifications
+    """
+    try:
+        # Get section properties
+        bf = safe_scalar(df.loc[section, 'bf [mm]'])
+        tf = safe_scalar(df.loc[section, 'tf [mm]'])
+        
+        # For web
+        if 'ho [mm]' in df.columns:
+            h = safe_scalar(df.loc[section, 'ho [mm]'])
+        else:
+            d = safe_scalar(df.loc[section, 'd [mm]'])
+            h = d - 2 * tf
+        
+        tw = safe_scalar(df.loc[section, 'tw [mm]'])
+        
+        # Material constants
+        grade = grade_constant_row(df_mat, material)
+        
+        # Flange slenderness (AISC Table B4.1b Case 10 - Flanges of I-sections)
+        lambda_f = (bf / 2.0) / tf
+        lambda_pf = grade['lambda_pf']
+        lambda_rf = grade['lambda_rf']
+        
+        if lambda_f <= lambda_pf:
+            flange_class = "Compact"
+        elif lambda_f <= lambda_rf:
+            flange_class = "Non-compact"
+        else:
+            flange_class = "Slender"
+        
+        # Web slenderness (AISC Table B4.1b Case 15 - Webs in flexural compression)
+        lambda_w = h / tw
+        lambda_pw = grade['lambda_pw']
+        lambda_rw = grade['lambda_rw']
+        
+        if lambda_w <= lambda_pw:
+            web_class = "Compact"
+        elif lambda_w <= lambda_rw:
+            web_class = "Non-compact"
+        else:
+            web_class = "Slender"
+        
+        return {
+            'flange_class': flange_class,
+            'flange_lambda': lambda_f,
+            'flange_lambda_p': lambda_pf,
+            'flange_lambda_r': lambda_rf,
+            'web_class': web_class,
+            'web_lambda': lambda_w,
+            'web_lambda_p': lambda_pw,
+            'web_lambda_r': lambda_rw
+        }
+        
+    except Exception as e:
+        logger.error("Error in flexural classification: %s", e)
+        return None
+
+def classify_section_compression(df, df_mat, section, material):
+    """
+    Classify section elements for compression design per AISC 360-16 Table B4.1a
+    Returns: dict with overall classification
+    """
+    try:
+        # Get section properties
+        bf = safe_scalar(df.loc[section, 'bf [mm]'])
+        tf = safe_scalar(df.loc[section, 'tf [mm]'])
+        
+        d = safe_scalar(df.loc[section, 'd [mm]'])
+        tw = safe_scalar(df.loc[section, 'tw [mm]'])
+        h = d - 2 * tf
+        
+        # Material constants
+        grade = grade_constant_row(df_mat, material)
+        
+        # Flange slenderness (AISC Table B4.1a Case 1 - Flanges of I-sections)
+        lambda_f = (bf / 2.0) / tf
+        lambda_r_flange = grade['lambda_rf_c']
+        
+        # Web slenderness (AISC Table B4.1a Case 5 - Webs of doubly symmetric I-sections)
+        lambda_w = h / tw
+        lambda_r_web = grade['lambda_rw_c']
+        
+        flange_slender = lambda_f > lambda_r_flange
+        web_slender = lambda_w > lambda_r_web
+        
+        if flange_slender or web_slender:
+            overall_class = "Slender"
+            limiting_element = []
+            if flange_slender:
+                limiting_element.append("Flange")
+            if web_slender:
+                limiting_element.append("Web")
+            limiting = " & ".join(limiting_element)
+        else:
+            overall_class = "Non-slender"
+            limiting = "N/A"
+        
+        return {
+            'overall_class': overall_class,
+            'limiting_element': limiting,
+            'flange_lambda': lambda_f,
+            'flange_lambda_r': lambda_r_flange,
+            'flange_slender': flange_slender,
+            'web_lambda': lambda_w,
+            'web_lambda_r': lambda_r_web,
+            'web_slender': web_slender
+        }
+        
+    except Exception as e:
+        logger.error("Error in compression classification: %s", e)
+        return None
+
+# ==================== AISC 360-16 DESIGN FUNCTIONS ====================
+def aisc_360_16_f2_flexural_design(df, df_mat, section, material, Lb_input, Cb=1.0):
+    """AISC 360-16 F2 - Lateral-Torsional Buckling Analysis"""
+    try:
+        Sx = safe_scalar(df.loc[section, "Sx [cm3]"])
+        Zx = safe_scalar(df.loc[section, 'Zx [cm3]'])
+        ry = safe_scalar(df.loc[section, 'ry [cm]'])
+        
+        if 'rts [cm]' in df.columns:
+            rts = safe_scalar(df.loc[section, 'rts [cm]'])
+        else:
+            rts = ry * 1.2
+        
+        J = safe_scalar(df.loc[section, 'j [cm4]']) if 'j [cm4]' in df.columns else 1.0
+        
+        if 'ho [mm]' in df.columns:
+            ho = safe_scalar(df.loc[section, 'ho [mm]']) / 10.0
+        else:
+            ho = safe_scalar(df.loc[section, 'd [mm]']) / 10.0
+        
+        grade = grade_constant_row(df_mat, material)
+        Fy = grade['Fy']
+        E = grade['E']
+        Fr = grade['Fr']
+        
+        Lb = safe_scalar(Lb_input)
+        Cb = safe_scalar(Cb)
+        
+        # AISC 360-16 Equation F2.5
+        Lp = 1.76 * ry * grade['sqrt_E_Fy'] / 100.0
+        
+        # AISC 360-16 Equation F2.6
+        c = 1.0
+        term1 = 1.95 * rts * E / Fr
+        inner_sqrt = J * c / (Sx * ho)
+        term2 = safe_sqrt(inner_sqrt)
+        
+        ratio_term = (Fr / E) ** 2
+        geometry_term = (Sx * ho / (J * c)) ** 2
+        complex_inner = 1.0 + 6.76 * ratio_term * geometry_term
+        term3 = safe_sqrt(1.0 + safe_sqrt(complex_inner))
+        
+        Lr = term1 * term2 * term3 / 100.0
+        
+        Mp = Fy * Zx
+        
+        if Lb <= Lp:
+            Case = "F2.1 - Yielding"
+            Mn = Mp
+        elif Lb <= Lr:
+            Case = "F2.2 - Inelastic LTB"
+            Lb_cm = Lb * 100.0
+            Lp_cm = Lp * 100.0  
+            Lr_cm = Lr * 100.0
+            
+            Mp_minus_Mr = Mp - Fr * Sx
+            denom = Lr_cm - Lp_cm
+            length_ratio = (Lb_cm - Lp_cm) / denom if denom != 0 else 1.0
+            Mn = Cb * (Mp - Mp_minus_Mr * length_ratio)
+            Mn = min(Mp, Mn)
+        else:
+            Case = "F2.3 - Elastic LTB"
+            Lb_cm = Lb * 100.0
+            Lb_rts_ratio = Lb_cm / rts
+            
+            term_1 = (Cb * math.pi**2 * E) / (Lb_rts_ratio**2)
+            term_2 = 0.078 * (J * c / (Sx * ho)) * (Lb_rts_ratio**2)
+            Fcr = term_1 * safe_sqrt(1.0 + term_2)
+            
+            Mn = Fcr * Sx
+            Mn = min(Mp, Mn)
+        
+        Mn_tm = Mn / 100000.0
+        Mp_tm = Mp / 100000.0
+        
+        return {
+            'Mn': Mn_tm,
+            'Mp': Mp_tm,
+            'Lp': Lp,
+            'Lr': Lr, 
+            'Case': Case,
+            'Cb': Cb
+        }
+        
+    except Exception as e:
+        logger.error("Error in AISC 360-16 F2 calculation: %s", e)
+        return None
+
+def aisc_360_16_e3_compression_design(df, df_mat, section, material, KLx, KLy):
+    """AISC 360-16 E3 - Flexural Buckling Analysis"""
+    try:
+        grade = grade_constant_row(df_mat, material)
+        Fy = grade['Fy']
+        E = grade['E']
+        
+        Ag = safe_scalar(df.loc[section, 'A [cm2]'])
+        rx = safe_scalar(df.loc[section, 'rx [cm]'])
+        ry = safe_scalar(df.loc[section, 'ry [cm]'])
+        
+        KLx_scalar = safe_scalar(KLx) * 100.0
+        KLy_scalar = safe_scalar(KLy) * 100.0
+        
+        lambda_x = KLx_scalar / rx
+        lambda_y = KLy_scalar / ry
+        lambda_c = max(lambda_x, lambda_y)
+        
+        Fe = (math.pi**2 * E) / (lambda_c**2)
+        
+        lambda_limit = grade['lambda_e3']
+        
+        if lambda_c <= lambda_limit:
+            buckling_mode = "Inelastic"
+            exponent = Fy / Fe
+            Fcr = (0.658 ** exponent) * Fy
+        else:
+            buckling_mode = "Elastic"
+            Fcr = 0.877 * Fe
+        
+        Pn = Fcr * Ag / 1000.0
+        phi_c = 0.90
+        phi_Pn = phi_c * Pn
+        
+        slenderness_ok = lambda_c <= 200.0
+        
+        return {
+            'Pn': Pn,
+            'phi_Pn': phi_Pn,
+            'Fcr': Fcr,
+            'Fe': Fe,
+            'lambda_x': lambda_x,
+            'lambda_y': lambda_y,
+            'lambda_c': lambda_c,
+            'lambda_limit': lambda_limit,
+            'buckling_mode': buckling_mode,
+            'slenderness_ok': slenderness_ok,
+            'phi_c': phi_c
+        }
+        
+    except Exception as e:
+        logger.error("Error in AISC 360-16 E3 compression analysis: %s", e)
+        return None
+
+def e3_max_slenderness(Pu, Ag, Fy, E, phi_c=0.90, lambda_limit=None):
+    """
+    Closed-form inverse of AISC 360-16 E3-2/E3-3.
+
+    Returns the largest KL/r for which phi_c * Fcr * Ag >= Pu. All arguments
+    broadcast as NumPy arrays (Pu in tons, Ag in cm², Fy and E in ksc), so a
+    (grades x 1) Fy column against a (1 x sections) Ag row solves the whole
+    catalog at once. Pu <= 0 gives inf (no compression demand) and Pu above
+    the squash load phi_c * Fy * Ag gives 0. lambda_limit is the precomputed
+    4.71√(E/Fy) of the grades (see grade_constants), derived when omitted.
+    """
+    Pu, Ag, Fy, E = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (Pu, Ag, Fy, E)))
+    if lambda_limit is None:
+        lambda_limit = grade_constant_arrays(Fy, E)['lambda_e3']
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Fcr_req = Pu * 1000.0 / (phi_c * Ag)
+        fcr_ratio = Fcr_req / Fy
+
+        # E3-2 governs down to Fcr at the 4.71*sqrt(E/Fy) limit
+        inelastic = fcr_ratio >= 0.658 ** ((4.71 / math.pi) ** 2)
+
+        # E3-2: Fcr = 0.658^(Fy/Fe) * Fy  ->  Fe = Fy * ln(0.658) / ln(Fcr/Fy)
+        lambda_inelastic = np.pi * np.sqrt(E * np.log(fcr_ratio) / (Fy * math.log(0.658)))
+        # E3-3: Fcr = 0.877 * Fe; never shorter than the E3-2/E3-3 transition
+        lambda_elastic = np.maximum(np.pi * np.sqrt(0.877 * E / Fcr_req), lambda_limit)
+
+        lambda_max = np.where(inelastic, lambda_inelastic, lambda_elastic)
+
+    lambda_max = np.where(fcr_ratio > 1.0, 0.0, lambda_max)
+    lambda_max = np.where(Pu <= 0.0, np.inf, lambda_max)
+    return lambda_max, Fcr_req, inelastic
+
+def _e3_inverse_mode(Pu, fcr_ratio, inelastic):
+    """Label each inverse-E3 result the way the forward E3 check reports it"""
+    mode = np.where(inelastic, "Inelastic", "Elastic").astype(object)
+    mode[np.broadcast_to(fcr_ratio > 1.0, mode.shape)] = "Inadequate"
+    mode[np.broadcast_to(np.asarray(Pu) <= 0.0, mode.shape)] = "No compression"
+    return mode
+
+def aisc_360_16_e3_max_effective_length(df, df_mat, section, material, Pu, max_slenderness=None):
+    """AISC 360-16 E3 - Maximum Effective Length for a Required Axial Load"""
+    try:
+        grade = grade_constant_row(df_mat, material)
+        Fy = grade['Fy']
+        E = grade['E']
+
+        Ag = safe_scalar(df.loc[section, 'A [cm2]'])
+        rx = safe_scalar(df.loc[section, 'rx [cm]'])
+        ry = safe_scalar(df.loc[section, 'ry [cm]'])
+
+        Pu = safe_scalar(Pu)
+        phi_c = 0.90
+
+        lambda_max, Fcr_req, inelastic = e3_max_slenderness(Pu, Ag, Fy, E, phi_c, grade['lambda_e3'])
+        lambda_max = float(lambda_max)
+        if max_slenderness is not None:
+            lambda_max = min(lambda_max, float(max_slenderness))
+
+        buckling_mode = _e3_inverse_mode(Pu, float(Fcr_req) / Fy, inelastic).item()
+
+        return {
+            'KL_max': lambda_max * min(rx, ry) / 100.0,
+            'KLx_max': lambda_max * rx / 100.0,
+            'KLy_max': lambda_max * ry / 100.0,
+            'lambda_max': lambda_max,
+            'Fcr_req': float(Fcr_req),
+            'phi_Py': phi_c * Fy * Ag / 1000.0,
+            'buckling_mode': buckling_mode,
+            'adequate': lambda_max > 0.0,
+            'phi_c': phi_c
+        }
+
+    except Exception as e:
+        logger.error("Error in AISC 360-16 E3 maximum length analysis: %s", e)
+        return None
+
+def aisc_360_16_e3_max_effective_length_table(df, df_mat, Pu, sections=None, materials=None,
+                                              max_slenderness=None):
+    """
+    Maximum effective length for every section x grade combination.
+
+    Vectorized batch form of aisc_360_16_e3_max_effective_length for bracing
+    layout studies. Returns one row per (material, section) with the maximum
+    KL about each axis and for equal KLx = KLy, in metres.
+    """
+    sections = list(df.index) if sections is None else list(sections)
+    materials = list(df_mat.index) if materials is None else list(materials)
+
+    sec = df.loc[sections]
+    Ag = pd.to_numeric(sec['A [cm2]'], errors='coerce').to_numpy(dtype=float)
+    rx = pd.to_numeric(sec['rx [cm]'], errors='coerce').to_numpy(dtype=float)
+    ry = pd.to_numeric(sec['ry [cm]'], errors='coerce').to_numpy(dtype=float)
+    w = pd.to_numeric(sec['w [kg/m]'], errors='coerce').to_numpy(dtype=float)
+
+    mat = material_property_arrays(df_mat, materials)
+    Fy = mat['Fy'][:, None]
+    E = mat['E'][:, None]
+
+    phi_c = 0.90
+    lambda_max, Fcr_req, inelastic = e3_max_slenderness(Pu, Ag[None, :], Fy, E, phi_c,
+                                                        mat['lambda_e3'][:, None])
+    if max_slenderness is not None:
+        lambda_max = np.minimum(lambda_max, float(max_slenderness))
+    mode = _e3_inverse_mode(Pu, Fcr_req / Fy, inelastic)
+
+    n_mat, n_sec = lambda_max.shape
+    return pd.DataFrame({
+        'Material': np.repeat(np.asarray(materials, dtype=object), n_sec),
+        'Section': np.tile(np.asarray(sections, dtype=object), n_mat),
+        'w [kg/m]': np.tile(w, n_mat),
+        'φPy (tons)': (phi_c * Fy * Ag[None, :] / 1000.0).ravel(),
+        'Fcr req (ksc)': Fcr_req.ravel(),
+        'λ max': lambda_max.ravel(),
+        'KLx max (m)': (lambda_max * rx[None, :] / 100.0).ravel(),
+        'KLy max (m)': (lambda_max * ry[None, :] / 100.0).ravel(),
+        'KL max (m)': (lambda_max * np.minimum(rx, ry)[None, :] / 100.0).ravel(),
+        'Mode': mode.ravel(),
+        'Adequate': (lambda_max > 0.0).ravel()
+    })
+
+def aisc_360_16_h1_interaction(Pu, phi_Pn, Mux, phi_Mnx, Muy, phi_Mny):
+    """AISC 360-16 H1 - Combined Forces Analysis"""
+    try:
+        Pu = safe_scalar(Pu)
+        phi_Pn = safe_scalar(phi_Pn) 
+        Mux = safe_scalar(Mux)
+        phi_Mnx = safe_scalar(phi_Mnx)
+        Muy = safe_scalar(Muy)
+        phi_Mny = safe_scalar(phi_Mny)
+        
+        if phi_Pn <= 0.0 or phi_Mnx <= 0.0 or phi_Mny <= 0.0:
+            return None
+        
+        Pr_Pc = Pu / phi_Pn
+        Mrx_Mcx = Mux / phi_Mnx
+        Mry_Mcy = Muy / phi_Mny
+        
+        if Pr_Pc >= 0.2:
+            interaction_ratio = Pr_Pc + (8.0/9.0) * (Mrx_Mcx + Mry_Mcy)
+            equation = "H1-1a"
+        else:
+            interaction_ratio = Pr_Pc/2.0 + (Mrx_Mcx + Mry_Mcy)
+            equation = "H1-1b"
+        
+        design_ok = interaction_ratio <= 1.0
+        safety_margin = (1.0 - interaction_ratio) if design_ok else None
+        
+        return {
+            'interaction_ratio': interaction_ratio,
+            'equation': equation,
+            'design_ok': design_ok,
+            'Pr_Pc': Pr_Pc,
+            'Mrx_Mcx': Mrx_Mcx,
+            'Mry_Mcy': Mry_Mcy,
+            'safety_margin': safety_margin
+        }
+        
+    except Exception as e:
+        logger.error("Error in AISC 360-16 H1 interaction calculation: %s", e)
+        return None
+
+# ==================== VECTORIZED CATALOG CAPACITIES ====================
+MEMBER_TYPES = ["Beam-Column (Compression)", "Beam-Column (Tension)",
+                "Beam (Flexure Only)", "Tension Member"]
+
+SECTION_CLASSES = ["Compact", "Non-compact", "Slender"]
+
+def _numeric_column(frame, column, default=None):
+    """Column of a section/material table as a float array (default when absent)"""
+    if column not in frame.columns:
+        return np.full(len(frame), np.nan if default is None else default, dtype=float)
+    return pd.to_numeric(frame[column], errors='coerce').to_numpy(dtype=float)
+
+def section_property_arrays(df, sections=None):
+    """
+    Section properties as aligned float arrays for vectorized checks.
+
+    Uses the same column fallbacks as aisc_360_16_f2_flexural_design so the
+    vectorized results match the scalar functions section for section.
+    """
+    sec = df if sections is None else df.loc[list(sections)]
+    ry = _numeric_column(sec, 'ry [cm]')
+    d = _numeric_column(sec, 'd [mm]')
+    props = {
+        'A': _numeric_column(sec, 'A [cm2]'),
+        'rx': _numeric_column(sec, 'rx [cm]'),
+        'ry': ry,
+        'Sx': _numeric_column(sec, 'Sx [cm3]'),
+        'Zx': _numeric_column(sec, 'Zx [cm3]'),
+        'Zy': _numeric_column(sec, 'Zy [cm3]'),
+        'w': _numeric_column(sec, 'w [kg/m]'),
+        'rts': _numeric_column(sec, 'rts [cm]') if 'rts [cm]' in sec.columns else ry * 1.2,
+        'J': _numeric_column(sec, 'j [cm4]', default=1.0),
+        'ho': (_numeric_column(sec, 'ho [mm]') if 'ho [mm]' in sec.columns else d) / 10.0
+    }
+    return props
+
+def material_property_arrays(df_mat, materials=None):
+    """Fy, E (ksc) and the GRADE_CONSTANTS of each grade as float arrays"""
+    table = grade_constants(df_mat)
+    if materials is not None:
+        table = table.loc[list(materials)]
+    return {name: table[name].to_numpy(dtype=float) for name in GRADE_CONSTANTS}
+
+def section_class_arrays(df, df_mat, sections=None, materials=None):
+    """
+    Table B4.1 classification of every grade x section in one broadcast.
+
+    Section λ rows (1 x sections) are compared against the per-grade limit
+    columns (grades x 1) with the same element definitions as
+    classify_section_flexure / classify_section_compression. Flexure classes
+    are coded 0 = Compact, 1 = Non-compact, 2 = Slender (see
+    SECTION_CLASSES); the compression entries are boolean slender masks.
+    """
+    sec = df if sections is None else df.loc[list(sections)]
+    mat = material_property_arrays(df_mat, materials)
+    bf = _numeric_column(sec, 'bf [mm]')
+    tf = _numeric_column(sec, 'tf [mm]')
+    tw = _numeric_column(sec, 'tw [mm]')
+    d = _numeric_column(sec, 'd [mm]')
+    h_flexure = _numeric_column(sec, 'ho [mm]') if 'ho [mm]' in sec.columns else d - 2 * tf
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lambda_f = (bf / 2.0) / tf
+        lambda_w = h_flexure / tw
+        lambda_w_c = (d - 2 * tf) / tw
+
+    def limit(name):
+        return mat[name][:, None]
+
+    flange_class = np.where(lambda_f <= limit('lambda_pf'), 0, np.where(lambda_f <= limit('lambda_rf'), 1, 2))
+    web_class = np.where(lambda_w <= limit('lambda_pw'), 0, np.where(lambda_w <= limit('lambda_rw'), 1, 2))
+    flange_slender = lambda_f > limit('lambda_rf_c')
+    web_slender = lambda_w_c > limit('lambda_rw_c')
+    return {
+        'flange_lambda': lambda_f,
+        'web_lambda': lambda_w,
+        'flange_class': flange_class,
+        'web_class': web_class,
+        'flange_slender': flange_slender,
+        'web_slender': web_slender,
+        'compression_slender': flange_slender | web_slender
+    }
+
+def f2_flexural_capacity_arrays(Sx, Zx, ry, rts, J, ho, Fy, E, Lb, Cb=1.0, sqrt_E_Fy=None):
+    """
+    Vectorized AISC 360-16 F2 over broadcastable arrays.
+
+    Same units and branches as aisc_360_16_f2_flexural_design (section
+    properties in cm, Fy and E in ksc, Lb in m). sqrt_E_Fy is the
+    precomputed √(E/Fy) of the grades, derived when omitted. Returns Mn and
+    Mp in t·m and Lp, Lr in m.
+    """
+    c = 1.0
+    Fr = 0.7 * Fy
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if sqrt_E_Fy is None:
+            sqrt_E_Fy = np.sqrt(E / Fy)
+        Lp = 1.76 * ry * sqrt_E_Fy / 100.0
+
+        jc_term = J * c / (Sx * ho)
+        Lr = (1.95 * rts * E / Fr * np.sqrt(jc_term)
+              * np.sqrt(1.0 + np.sqrt(1.0 + 6.76 * (Fr / E) ** 2 / jc_term ** 2)) / 100.0)
+
+        Mp = Fy * Zx
+
+        length_ratio = np.where(Lr != Lp, (Lb - Lp) / (Lr - Lp), 1.0)
+        Mn_inelastic = Cb * (Mp - (Mp - Fr * Sx) * length_ratio)
+
+        Lb_rts = Lb * 100.0 / rts
+        Fcr = Cb * np.pi ** 2 * E / Lb_rts ** 2 * np.sqrt(1.0 + 0.078 * jc_term * Lb_rts ** 2)
+        Mn_elastic = Fcr * Sx
+
+        Mn = np.where(Lb <= Lp, Mp,
+                      np.minimum(Mp, np.where(Lb <= Lr, Mn_inelastic, Mn_elastic)))
+
+    return Mn / 100000.0, Mp / 100000.0, Lp, Lr
+
+def e3_compression_capacity_arrays(Ag, rx, ry, Fy, E, KLx, KLy, phi_c=0.90, lambda_limit=None):
+    """
+    Vectorized AISC 360-16 E3 over broadcastable arrays.
+
+    Same units as aisc_360_16_e3_compression_design (KL in m, r in cm).
+    lambda_limit is the precomputed 4.71√(E/Fy) of the grades, derived when
+    omitted. Returns phi_Pn in tons, the governing KL/r and an
+    inelastic-buckling mask.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if lambda_limit is None:
+            lambda_limit = 4.71 * np.sqrt(E / Fy)
+        lambda_c = np.maximum(KLx * 100.0 / rx, KLy * 100.0 / ry)
+        Fe = np.pi ** 2 * E / lambda_c ** 2
+        inelastic = lambda_c <= lambda_limit
+        Fcr = np.where(inelastic, 0.658 ** (Fy / Fe) * Fy, 0.877 * Fe)
+    return phi_c * Fcr * Ag / 1000.0, lambda_c, inelastic
+
+def member_ratio_envelope(df, df_mat, member_groups, df_loads, members=None,
+                          sections=None, materials=None, max_elements=20_000_000,
+                          section_arrays=None, grade_arrays=None):
+    """
+    Governing Tab 5 utilization of every member for every grade x section.
+
+    Evaluates all load combinations of each member with the same equations
+    as the Tab 5 Design Check (H1-1a/b for compression, linear Tu/φTn +
+    Mu/φMn for tension) in one vectorized pass, chunked by member so that no
+    intermediate array exceeds max_elements.
+
+    section_arrays / grade_arrays are precomputed section_property_arrays /
+    material_property_arrays (e.g. a DatabaseSnapshot's, subset to the
+    candidates) used in place of the df/df_mat lookups; sections/materials
+    are then ignored.
+
+    Returns (members, ratios) where ratios has shape
+    (n_members, n_materials, n_sections); combinations that cannot carry a
+    load combination (e.g. compression on a tension member) are inf.
+    """
+    members = [m for m in (member_groups if members is None else members) if m in member_groups]
+    sec = section_property_arrays(df, sections) if section_arrays is None else section_arrays
+    mat = material_property_arrays(df_mat, materials) if grade_arrays is None else grade_arrays
+    n_mat, n_sec = len(mat['Fy']), len(sec['A'])
+
+    if not members:
+        return members, np.empty((0, n_mat, n_sec))
+
+    Fy, E = mat['Fy'][:, None], mat['E'][:, None]
+    phi_Pt = 0.9 * Fy * sec['A'] / 1000.0
+    phi_Mny = 0.9 * 0.9 * Fy * sec['Zy'] / 100000.0
+
+    loads = df_loads[df_loads['Member No.'].isin(members)]
+    member_pos = {m: i for i, m in enumerate(members)}
+    row_member = loads['Member No.'].map(member_pos).to_numpy()
+    order = np.argsort(row_member, kind='stable')
+    row_member = row_member[order]
+    Mu_all = np.abs(pd.to_numeric(loads['Mu'], errors='coerce').to_numpy(dtype=float)[order])
+    Pu_all = pd.to_numeric(loads['Pu'], errors='coerce').to_numpy(dtype=float)[order]
+
+    configs = [member_groups[m] for m in members]
+    type_code = np.array([MEMBER_TYPES.index(c['member_type']) if c['member_type'] in MEMBER_TYPES else 0
+                          for c in configs])
+    flex_keys, flex_idx = np.unique(np.array([[c['Lb'], c['Cb']] for c in configs], dtype=float),
+                                    axis=0, return_inverse=True)
+    kl_keys, kl_idx = np.unique(np.array([c['KL'] for c in configs], dtype=float), return_inverse=True)
+
+    # Capacities depend only on (Lb, Cb) and KL, which members usually share
+    phi_Mnx = 0.9 * f2_flexural_capacity_arrays(
+        sec['Sx'], sec['Zx'], sec['ry'], sec['rts'], sec['J'], sec['ho'], Fy, E,
+        flex_keys[:, 0, None, None], flex_keys[:, 1, None, None],
+        sqrt_E_Fy=mat['sqrt_E_Fy'][:, None])[0]
+    phi_Pc = e3_compression_capacity_arrays(
+        sec['A'], sec['rx'], sec['ry'], Fy, E, kl_keys[:, None, None], kl_keys[:, None, None],
+        lambda_limit=mat['lambda_e3'][:, None])[0]
+
+    ratios = np.zeros((len(members), n_mat, n_sec))
+    starts = np.searchsorted(row_member, np.arange(len(members)))
+    ends = np.searchsorted(row_member, np.arange(len(members)), side='right')
+    rows_per_chunk = max(1, max_elements // max(1, n_mat * n_sec))
+
+    first = 0
+    while first < len(members):
+        last = first + 1
+        while last < len(members) and ends[last] - starts[first] <= rows_per_chunk:
+            last += 1
+        rows = slice(starts[first], ends[last - 1])
+        chunk_members = row_member[rows]
+
+        if chunk_members.size:
+            Mu = Mu_all[rows, None, None]
+            Pu = Pu_all[rows, None, None]
+            kind = type_code[chunk_members][:, None, None]
+            Mcx = phi_Mnx[flex_idx[chunk_members]]
+            Pc = phi_Pc[kl_idx[chunk_members]]
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                Mr_Mc = Mu / Mcx
+                Pr_Pc = Pu / Pc
+                h1 = np.where(Pr_Pc >= 0.2, Pr_Pc + (8.0 / 9.0) * Mr_Mc, Pr_Pc / 2.0 + Mr_Mc)
+                h1 = np.where((Pc > 0) & (Mcx > 0) & (phi_Mny > 0), h1, np.inf)
+                tension = np.abs(Pu) / phi_Pt + Mr_Mc
+                combined = np.where(Pu < 0, tension, h1)
+
+                ratio = np.where(kind == 3, np.where(Pu >= 0, np.inf, np.abs(Pu) / phi_Pt),
+                                 np.where(kind == 2, Mr_Mc, combined))
+            ratio = np.where(np.isnan(ratio), np.inf, ratio)
+
+            bounds = np.flatnonzero(np.r_[True, chunk_members[1:] != chunk_members[:-1]])
+            ratios[chunk_members[bounds]] = np.maximum.reduceat(ratio, bounds, axis=0)
+
+        first = last
+
+    return members, ratios
+
+# ==================== EVALUATION FUNCTION ====================
+def evaluate_section_design(df, df_mat, section, material, design_loads, design_lengths):
+    """Comprehensive section evaluation"""
+    try:
+        weight_col = 'Unit Weight [kg/m]' if 'Unit Weight [kg/m]' in df.columns else 'w [kg/m]'
+        weight = safe_scalar(df.loc[section, weight_col])
+        
+        flex_result = aisc_360_16_f2_flexural_design(df, df_mat, section, material, design_lengths['Lb'])
+        comp_result = aisc_360_16_e3_compression_design(df, df_mat, section, material, 
+                                                       design_lengths['KLx'], design_lengths['KLy'])
+        
+        if flex_result and comp_result:
+            phi_Mn = 0.9 * flex_result['Mn']
+            phi_Pn = comp_result['phi_Pn']
+            
+            moment_ratio = design_loads['Mu'] / phi_Mn if phi_Mn > 0 else 999
+            axial_ratio = design_loads['Pu'] / phi_Pn if phi_Pn > 0 else 999
+            
+            flexural_adequate = moment_ratio <= 1.0
+            compression_adequate = axial_ratio <= 1.0
+            overall_adequate = flexural_adequate and compression_adequate
+            
+            Lp = flex_result['Lp']
+            Lr = flex_result['Lr'] 
+            current_Lb = design_lengths['Lb']
+            
+            if current_Lb <= Lp:
+                flexural_zone = "Yielding (F2.1)"
+            elif current_Lb <= Lr:
+                flexural_zone = "Inelastic LTB (F2.2)"
+            else:
+                flexural_zone = "Elastic LTB (F2.3)"
+            
+            return {
+                'section': section,
+                'material': material,
+                'weight': weight,
+                'flexural': {
+                    'Mn': flex_result['Mn'],
+                    'phi_Mn': phi_Mn,
+                    'Mp': flex_result['Mp'],
+                    'Lp': Lp,
+                    'Lr': Lr,
+                    'case': flex_result['Case'],
+                    'zone': flexural_zone,
+                    'ratio': moment_ratio,
+                    'adequate': flexural_adequate,
+                },
+                'compression': {
+                    'Pn': comp_result['Pn'],
+                    'phi_Pn': phi_Pn,
+                    'Fcr': comp_result['Fcr'],
+                    'lambda_c': comp_result['lambda_c'],
+                    'mode': comp_result['buckling_mode'],
+                    'ratio': axial_ratio,
+                    'adequate': compression_adequate,
+                },
+                'design_check': {
+                    'overall_adequate': overall_adequate,
+                    'moment_utilization': moment_ratio,
+                    'axial_utilization': axial_ratio,
+                }
+            }
+    except Exception as e:
+        logger.error("Error in section evaluation: %s", e)
+        return None
+
+def evaluate_member_design(df, df_mat, section, material, member_type, design_loads, design_lengths):
+    """
+    Section evaluation for one Tab 5 load combination of a member.
+
+    Applies the member type's checks exactly as the Tab 5 Design Check
+    does: axial tension for a Tension Member, F2 flexure (with Cb) for a
+    Beam, and for beam-columns H1-1a/b under compression or the linear
+    Tu/φTn + Mu/φMn under tension. design_loads holds Mu and the signed Pu
+    (negative in tension), design_lengths Lb, KL and Cb. Returns the
+    evaluate_section_design layout with only the checks that apply, plus
+    'tension' and 'interaction' entries; 'ratio' is the Tab 5 ratio.
+    """
+    try:
+        Mu = abs(safe_scalar(design_loads['Mu']))
+        Pu = safe_scalar(design_loads['Pu'])
+        Lb, KL = design_lengths['Lb'], design_lengths['KL']
+        Cb = design_lengths.get('Cb', 1.0)
+        Fy = safe_scalar(df_mat.loc[material, "Yield Point (ksc)"])
+        Ag = safe_scalar(df.loc[section, 'A [cm2]'])
+        Zy = safe_scalar(df.loc[section, 'Zy [cm3]'])
+
+        evaluation = {'section': section, 'material': material, 'member_type': member_type}
+        phi_Tn = 0.9 * Fy * Ag / 1000.0
+
+        if member_type == "Tension Member":
+            ratio = abs(Pu) / phi_Tn if Pu < 0 else 999.0
+            evaluation['tension'] = {'phi_Pn': phi_Tn, 'Tu': abs(Pu), 'ratio': ratio, 'adequate': ratio <= 1.0}
+            evaluation['ratio'] = ratio
+            return evaluation
+
+        flex_result = aisc_360_16_f2_flexural_design(df, df_mat, section, material, Lb, Cb)
+        if not flex_result:
+            return None
+        phi_Mn = 0.9 * flex_result['Mn']
+        moment_ratio = Mu / phi_Mn if phi_Mn > 0 else 999
+        if Lb <= flex_result['Lp']:
+            flexural_zone = "Yielding (F2.1)"
+        elif Lb <= flex_result['Lr']:
+            flexural_zone = "Inelastic LTB (F2.2)"
+        else:
+            flexural_zone = "Elastic LTB (F2.3)"
+        evaluation['flexural'] = {
+            'Mn': flex_result['Mn'],
+            'phi_Mn': phi_Mn,
+            'Mp': flex_result['Mp'],
+            'Lp': flex_result['Lp'],
+            'Lr': flex_result['Lr'],
+            'case': flex_result['Case'],
+            'zone': flexural_zone,
+            'ratio': moment_ratio,
+            'adequate': moment_ratio <= 1.0,
+        }
+
+        if member_type == "Beam (Flexure Only)":
+            evaluation['ratio'] = moment_ratio
+            return evaluation
+
+        if Pu < 0:
+            axial_ratio = abs(Pu) / phi_Tn
+            evaluation['tension'] = {'phi_Pn': phi_Tn, 'Tu': abs(Pu), 'ratio': axial_ratio,
+                                     'adequate': axial_ratio <= 1.0}
+            ratio = axial_ratio + moment_ratio
+            evaluation['interaction'] = {'equation': "Tu/φTn + Mu/φMn", 'axial_ratio': axial_ratio,
+                                         'moment_ratio': moment_ratio, 'ratio': ratio, 'adequate': ratio <= 1.0}
+        else:
+            comp_result = aisc_360_16_e3_compression_design(df, df_mat, section, material, KL, KL)
+            if not comp_result:
+                return None
+            phi_Pn = comp_result['phi_Pn']
+            axial_ratio = Pu / phi_Pn if phi_Pn > 0 else 999
+            evaluation['compression'] = {
+                'Pn': comp_result['Pn'],
+                'phi_Pn': phi_Pn,
+                'Fcr': comp_result['Fcr'],
+                'lambda_c': comp_result['lambda_c'],
+                'mode': comp_result['buckling_mode'],
+                'ratio': axial_ratio,
+                'adequate': axial_ratio <= 1.0,
+            }
+            h1 = aisc_360_16_h1_interaction(Pu, phi_Pn, Mu, phi_Mn, 0, 0.9 * 0.9 * Fy * Zy / 100000.0)
+            if not h1:
+                return None
+            ratio = h1['interaction_ratio']
+            evaluation['interaction'] = {'equation': h1['equation'], 'axial_ratio': h1['Pr_Pc'],
+                                         'moment_ratio': h1['Mrx_Mcx'], 'ratio': ratio, 'adequate': h1['design_ok']}
+        evaluation['ratio'] = ratio
+        return evaluation
+
+    except Exception as e:
+        logger.error("Error in member evaluation: %s", e)
+        return None
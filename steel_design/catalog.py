@@ -0,0 +1,206 @@
+"""
+Multi-family section catalog.
+
+Each shape family (H/W, channels, angles, HSS, pipes) has its own CSV next
+to the H-shape database. The catalog stacks whichever family files exist
+into one table with a Family column and keeps each family's rows
+contiguous. Properties are held as per-family float arrays, so a family or
+dimension-range query only touches that family's rows.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .data import DATA_DIR, SECTION_DB_FILE, load_databases
+from .names import NameIndex
+
+# ==================== SECTION CATALOG ====================
+SHAPE_FAMILIES = {
+    'H': ("H/W-Shapes", SECTION_DB_FILE),
+    'C': ("Channels", "2003-Steel-Beam-DataBase-Channel.csv"),
+    'L': ("Angles", "2003-Steel-Beam-DataBase-Angle.csv"),
+    'HSS': ("Hollow Structural Sections", "2003-Steel-Beam-DataBase-HSS.csv"),
+    'PIPE': ("Pipes", "2003-Steel-Beam-DataBase-Pipe.csv")
+}
+
+# Families the AISC design functions can check (doubly symmetric I-shapes)
+DESIGN_FAMILIES = ('H',)
+
+# Short names accepted by SectionCatalog.filter; any column name also works
+DIMENSION_COLUMNS = {
+    'd': 'd [mm]',
+    'bf': 'bf [mm]',
+    'tw': 'tw [mm]',
+    'tf': 'tf [mm]',
+    'w': 'w [kg/m]',
+    'A': 'A [cm2]',
+    'Ix': 'Ix [cm4]',
+    'Iy': 'Iy [cm4]',
+    'Sx': 'Sx [cm3]',
+    'Zx': 'Zx [cm3]',
+    'rx': 'rx [cm]',
+    'ry': 'ry [cm]'
+}
+
+class SectionCatalog:
+    """
+    Sections of several shape families in one indexed store.
+
+    frame is the stacked table (indexed by section name, with a Family
+    column), family_slices maps each family to its row range in frame, and
+    arrays(family) gives that family's numeric columns as contiguous
+    float64 arrays. Sorted orders per (family, column) are built on first
+    use so range filters are a binary search rather than a scan.
+    """
+
+    def __init__(self, frames):
+        parts = []
+        self.family_slices = {}
+        start = 0
+        for family, frame in frames.items():
+            if frame is None or len(frame) == 0:
+                continue
+            part = frame.copy()
+            part['Family'] = family
+            parts.append(part)
+            self.family_slices[family] = slice(start, start + len(part))
+            start += len(part)
+
+        self.frame = pd.concat(parts) if parts else pd.DataFrame(columns=['Family'])
+        self.families = tuple(self.family_slices)
+        self._names = {}
+        self._arrays = {}
+        self._sorted = {}
+        self._name_indexes = {}
+        self._columns = {family: list(frame.columns) + ['Family']
+                         for family, frame in frames.items() if family in self.family_slices}
+        for family, rows in self.family_slices.items():
+            part = self.frame.iloc[rows]
+            self._names[family] = part.index.to_numpy(dtype=object)
+            self._arrays[family] = {
+                column: np.ascontiguousarray(pd.to_numeric(part[column], errors='coerce'), dtype=float)
+                for column in self._columns[family]
+                if column != 'Family' and pd.api.types.is_numeric_dtype(part[column])
+            }
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __contains__(self, section):
+        return section in self.frame.index
+
+    def family_of(self, section):
+        """Family key of a section name"""
+        return self.frame.at[section, 'Family']
+
+    def family_frame(self, family):
+        """The rows of one family, with that family's own columns"""
+        return self.frame.iloc[self.family_slices[family]][self._columns[family]]
+
+    def sections(self, family=None):
+        """Section names, in catalog order, of one family or all of them"""
+        if family is None:
+            return self.frame.index.tolist()
+        return self._names[family].tolist() if family in self._names else []
+
+    def name_index(self, family=None):
+        """NameIndex of one family, several (tuple) or all sections, built once"""
+        key = family if family is None or isinstance(family, str) else tuple(family)
+        if key not in self._name_indexes:
+            families = self.families if key is None else ((key,) if isinstance(key, str) else key)
+            self._name_indexes[key] = NameIndex(name for fam in families for name in self.sections(fam))
+        return self._name_indexes[key]
+
+    def arrays(self, family, columns=None):
+        """Contiguous float arrays of a family's numeric columns"""
+        arrays = self._arrays[family]
+        if columns is None:
+            return dict(arrays)
+        return {column: arrays[DIMENSION_COLUMNS.get(column, column)] for column in columns}
+
+    def _sorted_column(self, family, column):
+        key = (family, column)
+        if key not in self._sorted:
+            values = self._arrays[family][column]
+            order = np.argsort(values, kind='stable')
+            self._sorted[key] = (order, values[order])
+        return self._sorted[key]
+
+    def filter(self, family=None, **ranges):
+        """
+        Section names within dimension ranges.
+
+        family is a family key, a list of keys or None for all families.
+        Each keyword is a short name from DIMENSION_COLUMNS (or a column
+        name) mapped to (low, high); either bound may be None. A family
+        without one of the requested columns contributes no sections.
+
+        Example: catalog.filter('H', d=(300, 500), w=(None, 80))
+        """
+        if family is None:
+            families = self.families
+        elif isinstance(family, str):
+            families = (family,)
+        else:
+            families = tuple(family)
+
+        bounds = []
+        for name, (low, high) in ranges.items():
+            low = -np.inf if low is None else float(low)
+            high = np.inf if high is None else float(high)
+            bounds.append((DIMENSION_COLUMNS.get(name, name), low, high))
+
+        names = []
+        for fam in families:
+            if fam not in self._arrays:
+                continue
+            arrays = self._arrays[fam]
+            if any(column not in arrays for column, _, _ in bounds):
+                continue
+            if not bounds:
+                names.extend(self._names[fam].tolist())
+                continue
+
+            # Narrow with a binary search on the first range, then mask the candidates
+            column, low, high = bounds[0]
+            order, values = self._sorted_column(fam, column)
+            rows = order[np.searchsorted(values, low, 'left'):np.searchsorted(values, high, 'right')]
+            for column, low, high in bounds[1:]:
+                values = arrays[column][rows]
+                rows = rows[(values >= low) & (values <= high)]
+            names.extend(self._names[fam][np.sort(rows)].tolist())
+        return names
+
+    def dimension_range(self, family, column):
+        """(min, max) of a column within a family, ignoring missing values"""
+        values = self._arrays[family][DIMENSION_COLUMNS.get(column, column)]
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return (np.nan, np.nan)
+        return (float(values.min()), float(values.max()))
+
+def load_catalog(source=None, families=None, df=None):
+    """
+    Build a SectionCatalog from the family CSVs that are present.
+
+    source is a local directory as for load_databases (families are not
+    probed over http). The H family comes from load_databases (or df when
+    given) so it shares the compiled cache; other family files that do not
+    exist are skipped.
+    """
+    source = source or os.environ.get("STEEL_DESIGN_DATA_SOURCE") or DATA_DIR
+    families = list(SHAPE_FAMILIES) if families is None else list(families)
+    remote = source.startswith(("http://", "https://"))
+
+    frames = {}
+    for family in families:
+        if family == 'H':
+            frames[family] = df if df is not None else load_databases(source)[0]
+            continue
+        path = os.path.join(source, SHAPE_FAMILIES[family][1])
+        if remote or not os.path.exists(path):
+            continue
+        frames[family] = pd.read_csv(path, index_col=0, encoding='ISO-8859-1')
+    return SectionCatalog(frames)
@@ -0,0 +1,108 @@
+"""
+Section and material database loading.
+
+The bundled CSVs live at the repository root next to Function.py and are
+compiled into a pickle cache that is only rebuilt when they change.
+"""
+
+import hashlib
+import os
+import pickle
+
+import pandas as pd
+
+from .properties import complete_section_properties
+
+# ==================== LOAD DATA ====================
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_URL = "https://raw.githubusercontent.com/Thana-site/Steel_Design_2003/main/"
+SECTION_DB_FILE = "2003-Steel-Beam-DataBase-H-Shape.csv"
+MATERIAL_DB_FILE = "2003-Steel-Beam-DataBase-Material.csv"
+DATA_CACHE_FILE = os.path.join(DATA_DIR, ".steel_design_cache", "databases.pkl")
+DATA_CACHE_VERSION = 2
+
+def _read_databases(section_source, material_source):
+    """Parse the section and material CSVs (local paths or URLs) and complete the section properties"""
+    df = complete_section_properties(pd.read_csv(section_source, index_col=0, encoding='ISO-8859-1'))
+    df_mat = pd.read_csv(material_source, index_col=0, encoding="utf-8")
+    return df, df_mat
+
+def _file_stat(path):
+    """(size, mtime_ns) of a file, the cheap part of the cache key"""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+def _file_checksum(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _write_data_cache(cache_path, payload):
+    """Atomically write the compiled database cache; a read-only disk just skips caching"""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+def load_databases(source=None, cache_path=DATA_CACHE_FILE):
+    """
+    Load the section and material databases.
+
+    source is a directory holding the bundled CSVs (default: next to this
+    file, or the STEEL_DESIGN_DATA_SOURCE environment variable) or an
+    http(s) URL prefix. Local CSVs are compiled into a pickle cache keyed by
+    each file's size/mtime and SHA-256, so a cold start only parses them
+    again after they change. The section table is completed with exact
+    torsion/warping properties (see properties.complete_section_properties)
+    before it is cached. Returns (df, df_mat).
+    """
+    source = source or os.environ.get("STEEL_DESIGN_DATA_SOURCE") or DATA_DIR
+
+    if source.startswith(("http://", "https://")):
+        base = source if source.endswith("/") else source + "/"
+        return _read_databases(base + SECTION_DB_FILE, base + MATERIAL_DB_FILE)
+
+    paths = [os.path.join(source, SECTION_DB_FILE), os.path.join(source, MATERIAL_DB_FILE)]
+    stats = [_file_stat(path) for path in paths]
+
+    cached = None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:
+            cached = None
+        if (not isinstance(cached, dict) or cached.get('version') != DATA_CACHE_VERSION
+                or cached.get('paths') != paths):
+            cached = None
+
+    if cached is not None:
+        if cached['stats'] == stats:
+            return cached['df'], cached['df_mat']
+
+        # Touched but possibly unchanged (e.g. fresh checkout): compare contents
+        checksums = [_file_checksum(path) for path in paths]
+        if cached['checksums'] == checksums:
+            _write_data_cache(cache_path, {**cached, 'stats': stats})
+            return cached['df'], cached['df_mat']
+    else:
+        checksums = [_file_checksum(path) for path in paths]
+
+    df, df_mat = _read_databases(*paths)
+    if cache_path:
+        _write_data_cache(cache_path, {
+            'version': DATA_CACHE_VERSION,
+            'paths': paths,
+            'stats': stats,
+            'checksums': checksums,
+            'df': df,
+            'df_mat': df_mat
+        })
+    return df, df_mat
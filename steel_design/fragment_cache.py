@@ -0,0 +1,70 @@
+"""
+Content-addressed cache of rendered report fragments.
+
+A member's HTML section or MIDAS page depends only on the member dict (and
+the writer that renders it), so fragments are cached under a hash of that
+content. Regenerating a report after editing one member then renders only
+the members whose content changed and reuses the cached text for the rest.
+"""
+
+import hashlib
+import json
+import pickle
+import threading
+from collections import OrderedDict
+
+# ==================== FRAGMENT CACHE ====================
+def member_digest(member, *context):
+    """
+    Stable hash of a member dict (section properties, loads, results) and
+    any context the rendering depends on, e.g. the writer and code name.
+    """
+    try:
+        payload = json.dumps([member, context], sort_keys=True, default=repr).encode('utf-8')
+    except (TypeError, ValueError):
+        payload = pickle.dumps([member, context], protocol=4)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+class FragmentCache:
+    """
+    Bounded LRU map from a content hash to a rendered fragment.
+
+    Holds at most maxsize fragments; the least recently used one is evicted
+    first. Safe to share between sessions and threads.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._items.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return self._items[key]
+
+    def put(self, key, fragment):
+        with self._lock:
+            self._items[key] = fragment
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,679 @@
+"""HTML and MIDAS Gen style text design reports."""
+
+from datetime import datetime
+
+import numpy as np
+
+from .report_checks import create_member_data
+from .html_templates import (
+    COMPRESSION_TABLE, CONCLUSION, FLEXURE_TABLE, GEOMETRY_TABLE, H1_CALC,
+    INTERACTION_ROW, INTERACTION_TABLE_CLOSE, INTERACTION_TABLE_OPEN, LOAD_ROW, LOAD_TABLE_CLOSE,
+    LOAD_TABLE_OPEN, MEMBER_CLOSE, MEMBER_OPEN, REPORT_CSS, REPORT_FOOT, REPORT_HEAD_CLOSE,
+    REPORT_HEAD_OPEN, SECTION_TABLE, SECTION_TABLE_PROPERTIES, SHEAR_TABLE, TENSION_TABLE
+)
+
+# ==================== HTML REPORT GENERATOR ====================
+
+
+class SteelDesignReportGenerator:
+    """Generate steel member design reports in HTML format"""
+    
+    def __init__(self, project_info=None):
+        self.project_info = project_info or {}
+        self.members = []
+        self.report_date = datetime.now().strftime("%Y-%m-%d")
+        
+    def add_member(self, member_data):
+        """Add a member to the report"""
+        self.members.append(member_data)
+    
+    @staticmethod
+    def _get_css_styles():
+        """Return CSS styles for the report - optimized to prevent overlap"""
+        return REPORT_CSS
+    
+    @staticmethod
+    def _format_substitution(parts, separator=" "):
+        """Format substitution string with line breaks for long expressions"""
+        if isinstance(parts, list):
+            return f'<span style="white-space: nowrap;">{separator}</span>'.join(parts)
+        return str(parts)
+    
+    @staticmethod
+    def _generate_member_geometry_table(member):
+        """Generate Member & Geometry Summary table"""
+        return GEOMETRY_TABLE.render(
+            member_no=member.get('member_no', '—'),
+            member_type=member.get('member_type', '—'),
+            length=member.get('length', 0),
+            K=member.get('K', 1.0),
+            KL=member.get('KL', 0),
+            Lb=member.get('Lb', 0),
+            Cb=member.get('Cb', 1.0),
+            bracing=member.get('bracing', 'Unbraced')
+        )
+    
+    @staticmethod
+    def _generate_section_properties_table(member):
+        """Generate Section Properties & Classification table"""
+        section = member.get('section_props', {})
+        classification = member.get('classification', 'Compact')
+        
+        # Determine classification style
+        if classification == 'Compact':
+            class_style = 'pass'
+        elif classification == 'Noncompact':
+            class_style = 'warning'
+        else:
+            class_style = 'fail'
+        
+        return SECTION_TABLE.render(
+            section_name=member.get('section_name', '—'),
+            class_style=class_style,
+            classification=classification,
+            **{name: section.get(name, 0) for name in SECTION_TABLE_PROPERTIES}
+        )
+    
+    @staticmethod
+    def _generate_flexural_strength_table(member):
+        """Generate Flexural Strength Calculation table"""
+        flex = member.get('flexural_results', {})
+        section = member.get('section_props', {})
+        
+        Lp = flex.get('Lp', 0)
+        Lr = flex.get('Lr', 0)
+        Lb = member.get('Lb', 0)
+        
+        # Determine limit state
+        if Lb <= Lp:
+            limit_state = "Yielding (Lb ≤ Lp)"
+            case = "F2-1"
+        elif Lb <= Lr:
+            limit_state = "Inelastic LTB (Lp < Lb ≤ Lr)"
+            case = "F2-2"
+        else:
+            limit_state = "Elastic LTB (Lb > Lr)"
+            case = "F2-3"
+        
+        return FLEXURE_TABLE.render(
+            limit_state=limit_state,
+            case=case,
+            ry_mm=section.get('ry', 0) * 10,  # cm to mm
+            Fy=section.get('Fy', 345),
+            Zx_mm3=section.get('Zx', 0) * 1000,  # cm³ to mm³
+            Lp=Lp,
+            Lr=Lr,
+            Lb=Lb,
+            Mp=flex.get('Mp', 0),
+            Mn=flex.get('Mn', 0),
+            phi_Mn=flex.get('phi_Mn', 0)
+        )
+    
+    @staticmethod
+    def _generate_compression_strength_table(member):
+        """Generate Compression Strength Calculation table"""
+        comp = member.get('compression_results', {})
+        section = member.get('section_props', {})
+        
+        lambda_x = comp.get('lambda_x', 0)
+        lambda_y = comp.get('lambda_y', 0)
+        lambda_limit = comp.get('lambda_limit', 0)
+        lambda_gov = comp.get('lambda_governing', max(lambda_x, lambda_y) if lambda_x > 0 or lambda_y > 0 else 0)
+        
+        # Determine governing axis
+        gov_axis = 'Y-axis' if lambda_y > lambda_x else 'X-axis'
+        
+        # Determine buckling mode
+        if lambda_gov <= lambda_limit:
+            buckling_mode = "Inelastic Buckling"
+            equation = "E3-2"
+        else:
+            buckling_mode = "Elastic Buckling"
+            equation = "E3-3"
+        
+        return COMPRESSION_TABLE.render(
+            buckling_mode=buckling_mode,
+            equation=equation,
+            gov_axis=gov_axis,
+            KL_mm=member.get('KL', 0) * 1000,  # m to mm
+            rx_mm=section.get('rx', 0) * 10,  # cm to mm
+            ry_mm=section.get('ry', 0) * 10,  # cm to mm
+            Ag_mm2=section.get('Ag', 0) * 100,  # cm² to mm²
+            Fy=section.get('Fy', 345),
+            lambda_x=lambda_x,
+            lambda_y=lambda_y,
+            lambda_gov=lambda_gov,
+            lambda_limit=lambda_limit,
+            Fe=comp.get('Fe', 0),
+            Fcr=comp.get('Fcr', 0),
+            Pn=comp.get('Pn', 0),
+            phi_Pn=comp.get('phi_Pn', 0)
+        )
+    
+    @staticmethod
+    def _generate_tension_strength_table(member):
+        """Generate Tension Strength Calculation table"""
+        tens = member.get('tension_results', {})
+        section = member.get('section_props', {})
+        governing = tens.get('governing', 'Yielding')
+        
+        return TENSION_TABLE.render(
+            governing=governing,
+            yield_class='governing' if governing == 'Yielding' else '',
+            rupture_class='governing' if governing == 'Rupture' else '',
+            Fy=section.get('Fy', 345),
+            Fu=tens.get('Fu', 450),
+            Ag_mm2=section.get('Ag', 0) * 100,
+            Ae_mm2=tens.get('Ae', section.get('Ag', 0)) * 100,
+            Pn_yield=tens.get('Pn_yield', 0),
+            Pn_rupture=tens.get('Pn_rupture', 0),
+            phi_Pn_yield=tens.get('phi_Pn_yield', 0),
+            phi_Pn_rupture=tens.get('phi_Pn_rupture', 0),
+            phi_Pn=tens.get('phi_Pn', 0)
+        )
+    
+    @staticmethod
+    def _generate_shear_strength_table(member):
+        """Generate Shear Strength Calculation table"""
+        shear = member.get('shear_results', {})
+        section = member.get('section_props', {})
+        
+        if not shear:
+            return ""
+        
+        Aw = shear.get('Aw', 0)
+        return SHEAR_TABLE.render(
+            Fy=section.get('Fy', 345),
+            Aw=Aw,
+            Aw_mm2=Aw * 100,
+            Cv1=shear.get('Cv1', 1.0),
+            Vn=shear.get('Vn', 0),
+            phi_Vn=shear.get('phi_Vn', 0)
+        )
+    
+    @staticmethod
+    def _generate_load_combination_table(member):
+        """Generate Load Combination Summary table"""
+        loads = member.get('loads', [])
+        
+        if not loads:
+            return ""
+        
+        Pu = [load.get('Pu', 0) for load in loads]
+        rows = LOAD_ROW.render_rows(
+            lc=[load.get('LC', '—') for load in loads],
+            pu_class=['' if value >= 0 else 'warning' for value in Pu],  # Highlight tension loads
+            Pu=Pu,
+            Mux=[load.get('Mux', 0) for load in loads],
+            Muy=[load.get('Muy', 0) for load in loads],
+            Vu=[load.get('Vu', 0) for load in loads]
+        )
+        return LOAD_TABLE_OPEN + rows + LOAD_TABLE_CLOSE
+    
+    @staticmethod
+    def _generate_interaction_table(member):
+        """Generate Combined Force Check table"""
+        interactions = member.get('interaction_results', [])
+        
+        if not interactions:
+            return ""
+        
+        ratios = [inter.get('interaction_ratio', 0) for inter in interactions]
+        equations = [inter.get('equation_used', 'H1-1a') for inter in interactions]
+        h1a = ['H1-1a' in equation for equation in equations]
+        phi_Pn = [inter.get('phi_Pn', 1) for inter in interactions]
+        
+        # Find governing (max ratio)
+        max_ratio = max(ratios)
+        governing = [abs(ratio - max_ratio) < 0.0001 for ratio in ratios]
+        
+        # Calculation based on equation type
+        calcs = H1_CALC.render_each(
+            Pu=[abs(inter.get('Pu', 0)) for inter in interactions],
+            Pc=[value if is_a else 2 * value for value, is_a in zip(phi_Pn, h1a)],
+            open=['(8/9)[' if is_a else '' for is_a in h1a],
+            Mux=[abs(inter.get('Mux', 0)) for inter in interactions],
+            phi_Mnx=[inter.get('phi_Mnx', 1) for inter in interactions],
+            Muy=[abs(inter.get('Muy', 0)) for inter in interactions],
+            phi_Mny=[inter.get('phi_Mny', 1) for inter in interactions],
+            close=[']' if is_a else '' for is_a in h1a]
+        )
+        rows = INTERACTION_ROW.render_rows(
+            row_class=['governing' if gov else '' for gov in governing],
+            lc=[inter.get('LC', '—') for inter in interactions],
+            gov_marker=[" ★" if gov else "" for gov in governing],
+            equation=equations,
+            calc=calcs,
+            ratio=ratios,
+            status_class=['pass' if ratio <= 1.0 else 'fail' for ratio in ratios],
+            status=["OK" if ratio <= 1.0 else "NG" for ratio in ratios]
+        )
+        return INTERACTION_TABLE_OPEN + rows + INTERACTION_TABLE_CLOSE
+    
+    @staticmethod
+    def _generate_conclusion(member):
+        """Generate Design Conclusion section"""
+        interactions = member.get('interaction_results', [])
+        flex = member.get('flexural_results', {})
+        comp = member.get('compression_results', {})
+        
+        if interactions:
+            max_idx = max(range(len(interactions)), key=lambda i: interactions[i].get('interaction_ratio', 0))
+            max_inter = interactions[max_idx]
+            max_ratio = max_inter.get('interaction_ratio', 0)
+            governing_lc = max_inter.get('LC', '—')
+            governing_state = max_inter.get('equation_used', '—')
+        else:
+            max_ratio = 0
+            governing_lc = "—"
+            governing_state = "—"
+        
+        design_ok = max_ratio <= 1.0
+        return CONCLUSION.render(
+            status_class='conclusion-pass' if design_ok else 'conclusion-fail',
+            status_style='status-pass' if design_ok else 'status-fail',
+            status_text='✓ DESIGN ADEQUATE' if design_ok else '✗ DESIGN INADEQUATE',
+            section_name=member.get('section_name', '—'),
+            member_type=member.get('member_type', '—'),
+            governing_lc=governing_lc,
+            governing_state=governing_state,
+            phi_Mn=flex.get('phi_Mn', 0),
+            phi_Pn=comp.get('phi_Pn', 0),
+            max_ratio=max_ratio,
+            utilization=max_ratio * 100
+        )
+    
+    def iter_member_report(self, member):
+        """Yield the report section for one member in order, table by table"""
+        member_type = member.get('member_type', 'Beam-Column')
+        
+        yield MEMBER_OPEN.render(
+            member_no=member.get('member_no', '—'),
+            section_name=member.get('section_name', '—'),
+            member_type=member_type
+        )
+        
+        # 1. Member & Geometry Summary
+        yield self._generate_member_geometry_table(member)
+        
+        # 2. Section Properties & Classification
+        yield self._generate_section_properties_table(member)
+        
+        # 3. Flexural Strength (if applicable)
+        if member_type in ['Beam', 'Beam-Column']:
+            yield self._generate_flexural_strength_table(member)
+        
+        # 4. Axial Strength
+        if member_type in ['Column', 'Beam-Column']:
+            yield self._generate_compression_strength_table(member)
+        elif member_type == 'Tension Member':
+            yield self._generate_tension_strength_table(member)
+        
+        # 5. Shear Strength (optional)
+        yield self._generate_shear_strength_table(member)
+        
+        # 5/6. Load Combination Summary
+        yield self._generate_load_combination_table(member)
+        
+        # 6/7. Combined Force Check (if beam-column)
+        if member_type in ['Beam-Column', 'Column']:
+            yield self._generate_interaction_table(member)
+        
+        # 7/8. Design Conclusion
+        yield self._generate_conclusion(member)
+        
+        yield MEMBER_CLOSE
+    
+    def generate_member_report(self, member):
+        """Generate complete report section for one member"""
+        return "".join(self.iter_member_report(member))
+    
+    def _report_head(self):
+        return (
+            REPORT_HEAD_OPEN.render(title=self.project_info.get('name', 'Project'))
+            + self._get_css_styles()
+            + REPORT_HEAD_CLOSE.render(
+                project=self.project_info.get('name', '—'),
+                date=self.report_date,
+                engineer=self.project_info.get('engineer', '—'),
+                checker=self.project_info.get('checker', '—')
+            )
+        )
+    
+    def _report_foot(self):
+        return REPORT_FOOT.render(date=self.report_date)
+    
+    def iter_full_report(self, members=None):
+        """
+        Yield the full HTML report as consecutive string chunks.
+        
+        members defaults to the added members; any iterable (e.g. a
+        generator building member data on the fly) may be passed instead, so
+        only one member is held at a time. The chunks join to exactly
+        generate_full_report().
+        """
+        yield self._report_head()
+        for member in (self.members if members is None else members):
+            yield from self.iter_member_report(member)
+        yield self._report_foot()
+    
+    def write_full_report(self, fp, members=None):
+        """Write the full HTML report to a text file object; returns characters written"""
+        written = 0
+        for chunk in self.iter_full_report(members):
+            fp.write(chunk)
+            written += len(chunk)
+        return written
+    
+    def generate_full_report(self):
+        """Generate complete HTML report for all members"""
+        return "".join(self.iter_full_report())
+
+
+# ==================== MIDAS GEN TEXT REPORT ====================
+# Members whose pages are formatted together; bounds the writer's memory
+MIDAS_BLOCK_SIZE = 1024
+
+_SUMMARY_LINE = "  {!s:<8} {!s:<24} {!s:<12} {!s:>6} {:>13.3f}     {}".format
+_LOAD_LINE = "    {!s:>2} {} {} {}".format
+_CHECK_LINE = "    {!s:>2}   {!s:<20} {:>8.3f}     {}".format
+
+
+def _midas_line(ch='-', n=98):
+    return ch * n
+
+
+def _midas_fmt(v, w=10, d=3):
+    try:
+        return f"{float(v):>{w}.{d}f}"
+    except Exception:
+        return f"{str(v):>{w}}"
+
+
+def _midas_column(values, w, d=3):
+    """_midas_fmt over a column: one float() and one format() pass when every value converts"""
+    try:
+        numbers = list(map(float, values))
+    except Exception:
+        return [_midas_fmt(v, w, d) for v in values]
+    return list(map(f"{{:>{w}.{d}f}}".format, numbers))
+
+
+def midas_governing(members):
+    """
+    Governing check of every member in one pass: (LC, ratio) lists.
+    
+    The ratio is the largest interaction ratio and the LC that of the first
+    check reaching it ('-' and 0.0 without checks), as max() picks them.
+    """
+    checks = [m.get('interaction_results', []) for m in members]
+    counts = np.fromiter(map(len, checks), dtype=np.int64, count=len(checks))
+    ratios = [r.get('interaction_ratio', 0) for results in checks for r in results]
+    try:
+        flat = np.array(ratios, dtype=float)
+        vectorized = bool(np.isfinite(flat).all())
+    except (TypeError, ValueError):
+        vectorized = False
+
+    if not vectorized:
+        governing = [max(results, key=lambda x: x.get('interaction_ratio', 0)) if results else None
+                     for results in checks]
+        return ([g.get('LC', '-') if g else '-' for g in governing],
+                [g.get('interaction_ratio', 0) if g else 0.0 for g in governing])
+
+    has_checks = counts > 0
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    best = np.zeros(len(checks))
+    if has_checks.any():
+        best[has_checks] = np.maximum.reduceat(flat, starts[has_checks])
+    owner = np.repeat(np.arange(len(checks)), counts)
+    first = np.full(len(checks), -1, dtype=np.int64)
+    at_max = np.flatnonzero(flat == best[owner])[::-1]
+    first[owner[at_max]] = at_max      # reversed, so the first maximal check wins
+    gov_lc = ['-'] * len(checks)
+    gov_ratio = [0.0] * len(checks)
+    for i in np.flatnonzero(has_checks).tolist():
+        j = int(first[i])
+        gov_lc[i] = checks[i][j - starts[i]].get('LC', '-')
+        gov_ratio[i] = ratios[j]
+    return gov_lc, gov_ratio
+
+
+def midas_report_header(members, project_info=None, code_name="AISC(15th)-LRFD16", now_str=None,
+                        governing=None):
+    """Title block and summary sheet of the MIDAS GEN-style text report."""
+    project_info = project_info or {}
+    now_str = now_str or datetime.now().strftime("%Y-%m-%d %H:%M")
+    gov_lc, gov_ratio = governing or midas_governing(members)
+    line = _midas_line
+
+    report = []
+    report.append(line('-'))
+    report.append(f" midas Gen - Steel Code Checking[ {code_name} ]{'Gen 2025':>44}")
+    report.append(line('='))
+    report.append("")
+    report.append(f" *.PROJECT     : {project_info.get('name', '')}")
+    report.append(" *.UNIT SYSTEM : kN, m")
+    report.append(f" *.GENERATED   : {now_str}")
+    report.append(line('='))
+    report.append(f"   [ {code_name} ]  CODE CHECKING SUMMARY SHEET --- SELECTED MEMBERS")
+    report.append(line('-'))
+    report.append("  MEMB     SECTION                  TYPE         GOV.LC     MAX RATIO     STATUS")
+    report.append(line('='))
+    report.extend(map(
+        _SUMMARY_LINE,
+        [m.get('member_no', '-') for m in members],
+        [m.get('section_name', '-') for m in members],
+        [m.get('member_type', '-') for m in members],
+        gov_lc,
+        gov_ratio,
+        ['OK' if ratio <= 1.0 else 'NG' for ratio in gov_ratio]
+    ))
+    report.append(line('-'))
+    report.append("\f")
+    return "\n".join(report)
+
+
+def _midas_table_lines(members):
+    """Load and check lines of several members, formatted column by column"""
+    loads = [m.get('loads', []) for m in members]
+    checks = [m.get('interaction_results', []) for m in members]
+    flat_loads = [ld for rows in loads for ld in rows]
+    flat_checks = [r for rows in checks for r in rows]
+
+    load_lines = list(map(
+        _LOAD_LINE,
+        [ld.get('LC', '-') for ld in flat_loads],
+        _midas_column([ld.get('Pu', 0) for ld in flat_loads], 14),
+        _midas_column([ld.get('Mux', 0) for ld in flat_loads], 16),
+        _midas_column([ld.get('Muy', 0) for ld in flat_loads], 14)
+    ))
+    ratios = [r.get('interaction_ratio', 0) for r in flat_checks]
+    check_lines = list(map(
+        _CHECK_LINE,
+        [r.get('LC', '-') for r in flat_checks],
+        [r.get('equation_used', 'H1') for r in flat_checks],
+        ratios,
+        ['O.K.' if ratio <= 1.0 else 'N.G.' for ratio in ratios]
+    ))
+
+    tables = []
+    i = j = 0
+    for rows_l, rows_c in zip(loads, checks):
+        tables.append((load_lines[i:i + len(rows_l)], check_lines[j:j + len(rows_c)]))
+        i += len(rows_l)
+        j += len(rows_c)
+    return tables
+
+
+def _midas_page(m, code_name, load_lines, check_lines, max_ratio):
+    line = _midas_line
+    section = m.get('section_props', {})
+
+    report = []
+    report.append(line('-'))
+    report.append(f" midas Gen - Steel Code Checking[ {code_name} ]{'Gen 2025':>44}")
+    report.append(line('='))
+    report.append("")
+    report.append(f" *. MEMBER NO   = {m.get('member_no','-')},  ELEMENT TYPE = {m.get('member_type','-')}")
+    report.append(f" *. SECTION     = {m.get('section_name','-')}")
+    report.append(f" *. MATERIAL Fy = {section.get('Fy', 0):.3f},  E = {section.get('E', 0):.1f}")
+    report.append(f" *. LENGTH(m)   = L={m.get('length',0):.3f}, KL={m.get('KL',0):.3f}, Lb={m.get('Lb',0):.3f}")
+    report.append("")
+
+    report.append(line('='))
+    report.append("   [[[*]]]   DEFINITION OF LOAD COMBINATIONS")
+    report.append(line('='))
+    report.append("    LC        Pu(kN)         Mux(kN·m)      Muy(kN·m)")
+    report.append(line('-'))
+    report.extend(load_lines)
+    if not load_lines:
+        report.append("    (no load combinations)")
+    report.append("")
+
+    report.append(line('='))
+    report.append("   [[[*]]]   LRFD STRENGTH CHECK RESULTS")
+    report.append(line('='))
+    report.append("    LC      Eqn                      Ratio       Result")
+    report.append(line('-'))
+    report.extend(check_lines)
+    if not check_lines:
+        report.append("    (no check results)")
+
+    report.append(line('-'))
+    report.append(f"    Governing Ratio = {max_ratio:.3f}  --->  {'O.K.' if max_ratio <= 1.0 else 'N.G.'}")
+    report.append("\f")
+    return "\n".join(report)
+
+
+def midas_member_page(m, code_name="AISC(15th)-LRFD16"):
+    """One member's page of the MIDAS GEN-style text report."""
+    max_ratio = max((x.get('interaction_ratio', 0) for x in m.get('interaction_results', [])), default=0)
+    return _midas_page(m, code_name, *_midas_table_lines([m])[0], max_ratio)
+
+
+def iter_midas_gen_text_report(members, project_info=None, code_name="AISC(15th)-LRFD16",
+                               block_size=MIDAS_BLOCK_SIZE):
+    """
+    Yield the MIDAS GEN-style text report as consecutive chunks.
+    
+    The governing checks of all members are found in one vectorized pass
+    for the summary sheet; the member pages are then formatted
+    block_size members at a time, so memory does not grow with the job.
+    """
+    members = members if isinstance(members, (list, tuple)) else list(members)
+    governing = midas_governing(members)
+    yield midas_report_header(members, project_info, code_name, governing=governing)
+    gov_ratio = governing[1]
+    for start in range(0, len(members), block_size):
+        block = members[start:start + block_size]
+        for i, (m, tables) in enumerate(zip(block, _midas_table_lines(block)), start):
+            yield "\n"
+            yield _midas_page(m, code_name, *tables, gov_ratio[i])
+
+
+def write_midas_gen_text_report(fp, members, project_info=None, code_name="AISC(15th)-LRFD16"):
+    """Write the MIDAS GEN-style text report to a text file object; returns characters written"""
+    written = 0
+    for chunk in iter_midas_gen_text_report(members, project_info, code_name):
+        fp.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def generate_midas_gen_text_report(members, project_info=None, code_name="AISC(15th)-LRFD16"):
+    """Generate MIDAS GEN-style plain text calculation report."""
+    return "".join(iter_midas_gen_text_report(members, project_info, code_name))
+
+
+# ==================== EXAMPLE USAGE / DEMO ====================
+
+def demo_report():
+    """Generate a demo report"""
+    
+    # Sample section properties (W14x22 equivalent in metric)
+    section_props = {
+        'Ag': 41.8,      # cm²
+        'Ix': 8247,      # cm⁴
+        'Iy': 533,       # cm⁴
+        'Sx': 467,       # cm³
+        'Zx': 524,       # cm³
+        'rx': 14.0,      # cm
+        'ry': 3.57,      # cm
+        'Fy': 345,       # MPa (Gr. 50)
+        'Fu': 450,       # MPa
+        'J': 16.4,       # cm⁴
+        'd': 35.0,       # cm
+        'tf': 1.07,      # cm
+        'ho': 33.9,      # cm
+        'rts': 3.91      # cm
+    }
+    
+    # Sample loads for a beam-column
+    loads = [
+        {'LC': 1, 'Pu': 450, 'Mux': 85, 'Muy': 0},
+        {'LC': 2, 'Pu': 520, 'Mux': 95, 'Muy': 0},
+        {'LC': 3, 'Pu': -180, 'Mux': 65, 'Muy': 0},  # Tension case
+        {'LC': 4, 'Pu': 580, 'Mux': 110, 'Muy': 0},
+        {'LC': 5, 'Pu': 490, 'Mux': 88, 'Muy': 0},
+    ]
+    
+    # Create member data
+    member1 = create_member_data(
+        member_no='B-101',
+        section_name='W14x22',
+        section_props=section_props,
+        member_type='Beam-Column',
+        length=4.0,
+        K=1.0,
+        KL=4.0,
+        Lb=2.0,
+        loads=loads,
+        classification='Compact'
+    )
+    
+    # Create tension member
+    tension_loads = [
+        {'LC': 1, 'Pu': -320, 'Mux': 0, 'Muy': 0},
+        {'LC': 2, 'Pu': -410, 'Mux': 0, 'Muy': 0},
+        {'LC': 3, 'Pu': -285, 'Mux': 0, 'Muy': 0},
+    ]
+    
+    member2 = create_member_data(
+        member_no='T-201',
+        section_name='W8x18',
+        section_props={
+            'Ag': 34.2, 'Ix': 3040, 'Iy': 310, 'Sx': 278, 'Zx': 316,
+            'rx': 9.42, 'ry': 3.00, 'Fy': 345, 'Fu': 450, 'Ae': 29.1
+        },
+        member_type='Tension Member',
+        length=6.0,
+        K=1.0,
+        KL=6.0,
+        Lb=6.0,
+        loads=tension_loads,
+        classification='Compact'
+    )
+    
+    # Generate report
+    generator = SteelDesignReportGenerator(
+        project_info={
+            'name': 'Sample Steel Building',
+            'engineer': 'Design Engineer'
+        }
+    )
+    
+    generator.add_member(member1)
+    generator.add_member(member2)
+    
+    return generator.generate_full_report()
+
+
+if __name__ == "__main__":
+    # Generate demo report and save
+    html_report = demo_report()
+    
+    with open('steel_design_report_demo.html', 'w', encoding='utf-8') as f:
+        f.write(html_report)
+    
+    print("Demo report generated: steel_design_report_demo.html")
@@ -0,0 +1,1047 @@
+"""
+Precompiled HTML fragments of the design report.
+
+Every fragment is compiled once at import into a function that builds it
+with a single f-string. {name} inserts text as is and {name:d} shows a
+number the way format_number does with d decimals, so a table is rendered
+by passing its raw values: render() fills one fragment and render_rows()
+fills a row fragment from flat columns of values (one list or array per
+field). The stylesheet and other static pieces are plain strings shared
+by every report.
+"""
+
+import math
+import string
+from operator import itemgetter
+
+from .utils import format_number
+
+
+def _getter(names):
+    """itemgetter that always returns a tuple"""
+    if len(names) == 1:
+        name = names[0]
+        return lambda values: (values[name],)
+    return itemgetter(*names) if names else (lambda values: ())
+
+def _all_finite(numbers):
+    try:
+        return math.isfinite(math.fsum(numbers))
+    except (TypeError, ValueError, OverflowError):
+        return False
+
+def _compile(pieces, fields, numeric):
+    """
+    Function of the field values returning the filled fragment. With
+    numeric=True number fields get their format spec (whole numbers are
+    rounded to int first, as in format_number); otherwise every field is
+    inserted as given.
+    """
+    body = []
+    for i, literal in enumerate(pieces):
+        body.append(literal.replace('{', '{{').replace('}', '}}'))
+        if i < len(fields):
+            decimals = fields[i][1]
+            if not numeric or decimals is None:
+                body.append('{_%d}' % i)
+            elif decimals == 0:
+                body.append('{int(round(_%d)):,}' % i)
+            else:
+                body.append('{_%d:,.%df}' % (i, decimals))
+    args = ', '.join('_%d' % i for i in range(len(fields)))
+    return eval('lambda %s: f%r' % (args, ''.join(body)), {})
+
+
+class HtmlFragment:
+    """
+    HTML template compiled to an f-string function.
+
+    Finite numbers are formatted inside the f-string; a None, NaN or
+    non-numeric value sends the fragment (or the column, for rows) through
+    format_number instead, so the output always matches it.
+    """
+
+    def __init__(self, template):
+        pieces = []
+        fields = []
+        for literal, name, spec, _ in string.Formatter().parse(template):
+            if len(pieces) > len(fields):
+                pieces[-1] += literal
+            else:
+                pieces.append(literal)
+            if name is not None:
+                fields.append((name, int(spec) if spec else None))
+        self._fields = tuple(fields)
+        self._fill = _compile(pieces, fields, numeric=True)
+        self._fill_text = _compile(pieces, fields, numeric=False)
+        self._values = _getter([name for name, _ in fields])
+        self._numbers = _getter([i for i, (_, d) in enumerate(fields) if d is not None])
+
+    def _as_text(self, args):
+        return [value if d is None else format_number(value, d) for value, (_, d) in zip(args, self._fields)]
+
+    def render(self, **values):
+        """Fill the fragment from raw values"""
+        args = self._values(values)
+        if _all_finite(self._numbers(args)):
+            return self._fill(*args)
+        return self._fill_text(*self._as_text(args))
+
+    def render_each(self, **columns):
+        """One filled fragment per row of equal-length columns"""
+        columns = self._values(columns)
+        if _all_finite(value for column in self._numbers(columns) for value in column):
+            return list(map(self._fill, *columns))
+        columns = [column if d is None else [format_number(value, d) for value in column]
+                   for column, (_, d) in zip(columns, self._fields)]
+        return list(map(self._fill_text, *columns))
+
+    def render_rows(self, **columns):
+        """The fragment filled once per row of equal-length columns, concatenated"""
+        return ''.join(self.render_each(**columns))
+
+
+# ==================== STYLESHEET ====================
+REPORT_CSS = """
+        <style>
+            /* ===== RESET & BASE ===== */
+            * { 
+                box-sizing: border-box; 
+                margin: 0;
+                padding: 0;
+            }
+            
+            body { 
+                font-family: 'Segoe UI', Tahoma, Arial, sans-serif; 
+                font-size: 10pt; 
+                line-height: 1.5;
+                color: #333;
+                max-width: 210mm;
+                margin: 0 auto;
+                padding: 15mm;
+                background: #fff;
+            }
+            
+            /* ===== REPORT HEADER ===== */
+            .report-header {
+                text-align: center;
+                border-bottom: 3px solid #2c3e50;
+                padding-bottom: 15px;
+                margin-bottom: 25px;
+            }
+            
+            .report-title { 
+                font-size: 18pt; 
+                font-weight: bold; 
+                color: #2c3e50;
+                margin: 0 0 5px 0;
+                letter-spacing: 1px;
+            }
+            
+            .report-subtitle {
+                font-size: 10pt;
+                color: #666;
+                margin: 5px 0;
+            }
+            
+            .report-info {
+                display: flex;
+                justify-content: center;
+                gap: 20px;
+                flex-wrap: wrap;
+                margin-top: 10px;
+                font-size: 9pt;
+            }
+            
+            .report-info span {
+                background: #ecf0f1;
+                padding: 4px 12px;
+                border-radius: 3px;
+            }
+            
+            /* ===== MEMBER SECTION ===== */
+            .member-section {
+                margin-bottom: 30px;
+                border: 1px solid #ddd;
+                border-radius: 8px;
+                background: #fafafa;
+                overflow: hidden;
+                page-break-inside: avoid;
+                break-inside: avoid;
+            }
+            
+            .member-header {
+                background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
+                color: white;
+                padding: 12px 15px;
+                font-size: 11pt;
+                font-weight: bold;
+                display: flex;
+                justify-content: space-between;
+                flex-wrap: wrap;
+                gap: 10px;
+            }
+            
+            .member-header-item {
+                display: flex;
+                align-items: center;
+                gap: 5px;
+            }
+            
+            .member-header-label {
+                opacity: 0.8;
+                font-weight: normal;
+                font-size: 9pt;
+            }
+            
+            .member-content {
+                padding: 15px;
+            }
+            
+            /* ===== SECTION TITLES ===== */
+            .section-title {
+                font-size: 11pt;
+                font-weight: bold;
+                color: #2c3e50;
+                border-bottom: 2px solid #3498db;
+                padding-bottom: 5px;
+                margin: 20px 0 12px 0;
+                display: flex;
+                align-items: center;
+                gap: 8px;
+            }
+            
+            .section-title:first-child {
+                margin-top: 0;
+            }
+            
+            .section-number {
+                background: #3498db;
+                color: white;
+                width: 22px;
+                height: 22px;
+                border-radius: 50%;
+                display: inline-flex;
+                align-items: center;
+                justify-content: center;
+                font-size: 9pt;
+            }
+            
+            /* ===== TABLES - FIXED LAYOUT TO PREVENT OVERLAP ===== */
+            table {
+                width: 100%;
+                border-collapse: collapse;
+                margin: 10px 0;
+                font-size: 9pt;
+                table-layout: fixed;
+            }
+            
+            th, td {
+                border: 1px solid #ddd;
+                padding: 8px 10px;
+                text-align: left;
+                vertical-align: middle;
+                overflow: hidden;
+                text-overflow: ellipsis;
+                word-wrap: break-word;
+                overflow-wrap: break-word;
+            }
+            
+            th {
+                background: #34495e;
+                color: white;
+                font-weight: 600;
+                font-size: 8.5pt;
+                text-transform: uppercase;
+                letter-spacing: 0.3px;
+            }
+            
+            tbody tr:nth-child(even) {
+                background: #f8f9fa;
+            }
+            
+            tbody tr:hover {
+                background: #e8f4f8;
+            }
+            
+            /* ===== PROPERTY TABLE (2x2 layout) ===== */
+            .prop-table th { width: 25%; }
+            .prop-table td { width: 25%; }
+            
+            /* ===== CALCULATION TABLE ===== */
+            .calc-table th:nth-child(1),
+            .calc-table td:nth-child(1) { width: 20%; }
+            
+            .calc-table th:nth-child(2),
+            .calc-table td:nth-child(2) { width: 25%; }
+            
+            .calc-table th:nth-child(3),
+            .calc-table td:nth-child(3) { width: 35%; }
+            
+            .calc-table th:nth-child(4),
+            .calc-table td:nth-child(4) { width: 20%; }
+            
+            .calc-table td:nth-child(2) {
+                font-family: 'Cambria Math', 'Times New Roman', Georgia, serif;
+                font-style: italic;
+                font-size: 9pt;
+            }
+            
+            .calc-table td:nth-child(3) {
+                font-family: 'Consolas', 'Monaco', monospace;
+                font-size: 8pt;
+                word-break: break-all;
+                line-height: 1.4;
+                color: #555;
+            }
+            
+            /* ===== INTERACTION TABLE ===== */
+            .interaction-table th:nth-child(1),
+            .interaction-table td:nth-child(1) { width: 10%; text-align: center; }
+            
+            .interaction-table th:nth-child(2),
+            .interaction-table td:nth-child(2) { width: 20%; }
+            
+            .interaction-table th:nth-child(3),
+            .interaction-table td:nth-child(3) { width: 40%; font-size: 8pt; }
+            
+            .interaction-table th:nth-child(4),
+            .interaction-table td:nth-child(4) { width: 15%; text-align: center; }
+            
+            .interaction-table th:nth-child(5),
+            .interaction-table td:nth-child(5) { width: 15%; text-align: center; }
+            
+            /* ===== LOAD TABLE ===== */
+            .load-table th,
+            .load-table td { 
+                text-align: center; 
+                width: 20%;
+            }
+            
+            /* ===== SPECIAL CELL STYLES ===== */
+            .equation { 
+                font-family: 'Cambria Math', 'Times New Roman', Georgia, serif;
+                font-style: italic;
+            }
+            
+            .result { 
+                font-weight: bold; 
+                color: #2c3e50;
+            }
+            
+            .result-box {
+                background: #e8f4f8;
+                padding: 2px 6px;
+                border-radius: 3px;
+                display: inline-block;
+            }
+            
+            .pass { 
+                background: #d4edda !important; 
+                color: #155724;
+                font-weight: bold;
+            }
+            
+            .fail { 
+                background: #f8d7da !important; 
+                color: #721c24;
+                font-weight: bold;
+            }
+            
+            .warning {
+                background: #fff3cd !important;
+                color: #856404;
+                font-weight: bold;
+            }
+            
+            .governing {
+                background: #cce5ff !important;
+                font-weight: bold;
+            }
+            
+            .text-center { text-align: center; }
+            .text-right { text-align: right; }
+            .text-bold { font-weight: bold; }
+            
+            /* ===== CONCLUSION BOX ===== */
+            .conclusion-box {
+                border: 2px solid #2c3e50;
+                border-radius: 8px;
+                padding: 15px;
+                margin-top: 20px;
+                background: #fff;
+            }
+            
+            .conclusion-pass {
+                border-color: #28a745;
+                background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
+            }
+            
+            .conclusion-fail {
+                border-color: #dc3545;
+                background: linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%);
+            }
+            
+            .conclusion-title {
+                font-size: 12pt;
+                font-weight: bold;
+                color: #2c3e50;
+                margin-bottom: 10px;
+                text-align: center;
+            }
+            
+            .conclusion-grid {
+                display: grid;
+                grid-template-columns: repeat(2, 1fr);
+                gap: 10px;
+            }
+            
+            .conclusion-item {
+                display: flex;
+                justify-content: space-between;
+                padding: 8px 12px;
+                background: rgba(255,255,255,0.7);
+                border-radius: 4px;
+            }
+            
+            .conclusion-label {
+                color: #666;
+                font-size: 9pt;
+            }
+            
+            .conclusion-value {
+                font-weight: bold;
+                color: #2c3e50;
+            }
+            
+            .conclusion-status {
+                grid-column: span 2;
+                text-align: center;
+                padding: 12px;
+                font-size: 14pt;
+                font-weight: bold;
+                border-radius: 5px;
+                margin-top: 5px;
+            }
+            
+            .status-pass {
+                background: #28a745;
+                color: white;
+            }
+            
+            .status-fail {
+                background: #dc3545;
+                color: white;
+            }
+            
+            /* ===== NOTES ===== */
+            .note {
+                font-size: 8pt;
+                color: #666;
+                font-style: italic;
+                margin: 8px 0;
+                padding: 5px 10px;
+                background: #f8f9fa;
+                border-left: 3px solid #3498db;
+                border-radius: 0 3px 3px 0;
+            }
+            
+            .note-icon {
+                margin-right: 5px;
+            }
+            
+            /* ===== FOOTER ===== */
+            .report-footer {
+                margin-top: 30px;
+                padding-top: 15px;
+                border-top: 1px solid #ddd;
+                text-align: center;
+                font-size: 8pt;
+                color: #999;
+            }
+            
+            /* ===== PRINT STYLES ===== */
+            @media print {
+                body { 
+                    padding: 10mm;
+                    font-size: 9pt;
+                    -webkit-print-color-adjust: exact !important;
+                    print-color-adjust: exact !important;
+                }
+                
+                .member-section { 
+                    page-break-inside: avoid;
+                    break-inside: avoid;
+                    margin-bottom: 20px;
+                }
+                
+                .section-title {
+                    page-break-after: avoid;
+                }
+                
+                table { 
+                    font-size: 8pt;
+                    page-break-inside: avoid;
+                }
+                
+                .calc-table td:nth-child(3) {
+                    font-size: 7pt;
+                }
+                
+                th {
+                    background: #34495e !important;
+                    color: white !important;
+                }
+                
+                .pass { background: #d4edda !important; }
+                .fail { background: #f8d7da !important; }
+                .governing { background: #cce5ff !important; }
+                
+                .report-footer {
+                    position: fixed;
+                    bottom: 10mm;
+                    left: 0;
+                    right: 0;
+                }
+            }
+            
+            /* ===== RESPONSIVE ===== */
+            @media screen and (max-width: 800px) {
+                body {
+                    padding: 10px;
+                    font-size: 9pt;
+                }
+                
+                table {
+                    font-size: 8pt;
+                }
+                
+                .calc-table td:nth-child(3) {
+                    font-size: 7pt;
+                }
+                
+                .conclusion-grid {
+                    grid-template-columns: 1fr;
+                }
+                
+                .conclusion-status {
+                    grid-column: span 1;
+                }
+            }
+        </style>
+        """
+
+
+# ==================== STATIC PIECES ====================
+LOAD_TABLE_OPEN = """
+        <div class="section-title">
+            <span class="section-number">5</span>
+            Load Combination Summary
+        </div>
+        <table class="load-table">
+            <thead>
+                <tr>
+                    <th>Load Comb.</th>
+                    <th>Pu (kN)</th>
+                    <th>Mux (kN·m)</th>
+                    <th>Muy (kN·m)</th>
+                    <th>Vu (kN)</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+
+LOAD_TABLE_CLOSE = """
+            </tbody>
+        </table>
+        <div class="note">
+            <span class="note-icon">💡</span>
+            Positive Pu = Compression, Negative Pu = Tension
+        </div>
+        """
+
+INTERACTION_TABLE_OPEN = """
+        <div class="section-title">
+            <span class="section-number">6</span>
+            Combined Force Check (AISC 360-16 Chapter H)
+        </div>
+        <table class="interaction-table">
+            <thead>
+                <tr>
+                    <th>LC</th>
+                    <th>Equation</th>
+                    <th>Calculation</th>
+                    <th>Ratio</th>
+                    <th>Status</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+
+INTERACTION_TABLE_CLOSE = """
+            </tbody>
+        </table>
+        <div class="note">
+            <span class="note-icon">★</span>
+            Governing Load Combination | H1-1a: Pr/Pc ≥ 0.2 | H1-1b: Pr/Pc &lt; 0.2
+        </div>
+        """
+
+MEMBER_CLOSE = """
+            </div>
+        </div>
+        """
+
+
+# ==================== PROPERTY TABLES ====================
+_PROPERTY_ROW = """
+                <tr>
+                    <td class="text-bold">{label1}</td>
+                    <td>{value1}</td>
+                    <td class="text-bold">{label2}</td>
+                    <td>{value2}</td>
+                </tr>
+            """
+
+_PROPERTY_TABLE_CLOSE = """
+            </tbody>
+        </table>
+        """
+
+def _property_table(opening, params):
+    """One fragment for a table of fixed labels, two (label, value) pairs per row"""
+    rows = []
+    for i in range(0, len(params), 2):
+        p1 = params[i]
+        p2 = params[i+1] if i+1 < len(params) else ('', '')
+        rows.append(_PROPERTY_ROW.format(label1=p1[0], value1=p1[1], label2=p2[0], value2=p2[1]))
+    return HtmlFragment(opening + ''.join(rows) + _PROPERTY_TABLE_CLOSE)
+
+GEOMETRY_TABLE = _property_table("""
+        <div class="section-title">
+            <span class="section-number">1</span>
+            Member & Geometry Summary
+        </div>
+        <table class="prop-table">
+            <thead>
+                <tr>
+                    <th>Parameter</th>
+                    <th>Value</th>
+                    <th>Parameter</th>
+                    <th>Value</th>
+                </tr>
+            </thead>
+            <tbody>
+        """, [
+    ('Member No.', '{member_no}'),
+    ('Member Type', '{member_type}'),
+    ('Length (m)', '{length:3}'),
+    ('K Factor', '{K:2}'),
+    ('KL (m)', '{KL:3}'),
+    ('Lb (m)', '{Lb:3}'),
+    ('Cb', '{Cb:2}'),
+    ('Bracing', '{bracing}'),
+])
+
+SECTION_TABLE = _property_table("""
+        <div class="section-title">
+            <span class="section-number">2</span>
+            Section Properties & Classification
+        </div>
+        <table class="prop-table">
+            <thead>
+                <tr>
+                    <th>Property</th>
+                    <th>Value</th>
+                    <th>Property</th>
+                    <th>Value</th>
+                </tr>
+            </thead>
+            <tbody>
+        """, [
+    ('Section', '<b>{section_name}</b>'),
+    ('Classification', '<span class="{class_style}" style="padding: 2px 8px; border-radius: 3px;">{classification}</span>'),
+    ('Ag (cm²)', '{Ag:2}'),
+    ('Weight (kg/m)', '{weight:2}'),
+    ('Ix (cm⁴)', '{Ix:1}'),
+    ('Iy (cm⁴)', '{Iy:1}'),
+    ('Sx (cm³)', '{Sx:1}'),
+    ('Sy (cm³)', '{Sy:1}'),
+    ('Zx (cm³)', '{Zx:1}'),
+    ('Zy (cm³)', '{Zy:1}'),
+    ('rx (cm)', '{rx:2}'),
+    ('ry (cm)', '{ry:2}'),
+    ('J (cm⁴)', '{J:2}'),
+    ('Cw (cm⁶)', '{Cw:0}'),
+    ('Fy (MPa)', '{Fy:0}'),
+    ('E (MPa)', '200,000'),
+])
+
+# section_props keys SECTION_TABLE shows (missing ones render as 0)
+SECTION_TABLE_PROPERTIES = ('Ag', 'weight', 'Ix', 'Iy', 'Sx', 'Sy', 'Zx', 'Zy', 'rx', 'ry', 'J', 'Cw', 'Fy')
+
+
+# ==================== FRAGMENTS ====================
+REPORT_HEAD_OPEN = HtmlFragment("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Steel Design Report - {title}</title>
+    """)
+
+REPORT_HEAD_CLOSE = HtmlFragment("""
+</head>
+<body>
+    <div class="report-header">
+        <h1 class="report-title">STEEL MEMBER DESIGN REPORT</h1>
+        <p class="report-subtitle">Per AISC 360-16 Specification for Structural Steel Buildings</p>
+        <div class="report-info">
+            <span><b>Project:</b> {project}</span>
+            <span><b>Date:</b> {date}</span>
+            <span><b>Engineer:</b> {engineer}</span>
+            <span><b>Checker:</b> {checker}</span>
+        </div>
+    </div>
+""")
+
+REPORT_FOOT = HtmlFragment("""
+    <div class="report-footer">
+        <p>Generated by Steel Design Application | AISC 360-16 | {date}</p>
+        <p>Thai Obayashi Corporation Limited - Design Service (Structure) Department</p>
+    </div>
+</body>
+</html>
+""")
+
+MEMBER_OPEN = HtmlFragment("""
+        <div class="member-section">
+            <div class="member-header">
+                <div class="member-header-item">
+                    <span class="member-header-label">Member:</span>
+                    <span>{member_no}</span>
+                </div>
+                <div class="member-header-item">
+                    <span class="member-header-label">Section:</span>
+                    <span>{section_name}</span>
+                </div>
+                <div class="member-header-item">
+                    <span class="member-header-label">Type:</span>
+                    <span>{member_type}</span>
+                </div>
+            </div>
+            <div class="member-content">
+        """)
+
+FLEXURE_TABLE = HtmlFragment("""
+        <div class="section-title">
+            <span class="section-number">3</span>
+            Flexural Strength Calculation (AISC 360-16 Chapter F)
+        </div>
+        <div class="note">
+            <span class="note-icon">📋</span>
+            Limit State: <b>{limit_state}</b> | Governing Equation: <b>{case}</b>
+        </div>
+        <table class="calc-table">
+            <thead>
+                <tr>
+                    <th>Item</th>
+                    <th>Expression</th>
+                    <th>Calculation</th>
+                    <th>Result</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Lp</td>
+                    <td class="equation">1.76·ry·√(E/Fy)</td>
+                    <td>1.76 × {ry_mm:1} × √(200000/{Fy:0}) / 1000</td>
+                    <td class="result">{Lp:3} m</td>
+                </tr>
+                <tr>
+                    <td>Lr</td>
+                    <td class="equation">Per AISC F2-6</td>
+                    <td>Function of section properties</td>
+                    <td class="result">{Lr:3} m</td>
+                </tr>
+                <tr>
+                    <td>Lb</td>
+                    <td class="equation">Unbraced length</td>
+                    <td>Given</td>
+                    <td class="result">{Lb:3} m</td>
+                </tr>
+                <tr>
+                    <td>Mp</td>
+                    <td class="equation">Fy × Zx</td>
+                    <td>{Fy:0} × {Zx_mm3:0} / 10⁶</td>
+                    <td class="result">{Mp:2} kN·m</td>
+                </tr>
+                <tr>
+                    <td>Mn</td>
+                    <td class="equation">Per {case}</td>
+                    <td>{limit_state}</td>
+                    <td class="result">{Mn:2} kN·m</td>
+                </tr>
+                <tr>
+                    <td>φb</td>
+                    <td class="equation">Resistance factor</td>
+                    <td>AISC F1</td>
+                    <td class="result">0.90</td>
+                </tr>
+                <tr class="governing">
+                    <td><b>φMn</b></td>
+                    <td class="equation"><b>φb × Mn</b></td>
+                    <td><b>0.90 × {Mn:2}</b></td>
+                    <td class="result"><span class="result-box"><b>{phi_Mn:2} kN·m</b></span></td>
+                </tr>
+            </tbody>
+        </table>
+        """)
+
+COMPRESSION_TABLE = HtmlFragment("""
+        <div class="section-title">
+            <span class="section-number">4</span>
+            Compression Strength Calculation (AISC 360-16 Chapter E)
+        </div>
+        <div class="note">
+            <span class="note-icon">📋</span>
+            Buckling Mode: <b>{buckling_mode}</b> | Equation: <b>{equation}</b> | Governing: <b>{gov_axis}</b>
+        </div>
+        <table class="calc-table">
+            <thead>
+                <tr>
+                    <th>Item</th>
+                    <th>Expression</th>
+                    <th>Calculation</th>
+                    <th>Result</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>KL/rx</td>
+                    <td class="equation">KLx / rx</td>
+                    <td>{KL_mm:0} / {rx_mm:1}</td>
+                    <td class="result">{lambda_x:1}</td>
+                </tr>
+                <tr>
+                    <td>KL/ry</td>
+                    <td class="equation">KLy / ry</td>
+                    <td>{KL_mm:0} / {ry_mm:1}</td>
+                    <td class="result">{lambda_y:1}</td>
+                </tr>
+                <tr>
+                    <td>λ (governing)</td>
+                    <td class="equation">max(KL/rx, KL/ry)</td>
+                    <td>{gov_axis}</td>
+                    <td class="result">{lambda_gov:1}</td>
+                </tr>
+                <tr>
+                    <td>4.71√(E/Fy)</td>
+                    <td class="equation">Limiting λ</td>
+                    <td>4.71 × √(200000/{Fy:0})</td>
+                    <td class="result">{lambda_limit:1}</td>
+                </tr>
+                <tr>
+                    <td>Fe</td>
+                    <td class="equation">π²E / λ²</td>
+                    <td>π² × 200000 / {lambda_gov:1}²</td>
+                    <td class="result">{Fe:1} MPa</td>
+                </tr>
+                <tr>
+                    <td>Fcr</td>
+                    <td class="equation">Per {equation}</td>
+                    <td>{buckling_mode}</td>
+                    <td class="result">{Fcr:1} MPa</td>
+                </tr>
+                <tr>
+                    <td>Pn</td>
+                    <td class="equation">Fcr × Ag</td>
+                    <td>{Fcr:1} × {Ag_mm2:0} / 1000</td>
+                    <td class="result">{Pn:1} kN</td>
+                </tr>
+                <tr>
+                    <td>φc</td>
+                    <td class="equation">Resistance factor</td>
+                    <td>AISC E1</td>
+                    <td class="result">0.90</td>
+                </tr>
+                <tr class="governing">
+                    <td><b>φPn</b></td>
+                    <td class="equation"><b>φc × Pn</b></td>
+                    <td><b>0.90 × {Pn:1}</b></td>
+                    <td class="result"><span class="result-box"><b>{phi_Pn:1} kN</b></span></td>
+                </tr>
+            </tbody>
+        </table>
+        """)
+
+TENSION_TABLE = HtmlFragment("""
+        <div class="section-title">
+            <span class="section-number">4</span>
+            Tension Strength Calculation (AISC 360-16 Chapter D)
+        </div>
+        <div class="note">
+            <span class="note-icon">📋</span>
+            Governing Limit State: <b>{governing}</b>
+        </div>
+        <table class="calc-table">
+            <thead>
+                <tr>
+                    <th>Item</th>
+                    <th>Expression</th>
+                    <th>Calculation</th>
+                    <th>Result</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr class="{yield_class}">
+                    <td>Pn (Yield)</td>
+                    <td class="equation">Fy × Ag</td>
+                    <td>{Fy:0} × {Ag_mm2:0} / 1000</td>
+                    <td class="result">{Pn_yield:1} kN</td>
+                </tr>
+                <tr class="{yield_class}">
+                    <td>φPn (Yield)</td>
+                    <td class="equation">0.90 × Pn</td>
+                    <td>0.90 × {Pn_yield:1}</td>
+                    <td class="result">{phi_Pn_yield:1} kN</td>
+                </tr>
+                <tr class="{rupture_class}">
+                    <td>Pn (Rupture)</td>
+                    <td class="equation">Fu × Ae</td>
+                    <td>{Fu:0} × {Ae_mm2:0} / 1000</td>
+                    <td class="result">{Pn_rupture:1} kN</td>
+                </tr>
+                <tr class="{rupture_class}">
+                    <td>φPn (Rupture)</td>
+                    <td class="equation">0.75 × Pn</td>
+                    <td>0.75 × {Pn_rupture:1}</td>
+                    <td class="result">{phi_Pn_rupture:1} kN</td>
+                </tr>
+                <tr class="governing">
+                    <td><b>φPn</b></td>
+                    <td class="equation"><b>min(φPn)</b></td>
+                    <td><b>Governing: {governing}</b></td>
+                    <td class="result"><span class="result-box"><b>{phi_Pn:1} kN</b></span></td>
+                </tr>
+            </tbody>
+        </table>
+        """)
+
+SHEAR_TABLE = HtmlFragment("""
+        <div class="section-title">
+            <span class="section-number">5</span>
+            Shear Strength Calculation (AISC 360-16 Chapter G)
+        </div>
+        <table class="calc-table">
+            <thead>
+                <tr>
+                    <th>Item</th>
+                    <th>Expression</th>
+                    <th>Calculation</th>
+                    <th>Result</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Aw</td>
+                    <td class="equation">d × tw</td>
+                    <td>Web area</td>
+                    <td class="result">{Aw:2} cm²</td>
+                </tr>
+                <tr>
+                    <td>Cv1</td>
+                    <td class="equation">Web shear coefficient</td>
+                    <td>Per AISC G2.1</td>
+                    <td class="result">{Cv1:3}</td>
+                </tr>
+                <tr>
+                    <td>Vn</td>
+                    <td class="equation">0.6 × Fy × Aw × Cv1</td>
+                    <td>0.6 × {Fy:0} × {Aw_mm2:0} × {Cv1:3} / 1000</td>
+                    <td class="result">{Vn:1} kN</td>
+                </tr>
+                <tr>
+                    <td>φv</td>
+                    <td class="equation">Resistance factor</td>
+                    <td>AISC G1</td>
+                    <td class="result">1.00</td>
+                </tr>
+                <tr class="governing">
+                    <td><b>φVn</b></td>
+                    <td class="equation"><b>φv × Vn</b></td>
+                    <td><b>1.00 × {Vn:1}</b></td>
+                    <td class="result"><span class="result-box"><b>{phi_Vn:1} kN</b></span></td>
+                </tr>
+            </tbody>
+        </table>
+        """)
+
+LOAD_ROW = HtmlFragment("""
+                <tr>
+                    <td><b>{lc}</b></td>
+                    <td class="{pu_class}">{Pu:1}</td>
+                    <td>{Mux:2}</td>
+                    <td>{Muy:2}</td>
+                    <td>{Vu:1}</td>
+                </tr>
+            """)
+
+INTERACTION_ROW = HtmlFragment("""
+                <tr class="{row_class}">
+                    <td><b>{lc}{gov_marker}</b></td>
+                    <td class="equation">{equation}</td>
+                    <td>{calc}</td>
+                    <td class="result text-center"><b>{ratio:3}</b></td>
+                    <td class="{status_class} text-center">{status}</td>
+                </tr>
+            """)
+
+CONCLUSION = HtmlFragment("""
+        <div class="section-title">
+            <span class="section-number">7</span>
+            Design Summary & Conclusion
+        </div>
+        <div class="conclusion-box {status_class}">
+            <div class="conclusion-grid">
+                <div class="conclusion-item">
+                    <span class="conclusion-label">Section Used</span>
+                    <span class="conclusion-value">{section_name}</span>
+                </div>
+                <div class="conclusion-item">
+                    <span class="conclusion-label">Member Type</span>
+                    <span class="conclusion-value">{member_type}</span>
+                </div>
+                <div class="conclusion-item">
+                    <span class="conclusion-label">Governing LC</span>
+                    <span class="conclusion-value">{governing_lc}</span>
+                </div>
+                <div class="conclusion-item">
+                    <span class="conclusion-label">Limit State</span>
+                    <span class="conclusion-value">{governing_state}</span>
+                </div>
+                <div class="conclusion-item">
+                    <span class="conclusion-label">φMn</span>
+                    <span class="conclusion-value">{phi_Mn:2} kN·m</span>
+                </div>
+                <div class="conclusion-item">
+                    <span class="conclusion-label">φPn</span>
+                    <span class="conclusion-value">{phi_Pn:1} kN</span>
+                </div>
+                <div class="conclusion-item">
+                    <span class="conclusion-label">Max Ratio</span>
+                    <span class="conclusion-value">{max_ratio:3}</span>
+                </div>
+                <div class="conclusion-item">
+                    <span class="conclusion-label">Utilization</span>
+                    <span class="conclusion-value">{utilization:1}%</span>
+                </div>
+                <div class="conclusion-status {status_style}">
+                    {status_text}
+                </div>
+            </div>
+        </div>
+        """)
+
+# Substitution for H1-1a (open="(8/9)[", close="]", Pc=φPn) or H1-1b (no brackets, Pc=2φPn)
+H1_CALC = HtmlFragment("({Pu:1}/{Pc:1}) + {open}({Mux:2}/{phi_Mnx:2}) + ({Muy:2}/{phi_Mny:2}){close}")
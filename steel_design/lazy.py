@@ -0,0 +1,42 @@
+"""
+Optional heavy dependencies, imported on first use.
+
+matplotlib, plotly, reportlab and openpyxl cost about a second at startup
+and most callers never export, so nothing here imports them eagerly.
+"""
+
+import functools
+import importlib.util
+
+# Exporters are detected without importing them
+PDF_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+EXCEL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
+# Merging calculation book parts is optional; without it the book is one document
+PDF_MERGE_AVAILABLE = importlib.util.find_spec("pypdf") is not None
+
+# ==================== LAZY IMPORTS ====================
+@functools.lru_cache(maxsize=None)
+def get_pyplot():
+    """matplotlib.pyplot on the non-interactive Agg backend"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+@functools.lru_cache(maxsize=None)
+def get_mpl_patches():
+    """matplotlib.patches"""
+    import matplotlib.patches as patches
+    return patches
+
+@functools.lru_cache(maxsize=None)
+def get_plotly_go():
+    """plotly.graph_objects"""
+    import plotly.graph_objects as go
+    return go
+
+@functools.lru_cache(maxsize=None)
+def get_make_subplots():
+    """plotly.subplots.make_subplots"""
+    from plotly.subplots import make_subplots
+    return make_subplots
@@ -0,0 +1,134 @@
+"""
+Normalized name index for the section and grade pickers.
+
+Section names look like "W-*400x300x9x14 (94.3 kg/m)": a series prefix,
+optional '*'/'V' markers, the nominal d x bf x tw x tf and the weight.
+NameIndex tokenizes each name once (full name, nominal size, weight) into
+one sorted token list, so a prefix query is a binary search and a
+dimension query is a comparison on precomputed d/bf arrays.
+"""
+
+import bisect
+import difflib
+import re
+
+import numpy as np
+
+# ==================== NAME INDEX ====================
+_SERIES_PREFIX = re.compile(r'^[a-z]+-')
+_MARKERS = re.compile(r'[*]|^v(?=\d)')
+_NOMINAL = re.compile(r'(\d+(?:\.\d+)?)x(\d+(?:\.\d+)?)(?:x(\d+(?:\.\d+)?)x(\d+(?:\.\d+)?))?')
+_WEIGHT = re.compile(r'\((\d+(?:\.\d+)?)kg/m\)')
+_DIMENSION_QUERY = re.compile(r'^(\d+(?:\.\d+)?)\s*[x×*]\s*(\d+(?:\.\d+)?)$')
+
+def normalize_name(name):
+    """Lower-case a section/grade name and drop whitespace"""
+    return re.sub(r'\s+', '', str(name)).lower()
+
+def _nominal_key(key):
+    """Normalized name without the series prefix and '*'/'V' markers"""
+    return _MARKERS.sub('', _SERIES_PREFIX.sub('', key))
+
+class NameIndex:
+    """
+    Names of a section or grade table with a precomputed search structure.
+
+    names keeps the table order (duplicates dropped) for pickers,
+    sorted_names is the stripped, alphabetical list the sidebar shows and
+    position maps a name to its place in names. search() answers prefix,
+    d×bf and fuzzy queries without rebuilding any list.
+    """
+
+    def __init__(self, names):
+        self.names = tuple(dict.fromkeys(str(name) for name in names))
+        self.position = {name: i for i, name in enumerate(self.names)}
+        self.sorted_names = tuple(sorted({name.strip() for name in self.names}))
+
+        keys = [normalize_name(name) for name in self.names]
+        nominal = [_nominal_key(key) for key in keys]
+
+        d = np.full(len(keys), np.nan)
+        bf = np.full(len(keys), np.nan)
+        tokens = []
+        sizes = []
+        for i, (key, short) in enumerate(zip(keys, nominal)):
+            tokens.append((key, i))
+            if short != key:
+                tokens.append((short, i))
+            size = _NOMINAL.search(short)
+            if size:
+                d[i], bf[i] = float(size.group(1)), float(size.group(2))
+                sizes.extend([(size.group(0), i), (f"{size.group(1)}x{size.group(2)}", i)])
+            else:
+                sizes.append((short, i))
+            weight = _WEIGHT.search(short)
+            if weight:
+                tokens.append((weight.group(1) + "kg/m", i))
+        tokens.sort()
+        self._token_keys = [token for token, _ in tokens]
+        self._token_rows = np.array([row for _, row in tokens], dtype=np.int64)
+        self._fuzzy_keys = [key for key, _ in sizes]
+        self._fuzzy_rows = [row for _, row in sizes]
+        self.d = d
+        self.bf = bf
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.position
+
+    def index_of(self, name, default=0):
+        """Position of a name in names (default when absent), for picker index="""
+        return self.position.get(name, default)
+
+    def _prefix_rows(self, prefix):
+        lo = bisect.bisect_left(self._token_keys, prefix)
+        hi = bisect.bisect_left(self._token_keys, prefix + '\uffff')
+        return self._token_rows[lo:hi]
+
+    def _term_rows(self, term):
+        """Rows with a token starting with term; series-qualified terms try the full name first"""
+        short = _nominal_key(term)
+        if short != term:
+            rows = self._prefix_rows(term)
+            if len(rows):
+                return np.unique(rows)
+        return np.unique(self._prefix_rows(short))
+
+    def search(self, query, limit=None, fuzzy=True):
+        """
+        Names matching a query, in table order.
+
+        Every whitespace-separated term must match the start of the full
+        name, the nominal size (e.g. "400x2") or the weight (e.g. "94").
+        "d x bf" / "d×bf" also matches that nominal depth and width exactly.
+        With no match, fuzzy=True falls back to the closest nominal sizes.
+        """
+        query = str(query or '').strip().lower()
+        if not query:
+            names = list(self.names)
+            return names if limit is None else names[:limit]
+
+        dims = _DIMENSION_QUERY.match(query)
+        if dims:
+            exact = np.flatnonzero((self.d == float(dims.group(1))) & (self.bf == float(dims.group(2))))
+            rows = np.union1d(exact, self._term_rows(f"{dims.group(1)}x{dims.group(2)}"))
+        else:
+            rows = None
+            for term in query.split():
+                term_rows = self._term_rows(term)
+                rows = term_rows if rows is None else np.intersect1d(rows, term_rows)
+
+        if len(rows) == 0 and fuzzy:
+            target = _nominal_key(normalize_name(query))
+            close = set(difflib.get_close_matches(target, self._fuzzy_keys, n=limit or 10, cutoff=0.6))
+            rows = np.unique([row for key, row in zip(self._fuzzy_keys, self._fuzzy_rows) if key in close])
+
+        names = [self.names[i] for i in np.sort(np.asarray(rows, dtype=np.int64))]
+        return names if limit is None else names[:limit]
+
+    def select(self, names):
+        """The given names that are in the index, in table order"""
+        rows = sorted(self.position[name] for name in set(names) if name in self.position)
+        return [self.names[i] for i in rows]
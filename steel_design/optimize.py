@@ -0,0 +1,117 @@
+"""Minimum-cost grade and section selection for Tab 5 member models."""
+
+import numpy as np
+import pandas as pd
+
+from .aisc import member_ratio_envelope, material_property_arrays, section_property_arrays
+from .takeoff import member_length
+
+# ==================== GRADE & SECTION OPTIMIZER ====================
+def _take_rows(arrays, index, labels):
+    """The rows of each property array (aligned with index) for the given labels"""
+    positions = index.get_indexer(labels)
+    if (positions < 0).any():
+        raise KeyError([label for label, pos in zip(labels, positions) if pos < 0])
+    return {name: values[positions] for name, values in arrays.items()}
+
+def optimize_grade_and_section(df, df_mat, member_groups, df_loads, prices=None, members=None,
+                               sections=None, materials=None, max_ratio=1.0,
+                               section_arrays=None, grade_arrays=None):
+    """
+    Minimum-cost adequate grade and section for each configured member.
+
+    prices maps grade -> price per kg; grades without a price are left out
+    of the search (all grades at 1.0, i.e. minimum weight, when None). Cost
+    per metre is w [kg/m] x price, with ties broken by lighter section and
+    then lower utilization.
+
+    section_arrays / grade_arrays are the precomputed property arrays of
+    every row of df / df_mat (a DatabaseSnapshot's); the candidates are
+    taken from them instead of being rebuilt from the tables.
+
+    Returns (df_choice, totals): one row per member with the chosen section,
+    material, governing ratio, weight and cost, and a dict with the member
+    count, tonnage and total cost of the adequate choices.
+    """
+    sections = list(df.index) if sections is None else list(sections)
+    if prices is None:
+        materials = list(df_mat.index) if materials is None else list(materials)
+        price = np.ones(len(materials))
+    else:
+        candidates = list(df_mat.index) if materials is None else list(materials)
+        materials = [m for m in candidates if m in prices and prices[m] is not None]
+        price = np.array([float(prices[m]) for m in materials])
+
+    sec = (section_property_arrays(df, sections) if section_arrays is None
+           else _take_rows(section_arrays, df.index, sections))
+    mat = (material_property_arrays(df_mat, materials) if grade_arrays is None
+           else _take_rows(grade_arrays, df_mat.index, materials))
+    members, ratios = member_ratio_envelope(df, df_mat, member_groups, df_loads, members,
+                                            section_arrays=sec, grade_arrays=mat)
+
+    w = sec['w']
+    cost_per_m = price[:, None] * w[None, :]
+    flat_ratios = ratios.reshape(len(members), -1)
+
+    # Rank every grade x section once; each member takes its first adequate entry
+    flat_cost = cost_per_m.ravel()
+    flat_w = np.broadcast_to(w, cost_per_m.shape).ravel()
+    ranking = np.lexsort((flat_w, flat_cost))
+    ranking = ranking[np.isfinite(flat_cost[ranking])]
+
+    best = np.zeros(len(members), dtype=int)
+    found = np.zeros(len(members), dtype=bool)
+    if len(members) and len(ranking):
+        ranked_ratios = flat_ratios[:, ranking]
+        adequate = ranked_ratios <= max_ratio
+        found = adequate.any(axis=1)
+        first = ranking[adequate.argmax(axis=1)]
+
+        # Among equal cost and weight, prefer the lowest utilization
+        tied = (adequate & (flat_cost[ranking] == flat_cost[first][:, None])
+                & (flat_w[ranking] == flat_w[first][:, None]))
+        best = ranking[np.where(tied, ranked_ratios, np.inf).argmin(axis=1)]
+
+    if cost_per_m.size:
+        mat_idx, sec_idx = np.unravel_index(best, cost_per_m.shape)
+        w_best = np.where(found, w[sec_idx], np.nan)
+        price_best = np.where(found, price[mat_idx], np.nan)
+        ratio_best = np.where(found, flat_ratios[np.arange(len(members)), best], np.nan)
+    else:
+        mat_idx = sec_idx = best
+        w_best = price_best = ratio_best = np.full(len(members), np.nan)
+
+    lengths = np.array([member_length(member_groups[m]) for m in members], dtype=float)
+    weight_kg = w_best * lengths
+
+    df_choice = pd.DataFrame({
+        'Member': members,
+        'Type': [member_groups[m]['member_type'] for m in members],
+        'Current Section': [member_groups[m]['section'] for m in members],
+        'Current Material': [member_groups[m]['material'] for m in members],
+        'Section': [sections[i] if ok else None for i, ok in zip(sec_idx, found)],
+        'Material': [materials[i] if ok else None for i, ok in zip(mat_idx, found)],
+        'Ratio': ratio_best,
+        'w [kg/m]': w_best,
+        'Length (m)': lengths,
+        'Weight (kg)': weight_kg,
+        'Price (/kg)': price_best,
+        'Cost': weight_kg * price_best,
+        'Status': np.where(found, "✓ OK", "✗ No adequate section")
+    })
+
+    totals = {
+        'members': len(members),
+        'adequate': int(found.sum()),
+        'tonnage': float(np.nansum(weight_kg) / 1000.0),
+        'cost': float(np.nansum(weight_kg * price_best))
+    }
+    return df_choice, totals
+
+def apply_design_choice(member_groups, df_choice):
+    """New member configuration dict with the optimizer's section/material applied"""
+    design = dict(member_groups)
+    for member, section, material in zip(df_choice['Member'], df_choice['Section'], df_choice['Material']):
+        if section is not None and member in design:
+            design[member] = {**design[member], 'section': section, 'material': material}
+    return design
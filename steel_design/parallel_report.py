@@ -0,0 +1,205 @@
+"""
+Parallel per-member report rendering.
+
+Each member's HTML section or MIDAS page depends only on that member, so
+the members are rendered in a process pool and reassembled in their
+original order. The pool is started once per process (spawn, so it is
+safe next to Streamlit's threads) with report_workers() processes, the
+CPU count or the STEEL_DESIGN_REPORT_WORKERS environment variable, and is
+shared by every report. It is never resized: a call's workers argument
+only limits how many of its chunks are in flight at once, so concurrent
+reports of different sizes do not disturb each other.
+
+Under `streamlit run`, __main__ is Streamlit's stand-in module for the app
+script, with the script as its __file__, and spawned (or forkserver)
+children re-run __main__ from that path before taking work. Workers are
+therefore started with a bare __main__ in place (_library_main), so they
+import only the steel_design functions they are sent instead of running
+the whole app. Small reports, one worker or a pool that cannot start fall back
+to rendering in the calling process, so the output is always identical to
+the sequential writers.
+"""
+
+import atexit
+import collections
+import contextlib
+import functools
+import logging
+import multiprocessing
+import os
+import pickle
+import sys
+import threading
+import types
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .fragment_cache import member_digest
+from .html_report import midas_report_header, midas_member_page
+
+logger = logging.getLogger(__name__)
+
+# ==================== REPORT WORKER POOL ====================
+# Below this many members per worker the pool costs more than it saves
+MIN_MEMBERS_PER_WORKER = 8
+
+_pool = None
+_pool_lock = threading.Lock()
+_main_lock = threading.Lock()
+
+def report_workers(workers=None):
+    """Number of report worker processes to use"""
+    if workers is None:
+        workers = os.environ.get("STEEL_DESIGN_REPORT_WORKERS") or os.cpu_count() or 1
+    return max(1, int(workers))
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=report_workers(),
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+@contextlib.contextmanager
+def _library_main():
+    """Swap in a __main__ without __file__ or __spec__ while workers are started"""
+    with _main_lock:
+        main = sys.modules["__main__"]
+        sys.modules["__main__"] = types.ModuleType("__main__")
+        try:
+            yield
+        finally:
+            sys.modules["__main__"] = main
+
+def _discard_pool(pool=None):
+    """Shut the pool down, only if it is still pool when one is given"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and (pool is None or _pool is pool):
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+def shutdown_report_pool():
+    """Stop the report workers (they are restarted on the next parallel report)"""
+    _discard_pool()
+
+def _render_chunk(render, chunk):
+    return [render(member) for member in chunk]
+
+atexit.register(shutdown_report_pool)
+
+def map_members(render, members, workers=None):
+    """
+    render(member) for every member, yielded in the original order.
+
+    render must be picklable (a module-level function or a
+    functools.partial of one). Members are sent to the shared pool in
+    chunks so each worker renders a contiguous run, with at most workers
+    chunks in flight; results stream back in order as they complete.
+    Falls back to rendering in this process when parallel rendering would
+    not pay off or the pool fails.
+    """
+    members = list(members)
+    workers = min(report_workers(workers), max(1, len(members) // MIN_MEMBERS_PER_WORKER))
+    if workers <= 1:
+        yield from map(render, members)
+        return
+
+    chunksize = max(1, len(members) // (workers * 4))
+    chunks = collections.deque(members[i:i + chunksize] for i in range(0, len(members), chunksize))
+    pending = collections.deque()
+    pool = None
+    done = 0
+    try:
+        pool = _get_pool()
+        while chunks or pending:
+            while chunks and len(pending) < workers:
+                # Submitting is what starts a worker when the pool has none idle
+                with _library_main():
+                    pending.append(pool.submit(_render_chunk, render, chunks.popleft()))
+            for result in pending.popleft().result():
+                yield result
+                done += 1
+    except (BrokenProcessPool, CancelledError, RuntimeError, OSError, pickle.PicklingError, AttributeError) as e:
+        logger.warning("Parallel report rendering unavailable, rendering in process: %s", e)
+        # Cancelled or refused work means another report already shut the pool down
+        if not isinstance(e, (CancelledError, RuntimeError)):
+            _discard_pool(pool)
+        yield from map(render, members[done:])
+    finally:
+        for future in pending:
+            future.cancel()
+
+def render_members(render, members, workers=None, cache=None, context=()):
+    """
+    map_members(render, members) as a list, reusing cached fragments.
+
+    With a FragmentCache, each member is looked up by member_digest(member,
+    *context); only the misses are rendered (in parallel) and stored, so a
+    report regenerated after editing one member renders just that member.
+    context must identify the renderer and anything else that changes the
+    output for the same member dict.
+    """
+    members = list(members)
+    if cache is None:
+        return list(map_members(render, members, workers))
+
+    keys = [member_digest(member, *context) for member in members]
+    fragments = [cache.get(key) for key in keys]
+    missing = [i for i, fragment in enumerate(fragments) if fragment is None]
+    rendered = map_members(render, [members[i] for i in missing], workers)
+    for i, fragment in zip(missing, rendered):
+        fragments[i] = fragment
+        cache.put(keys[i], fragment)
+    return fragments
+
+# ==================== PARALLEL REPORT WRITERS ====================
+_worker_generators = {}
+
+def _render_html_member(generator_class, member):
+    # One generator per class and worker process; members do not share state
+    generator = _worker_generators.get(generator_class)
+    if generator is None:
+        generator = _worker_generators[generator_class] = generator_class()
+    return generator.generate_member_report(member)
+
+def _html_context(generator):
+    return ('html', f"{type(generator).__module__}.{type(generator).__qualname__}")
+
+def iter_parallel_full_report(generator, members=None, workers=None, cache=None):
+    """
+    Chunks of generator's full HTML report with the members rendered in
+    parallel; the chunks join to exactly generator.generate_full_report().
+    Unchanged members are taken from cache (a FragmentCache) when given.
+    """
+    members = generator.members if members is None else members
+    render = functools.partial(_render_html_member, type(generator))
+    yield generator._report_head()
+    if cache is None:
+        yield from map_members(render, members, workers)
+    else:
+        yield from render_members(render, members, workers, cache, _html_context(generator))
+    yield generator._report_foot()
+
+def parallel_full_report(generator, workers=None, cache=None):
+    """generator.generate_full_report() with the members rendered in parallel"""
+    return "".join(iter_parallel_full_report(generator, workers=workers, cache=cache))
+
+def iter_parallel_midas_text_report(members, project_info=None, code_name="AISC(15th)-LRFD16", workers=None,
+                                    cache=None):
+    """
+    Chunks of the MIDAS text report with the member pages rendered in
+    parallel; they join to exactly generate_midas_gen_text_report().
+    """
+    members = list(members)
+    render = functools.partial(midas_member_page, code_name=code_name)
+    yield midas_report_header(members, project_info, code_name)
+    for page in render_members(render, members, workers, cache, ('midas', code_name)):
+        yield "\n"
+        yield page
+
+def parallel_midas_text_report(members, project_info=None, code_name="AISC(15th)-LRFD16", workers=None,
+                               cache=None):
+    """generate_midas_gen_text_report() with the member pages rendered in parallel"""
+    return "".join(iter_parallel_midas_text_report(members, project_info, code_name, workers, cache))
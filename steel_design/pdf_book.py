@@ -0,0 +1,263 @@
+"""
+Multi-member PDF calculation book for the Tab 5 design check.
+
+Every member gets the same calculation sheet as the Tab 3 PDF
+(calculation_story), checked at its governing load combination. The
+sheets are rendered as separate PDF parts in the report worker pool
+(parallel_report.map_members), then merged behind a summary front section
+and stamped with continuous page numbers. The workers read their section
+and grade rows from the tables published to shared memory for the book
+(shared.publish_tables). Merging needs pypdf; without it the book is
+built as a single document in the calling process.
+"""
+
+import functools
+import logging
+from datetime import datetime
+from io import BytesIO
+
+from .lazy import PDF_AVAILABLE, PDF_MERGE_AVAILABLE
+from .aisc import evaluate_member_design
+from .parallel_report import map_members
+from .pdf_report import calculation_document, calculation_story, draw_page_number, get_pdf_flowables
+from .shared import attach_tables, publish_tables
+
+logger = logging.getLogger(__name__)
+
+# ==================== BOOK MEMBERS ====================
+def book_members(all_results, members=None):
+    """
+    One entry per member of Tab 5 results ({member: {'results', 'config'}}).
+
+    The governing load combination is the largest valid ratio (< 900), as
+    in the Summary Report; its |Mu| and signed Pu (negative in tension) are
+    the design forces of the member's calculation sheet.
+    """
+    entries = []
+    for member in (all_results if members is None else members):
+        data = all_results[member]
+        df_result = data['results']
+        config = data['config']
+
+        valid = df_result[df_result['Ratio'] < 900]
+        if len(valid) > 0:
+            row = df_result.loc[valid['Ratio'].idxmax()]
+            lc, ratio, mode = row['LC'], float(row['Ratio']), row['Mode']
+            Mu, Pu = abs(float(row['Mu (t·m)'])), float(row['Pu (tons)'])
+        else:
+            lc, ratio, mode = "N/A", 999.0, "Error"
+            Mu = Pu = 0.0
+
+        entries.append({
+            'member': member,
+            'section': config['section'],
+            'material': config['material'],
+            'member_type': config['member_type'],
+            'Lb': config['Lb'],
+            'KL': config['KL'],
+            'Cb': config.get('Cb', 1.0),
+            'LC': lc,
+            'Mu': Mu,
+            'Pu': Pu,
+            'ratio': ratio,
+            'mode': mode,
+            'status': '✓ OK' if ratio <= 1.0 else '✗ NG'
+        })
+    return entries
+
+# ==================== MEMBER SHEETS ====================
+def _member_story(df, df_mat, entry, project_info, page_width):
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph
+
+    # The member type's own checks, as in the Tab 5 Design Check, so the
+    # sheet's governing ratio is the one in its heading
+    section, material = entry['section'], entry['material']
+    evaluation = evaluate_member_design(
+        df, df_mat, section, material, entry['member_type'],
+        {'Mu': entry['Mu'], 'Pu': entry['Pu']},
+        {'Lb': entry['Lb'], 'KL': entry['KL'], 'Cb': entry['Cb']}
+    ) or {}
+    design_params = {'Mu': entry['Mu'], 'Pu': entry['Pu'], 'Lb': entry['Lb'], 'KL': entry['KL'], 'Cb': entry['Cb']}
+
+    heading = Paragraph(
+        f"MEMBER {entry['member']} &nbsp;|&nbsp; {entry['member_type']} &nbsp;|&nbsp; "
+        f"Governing LC {entry['LC']} (ratio {entry['ratio']:.3f})",
+        getSampleStyleSheet()['Heading3']
+    )
+    return [heading] + calculation_story(df, df_mat, section, material, evaluation, design_params,
+                                         project_info, page_width)
+
+def _render_member_part(project_info, item):
+    """One member's calculation sheet as a PDF part (runs in a report worker)"""
+    entry, df_section, df_material = item
+    _, NumberedCanvas = get_pdf_flowables()
+    buffer = BytesIO()
+    doc = calculation_document(buffer, title=f"Member {entry['member']}")
+    doc.build(_member_story(df_section, df_material, entry, project_info, doc.width),
+              canvasmaker=functools.partial(NumberedCanvas, page_numbers=False))
+    return buffer.getvalue()
+
+def _render_shared_member_part(project_info, descriptor, entry):
+    """_render_member_part with the member's rows taken from the published tables"""
+    tables = attach_tables(descriptor)
+    return _render_member_part(project_info, (entry, tables.rows('section', [entry['section']]),
+                                              tables.rows('material', [entry['material']])))
+
+# ==================== SUMMARY FRONT SECTION ====================
+def _summary_story(entries, project_info, page_width, start_pages=None):
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib import colors as rl_colors
+
+    styles = getSampleStyleSheet()
+    passing = sum(1 for entry in entries if entry['ratio'] <= 1.0)
+    valid = [entry['ratio'] for entry in entries if entry['ratio'] < 900]
+
+    story = [
+        Paragraph("STRUCTURAL DESIGN CALCULATION BOOK", styles['Title']),
+        Paragraph(f"Project: {project_info.get('project_name') or 'N/A'} &nbsp;&nbsp; "
+                  f"Project No.: {project_info.get('project_no') or 'N/A'}", styles['Normal']),
+        Paragraph(f"Designer: {project_info.get('designer') or 'N/A'} &nbsp;&nbsp; "
+                  f"Checker: {project_info.get('checker') or 'N/A'} &nbsp;&nbsp; "
+                  f"Date: {project_info.get('date') or datetime.now().strftime('%Y-%m-%d')}", styles['Normal']),
+        Spacer(1, 0.15*inch),
+        Paragraph("DESIGN SUMMARY", styles['Heading2']),
+        Paragraph(f"Members: <b>{len(entries)}</b> &nbsp;&nbsp; Passing: <b>{passing}</b> &nbsp;&nbsp; "
+                  f"Failing: <b>{len(entries) - passing}</b> &nbsp;&nbsp; "
+                  f"Max Ratio: <b>{f'{max(valid):.3f}' if valid else 'N/A'}</b>", styles['Normal']),
+        Spacer(1, 0.1*inch)
+    ]
+
+    rows = [['Member', 'Section', 'Grade', 'Type', 'Gov. LC', 'Max Ratio', 'Status', 'Page']]
+    for i, entry in enumerate(entries):
+        rows.append([
+            str(entry['member']), entry['section'], entry['material'],
+            entry['member_type'].split('(')[0].strip(), str(entry['LC']),
+            f"{entry['ratio']:.3f}" if entry['ratio'] < 900 else "N/A",
+            'OK' if entry['ratio'] <= 1.0 else 'NG',
+            str(start_pages[i]) if start_pages else '—'
+        ])
+    fixed = 0.7*inch + 0.9*inch + 0.8*inch + 0.6*inch + 0.7*inch + 0.5*inch
+    table = Table(rows, colWidths=[0.7*inch, page_width - fixed - 0.9*inch, 0.9*inch, 0.8*inch,
+                                   0.6*inch, 0.7*inch, 0.5*inch], repeatRows=1)
+    style = [
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#455a64')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('ALIGN', (4, 0), (-1, -1), 'CENTER'),
+        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.HexColor('#90a4ae')),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#f5f7f8')])
+    ]
+    for i, entry in enumerate(entries, 1):
+        if entry['ratio'] > 1.0:
+            style.append(('TEXTCOLOR', (5, i), (6, i), rl_colors.HexColor('#c62828')))
+    table.setStyle(TableStyle(style))
+    story.append(table)
+    return story
+
+def _render_summary(entries, project_info, start_pages=None):
+    _, NumberedCanvas = get_pdf_flowables()
+    buffer = BytesIO()
+    doc = calculation_document(buffer, title="Design Summary")
+    doc.build(_summary_story(entries, project_info, doc.width, start_pages),
+              canvasmaker=functools.partial(NumberedCanvas, page_numbers=False))
+    return buffer.getvalue()
+
+# ==================== CALCULATION BOOK ====================
+def _page_number_stamps(page_sizes):
+    """One overlay page per book page carrying only its "Page n of N" footer"""
+    from reportlab.pdfgen import canvas
+
+    buffer = BytesIO()
+    stamp = canvas.Canvas(buffer)
+    for number, (page_w, page_h) in enumerate(page_sizes, 1):
+        stamp.setPageSize((page_w, page_h))
+        draw_page_number(stamp, page_w, number, len(page_sizes))
+        stamp.showPage()
+    stamp.save()
+    return buffer
+
+def _merged_book(entries, parts, project_info):
+    from pypdf import PdfReader, PdfWriter
+
+    readers = [PdfReader(BytesIO(part)) for part in parts]
+
+    # The page column changes no row heights, but re-check the front
+    # section's length once the start pages are filled in
+    summary = PdfReader(BytesIO(_render_summary(entries, project_info)))
+    for _ in range(3):
+        start_pages = []
+        page = len(summary.pages) + 1
+        for reader in readers:
+            start_pages.append(page)
+            page += len(reader.pages)
+        front_pages = len(summary.pages)
+        summary = PdfReader(BytesIO(_render_summary(entries, project_info, start_pages)))
+        if len(summary.pages) == front_pages:
+            break
+
+    writer = PdfWriter()
+    writer.append(summary, outline_item="Design Summary")
+    for entry, reader in zip(entries, readers):
+        writer.append(reader, outline_item=f"Member {entry['member']}")
+
+    sizes = [(float(page.mediabox.width), float(page.mediabox.height)) for page in writer.pages]
+    stamps = PdfReader(_page_number_stamps(sizes))
+    for page, stamp in zip(writer.pages, stamps.pages):
+        page.merge_page(stamp)
+
+    buffer = BytesIO()
+    writer.write(buffer)
+    buffer.seek(0)
+    return buffer
+
+def _single_document_book(df, df_mat, entries, project_info):
+    from reportlab.platypus import PageBreak
+
+    _, NumberedCanvas = get_pdf_flowables()
+    buffer = BytesIO()
+    doc = calculation_document(buffer, title="AISC 360-16 Calculation Book")
+    story = _summary_story(entries, project_info, doc.width)
+    for entry in entries:
+        story.append(PageBreak())
+        story.extend(_member_story(df, df_mat, entry, project_info, doc.width))
+    doc.build(story, canvasmaker=NumberedCanvas)
+    buffer.seek(0)
+    return buffer
+
+def generate_calculation_book(df, df_mat, all_results, project_info, members=None, workers=None):
+    """
+    PDF calculation book of the Tab 5 members: a summary front section
+    followed by each member's calculation sheet, numbered continuously.
+
+    all_results is st.session_state.analysis_results_tab5; members limits
+    and orders the book. Member sheets are rendered in parallel (workers as
+    for the other parallel reports) and merged with pypdf; without pypdf
+    the book is built as one document here. Returns a BytesIO, or None
+    when reportlab is missing.
+    """
+    if not PDF_AVAILABLE:
+        return None
+
+    project_info = dict(project_info or {})
+    entries = book_members(all_results, members)
+
+    if not PDF_MERGE_AVAILABLE:
+        logger.info("pypdf not installed, building the calculation book as one document")
+        return _single_document_book(df, df_mat, entries, project_info)
+
+    try:
+        tables = publish_tables(section=df, material=df_mat)
+    except OSError as e:
+        # Each part then carries its own section and grade rows to the worker
+        logger.warning("Shared memory unavailable, sending the calculation book rows to each part: %s", e)
+        items = [(entry, df.loc[[entry['section']]], df_mat.loc[[entry['material']]]) for entry in entries]
+        parts = list(map_members(functools.partial(_render_member_part, project_info), items, workers))
+    else:
+        with tables:
+            render = functools.partial(_render_shared_member_part, project_info, tables.descriptor)
+            parts = list(map_members(render, entries, workers))
+    return _merged_book(entries, parts, project_info)
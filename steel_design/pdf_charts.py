@@ -0,0 +1,319 @@
+"""
+Vector charts for the PDF reports, drawn with reportlab.graphics.
+
+The capacity curves are computed as arrays in one vectorized call and
+drawn as polylines, so a chart is a few hundred PDF path operators
+instead of a matplotlib render, a PNG encode and an embedded image: it
+renders in milliseconds, stays sharp at any zoom and adds a few kB per
+page. reportlab is imported on first use.
+"""
+
+import math
+
+import numpy as np
+
+from .aisc import f2_flexural_capacity_arrays, grade_constant_row, section_property_arrays
+from .charts import COMPRESSION_CHART_RANGE, FLEXURE_CHART_RANGE
+
+# ==================== CAPACITY ARRAYS ====================
+def flexural_capacity_curve(df, df_mat, section, material, Cb=1.0, lb_range=FLEXURE_CHART_RANGE):
+    """Lb (m) and φMn (t·m) along the F2 curve, as aisc_360_16_f2_flexural_design gives point by point"""
+    Lb = np.linspace(*lb_range)
+    sec = section_property_arrays(df, [section])
+    grade = grade_constant_row(df_mat, material)
+    Mn, _, _, _ = f2_flexural_capacity_arrays(sec['Sx'], sec['Zx'], sec['ry'], sec['rts'], sec['J'], sec['ho'],
+                                              grade['Fy'], grade['E'], Lb, Cb, grade['sqrt_E_Fy'])
+    return Lb, np.nan_to_num(0.9 * Mn, nan=0.0)
+
+def compression_capacity_curve(E, Fy, Ag, lambda_limit, lambda_range=COMPRESSION_CHART_RANGE):
+    """KL/r and φPn (tons) along the E3 column curve"""
+    lam = np.linspace(*lambda_range)
+    Fe = np.pi ** 2 * E / lam ** 2
+    Fcr = np.where(lam <= lambda_limit, 0.658 ** (Fy / Fe) * Fy, 0.877 * Fe)
+    return lam, 0.9 * Fcr * Ag / 1000.0
+
+def interaction_curve(points=50):
+    """Normalized H1-1a/H1-1b envelope: Pr/Pc and Mr/Mc from pure bending to pure axial"""
+    p = np.linspace(0.0, 1.0, points)
+    m = np.where(p >= 0.2, 9.0 / 8.0 * (1.0 - p), 1.0 - p / 2.0)
+    return p, m
+
+# ==================== DRAWING PRIMITIVES ====================
+_BLUE = '#1565c0'
+_RED = '#d32f2f'
+_GREEN = '#2e7d32'
+_ORANGE = '#ef6c00'
+_GRID = '#cfd8dc'
+_TEXT = '#263238'
+
+def _nice_ticks(lo, hi, count=6):
+    """Round tick values covering [lo, hi]"""
+    span = hi - lo
+    if not math.isfinite(span) or span <= 0:
+        return [lo]
+    raw = span / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    first = math.ceil(lo / step - 1e-9) * step
+    return [first + i * step for i in range(int((hi - first) / step + 1e-9) + 1)]
+
+def _tick_label(value, step):
+    decimals = max(0, -int(math.floor(math.log10(step)))) if step < 1 else 0
+    return f"{value:.{decimals}f}"
+
+def _star(cx, cy, radius):
+    points = []
+    for i in range(10):
+        r = radius if i % 2 == 0 else radius * 0.381966
+        angle = math.pi / 2 + i * math.pi / 5
+        points.extend((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+    return points
+
+class _Plot:
+    """
+    Axes, grid and title on a reportlab Drawing, mapping data to points.
+
+    Everything is clipped to the axes by hand (polylines are cut at the
+    frame), since reportlab drawings have no clip paths.
+    """
+
+    def __init__(self, width, height, title, xlabel, ylabel, xlim, ylim):
+        from reportlab.graphics.shapes import Drawing, Group, Line, Rect, String
+        from reportlab.lib import colors as rl_colors
+
+        self.colors = rl_colors
+        self.drawing = Drawing(width, height)
+        self.x0, self.y0 = 46.0, 32.0
+        self.x1, self.y1 = width - 10.0, height - 22.0
+        self.xlim, self.ylim = xlim, ylim
+        self.legend = []
+        draw = self.drawing
+
+        draw.add(String(width / 2, height - 13, title, fontName='Helvetica-Bold', fontSize=9.5,
+                        fillColor=rl_colors.HexColor(_TEXT), textAnchor='middle'))
+
+        grid = rl_colors.HexColor(_GRID)
+        xticks = _nice_ticks(*xlim)
+        yticks = _nice_ticks(*ylim)
+        xstep = xticks[1] - xticks[0] if len(xticks) > 1 else 1.0
+        ystep = yticks[1] - yticks[0] if len(yticks) > 1 else 1.0
+        for value in xticks:
+            x, _ = self.point(value, ylim[0])
+            draw.add(Line(x, self.y0, x, self.y1, strokeColor=grid, strokeWidth=0.4, strokeDashArray=[1, 2]))
+            draw.add(String(x, self.y0 - 9, _tick_label(value, xstep), fontName='Helvetica', fontSize=7,
+                            textAnchor='middle'))
+        for value in yticks:
+            _, y = self.point(xlim[0], value)
+            draw.add(Line(self.x0, y, self.x1, y, strokeColor=grid, strokeWidth=0.4, strokeDashArray=[1, 2]))
+            draw.add(String(self.x0 - 3, y - 2.5, _tick_label(value, ystep), fontName='Helvetica', fontSize=7,
+                            textAnchor='end'))
+
+        draw.add(Rect(self.x0, self.y0, self.x1 - self.x0, self.y1 - self.y0, fillColor=None,
+                      strokeColor=rl_colors.HexColor('#90a4ae'), strokeWidth=0.8))
+        draw.add(String((self.x0 + self.x1) / 2, 6, xlabel, fontName='Helvetica-Bold', fontSize=8,
+                        fillColor=rl_colors.HexColor(_TEXT), textAnchor='middle'))
+        ylabel_group = Group(String(0, 0, ylabel, fontName='Helvetica-Bold', fontSize=8,
+                                    fillColor=rl_colors.HexColor(_TEXT), textAnchor='middle'))
+        ylabel_group.transform = (0, 1, -1, 0, 11, (self.y0 + self.y1) / 2)
+        draw.add(ylabel_group)
+
+    def point(self, x, y):
+        (xa, xb), (ya, yb) = self.xlim, self.ylim
+        return (self.x0 + (x - xa) * (self.x1 - self.x0) / (xb - xa),
+                self.y0 + (y - ya) * (self.y1 - self.y0) / (yb - ya))
+
+    def inside(self, x, y):
+        return self.xlim[0] <= x <= self.xlim[1] and self.ylim[0] <= y <= self.ylim[1]
+
+    def band(self, xa, xb, color, label=None):
+        """Shaded vertical zone between xa and xb"""
+        from reportlab.graphics.shapes import Rect
+        xa, xb = max(xa, self.xlim[0]), min(xb, self.xlim[1])
+        if xb <= xa:
+            return
+        (left, _), (right, _) = self.point(xa, 0), self.point(xb, 0)
+        fill = self.colors.HexColor(color)
+        self.drawing.add(Rect(left, self.y0, right - left, self.y1 - self.y0, fillColor=fill,
+                              fillOpacity=0.13, strokeColor=None))
+        if label:
+            self.legend.append(('band', color, label))
+
+    def curve(self, xs, ys, color, width=2.0, label=None):
+        """Polyline through the finite points inside the axes"""
+        from reportlab.graphics.shapes import PolyLine
+        stroke = self.colors.HexColor(color)
+        run = []
+        for x, y in zip(xs, ys):
+            if math.isfinite(x) and math.isfinite(y) and self.inside(x, y):
+                run.extend(self.point(x, y))
+            elif run:
+                self.drawing.add(PolyLine(run, strokeColor=stroke, strokeWidth=width, strokeLineJoin=1))
+                run = []
+        if len(run) >= 4:
+            self.drawing.add(PolyLine(run, strokeColor=stroke, strokeWidth=width, strokeLineJoin=1))
+        if label:
+            self.legend.append(('line', color, label))
+
+    def vline(self, x, color, label=None, text=None):
+        from reportlab.graphics.shapes import Line, String
+        if not self.xlim[0] <= x <= self.xlim[1]:
+            return
+        px, _ = self.point(x, 0)
+        stroke = self.colors.HexColor(color)
+        self.drawing.add(Line(px, self.y0, px, self.y1, strokeColor=stroke, strokeWidth=1.1, strokeDashArray=[4, 2]))
+        if text:
+            self.drawing.add(String(px, self.y1 - 9, text, fontName='Helvetica-Bold', fontSize=7,
+                                    fillColor=stroke, textAnchor='middle'))
+        if label:
+            self.legend.append(('dash', color, label))
+
+    def hline(self, y, color, label=None):
+        from reportlab.graphics.shapes import Line, String
+        stroke = self.colors.HexColor(color)
+        if y > self.ylim[1]:
+            if label:
+                self.drawing.add(String(self.x0 + 4, self.y0 + 4, f"{label} (above chart)", fontName='Helvetica',
+                                        fontSize=7, fillColor=stroke))
+            return
+        if y < self.ylim[0]:
+            return
+        _, py = self.point(self.xlim[0], y)
+        self.drawing.add(Line(self.x0, py, self.x1, py, strokeColor=stroke, strokeWidth=1.1, strokeDashArray=[4, 2]))
+        if label:
+            self.legend.append(('dash', color, label))
+
+    def marker(self, x, y, label=None):
+        """Design point star"""
+        from reportlab.graphics.shapes import Polygon
+        if self.inside(x, y):
+            fill = self.colors.HexColor(_RED)
+            self.drawing.add(Polygon(_star(*self.point(x, y), 6.5), fillColor=fill, strokeColor=fill,
+                                     strokeWidth=0.3))
+        if label:
+            self.legend.append(('star', _RED, label))
+
+    def finish(self):
+        """Legend box in the upper right corner; returns the Drawing"""
+        from reportlab.graphics.shapes import Line, Polygon, Rect, String
+        if not self.legend:
+            return self.drawing
+        row = 10.0
+        width = max(len(label) for _, _, label in self.legend) * 3.9 + 30
+        height = row * len(self.legend) + 6
+        left, top = self.x1 - width - 4, self.y1 - 4
+        self.drawing.add(Rect(left, top - height, width, height, fillColor=self.colors.white,
+                              fillOpacity=0.9, strokeColor=self.colors.HexColor('#b0bec5'), strokeWidth=0.5))
+        for i, (kind, color, label) in enumerate(self.legend):
+            y = top - 8 - i * row
+            stroke = self.colors.HexColor(color)
+            if kind == 'star':
+                self.drawing.add(Polygon(_star(left + 12, y + 2.5, 4), fillColor=stroke, strokeColor=stroke,
+                                         strokeWidth=0.3))
+            elif kind == 'band':
+                self.drawing.add(Rect(left + 5, y, 14, 6, fillColor=stroke, fillOpacity=0.25, strokeColor=None))
+            else:
+                self.drawing.add(Line(left + 5, y + 2.5, left + 19, y + 2.5, strokeColor=stroke, strokeWidth=1.5,
+                                      strokeDashArray=[3, 1.5] if kind == 'dash' else None))
+            self.drawing.add(String(left + 24, y, label, fontName='Helvetica', fontSize=7))
+        return self.drawing
+
+def _upper(values, *extra):
+    """Top of a y axis starting at zero, with some headroom"""
+    top = max([float(np.nanmax(values)) if len(values) else 0.0] + [v for v in extra if math.isfinite(v)])
+    return top * 1.08 if top > 0 else 1.0
+
+# ==================== VECTOR CHARTS ====================
+def flexural_capacity_drawing(Lb_points, phi_Mn_points, Lp, Lr, design_point=None, title="Flexural Capacity",
+                              width=396, height=245):
+    """F2 φMn–Lb curve with the Lp/Lr zones and the design point (Lb, φMn)"""
+    xlim = (0.0, float(Lb_points[-1]))
+    plot = _Plot(width, height, title, "Unbraced Length, Lb (m)", "Design Moment, φMn (t·m)",
+                 xlim, (0.0, _upper(phi_Mn_points)))
+    plot.band(0, Lp, _GREEN, 'Yielding (F2.1)')
+    plot.band(Lp, Lr, _ORANGE, 'Inelastic LTB (F2.2)')
+    plot.band(Lr, xlim[1], _RED, 'Elastic LTB (F2.3)')
+    plot.vline(Lp, _GREEN, text=f"Lp={Lp:.2f}m")
+    plot.vline(Lr, _ORANGE, text=f"Lr={Lr:.2f}m")
+    plot.curve(Lb_points, phi_Mn_points, _BLUE, label='φMn')
+    if design_point is not None:
+        plot.marker(*design_point, label='Design Point')
+    return plot.finish()
+
+def compression_capacity_drawing(lambda_points, phi_Pn_points, lambda_limit, design_point=None, Pu=0,
+                                 title="Column Capacity", width=396, height=245):
+    """E3 φPn–KL/r curve with the design point (λc, φPn) and the Pu demand line"""
+    plot = _Plot(width, height, title, "Slenderness Ratio (KL/r)", "Design Strength, φPn (tons)",
+                 (0.0, float(lambda_points[-1])), (0.0, _upper(phi_Pn_points)))
+    plot.band(0, lambda_limit, _GREEN, 'Inelastic (E3-2)')
+    plot.band(lambda_limit, lambda_points[-1], _ORANGE, 'Elastic (E3-3)')
+    plot.vline(lambda_limit, _ORANGE, text=f"λ limit={lambda_limit:.1f}")
+    plot.curve(lambda_points, phi_Pn_points, _BLUE, label='φPn')
+    if design_point is not None:
+        plot.marker(*design_point, label='Design Point')
+    if Pu > 0:
+        plot.hline(Pu, _RED, label=f"Pu = {Pu:.1f} tons")
+    return plot.finish()
+
+def interaction_drawing(phi_Pn, phi_Mn, Pu=None, Mu=None, title="P–M Interaction (AISC H1-1)",
+                        width=396, height=245):
+    """
+    H1-1a/H1-1b envelope in φPn and φMn units with the demand point
+    (|Mu|, |Pu|); points inside the envelope satisfy H1.
+    """
+    p, m = interaction_curve()
+    Ms, Ps = m * phi_Mn, p * phi_Pn
+    point = (abs(Mu), abs(Pu)) if Pu is not None and Mu is not None else None
+    extra = point or (0.0, 0.0)
+    plot = _Plot(width, height, title, "Required Moment, Mu (t·m)", "Required Axial, Pu (tons)",
+                 (0.0, _upper(Ms, extra[0])), (0.0, _upper(Ps, extra[1])))
+    plot.curve(Ms, Ps, _BLUE, label='H1-1 envelope')
+    plot.hline(0.2 * phi_Pn, _ORANGE, label='Pr/Pc = 0.2')
+    if point is not None:
+        plot.marker(*point, label='Demand (Mu, Pu)')
+    return plot.finish()
+
+def section_drawing(d, bf, tf, tw, section_name, width=260, height=230):
+    """Dimensioned I-section outline to scale"""
+    from reportlab.graphics.shapes import Drawing, Line, Polygon, String
+    from reportlab.lib import colors as rl_colors
+
+    drawing = Drawing(width, height)
+    drawing.add(String(width / 2, height - 13, f"{section_name}", fontName='Helvetica-Bold', fontSize=9,
+                       fillColor=rl_colors.HexColor('#1a237e'), textAnchor='middle'))
+    if not all(math.isfinite(v) and v > 0 for v in (d, bf, tf, tw)):
+        return drawing
+
+    scale = min((width - 110) / bf, (height - 60) / d)
+    cx, cy = width / 2 - 15, (height - 20) / 2
+    h, b, t, w = d * scale / 2, bf * scale / 2, tf * scale, tw * scale / 2
+    outline = [cx - b, cy + h, cx + b, cy + h, cx + b, cy + h - t, cx + w, cy + h - t,
+               cx + w, cy - h + t, cx + b, cy - h + t, cx + b, cy - h, cx - b, cy - h,
+               cx - b, cy - h + t, cx - w, cy - h + t, cx - w, cy + h - t, cx - b, cy + h - t]
+    drawing.add(Polygon(outline, fillColor=rl_colors.HexColor('#e8eaf6'),
+                        strokeColor=rl_colors.HexColor('#1a237e'), strokeWidth=1.2))
+
+    red, blue, green = rl_colors.HexColor(_RED), rl_colors.HexColor('#1976d2'), rl_colors.HexColor('#388e3c')
+    dim = cx + b + 14
+    drawing.add(Line(dim, cy - h, dim, cy + h, strokeColor=red, strokeWidth=0.8))
+    drawing.add(Line(dim - 3, cy + h, dim + 3, cy + h, strokeColor=red, strokeWidth=0.8))
+    drawing.add(Line(dim - 3, cy - h, dim + 3, cy - h, strokeColor=red, strokeWidth=0.8))
+    drawing.add(String(dim + 5, cy - 3, f"d = {d:.0f} mm", fontName='Helvetica-Bold', fontSize=8, fillColor=red))
+
+    top = cy + h + 8
+    drawing.add(Line(cx - b, top, cx + b, top, strokeColor=red, strokeWidth=0.8))
+    drawing.add(Line(cx - b, top - 3, cx - b, top + 3, strokeColor=red, strokeWidth=0.8))
+    drawing.add(Line(cx + b, top - 3, cx + b, top + 3, strokeColor=red, strokeWidth=0.8))
+    drawing.add(String(cx, top + 4, f"bf = {bf:.0f} mm", fontName='Helvetica-Bold', fontSize=8, fillColor=red,
+                       textAnchor='middle'))
+
+    drawing.add(String(cx - b - 4, cy + h - t / 2 - 3, f"tf = {tf:.1f}", fontName='Helvetica', fontSize=7.5,
+                       fillColor=blue, textAnchor='end'))
+    drawing.add(String(cx + w + 4, cy - h / 2, f"tw = {tw:.1f}", fontName='Helvetica', fontSize=7.5,
+                       fillColor=green))
+    drawing.add(Line(cx, cy - h - 6, cx, cy + h + 2, strokeColor=rl_colors.grey, strokeWidth=0.4,
+                     strokeDashArray=[3, 2]))
+    drawing.add(Line(cx - b - 6, cy, cx + b + 6, cy, strokeColor=rl_colors.grey, strokeWidth=0.4,
+                     strokeDashArray=[3, 2]))
+    drawing.add(String(cx + b + 8, cy + 3, "X", fontName='Helvetica', fontSize=7))
+    drawing.add(String(cx + 3, cy + h + 3 - 14 if h > 20 else cy + h + 3, "Y", fontName='Helvetica', fontSize=7))
+    return drawing
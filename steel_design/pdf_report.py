@@ -0,0 +1,1862 @@
+"""PDF calculation reports (reportlab is imported on first use)."""
+
+import functools
+import math
+from datetime import datetime
+from io import BytesIO
+
+from .lazy import PDF_AVAILABLE
+from .utils import safe_scalar
+from .aisc import classify_section_flexure, classify_section_compression, grade_constant_row
+from .pdf_charts import (flexural_capacity_curve, compression_capacity_curve, flexural_capacity_drawing,
+                         compression_capacity_drawing, interaction_drawing, section_drawing)
+
+# ==================== PDF GENERATION ====================
+def draw_page_number(canv, page_w, number, page_count):
+    """The "Page n of N" footer of a calculation sheet"""
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors as rl_colors
+    canv.setFont("Helvetica", 9)
+    canv.setFillColor(rl_colors.grey)
+    canv.drawRightString(page_w - 0.75*inch, 0.4*inch, f"Page {number} of {page_count}")
+
+@functools.lru_cache(maxsize=None)
+def get_pdf_flowables():
+    """
+    EquationBox and NumberedCanvas.
+
+    Both subclass reportlab classes, so they are defined on first PDF export.
+    """
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Flowable
+    from reportlab.lib import colors as rl_colors
+    from reportlab.pdfgen import canvas
+
+    class EquationBox(Flowable):
+        """Custom flowable for equation boxes with proper padding and no overlap"""
+        def __init__(self, text, width):
+            Flowable.__init__(self)
+            self.text = text
+            self.width = width
+            self.height = 0
+        
+        def wrap(self, availWidth, _availHeight):
+            # Calculate required height with padding
+            self.width = availWidth
+            # Estimate height based on text length (adjust as needed)
+            lines = len(self.text) / 80 + 1
+            self.height = max(30, lines * 15 + 20)  # Minimum 30pt, with padding
+            return (self.width, self.height)
+    
+        def draw(self):
+            # Draw blue background box
+            self.canv.setFillColor(rl_colors.HexColor('#E7F3FF'))
+            self.canv.setStrokeColor(rl_colors.HexColor('#2196F3'))
+            self.canv.setLineWidth(1)
+            self.canv.roundRect(0, 0, self.width, self.height, 5, fill=1, stroke=1)
+        
+            # Draw text with proper padding
+            self.canv.setFillColor(rl_colors.HexColor('#1565C0'))
+            self.canv.setFont('Courier', 9)
+        
+            # Word wrap text
+            words = self.text.split()
+            lines = []
+            current_line = []
+            current_width = 0
+            max_width = self.width - 20  # 10pt padding on each side
+        
+            for word in words:
+                word_width = self.canv.stringWidth(word + ' ', 'Courier', 9)
+                if current_width + word_width <= max_width:
+                    current_line.append(word)
+                    current_width += word_width
+                else:
+                    lines.append(' '.join(current_line))
+                    current_line = [word]
+                    current_width = word_width
+        
+            if current_line:
+                lines.append(' '.join(current_line))
+        
+            # Draw lines
+            y_position = self.height - 15
+            for line in lines:
+                self.canv.drawString(10, y_position, line)
+                y_position -= 12
+
+    class NumberedCanvas(canvas.Canvas):
+        """
+        Custom canvas for page numbers and headers.
+
+        page_numbers=False leaves out "Page n of N" (the calculation book
+        stamps continuous numbers after merging its parts).
+        """
+        def __init__(self, *args, page_numbers=True, **kwargs):
+            canvas.Canvas.__init__(self, *args, **kwargs)
+            self._saved_page_states = []
+            self._page_numbers = page_numbers
+
+        def showPage(self):
+            self._saved_page_states.append(dict(self.__dict__))
+            self._startPage()
+
+        def save(self):
+            num_pages = len(self._saved_page_states)
+            for state in self._saved_page_states:
+                self.__dict__.update(state)
+                self.draw_page_number(num_pages)
+                canvas.Canvas.showPage(self)
+            canvas.Canvas.save(self)
+
+        def inkAnnotation(self, inkList, mediaBox=None):
+            return canvas.Canvas.inkAnnotation(self, inkList, mediaBox)
+
+        def draw_page_number(self, page_count):
+            page_w, page_h = self._pagesize
+            self.setFont("Helvetica", 9)
+            self.setFillColor(rl_colors.grey)
+
+            # Header
+            self.line(0.75*inch, page_h - 0.6*inch, page_w - 0.75*inch, page_h - 0.6*inch)
+            self.setFont("Helvetica-Bold", 10)
+            self.setFillColor(rl_colors.HexColor('#37474f'))
+            self.drawString(0.75*inch, page_h - 0.5*inch, "MIDAS GEN Style - Steel Design Calculation Report")
+
+            # Footer
+            self.setFont("Helvetica", 9)
+            self.setFillColor(rl_colors.grey)
+            self.line(0.75*inch, 0.6*inch, page_w - 0.75*inch, 0.6*inch)
+            if self._page_numbers:
+                draw_page_number(self, page_w, self._pageNumber, page_count)
+            self.drawString(0.75*inch, 0.4*inch,
+                            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+
+    return EquationBox, NumberedCanvas
+def calculation_document(buffer, title="AISC 360-16 Structural Calculation"):
+    """A4 BaseDocTemplate with the calculation sheet margins and frame"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.platypus import PageTemplate, Frame, BaseDocTemplate
+
+    # Create document
+    doc = BaseDocTemplate(
+        buffer, 
+        pagesize=A4,
+        rightMargin=0.6*inch, 
+        leftMargin=0.6*inch,
+        topMargin=1.2*inch,
+        bottomMargin=0.8*inch,
+        title=title
+    )
+    
+    # Define frame
+    frame = Frame(
+        doc.leftMargin, 
+        doc.bottomMargin, 
+        doc.width, 
+        doc.height - 0.2*inch,
+        id='normal',
+        topPadding=10,
+        bottomPadding=10
+    )
+    template = PageTemplate(id='main', frames=frame, onPage=lambda c, d: None)
+    doc.addPageTemplates([template])
+    return doc
+
+def generate_calculation_report(df, df_mat, section, material, analysis_results, design_params, project_info):
+    """
+    Generate engineering calculation report with:
+    - Project information header
+    - Hand calculation style (detailed step-by-step)
+    - Summary tables
+    - Graphs/Charts
+    - formatting
+    """
+    if not PDF_AVAILABLE:
+        return None
+
+    _, NumberedCanvas = get_pdf_flowables()
+    
+    buffer = BytesIO()
+    doc = calculation_document(buffer)
+    story = calculation_story(df, df_mat, section, material, analysis_results, design_params, project_info,
+                              doc.width)
+    
+    # Build PDF
+    doc.build(story, canvasmaker=NumberedCanvas)
+    buffer.seek(0)
+    return buffer
+
+def calculation_story(df, df_mat, section, material, analysis_results, design_params, project_info, page_width):
+    """
+    Flowables of one section's calculation sheet, for a frame page_width wide.
+
+    generate_calculation_report() builds them into a single PDF; the
+    calculation book (pdf_book) strings several members' sheets together.
+    """
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Table, TableStyle, Paragraph, Spacer, PageBreak
+    from reportlab.lib import colors as rl_colors
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+
+    story = []
+    styles = getSampleStyleSheet()
+    
+    # ==================== CUSTOM STYLES ====================
+    title_style = ParagraphStyle(
+        'CalcTitle',
+        parent=styles['Heading1'],
+        fontSize=15,
+        textColor=rl_colors.HexColor('#263238'),
+        spaceAfter=8,
+        spaceBefore=6,
+        alignment=TA_LEFT,
+        fontName='Helvetica-Bold',
+        leading=18
+    )
+    
+    heading1_style = ParagraphStyle(
+        'CalcHeading1',
+        parent=styles['Heading1'],
+        fontSize=11,
+        textColor=rl_colors.HexColor('#263238'),
+        spaceAfter=8,
+        spaceBefore=14,
+        fontName='Helvetica-Bold',
+        backColor=rl_colors.HexColor('#eceff1'),
+        borderPadding=6,
+        borderWidth=0.5,
+        borderColor=rl_colors.HexColor('#b0bec5'),
+        leading=14
+    )
+    
+    heading2_style = ParagraphStyle(
+        'CalcHeading2',
+        parent=styles['Heading2'],
+        fontSize=10,
+        textColor=rl_colors.HexColor('#37474f'),
+        spaceAfter=6,
+        spaceBefore=10,
+        fontName='Helvetica-Bold',
+        borderWidth=0,
+        borderColor=rl_colors.HexColor('#90a4ae'),
+        borderPadding=4,
+        leading=13
+    )
+    
+    body_style = ParagraphStyle(
+        'CalcBody',
+        parent=styles['Normal'],
+        fontSize=10,
+        leading=13,
+        spaceAfter=4,
+        spaceBefore=2,
+        alignment=TA_LEFT,
+        wordWrap='CJK'
+    )
+    
+    equation_style = ParagraphStyle(
+        'CalcEquation',
+        parent=styles['Code'],
+        fontSize=10,
+        textColor=rl_colors.HexColor('#263238'),
+        backColor=rl_colors.HexColor('#f5f5f5'),
+        borderWidth=0.6,
+        borderColor=rl_colors.HexColor('#b0bec5'),
+        borderPadding=10,
+        leftIndent=20,
+        rightIndent=20,
+        spaceAfter=8,
+        spaceBefore=6,
+        fontName='Courier',
+        leading=14,
+        alignment=TA_CENTER,
+        wordWrap='CJK'
+    )
+    
+    result_style = ParagraphStyle(
+        'CalcResult',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=rl_colors.HexColor('#1b5e20'),
+        backColor=rl_colors.HexColor('#e8f5e9'),
+        borderWidth=2,
+        borderColor=rl_colors.HexColor('#4caf50'),
+        borderPadding=10,
+        spaceAfter=10,
+        spaceBefore=6,
+        fontName='Helvetica-Bold',
+        leading=16,
+        alignment=TA_CENTER
+    )
+    
+    reference_style = ParagraphStyle(
+        'CalcReference',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=rl_colors.HexColor('#616161'),
+        fontName='Helvetica-Oblique',
+        leading=12,
+        leftIndent=30,
+        wordWrap='CJK'
+    )
+
+    table_cell_style = ParagraphStyle(
+        'CalcTableCell',
+        parent=body_style,
+        fontSize=9,
+        leading=11,
+        spaceAfter=0,
+        spaceBefore=0,
+        wordWrap='CJK'
+    )
+
+    def _cell(val):
+        return Paragraph(str(val), table_cell_style)
+    
+    # ==================== PROJECT HEADER TABLE (MIDAS GEN STYLE) ====================
+    story.append(Spacer(1, 0.1*inch))
+    story.append(Paragraph("MIDAS GEN - STRUCTURAL DESIGN CALCULATION SHEET", title_style))
+    story.append(Spacer(1, 0.05*inch))
+    
+    # Project info table (engineering header)
+    header_data = [
+        [Paragraph('<b>STRUCTURAL CALCULATION SHEET</b>', 
+                  ParagraphStyle('header', fontSize=14, alignment=TA_CENTER, textColor=rl_colors.white)),
+         '', '', ''],
+        ['Project:', project_info.get('project_name', 'N/A'), 
+         'Project No.:', project_info.get('project_no', 'N/A')],
+        ['Subject:', f'Steel Design - {section}', 
+         'Date:', project_info.get('date', datetime.now().strftime('%Y-%m-%d'))],
+        ['Designer:', project_info.get('designer', 'N/A'), 
+         'Checker:', project_info.get('checker', 'N/A')],
+        ['Reference:', 'AISC 360-16', 
+         'Revision:', project_info.get('revision', '0')],
+    ]
+    for r in range(1, len(header_data)):
+        for c in range(4):
+            header_data[r][c] = _cell(header_data[r][c])
+    
+    header_table = Table(header_data, colWidths=[1.2*inch, page_width - 4.2*inch, 1.0*inch, 2.0*inch])
+    header_table.setStyle(TableStyle([
+        # Title row
+        ('SPAN', (0, 0), (-1, 0)),
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#455a64')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 14),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('TOPPADDING', (0, 0), (-1, 0), 12),
+        
+        # Data rows
+        ('BACKGROUND', (0, 1), (0, -1), rl_colors.HexColor('#e8eaf6')),
+        ('BACKGROUND', (2, 1), (2, -1), rl_colors.HexColor('#e8eaf6')),
+        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (2, 1), (2, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+        ('TOPPADDING', (0, 1), (-1, -1), 8),
+        ('WORDWRAP', (0, 0), (-1, -1), 'CJK'),
+        ('GRID', (0, 0), (-1, -1), 0.6, rl_colors.HexColor('#78909c')),
+    ]))
+    story.append(header_table)
+    story.append(Spacer(1, 0.2*inch))
+    
+    # ==================== TABLE OF CONTENTS ====================
+    story.append(Paragraph("TABLE OF CONTENTS", heading1_style))
+    story.append(Spacer(1, 6))
+
+    # Design chapters follow the three fixed ones, numbered by the checks present
+    design_chapters = [(key, title) for key, title in (
+        ('flexural', 'Flexural Design (AISC Chapter F2)'),
+        ('compression', 'Compression Design (AISC Chapter E3)'),
+        ('tension', 'Tension Design (AISC Chapter D2)'),
+        ('interaction', 'Combined Forces (AISC Chapter H1)'),
+    ) if analysis_results and key in analysis_results]
+    chapter = {key: number for number, (key, _) in enumerate(design_chapters, 4)}
+    summary_chapter = 4 + len(design_chapters)
+    
+    toc_data = [
+        ['1.', 'Design Data & Material Properties', ''],
+        ['2.', 'Section Properties', ''],
+        ['3.', 'Section Classification (AISC Table B4.1)', ''],
+        *[[f'{chapter[key]}.', title, ''] for key, title in design_chapters],
+        [f'{summary_chapter}.', 'Design Summary & Conclusion', ''],
+    ]
+    toc_data = [[_cell(r[0]), _cell(r[1]), _cell(r[2])] for r in toc_data]
+    
+    toc_table = Table(toc_data, colWidths=[0.5*inch, page_width - 1.5*inch, 1*inch])
+    toc_table.setStyle(TableStyle([
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+    ]))
+    story.append(toc_table)
+    story.append(Spacer(1, 0.15*inch))
+    
+    # ==================== 1. DESIGN DATA ====================
+    story.append(Paragraph("1. DESIGN DATA & MATERIAL PROPERTIES", heading1_style))
+    story.append(Spacer(1, 8))
+    
+    # Get material properties
+    Fy = safe_scalar(df_mat.loc[material, "Yield Point (ksc)"])
+    Fu = safe_scalar(df_mat.loc[material, "Tensile Strength (ksc)"])
+    E = safe_scalar(df_mat.loc[material, "E"])
+    
+    story.append(Paragraph("<b>1.1 Material Properties</b>", heading2_style))
+    story.append(Paragraph(f"Steel Grade: <b>{material}</b>", body_style))
+    story.append(Spacer(1, 4))
+    
+    mat_table_data = [
+        ['Property', 'Symbol', 'Value', 'Unit'],
+        ['Yield Strength', 'Fy', f'{Fy:.1f}', 'kgf/cm²'],
+        ['Tensile Strength', 'Fu', f'{Fu:.1f}', 'kgf/cm²'],
+        ['Modulus of Elasticity', 'E', f'{E:,.0f}', 'kgf/cm²'],
+        ['Poisson\'s Ratio', 'ν', '0.30', '-'],
+        ['Shear Modulus', 'G', f'{E/(2*1.3):,.0f}', 'kgf/cm²'],
+    ]
+    for r in range(1, len(mat_table_data)):
+        for c in range(4):
+            mat_table_data[r][c] = _cell(mat_table_data[r][c])
+    
+    mat_table = Table(mat_table_data, colWidths=[2.2*inch, 0.9*inch, 1.5*inch, page_width - 4.6*inch])
+    mat_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#607d8b')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('WORDWRAP', (0, 0), (-1, -1), 'CJK'),
+        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#f5f7f8')])
+    ]))
+    story.append(mat_table)
+    story.append(Spacer(1, 10))
+    
+    # Design Parameters
+    story.append(Paragraph("<b>1.2 Design Parameters (Input)</b>", heading2_style))
+    
+    design_table_data = [['Parameter', 'Symbol', 'Value', 'Unit']]
+    
+    if 'Mu' in design_params:
+        design_table_data.append(['Required Moment Strength', 'Mu', f"{design_params['Mu']:.2f}", 't·m'])
+    if 'Pu' in design_params:
+        design_table_data.append(['Required Axial Strength', 'Pu', f"{design_params['Pu']:.2f}", 'tons'])
+    if 'Lb' in design_params:
+        design_table_data.append(['Unbraced Length', 'Lb', f"{design_params['Lb']:.2f}", 'm'])
+    if 'KL' in design_params:
+        design_table_data.append(['Effective Length', 'KL', f"{design_params['KL']:.2f}", 'm'])
+    if 'Cb' in design_params:
+        design_table_data.append(['Moment Gradient Factor', 'Cb', f"{design_params['Cb']:.2f}", '-'])
+    for r in range(1, len(design_table_data)):
+        for c in range(4):
+            design_table_data[r][c] = _cell(design_table_data[r][c])
+    
+    design_table = Table(design_table_data, colWidths=[2.2*inch, 0.9*inch, 1.5*inch, page_width - 4.6*inch])
+    design_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#546e7a')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('WORDWRAP', (0, 0), (-1, -1), 'CJK'),
+        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.HexColor('#90a4ae')),
+    ]))
+    story.append(design_table)
+    
+    # ==================== 2. SECTION PROPERTIES ====================
+    story.append(Paragraph("2. SECTION PROPERTIES", heading1_style))
+    story.append(Spacer(1, 8))
+    
+    story.append(Paragraph(f"<b>Selected Section: {section}</b>", heading2_style))
+    story.append(Spacer(1, 4))
+    
+    # Get all section properties
+    d = safe_scalar(df.loc[section, 'd [mm]'])
+    bf = safe_scalar(df.loc[section, 'bf [mm]'])
+    tf = safe_scalar(df.loc[section, 'tf [mm]'])
+    tw = safe_scalar(df.loc[section, 'tw [mm]'])
+    r = safe_scalar(df.loc[section, 'r [mm]']) if 'r [mm]' in df.columns else 0
+    A = safe_scalar(df.loc[section, 'A [cm2]'])
+    Ix = safe_scalar(df.loc[section, 'Ix [cm4]'])
+    Iy = safe_scalar(df.loc[section, 'Iy [cm4]'])
+    rx = safe_scalar(df.loc[section, 'rx [cm]'])
+    ry = safe_scalar(df.loc[section, 'ry [cm]'])
+    Sx = safe_scalar(df.loc[section, 'Sx [cm3]'])
+    Sy = safe_scalar(df.loc[section, 'Sy [cm3]'])
+    Zx_val = safe_scalar(df.loc[section, 'Zx [cm3]'])
+    Zy_val = safe_scalar(df.loc[section, 'Zy [cm3]'])
+    J = safe_scalar(df.loc[section, 'j [cm4]']) if 'j [cm4]' in df.columns else 1.0
+    ho = safe_scalar(df.loc[section, 'ho [mm]']) if 'ho [mm]' in df.columns else (d - tf)
+    rts = safe_scalar(df.loc[section, 'rts [cm]']) if 'rts [cm]' in df.columns else ry * 1.2
+    
+    weight_col = 'Unit Weight [kg/m]' if 'Unit Weight [kg/m]' in df.columns else 'w [kg/m]'
+    weight = safe_scalar(df.loc[section, weight_col])
+    
+    # Section properties in two columns
+    props_data_1 = [
+        ['Geometric Properties', '', ''],
+        ['Overall Depth', 'd', f'{d:.0f} mm'],
+        ['Flange Width', 'bf', f'{bf:.0f} mm'],
+        ['Flange Thickness', 'tf', f'{tf:.1f} mm'],
+        ['Web Thickness', 'tw', f'{tw:.1f} mm'],
+        ['Fillet Radius', 'r', f'{r:.1f} mm'],
+        ['Unit Weight', 'w', f'{weight:.1f} kg/m'],
+    ]
+    
+    props_data_2 = [
+        ['Section Properties', '', ''],
+        ['Cross-sectional Area', 'A', f'{A:.2f} cm²'],
+        ['Moment of Inertia (x)', 'Ix', f'{Ix:,.0f} cm⁴'],
+        ['Moment of Inertia (y)', 'Iy', f'{Iy:,.0f} cm⁴'],
+        ['Radius of Gyration (x)', 'rx', f'{rx:.2f} cm'],
+        ['Radius of Gyration (y)', 'ry', f'{ry:.2f} cm'],
+        ['Torsional Constant', 'J', f'{J:.2f} cm⁴'],
+    ]
+    
+    props_data_3 = [
+        ['Section Moduli', '', ''],
+        ['Elastic Modulus (x)', 'Sx', f'{Sx:,.1f} cm³'],
+        ['Elastic Modulus (y)', 'Sy', f'{Sy:,.1f} cm³'],
+        ['Plastic Modulus (x)', 'Zx', f'{Zx_val:,.1f} cm³'],
+        ['Plastic Modulus (y)', 'Zy', f'{Zy_val:,.1f} cm³'],
+        ['Distance b/w flanges', 'ho', f'{ho:.1f} mm'],
+        ['Effective radius (LTB)', 'rts', f'{rts:.2f} cm'],
+    ]
+    
+    # Create combined table
+    def create_props_table(data):
+        table = Table(data, colWidths=[2.0*inch, 0.8*inch, 0.5 * page_width - 2.8*inch])
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#455a64')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('SPAN', (0, 0), (-1, 0)),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('WORDWRAP', (0, 0), (-1, -1), 'CJK'),
+            ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.HexColor('#90a4ae')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#fafafa')])
+        ]))
+        return table
+    
+    # Create a combined layout
+    combined_data = [[create_props_table(props_data_1), create_props_table(props_data_2)]]
+    combined_table = Table(combined_data, colWidths=[0.5 * page_width, 0.5 * page_width])
+    combined_table.setStyle(TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 5),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+    ]))
+    story.append(combined_table)
+    story.append(Spacer(1, 8))
+    story.append(create_props_table(props_data_3))
+    
+    # Section visualization removed by request
+
+    # ==================== 3. SECTION CLASSIFICATION ====================
+    story.append(PageBreak())
+    story.append(Paragraph("3. SECTION CLASSIFICATION (AISC Table B4.1)", heading1_style))
+    story.append(Spacer(1, 8))
+    
+    # Get classifications
+    flex_class = classify_section_flexure(df, df_mat, section, material)
+    comp_class = classify_section_compression(df, df_mat, section, material)
+    
+    if flex_class:
+        story.append(Paragraph("<b>3.1 Flexural Member Classification (Table B4.1b)</b>", heading2_style))
+        story.append(Spacer(1, 4))
+        
+        # Flange Classification - Hand Calculation Style
+        story.append(Paragraph("<b>Flange Classification (Case 10: Flanges of I-shaped sections)</b>", body_style))
+        story.append(Paragraph("<i>Reference: AISC 360-16, Table B4.1b</i>", reference_style))
+        story.append(Spacer(1, 4))
+        
+        story.append(Paragraph(
+            f"<font face='Courier'>λf = bf / (2·tf) = {bf:.1f} / (2 × {tf:.1f}) = <b>{flex_class['flange_lambda']:.2f}</b></font>",
+            equation_style
+        ))
+        
+        story.append(Paragraph(
+            f"<font face='Courier'>λpf = 0.38·√(E/Fy) = 0.38 × √({E:,.0f}/{Fy:.1f}) = <b>{flex_class['flange_lambda_p']:.2f}</b></font>",
+            equation_style
+        ))
+        
+        story.append(Paragraph(
+            f"<font face='Courier'>λrf = 1.0·√(E/Fy) = 1.0 × √({E:,.0f}/{Fy:.1f}) = <b>{flex_class['flange_lambda_r']:.2f}</b></font>",
+            equation_style
+        ))
+        
+        # Classification check
+        if flex_class['flange_lambda'] <= flex_class['flange_lambda_p']:
+            check_text = f"λf = {flex_class['flange_lambda']:.2f} ≤ λpf = {flex_class['flange_lambda_p']:.2f}"
+            result_text = "FLANGE: COMPACT ✓"
+            result_color = '#4caf50'
+        elif flex_class['flange_lambda'] <= flex_class['flange_lambda_r']:
+            check_text = f"λpf = {flex_class['flange_lambda_p']:.2f} < λf = {flex_class['flange_lambda']:.2f} ≤ λrf = {flex_class['flange_lambda_r']:.2f}"
+            result_text = "FLANGE: NON-COMPACT"
+            result_color = '#ff9800'
+        else:
+            check_text = f"λf = {flex_class['flange_lambda']:.2f} > λrf = {flex_class['flange_lambda_r']:.2f}"
+            result_text = "FLANGE: SLENDER ✗"
+            result_color = '#f44336'
+        
+        story.append(Paragraph(f"<font face='Courier'>Check: {check_text}</font>", equation_style))
+        story.append(Paragraph(
+            f"<b>{result_text}</b>",
+            ParagraphStyle('FlgResult', parent=result_style, textColor=rl_colors.HexColor(result_color))
+        ))
+        story.append(Spacer(1, 10))
+        
+        # Web Classification - Hand Calculation Style
+        story.append(Paragraph("<b>Web Classification (Case 15: Webs in flexural compression)</b>", body_style))
+        story.append(Paragraph("<i>Reference: AISC 360-16, Table B4.1b</i>", reference_style))
+        story.append(Spacer(1, 4))
+        
+        h_web = ho if 'ho [mm]' in df.columns else (d - 2*tf)
+        story.append(Paragraph(
+            f"<font face='Courier'>λw = h / tw = {h_web:.1f} / {tw:.1f} = <b>{flex_class['web_lambda']:.2f}</b></font>",
+            equation_style
+        ))
+        
+        story.append(Paragraph(
+            f"<font face='Courier'>λpw = 3.76·√(E/Fy) = 3.76 × √({E:,.0f}/{Fy:.1f}) = <b>{flex_class['web_lambda_p']:.2f}</b></font>",
+            equation_style
+        ))
+        
+        story.append(Paragraph(
+            f"<font face='Courier'>λrw = 5.70·√(E/Fy) = 5.70 × √({E:,.0f}/{Fy:.1f}) = <b>{flex_class['web_lambda_r']:.2f}</b></font>",
+            equation_style
+        ))
+        
+        # Web classification check
+        if flex_class['web_lambda'] <= flex_class['web_lambda_p']:
+            check_text = f"λw = {flex_class['web_lambda']:.2f} ≤ λpw = {flex_class['web_lambda_p']:.2f}"
+            result_text = "WEB: COMPACT ✓"
+            result_color = '#4caf50'
+        elif flex_class['web_lambda'] <= flex_class['web_lambda_r']:
+            check_text = f"λpw = {flex_class['web_lambda_p']:.2f} < λw = {flex_class['web_lambda']:.2f} ≤ λrw = {flex_class['web_lambda_r']:.2f}"
+            result_text = "WEB: NON-COMPACT"
+            result_color = '#ff9800'
+        else:
+            check_text = f"λw = {flex_class['web_lambda']:.2f} > λrw = {flex_class['web_lambda_r']:.2f}"
+            result_text = "WEB: SLENDER ✗"
+            result_color = '#f44336'
+        
+        story.append(Paragraph(f"<font face='Courier'>Check: {check_text}</font>", equation_style))
+        story.append(Paragraph(
+            f"<b>{result_text}</b>",
+            ParagraphStyle('WebResult', parent=result_style, textColor=rl_colors.HexColor(result_color))
+        ))
+    
+    # ==================== FLEXURAL DESIGN ====================
+    if analysis_results and 'flexural' in analysis_results:
+        story.append(PageBreak())
+        story.append(Paragraph(f"{chapter['flexural']}. FLEXURAL DESIGN (AISC Chapter F2)", heading1_style))
+        story.append(Spacer(1, 8))
+        
+        flex = analysis_results['flexural']
+        Lb = design_params.get('Lb', 0)
+        Cb = design_params.get('Cb', 1.0)
+        
+        # Step 1: Plastic Moment
+        story.append(Paragraph("<b>Step 1: Calculate Plastic Moment Capacity (Mp)</b>", heading2_style))
+        story.append(Paragraph("<i>Reference: AISC 360-16, Equation F2-1</i>", reference_style))
+        story.append(Spacer(1, 4))
+        
+        Mp_kgcm = Fy * Zx_val
+        Mp_tm = Mp_kgcm / 100000
+
+        story.append(Paragraph(
+            "<font face='Courier'>Mp = Fy × Zx</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Mp = {Fy:.1f} × {Zx_val:,.1f}</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Mp = {Mp_kgcm:,.0f} kgf·cm = <b>{Mp_tm:.2f} t·m</b></font>",
+            equation_style
+        ))
+        story.append(Spacer(1, 8))
+        
+        # Step 2: Limiting Lengths
+        story.append(Paragraph("<b>Step 2: Calculate Limiting Laterally Unbraced Lengths</b>", heading2_style))
+        story.append(Spacer(1, 4))
+        
+        # Lp calculation
+        story.append(Paragraph("<b>Compact Limit Lp (Equation F2-5):</b>", body_style))
+        story.append(Paragraph("<i>Reference: AISC 360-16, Equation F2-5</i>", reference_style))
+        
+        Lp_cm = 1.76 * ry * math.sqrt(E / Fy)
+        story.append(Paragraph(
+            "<font face='Courier'>Lp = 1.76 × ry × √(E/Fy)</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Lp = 1.76 × {ry:.2f} × √({E:,.0f}/{Fy:.1f})</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Lp = {Lp_cm:.1f} cm = <b>{flex['Lp']:.3f} m</b></font>",
+            equation_style
+        ))
+        story.append(Spacer(1, 6))
+        
+        # Lr calculation
+        story.append(Paragraph("<b>Inelastic Limit Lr (Equation F2-6):</b>", body_style))
+        story.append(Paragraph("<i>Reference: AISC 360-16, Equation F2-6</i>", reference_style))
+        
+        story.append(Paragraph(
+            "<font face='Courier'>Lr = 1.95 × rts × (E/0.7Fy) × √(Jc/Sxho) × √(1 + √(1 + 6.76(0.7Fy/E)²(Sxho/Jc)²))</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>where: rts = {rts:.2f} cm, J = {J:.2f} cm⁴, ho = {ho:.1f} mm, c = 1.0</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Lr = <b>{flex['Lr']:.3f} m</b></font>",
+            equation_style
+        ))
+        story.append(Spacer(1, 8))
+        
+        # Step 3: Determine Nominal Moment
+        story.append(Paragraph(f"<b>Step 3: Determine Nominal Moment (Lb = {Lb:.2f} m)</b>", heading2_style))
+        story.append(Spacer(1, 4))
+        
+        if Lb <= flex['Lp']:
+            story.append(Paragraph(
+                f"<font face='Courier'>Lb = {Lb:.2f} m ≤ Lp = {flex['Lp']:.3f} m</font>",
+                equation_style
+            ))
+            story.append(Paragraph("<b>→ YIELDING CONTROLS (F2.1) - LTB does not apply</b>", body_style))
+            story.append(Paragraph("<i>Reference: AISC 360-16, Equation F2-1</i>", reference_style))
+            story.append(Paragraph(
+                f"<font face='Courier'>Mn = Mp = <b>{flex['Mn']:.2f} t·m</b></font>",
+                equation_style
+            ))
+            
+        elif Lb <= flex['Lr']:
+            story.append(Paragraph(
+                f"<font face='Courier'>Lp = {flex['Lp']:.3f} m < Lb = {Lb:.2f} m ≤ Lr = {flex['Lr']:.3f} m</font>",
+                equation_style
+            ))
+            story.append(Paragraph("<b>→ INELASTIC LATERAL-TORSIONAL BUCKLING (F2.2)</b>", body_style))
+            story.append(Paragraph("<i>Reference: AISC 360-16, Equation F2-2</i>", reference_style))
+            
+            Mr = 0.7 * Fy * Sx / 100000
+            story.append(Paragraph(
+                "<font face='Courier'>Mn = Cb × [Mp - (Mp - 0.7FySx) × ((Lb-Lp)/(Lr-Lp))] ≤ Mp</font>",
+                equation_style
+            ))
+            story.append(Paragraph(
+                f"<font face='Courier'>Mn = {Cb:.2f} × [{Mp_tm:.2f} - ({Mp_tm:.2f} - {Mr:.2f}) × (({Lb:.2f}-{flex['Lp']:.3f})/({flex['Lr']:.3f}-{flex['Lp']:.3f}))]</font>",
+                equation_style
+            ))
+            story.append(Paragraph(
+                f"<font face='Courier'>Mn = <b>{flex['Mn']:.2f} t·m</b></font>",
+                equation_style
+            ))
+            
+        else:
+            story.append(Paragraph(
+                f"<font face='Courier'>Lb = {Lb:.2f} m > Lr = {flex['Lr']:.3f} m</font>",
+                equation_style
+            ))
+            story.append(Paragraph("<b>→ ELASTIC LATERAL-TORSIONAL BUCKLING (F2.3)</b>", body_style))
+            story.append(Paragraph("<i>Reference: AISC 360-16, Equations F2-3 and F2-4</i>", reference_style))
+            
+            story.append(Paragraph(
+                "<font face='Courier'>Fcr = (Cb×π²×E)/((Lb/rts)²) × √(1 + 0.078(Jc/Sxho)(Lb/rts)²)</font>",
+                equation_style
+            ))
+            story.append(Paragraph(
+                "<font face='Courier'>Mn = Fcr × Sx ≤ Mp</font>",
+                equation_style
+            ))
+            story.append(Paragraph(
+                f"<font face='Courier'>Mn = <b>{flex['Mn']:.2f} t·m</b></font>",
+                equation_style
+            ))
+        
+        story.append(Spacer(1, 8))
+        
+        # Step 4: Design Strength
+        story.append(Paragraph("<b>Step 4: Calculate Design Flexural Strength</b>", heading2_style))
+        story.append(Paragraph("<i>Reference: AISC 360-16, Section F1</i>", reference_style))
+        story.append(Spacer(1, 4))
+        
+        story.append(Paragraph(
+            "<font face='Courier'>φb = 0.90 (LRFD)</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>φbMn = 0.90 × {flex['Mn']:.2f} = <b>{flex['phi_Mn']:.2f} t·m</b></font>",
+            equation_style
+        ))
+        story.append(Spacer(1, 8))
+        
+        # Step 5: Adequacy Check
+        story.append(Paragraph("<b>Step 5: Adequacy Check</b>", heading2_style))
+        story.append(Spacer(1, 4))
+        
+        Mu = design_params.get('Mu', 0)
+        ratio = flex['ratio']
+        
+        story.append(Paragraph(
+            f"<font face='Courier'>Mu = {Mu:.2f} t·m</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>φbMn = {flex['phi_Mn']:.2f} t·m</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Ratio = Mu / φbMn = {Mu:.2f} / {flex['phi_Mn']:.2f} = <b>{ratio:.3f}</b></font>",
+            equation_style
+        ))
+        
+        if flex['adequate']:
+            story.append(Paragraph(
+                f"<font face='Courier'>Check: {ratio:.3f} ≤ 1.0 → <b>OK ✓</b></font>",
+                equation_style
+            ))
+            story.append(Paragraph("<b>FLEXURAL DESIGN: ADEQUATE ✓</b>", result_style))
+        else:
+            story.append(Paragraph(
+                f"<font face='Courier'>Check: {ratio:.3f} > 1.0 → <b>NG ✗</b></font>",
+                equation_style
+            ))
+            story.append(Paragraph(
+                "<b>FLEXURAL DESIGN: INADEQUATE ✗</b>",
+                ParagraphStyle('FailResult', parent=result_style, 
+                              textColor=rl_colors.HexColor('#c62828'),
+                              backColor=rl_colors.HexColor('#ffebee'),
+                              borderColor=rl_colors.HexColor('#f44336'))
+            ))
+        
+    # ==================== COMPRESSION DESIGN ====================
+    if analysis_results and 'compression' in analysis_results:
+        story.append(PageBreak())
+        story.append(Paragraph(f"{chapter['compression']}. COMPRESSION DESIGN (AISC Chapter E3)", heading1_style))
+        story.append(Spacer(1, 8))
+        
+        comp = analysis_results['compression']
+        KL = design_params.get('KL', 0)
+        
+        # Step 1: Slenderness Ratio
+        story.append(Paragraph("<b>Step 1: Calculate Slenderness Ratio</b>", heading2_style))
+        story.append(Paragraph("<i>Reference: AISC 360-16, Section E2</i>", reference_style))
+        story.append(Spacer(1, 4))
+        
+        KL_cm = KL * 100
+        lambda_x = KL_cm / rx
+        lambda_y = KL_cm / ry
+        lambda_c = max(lambda_x, lambda_y)
+        
+        story.append(Paragraph(
+            f"<font face='Courier'>KL = {KL:.2f} m = {KL_cm:.0f} cm</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>(KL/r)x = {KL_cm:.0f} / {rx:.2f} = <b>{lambda_x:.1f}</b></font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>(KL/r)y = {KL_cm:.0f} / {ry:.2f} = <b>{lambda_y:.1f}</b></font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Governing: (KL/r)max = <b>{lambda_c:.1f}</b> {'(X-axis)' if lambda_x >= lambda_y else '(Y-axis)'}</font>",
+            equation_style
+        ))
+        
+        # Check slenderness limit
+        if lambda_c <= 200:
+            story.append(Paragraph(
+                f"<font face='Courier'>Check: {lambda_c:.1f} ≤ 200 → OK (AISC E2)</font>",
+                equation_style
+            ))
+        else:
+            story.append(Paragraph(
+                f"<font face='Courier'>Check: {lambda_c:.1f} > 200 → Exceeds preferred limit (AISC E2)</font>",
+                equation_style
+            ))
+        story.append(Spacer(1, 8))
+        
+        # Step 2: Elastic Buckling Stress
+        story.append(Paragraph("<b>Step 2: Calculate Elastic Buckling Stress (Fe)</b>", heading2_style))
+        story.append(Paragraph("<i>Reference: AISC 360-16, Equation E3-4</i>", reference_style))
+        story.append(Spacer(1, 4))
+        
+        Fe = (math.pi**2 * E) / (lambda_c**2)
+        
+        story.append(Paragraph(
+            "<font face='Courier'>Fe = π²E / (KL/r)²</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Fe = π² × {E:,.0f} / {lambda_c:.1f}²</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Fe = <b>{Fe:,.1f} kgf/cm²</b></font>",
+            equation_style
+        ))
+        story.append(Spacer(1, 8))
+        
+        # Step 3: Critical Stress
+        story.append(Paragraph("<b>Step 3: Determine Critical Stress (Fcr)</b>", heading2_style))
+        story.append(Spacer(1, 4))
+        
+        lambda_limit = grade_constant_row(df_mat, material)['lambda_e3']
+        
+        story.append(Paragraph(
+            f"<font face='Courier'>Limiting Slenderness = 4.71 × √(E/Fy) = 4.71 × √({E:,.0f}/{Fy:.1f}) = {lambda_limit:.1f}</font>",
+            equation_style
+        ))
+        
+        if lambda_c <= lambda_limit:
+            story.append(Paragraph(
+                f"<font face='Courier'>(KL/r) = {lambda_c:.1f} ≤ {lambda_limit:.1f}</font>",
+                equation_style
+            ))
+            story.append(Paragraph("<b>→ INELASTIC BUCKLING CONTROLS (E3-2)</b>", body_style))
+            story.append(Paragraph("<i>Reference: AISC 360-16, Equation E3-2</i>", reference_style))
+            
+            story.append(Paragraph(
+                "<font face='Courier'>Fcr = [0.658^(Fy/Fe)] × Fy</font>",
+                equation_style
+            ))
+            story.append(Paragraph(
+                f"<font face='Courier'>Fcr = [0.658^({Fy:.1f}/{Fe:.1f})] × {Fy:.1f}</font>",
+                equation_style
+            ))
+        else:
+            story.append(Paragraph(
+                f"<font face='Courier'>(KL/r) = {lambda_c:.1f} > {lambda_limit:.1f}</font>",
+                equation_style
+            ))
+            story.append(Paragraph("<b>→ ELASTIC BUCKLING CONTROLS (E3-3)</b>", body_style))
+            story.append(Paragraph("<i>Reference: AISC 360-16, Equation E3-3</i>", reference_style))
+            
+            story.append(Paragraph(
+                "<font face='Courier'>Fcr = 0.877 × Fe</font>",
+                equation_style
+            ))
+            story.append(Paragraph(
+                f"<font face='Courier'>Fcr = 0.877 × {Fe:.1f}</font>",
+                equation_style
+            ))
+        
+        story.append(Paragraph(
+            f"<font face='Courier'>Fcr = <b>{comp['Fcr']:,.1f} kgf/cm²</b></font>",
+            equation_style
+        ))
+        story.append(Spacer(1, 8))
+        
+        # Step 4: Nominal and Design Strength
+        story.append(Paragraph("<b>Step 4: Calculate Nominal and Design Strength</b>", heading2_style))
+        story.append(Paragraph("<i>Reference: AISC 360-16, Equation E3-1</i>", reference_style))
+        story.append(Spacer(1, 4))
+        
+        story.append(Paragraph(
+            "<font face='Courier'>Pn = Fcr × Ag</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Pn = {comp['Fcr']:,.1f} × {A:.2f} = {comp['Fcr']*A:,.0f} kgf = <b>{comp['Pn']:.2f} tons</b></font>",
+            equation_style
+        ))
+        story.append(Spacer(1, 4))
+        
+        story.append(Paragraph(
+            "<font face='Courier'>φc = 0.90 (LRFD)</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>φcPn = 0.90 × {comp['Pn']:.2f} = <b>{comp['phi_Pn']:.2f} tons</b></font>",
+            equation_style
+        ))
+        story.append(Spacer(1, 8))
+        
+        # Step 5: Adequacy Check
+        story.append(Paragraph("<b>Step 5: Adequacy Check</b>", heading2_style))
+        story.append(Spacer(1, 4))
+        
+        Pu = design_params.get('Pu', 0)
+        ratio = comp['ratio']
+        
+        story.append(Paragraph(
+            f"<font face='Courier'>Pu = {Pu:.2f} tons</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>φcPn = {comp['phi_Pn']:.2f} tons</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Ratio = Pu / φcPn = {Pu:.2f} / {comp['phi_Pn']:.2f} = <b>{ratio:.3f}</b></font>",
+            equation_style
+        ))
+        
+        if comp['adequate']:
+            story.append(Paragraph(
+                f"<font face='Courier'>Check: {ratio:.3f} ≤ 1.0 → <b>OK ✓</b></font>",
+                equation_style
+            ))
+            story.append(Paragraph("<b>COMPRESSION DESIGN: ADEQUATE ✓</b>", result_style))
+        else:
+            story.append(Paragraph(
+                f"<font face='Courier'>Check: {ratio:.3f} > 1.0 → <b>NG ✗</b></font>",
+                equation_style
+            ))
+            story.append(Paragraph(
+                "<b>COMPRESSION DESIGN: INADEQUATE ✗</b>",
+                ParagraphStyle('FailResult', parent=result_style, 
+                              textColor=rl_colors.HexColor('#c62828'),
+                              backColor=rl_colors.HexColor('#ffebee'),
+                              borderColor=rl_colors.HexColor('#f44336'))
+            ))
+        
+    # ==================== TENSION DESIGN ====================
+    if analysis_results and 'tension' in analysis_results:
+        story.append(PageBreak())
+        story.append(Paragraph(f"{chapter['tension']}. TENSION DESIGN (AISC Chapter D2)", heading1_style))
+        story.append(Spacer(1, 8))
+
+        tension = analysis_results['tension']
+
+        story.append(Paragraph("<b>Step 1: Tensile Yielding in the Gross Section</b>", heading2_style))
+        story.append(Paragraph("<i>Reference: AISC 360-16, Equation D2-1</i>", reference_style))
+        story.append(Spacer(1, 4))
+        story.append(Paragraph(
+            "<font face='Courier'>φtPn = 0.90 × Fy × Ag</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>φtPn = 0.90 × {Fy:.0f} × {A:.2f} / 1000 = <b>{tension['phi_Pn']:.2f} tons</b></font>",
+            equation_style
+        ))
+        story.append(Spacer(1, 8))
+
+        story.append(Paragraph("<b>Step 2: Adequacy Check</b>", heading2_style))
+        story.append(Spacer(1, 4))
+        story.append(Paragraph(
+            f"<font face='Courier'>Tu = |Pu| = {tension['Tu']:.2f} tons</font>",
+            equation_style
+        ))
+        story.append(Paragraph(
+            f"<font face='Courier'>Ratio = Tu / φtPn = {tension['Tu']:.2f} / {tension['phi_Pn']:.2f} = "
+            f"<b>{tension['ratio']:.3f}</b></font>",
+            equation_style
+        ))
+        if tension['adequate']:
+            story.append(Paragraph("<b>TENSION DESIGN: ADEQUATE ✓</b>", result_style))
+        else:
+            story.append(Paragraph(
+                "<b>TENSION DESIGN: INADEQUATE ✗</b>",
+                ParagraphStyle('FailResult', parent=result_style,
+                              textColor=rl_colors.HexColor('#c62828'),
+                              backColor=rl_colors.HexColor('#ffebee'),
+                              borderColor=rl_colors.HexColor('#f44336'))
+            ))
+
+    # ==================== COMBINED FORCES ====================
+    if analysis_results and 'interaction' in analysis_results:
+        story.append(PageBreak())
+        story.append(Paragraph(f"{chapter['interaction']}. COMBINED FORCES (AISC Chapter H1)", heading1_style))
+        story.append(Spacer(1, 8))
+
+        interaction = analysis_results['interaction']
+        axial, moment = interaction['axial_ratio'], interaction['moment_ratio']
+
+        if interaction['equation'] == "H1-1a":
+            story.append(Paragraph("<i>Reference: AISC 360-16, Equation H1-1a (Pr/Pc ≥ 0.2)</i>", reference_style))
+            expression = "Pr/Pc + 8/9 × Mr/Mc"
+            values = f"{axial:.3f} + 8/9 × {moment:.3f}"
+        elif interaction['equation'] == "H1-1b":
+            story.append(Paragraph("<i>Reference: AISC 360-16, Equation H1-1b (Pr/Pc &lt; 0.2)</i>", reference_style))
+            expression = "Pr/(2Pc) + Mr/Mc"
+            values = f"{axial:.3f} / 2 + {moment:.3f}"
+        else:
+            story.append(Paragraph("<i>Axial tension with flexure, linear interaction</i>", reference_style))
+            expression = "Tu/φtPn + Mu/φbMn"
+            values = f"{axial:.3f} + {moment:.3f}"
+        story.append(Spacer(1, 4))
+        story.append(Paragraph(f"<font face='Courier'>Ratio = {expression}</font>", equation_style))
+        story.append(Paragraph(
+            f"<font face='Courier'>Ratio = {values} = <b>{interaction['ratio']:.3f}</b></font>",
+            equation_style
+        ))
+        if interaction['adequate']:
+            story.append(Paragraph("<b>COMBINED FORCES: ADEQUATE ✓</b>", result_style))
+        else:
+            story.append(Paragraph(
+                "<b>COMBINED FORCES: INADEQUATE ✗</b>",
+                ParagraphStyle('FailResult', parent=result_style,
+                              textColor=rl_colors.HexColor('#c62828'),
+                              backColor=rl_colors.HexColor('#ffebee'),
+                              borderColor=rl_colors.HexColor('#f44336'))
+            ))
+
+    # ==================== DESIGN SUMMARY ====================
+    story.append(PageBreak())
+    story.append(Paragraph(f"{summary_chapter}. DESIGN SUMMARY & CONCLUSION", heading1_style))
+    story.append(Spacer(1, 10))
+    
+    # Summary Table
+    summary_data = [
+        ['CHECK', 'CAPACITY', 'DEMAND', 'RATIO', 'STATUS'],
+    ]
+    
+    if 'flexural' in analysis_results:
+        flex = analysis_results['flexural']
+        Mu = design_params.get('Mu', 0)
+        status = '✓ PASS' if flex['adequate'] else '✗ FAIL'
+        summary_data.append(['Flexural (φbMn)', f"{flex['phi_Mn']:.2f} t·m", 
+                           f"{Mu:.2f} t·m", f"{flex['ratio']:.3f}", status])
+    
+    if 'compression' in analysis_results:
+        comp = analysis_results['compression']
+        Pu = design_params.get('Pu', 0)
+        status = '✓ PASS' if comp['adequate'] else '✗ FAIL'
+        summary_data.append(['Compression (φcPn)', f"{comp['phi_Pn']:.2f} tons",
+                           f"{Pu:.2f} tons", f"{comp['ratio']:.3f}", status])
+
+    if 'tension' in analysis_results:
+        tension = analysis_results['tension']
+        status = '✓ PASS' if tension['adequate'] else '✗ FAIL'
+        summary_data.append(['Tension (φtPn)', f"{tension['phi_Pn']:.2f} tons",
+                           f"{tension['Tu']:.2f} tons", f"{tension['ratio']:.3f}", status])
+
+    if 'interaction' in analysis_results:
+        interaction = analysis_results['interaction']
+        status = '✓ PASS' if interaction['adequate'] else '✗ FAIL'
+        equation = interaction['equation'] if interaction['equation'].startswith('H1') else 'linear'
+        summary_data.append([f"Interaction ({equation})", '-', '-',
+                           f"{interaction['ratio']:.3f}", status])
+    
+    summary_table = Table(summary_data, colWidths=[1.6*inch, 1.3*inch, 1.2*inch, 0.9*inch, 1*inch])
+    summary_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#1a237e')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, rl_colors.HexColor('#1a237e')),
+    ]))
+    
+    # Color code status column
+    for i, row in enumerate(summary_data[1:], start=1):
+        if '✓' in row[-1]:
+            summary_table.setStyle(TableStyle([
+                ('BACKGROUND', (-1, i), (-1, i), rl_colors.HexColor('#c8e6c9')),
+                ('TEXTCOLOR', (-1, i), (-1, i), rl_colors.HexColor('#2e7d32')),
+                ('FONTNAME', (-1, i), (-1, i), 'Helvetica-Bold'),
+            ]))
+        else:
+            summary_table.setStyle(TableStyle([
+                ('BACKGROUND', (-1, i), (-1, i), rl_colors.HexColor('#ffcdd2')),
+                ('TEXTCOLOR', (-1, i), (-1, i), rl_colors.HexColor('#c62828')),
+                ('FONTNAME', (-1, i), (-1, i), 'Helvetica-Bold'),
+            ]))
+    
+    story.append(summary_table)
+    story.append(Spacer(1, 0.2*inch))
+    
+    # Overall Conclusion
+    overall_adequate = True
+    for key in ('flexural', 'compression', 'tension', 'interaction'):
+        if key in analysis_results:
+            overall_adequate = overall_adequate and analysis_results[key]['adequate']
+    
+    if overall_adequate:
+        conclusion_style = ParagraphStyle(
+            'Conclusion',
+            parent=result_style,
+            fontSize=14,
+            textColor=rl_colors.HexColor('#1b5e20'),
+            backColor=rl_colors.HexColor('#c8e6c9'),
+            borderColor=rl_colors.HexColor('#4caf50'),
+            borderWidth=3
+        )
+        story.append(Paragraph(
+            f"<b>CONCLUSION: SECTION {section} IS ADEQUATE FOR THE DESIGN LOADS ✓</b>",
+            conclusion_style
+        ))
+    else:
+        conclusion_style = ParagraphStyle(
+            'Conclusion',
+            parent=result_style,
+            fontSize=14,
+            textColor=rl_colors.HexColor('#b71c1c'),
+            backColor=rl_colors.HexColor('#ffcdd2'),
+            borderColor=rl_colors.HexColor('#f44336'),
+            borderWidth=3
+        )
+        story.append(Paragraph(
+            f"<b>CONCLUSION: SECTION {section} IS INADEQUATE - REVISE DESIGN ✗</b>",
+            conclusion_style
+        ))
+    
+    # Signature Block
+    story.append(Spacer(1, 0.5*inch))
+    
+    sig_data = [
+        ['PREPARED BY:', '', 'CHECKED BY:', ''],
+        ['', '', '', ''],
+        ['', '', '', ''],
+        [f"Name: {project_info.get('designer', '_______________')}", '',
+         f"Name: {project_info.get('checker', '_______________')}", ''],
+        ['Date: _____________', '', 'Date: _____________', ''],
+        ['Signature: _____________', '', 'Signature: _____________', ''],
+    ]
+    
+    sig_table = Table(sig_data, colWidths=[2*inch, 0.7*inch, 2*inch, 0.7*inch])
+    sig_table.setStyle(TableStyle([
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ]))
+    story.append(sig_table)
+    return story
+
+def generate_pdf_report(df, df_mat, section, material, analysis_results, design_params):
+    """Generate PDF report with perfect formatting - NO OVERLAP"""
+    if not PDF_AVAILABLE:
+        return None
+
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import (Table, TableStyle, Paragraph, Spacer, PageBreak,
+                                    PageTemplate, Frame, BaseDocTemplate, KeepTogether)
+    from reportlab.lib import colors as rl_colors
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+    EquationBox, NumberedCanvas = get_pdf_flowables()
+    
+    buffer = BytesIO()
+    
+    # Create document with proper margins
+    doc = BaseDocTemplate(
+        buffer, 
+        pagesize=letter,
+        rightMargin=0.75*inch, 
+        leftMargin=0.75*inch,
+        topMargin=1.1*inch,  # Increased for header
+        bottomMargin=0.9*inch,  # Increased for footer
+        title="AISC 360-16 Steel Design Report"
+    )
+    
+    # Define frame for content with proper margins
+    frame = Frame(
+        doc.leftMargin, 
+        doc.bottomMargin, 
+        doc.width, 
+        doc.height - 0.3*inch,  # Account for header/footer space
+        id='normal',
+        topPadding=12,
+        bottomPadding=12
+    )
+    template = PageTemplate(id='main', frames=frame, onPage=lambda c, d: None)
+    doc.addPageTemplates([template])
+    
+    story = []
+    styles = getSampleStyleSheet()
+    
+    # ==================== ENHANCED CUSTOM STYLES - NO OVERLAP ====================
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=20,
+        textColor=rl_colors.HexColor('#667eea'),
+        spaceAfter=18,
+        spaceBefore=6,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold',
+        leading=24
+    )
+    
+    heading1_style = ParagraphStyle(
+        'CustomHeading1',
+        parent=styles['Heading1'],
+        fontSize=14,
+        textColor=rl_colors.HexColor('#2c3e50'),
+        spaceAfter=10,
+        spaceBefore=16,
+        fontName='Helvetica-Bold',
+        borderWidth=0,  # Remove border to prevent overlap
+        backColor=rl_colors.HexColor('#f0f3ff'),
+        borderPadding=6,
+        leftIndent=0,
+        rightIndent=0,
+        keepWithNext=True,
+        leading=18
+    )
+    
+    heading2_style = ParagraphStyle(
+        'CustomHeading2',
+        parent=styles['Heading2'],
+        fontSize=12,
+        textColor=rl_colors.HexColor('#34495e'),
+        spaceAfter=8,
+        spaceBefore=12,
+        fontName='Helvetica-Bold',
+        keepWithNext=True,
+        leading=16
+    )
+    
+    body_style = ParagraphStyle(
+        'CustomBody',
+        parent=styles['Normal'],
+        fontSize=9,
+        leading=13,
+        spaceAfter=4,
+        spaceBefore=2,
+        alignment=TA_LEFT,
+        wordWrap='CJK'  # Better word wrapping
+    )
+    
+    # Improved equation style - no overlap
+    equation_style = ParagraphStyle(
+        'EquationStyle',
+        parent=styles['Code'],
+        fontSize=9,
+        textColor=rl_colors.HexColor('#1565C0'),
+        backColor=rl_colors.HexColor('#E7F3FF'),
+        borderWidth=1,
+        borderColor=rl_colors.HexColor('#2196F3'),
+        borderPadding=8,
+        leftIndent=12,
+        rightIndent=12,
+        spaceAfter=8,
+        spaceBefore=8,
+        fontName='Courier',
+        leading=12,
+        borderRadius=5
+    )
+    
+    # ==================== TITLE PAGE ====================
+    story.append(Spacer(1, 0.3*inch))
+    story.append(Paragraph("AISC 360-16 STEEL DESIGN", title_style))
+    story.append(Paragraph("COMPREHENSIVE CALCULATION REPORT", title_style))
+    story.append(Spacer(1, 0.4*inch))
+    
+    # Report Info with proper table
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    header_data = [
+        ['Report Generated:', timestamp],
+        ['Section:', section],
+        ['Material Grade:', material],
+        ['Analysis Type:', 'Comprehensive Design Evaluation']
+    ]
+    
+    header_table = Table(header_data, colWidths=[2.3*inch, 4.2*inch])
+    header_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), rl_colors.HexColor('#667eea')),
+        ('TEXTCOLOR', (0, 0), (0, -1), rl_colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, rl_colors.grey),
+        ('ROWBACKGROUNDS', (0, 0), (-1, -1), [rl_colors.HexColor('#f5f5f5'), rl_colors.white])
+    ]))
+    story.append(KeepTogether(header_table))
+    story.append(Spacer(1, 0.25*inch))
+    
+    # Get material properties
+    Fy = safe_scalar(df_mat.loc[material, "Yield Point (ksc)"])
+    Fu = safe_scalar(df_mat.loc[material, "Tensile Strength (ksc)"])
+    E = safe_scalar(df_mat.loc[material, "E"])
+    
+    # ==================== MATERIAL PROPERTIES ====================
+    story.append(Paragraph("1. MATERIAL PROPERTIES", heading1_style))
+    story.append(Spacer(1, 6))
+    
+    mat_data = [
+        ['Property', 'Value', 'Unit', 'Description'],
+        ['Fy', f'{Fy:.1f}', 'kgf/cm²', 'Yield Strength'],
+        ['Fu', f'{Fu:.1f}', 'kgf/cm²', 'Tensile Strength'],
+        ['E', f'{E:.0f}', 'kgf/cm²', 'Modulus of Elasticity']
+    ]
+    
+    mat_table = Table(mat_data, colWidths=[1.3*inch, 1.2*inch, 1.3*inch, 2.7*inch])
+    mat_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#667eea')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#f9f9f9')])
+    ]))
+    story.append(KeepTogether(mat_table))
+    story.append(Spacer(1, 0.2*inch))
+    
+    # ==================== SECTION PROPERTIES ====================
+    story.append(PageBreak())
+    story.append(Paragraph("2. SECTION PROPERTIES", heading1_style))
+    story.append(Spacer(1, 6))
+    
+    # Build properties table with proper column widths
+    props_data = [['Property', 'Symbol', 'Value', 'Unit']]
+    
+    property_list = [
+        ('d [mm]', 'd', 'mm'),
+        ('bf [mm]', 'bf', 'mm'),
+        ('tw [mm]', 'tw', 'mm'),
+        ('tf [mm]', 'tf', 'mm'),
+        ('A [cm2]', 'A', 'cm²'),
+        ('Ix [cm4]', 'Ix', 'cm⁴'),
+        ('Iy [cm4]', 'Iy', 'cm⁴'),
+        ('rx [cm]', 'rx', 'cm'),
+        ('ry [cm]', 'ry', 'cm'),
+        ('Sx [cm3]', 'Sx', 'cm³'),
+        ('Sy [cm3]', 'Sy', 'cm³'),
+        ('Zx [cm3]', 'Zx', 'cm³'),
+        ('Zy [cm3]', 'Zy', 'cm³'),
+    ]
+    
+    weight_col = 'Unit Weight [kg/m]' if 'Unit Weight [kg/m]' in df.columns else 'w [kg/m]'
+    
+    for prop_key, symbol, unit in property_list:
+        if prop_key in df.columns:
+            value = safe_scalar(df.loc[section, prop_key])
+            description = prop_key.split('[')[0].strip()
+            formatted_value = f'{value:.2f}' if value < 1000 else f'{value:.1f}'
+            props_data.append([description, symbol, formatted_value, unit])
+    
+    # Create table with word wrap
+    props_table = Table(props_data, colWidths=[2.2*inch, 0.9*inch, 1.4*inch, 1*inch])
+    props_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#667eea')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#f9f9f9')]),
+        ('WORDWRAP', (0, 0), (-1, -1), True)
+    ]))
+    story.append(KeepTogether(props_table))
+    story.append(Spacer(1, 0.15*inch))
+    
+    # Add slenderness ratios
+    bf = safe_scalar(df.loc[section, 'bf [mm]'])
+    tf = safe_scalar(df.loc[section, 'tf [mm]'])
+    d = safe_scalar(df.loc[section, 'd [mm]'])
+    tw = safe_scalar(df.loc[section, 'tw [mm]'])
+    h = safe_scalar(df.loc[section, 'ho [mm]']) if 'ho [mm]' in df.columns else (d - 2*tf)
+    
+    slender_data = [
+        ['Parameter', 'Value'],
+        ['Flange Slenderness (bf/2tf)', f'{(bf/2.0)/tf:.2f}'],
+        ['Web Slenderness (h/tw)', f'{h/tw:.2f}']
+    ]
+    
+    slender_table = Table(slender_data, colWidths=[3.5*inch, 2*inch])
+    slender_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#2196f3')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
+    ]))
+    story.append(KeepTogether(slender_table))
+    story.append(Spacer(1, 0.15*inch))
+    story.append(section_drawing(d, bf, tf, tw, section))
+    
+    # ==================== SECTION CLASSIFICATION ====================
+    story.append(PageBreak())
+    story.append(Paragraph("3. SECTION CLASSIFICATION", heading1_style))
+    story.append(Spacer(1, 8))
+    
+    flex_class = classify_section_flexure(df, df_mat, section, material)
+    comp_class = classify_section_compression(df, df_mat, section, material)
+    
+    if flex_class:
+        story.append(Paragraph("3.1 Flexural Classification (AISC Table B4.1b)", heading2_style))
+        story.append(Spacer(1, 6))
+        
+        # Flange - Use equation box for formulas
+        story.append(Paragraph("<b>Flange (Case 10: I-shaped sections)</b>", body_style))
+        story.append(Spacer(1, 4))
+        
+        # Use custom equation box instead of paragraph
+        eq_text = f"λp = 0.38√(E/Fy) = 0.38√({E:.0f}/{Fy:.1f}) = {flex_class['flange_lambda_p']:.2f}"
+        story.append(EquationBox(eq_text, doc.width))
+        story.append(Spacer(1, 4))
+        
+        eq_text = f"λr = 1.0√(E/Fy) = 1.0√({E:.0f}/{Fy:.1f}) = {flex_class['flange_lambda_r']:.2f}"
+        story.append(EquationBox(eq_text, doc.width))
+        story.append(Spacer(1, 6))
+        
+        story.append(Paragraph(
+            f"<b>Actual λ = (bf/2)/tf = {flex_class['flange_lambda']:.2f}</b>",
+            body_style
+        ))
+        story.append(Paragraph(
+            f"<b>Classification: {flex_class['flange_class']}</b>",
+            body_style
+        ))
+        story.append(Spacer(1, 12))
+        
+        # Web
+        story.append(Paragraph("<b>Web (Case 15: Webs in flexure)</b>", body_style))
+        story.append(Spacer(1, 4))
+        
+        eq_text = f"λpw = 3.76√(E/Fy) = {flex_class['web_lambda_p']:.2f}"
+        story.append(EquationBox(eq_text, doc.width))
+        story.append(Spacer(1, 4))
+        
+        eq_text = f"λrw = 5.70√(E/Fy) = {flex_class['web_lambda_r']:.2f}"
+        story.append(EquationBox(eq_text, doc.width))
+        story.append(Spacer(1, 6))
+        
+        story.append(Paragraph(
+            f"<b>Actual λ = h/tw = {flex_class['web_lambda']:.2f}</b>",
+            body_style
+        ))
+        story.append(Paragraph(
+            f"<b>Classification: {flex_class['web_class']}</b>",
+            body_style
+        ))
+        story.append(Spacer(1, 0.15*inch))
+    
+    if comp_class:
+        story.append(Paragraph("3.2 Compression Classification (AISC Table B4.1a)", heading2_style))
+        story.append(Spacer(1, 6))
+        
+        comp_summary = [
+            ['Element', 'λ', 'λr', 'Status'],
+            ['Flange', f'{comp_class["flange_lambda"]:.2f}', 
+             f'{comp_class["flange_lambda_r"]:.2f}', 
+             'Slender' if comp_class['flange_slender'] else 'Non-slender'],
+            ['Web', f'{comp_class["web_lambda"]:.2f}',
+             f'{comp_class["web_lambda_r"]:.2f}',
+             'Slender' if comp_class['web_slender'] else 'Non-slender'],
+        ]
+        
+        comp_table = Table(comp_summary, colWidths=[1.5*inch, 1.3*inch, 1.3*inch, 1.4*inch])
+        comp_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#667eea')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
+        ]))
+        story.append(KeepTogether(comp_table))
+        
+        story.append(Spacer(1, 8))
+        story.append(Paragraph(
+            f"<b>Overall: {comp_class['overall_class']}</b>",
+            body_style
+        ))
+    
+    # ==================== DESIGN ANALYSIS ====================
+    if analysis_results:
+        story.append(PageBreak())
+        story.append(Paragraph("4. DESIGN ANALYSIS", heading1_style))
+        story.append(Spacer(1, 10))
+        
+        # FLEXURAL ANALYSIS
+        if 'flexural' in analysis_results:
+            story.append(Paragraph("4.1 Flexural Design (AISC Chapter F2)", heading2_style))
+            story.append(Spacer(1, 6))
+            
+            flex = analysis_results['flexural']
+            Lb = design_params.get('Lb', 0)
+            Cb = design_params.get('Cb', 1.0)
+            
+            Sx = safe_scalar(df.loc[section, "Sx [cm3]"])
+            Zx = safe_scalar(df.loc[section, 'Zx [cm3]'])
+            ry = safe_scalar(df.loc[section, 'ry [cm]'])
+            
+            # Step 1
+            story.append(Paragraph("<b>Step 1: Plastic Moment</b>", body_style))
+            story.append(Spacer(1, 4))
+            
+            eq_text = f"Mp = Fy × Zx = {Fy:.1f} × {Zx:.2f} = {flex['Mp']:.2f} t·m"
+            story.append(EquationBox(eq_text, doc.width))
+            story.append(Spacer(1, 10))
+            
+            # Step 2
+            story.append(Paragraph("<b>Step 2: Limiting Lengths</b>", body_style))
+            story.append(Spacer(1, 4))
+            
+            eq_text = f"Lp = 1.76 × ry × √(E/Fy) = 1.76 × {ry:.2f} × √({E:.0f}/{Fy:.1f}) = {flex['Lp']:.3f} m"
+            story.append(EquationBox(eq_text, doc.width))
+            story.append(Spacer(1, 4))
+            
+            eq_text = f"Lr = {flex['Lr']:.3f} m (AISC Eq. F2-6)"
+            story.append(EquationBox(eq_text, doc.width))
+            story.append(Spacer(1, 10))
+            
+            # Step 3
+            story.append(Paragraph(f"<b>Step 3: Nominal Moment (Lb = {Lb:.2f} m)</b>", body_style))
+            story.append(Spacer(1, 4))
+            
+            if Lb <= flex['Lp']:
+                story.append(Paragraph(
+                    f"Lb ({Lb:.2f}m) ≤ Lp ({flex['Lp']:.3f}m) → <b>Yielding (F2.1)</b>",
+                    body_style
+                ))
+                eq_text = f"Mn = Mp = {flex['Mn']:.2f} t·m"
+            elif Lb <= flex['Lr']:
+                story.append(Paragraph(
+                    f"Lp < Lb ({Lb:.2f}m) ≤ Lr → <b>Inelastic LTB (F2.2)</b>",
+                    body_style
+                ))
+                eq_text = f"Mn = Cb[Mp - ...] = {flex['Mn']:.2f} t·m"
+            else:
+                story.append(Paragraph(
+                    f"Lb ({Lb:.2f}m) > Lr → <b>Elastic LTB (F2.3)</b>",
+                    body_style
+                ))
+                eq_text = f"Mn = Fcr × Sx = {flex['Mn']:.2f} t·m"
+            
+            story.append(Spacer(1, 4))
+            story.append(EquationBox(eq_text, doc.width))
+            story.append(Spacer(1, 10))
+            
+            # Step 4
+            story.append(Paragraph("<b>Step 4: Design Strength</b>", body_style))
+            story.append(Spacer(1, 4))
+            
+            eq_text = f"φMn = 0.90 × {flex['Mn']:.2f} = {flex['phi_Mn']:.2f} t·m"
+            story.append(EquationBox(eq_text, doc.width))
+            story.append(Spacer(1, 12))
+            
+            # Summary table
+            flex_summary = [
+                ['Parameter', 'Value'],
+                ['Design Capacity (φMn)', f"{flex['phi_Mn']:.2f} t·m"],
+                ['Nominal Moment (Mn)', f"{flex['Mn']:.2f} t·m"],
+                ['Plastic Moment (Mp)', f"{flex['Mp']:.2f} t·m"],
+                ['Design Case', flex['case']],
+                ['Design Zone', flex['zone']],
+                ['Utilization', f"{flex['ratio']:.3f}"],
+                ['Status', '✓ ADEQUATE' if flex['adequate'] else '✗ INADEQUATE']
+            ]
+            
+            flex_table = Table(flex_summary, colWidths=[3*inch, 2.5*inch])
+            flex_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#4caf50')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
+                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+                ('TOPPADDING', (0, 0), (-1, -1), 8),
+                ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
+            ]))
+            story.append(KeepTogether(flex_table))
+            
+            # Add chart
+            story.append(Spacer(1, 0.15*inch))
+            story.append(Paragraph("<b>Flexural Capacity Curve:</b>", body_style))
+            story.append(Spacer(1, 6))
+            
+            Lb_points, phi_Mn_points = flexural_capacity_curve(df, df_mat, section, material, Cb)
+            story.append(flexural_capacity_drawing(Lb_points, phi_Mn_points, flex['Lp'], flex['Lr'],
+                                                   (Lb, flex['phi_Mn']), title=f'Flexural Capacity - {section}'))
+        
+        # COMPRESSION ANALYSIS
+        if 'compression' in analysis_results:
+            story.append(PageBreak())
+            story.append(Paragraph("4.2 Compression Design (AISC Chapter E3)", heading2_style))
+            story.append(Spacer(1, 6))
+            
+            comp = analysis_results['compression']
+            KL = design_params.get('KL', 0)
+            
+            Ag = safe_scalar(df.loc[section, 'A [cm2]'])
+            rx = safe_scalar(df.loc[section, 'rx [cm]'])
+            ry = safe_scalar(df.loc[section, 'ry [cm]'])
+            
+            # Step 1
+            story.append(Paragraph("<b>Step 1: Slenderness Ratio</b>", body_style))
+            story.append(Spacer(1, 4))
+            
+            KL_cm = KL * 100
+            lambda_x = KL_cm / rx
+            lambda_y = KL_cm / ry
+            lambda_c = max(lambda_x, lambda_y)
+            
+            eq_text = f"λc = max(KL/rx, KL/ry) = max({lambda_x:.1f}, {lambda_y:.1f}) = {lambda_c:.1f}"
+            story.append(EquationBox(eq_text, doc.width))
+            story.append(Spacer(1, 10))
+            
+            # Step 2
+            story.append(Paragraph("<b>Step 2: Elastic Buckling Stress</b>", body_style))
+            story.append(Spacer(1, 4))
+            
+            Fe = (math.pi**2 * E) / (lambda_c**2)
+            eq_text = f"Fe = π²E/(λc)² = π² × {E:.0f} / {lambda_c:.1f}² = {Fe:.1f} kgf/cm²"
+            story.append(EquationBox(eq_text, doc.width))
+            story.append(Spacer(1, 10))
+            
+            # Step 3
+            story.append(Paragraph("<b>Step 3: Critical Stress</b>", body_style))
+            story.append(Spacer(1, 4))
+            
+            lambda_limit = grade_constant_row(df_mat, material)['lambda_e3']
+            
+            if lambda_c <= lambda_limit:
+                story.append(Paragraph(
+                    f"λc ({lambda_c:.1f}) ≤ {lambda_limit:.1f} → <b>Inelastic (E3-2)</b>",
+                    body_style
+                ))
+                exponent = Fy / Fe
+                Fcr = (0.658 ** exponent) * Fy
+                eq_text = f"Fcr = [0.658^(Fy/Fe)] × Fy = {Fcr:.1f} kgf/cm²"
+            else:
+                story.append(Paragraph(
+                    f"λc ({lambda_c:.1f}) > {lambda_limit:.1f} → <b>Elastic (E3-3)</b>",
+                    body_style
+                ))
+                Fcr = 0.877 * Fe
+                eq_text = f"Fcr = 0.877 × Fe = {Fcr:.1f} kgf/cm²"
+            
+            story.append(Spacer(1, 4))
+            story.append(EquationBox(eq_text, doc.width))
+            story.append(Spacer(1, 10))
+            
+            # Step 4
+            story.append(Paragraph("<b>Step 4: Design Strength</b>", body_style))
+            story.append(Spacer(1, 4))
+            
+            Pn = Fcr * Ag / 1000
+            eq_text = f"Pn = Fcr × Ag = {Fcr:.1f} × {Ag:.2f} / 1000 = {Pn:.2f} tons"
+            story.append(EquationBox(eq_text, doc.width))
+            story.append(Spacer(1, 4))
+            
+            eq_text = f"φPn = 0.90 × {Pn:.2f} = {comp['phi_Pn']:.2f} tons"
+            story.append(EquationBox(eq_text, doc.width))
+            story.append(Spacer(1, 12))
+            
+            # Summary table
+            comp_summary = [
+                ['Parameter', 'Value'],
+                ['Design Strength (φPn)', f"{comp['phi_Pn']:.2f} tons"],
+                ['Nominal Strength (Pn)', f"{comp['Pn']:.2f} tons"],
+                ['Critical Stress (Fcr)', f"{comp['Fcr']:.1f} kgf/cm²"],
+                ['Slenderness (λc)', f"{comp['lambda_c']:.1f}"],
+                ['Buckling Mode', comp['mode']],
+                ['Utilization', f"{comp['ratio']:.3f}"],
+                ['Status', '✓ ADEQUATE' if comp['adequate'] else '✗ INADEQUATE']
+            ]
+            
+            comp_table = Table(comp_summary, colWidths=[3*inch, 2.5*inch])
+            comp_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#2196f3')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
+                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+                ('TOPPADDING', (0, 0), (-1, -1), 8),
+                ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.grey),
+            ]))
+            story.append(KeepTogether(comp_table))
+            
+            # Add chart
+            story.append(Spacer(1, 0.15*inch))
+            story.append(Paragraph("<b>Column Capacity Curve:</b>", body_style))
+            story.append(Spacer(1, 6))
+            
+            lambda_points, phi_Pn_points = compression_capacity_curve(E, Fy, Ag, lambda_limit)
+            story.append(compression_capacity_drawing(lambda_points, phi_Pn_points, lambda_limit,
+                                                      (comp['lambda_c'], comp['phi_Pn']), design_params.get('Pu', 0),
+                                                      title=f'Column Capacity - {section}'))
+        
+        # COMBINED FORCES
+        if 'flexural' in analysis_results and 'compression' in analysis_results:
+            flex = analysis_results['flexural']
+            comp = analysis_results['compression']
+            Mu = design_params.get('Mu', 0)
+            Pu = design_params.get('Pu', 0)
+            
+            story.append(Spacer(1, 0.2*inch))
+            story.append(Paragraph("4.3 Combined Forces (AISC H1)", heading2_style))
+            story.append(Spacer(1, 6))
+            
+            if comp['phi_Pn'] > 0 and flex['phi_Mn'] > 0:
+                # H1-1a/H1-1b about the strong axis (Mry = 0)
+                Pr_Pc = abs(Pu) / comp['phi_Pn']
+                Mr_Mc = abs(Mu) / flex['phi_Mn']
+                if Pr_Pc >= 0.2:
+                    eq_text = f"H1-1a: Pr/Pc + 8/9 × Mr/Mc = {Pr_Pc:.3f} + 8/9 × {Mr_Mc:.3f} = {Pr_Pc + 8.0/9.0*Mr_Mc:.3f}"
+                else:
+                    eq_text = f"H1-1b: Pr/2Pc + Mr/Mc = {Pr_Pc/2.0:.3f} + {Mr_Mc:.3f} = {Pr_Pc/2.0 + Mr_Mc:.3f}"
+                story.append(EquationBox(eq_text, doc.width))
+                story.append(Spacer(1, 8))
+                story.append(interaction_drawing(comp['phi_Pn'], flex['phi_Mn'], Pu, Mu))
+    
+    # Footer
+    story.append(PageBreak())
+    story.append(Spacer(1, 2*inch))
+    footer_text = """
+    <para align=center>
+    <b>AISC 360-16 Steel Design v7.0</b><br/>
+    All calculations comply with AISC 360-16 specifications.<br/>
+    <br/>
+    © 2024 - Structural Engineering Tool
+    </para>
+    """
+    story.append(Paragraph(footer_text, body_style))
+    
+    # Build PDF with custom canvas
+    doc.build(story, canvasmaker=NumberedCanvas)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,498 @@
+"""
+AISC 360-16 checks in SI units (kN, MPa, mm) for the HTML/MIDAS reports.
+
+The interactive engine in steel_design.aisc works in ksc and tons; these
+helpers back SteelDesignReportGenerator, which reports in kN and kN·m.
+"""
+
+import logging
+import math
+
+import pandas as pd
+
+from .aisc import grade_constant_arrays
+
+logger = logging.getLogger(__name__)
+
+# ==================== SECTION CLASSIFICATION ====================
+
+def classify_section_flange(bf, tf, tw, _d, Fy, E=200000):
+    """
+    Classify section flange per AISC 360-16 Table B4.1b
+    Returns: 'Compact', 'Noncompact', or 'Slender'
+    """
+    # Flange slenderness ratio
+    lambda_f = bf / (2 * tf)
+    
+    # Limiting ratios (Table B4.1b Case 10 - I-shaped rolled sections)
+    lambda_pf = 0.38 * math.sqrt(E / Fy)  # Compact limit
+    lambda_rf = 1.0 * math.sqrt(E / Fy)   # Noncompact limit
+    
+    if lambda_f <= lambda_pf:
+        return 'Compact', lambda_f, lambda_pf, lambda_rf
+    elif lambda_f <= lambda_rf:
+        return 'Noncompact', lambda_f, lambda_pf, lambda_rf
+    else:
+        return 'Slender', lambda_f, lambda_pf, lambda_rf
+
+def classify_section_web(h, tw, Fy, E=200000):
+    """
+    Classify section web per AISC 360-16 Table B4.1b
+    Returns: 'Compact', 'Noncompact', or 'Slender'
+    """
+    # Web slenderness ratio
+    lambda_w = h / tw
+    
+    # Limiting ratios (Table B4.1b Case 15 - Webs in flexure)
+    lambda_pw = 3.76 * math.sqrt(E / Fy)  # Compact limit
+    lambda_rw = 5.70 * math.sqrt(E / Fy)  # Noncompact limit
+    
+    if lambda_w <= lambda_pw:
+        return 'Compact', lambda_w, lambda_pw, lambda_rw
+    elif lambda_w <= lambda_rw:
+        return 'Noncompact', lambda_w, lambda_pw, lambda_rw
+    else:
+        return 'Slender', lambda_w, lambda_pw, lambda_rw
+
+def get_overall_classification(flange_class, web_class):
+    """Get overall section classification"""
+    classes = ['Compact', 'Noncompact', 'Slender']
+    return classes[max(classes.index(flange_class), classes.index(web_class))]
+
+# ==================== FLEXURAL STRENGTH (AISC F2) ====================
+
+def calculate_flexural_strength(section_props, Lb, Cb=1.0, E=200000):
+    """
+    Calculate flexural strength per AISC 360-16 Chapter F2
+    Returns dict with all calculation steps
+    """
+    Fy = section_props['Fy']
+    Zx = section_props['Zx']
+    Sx = section_props['Sx']
+    Iy = section_props['Iy']
+    ry = section_props['ry']
+    J = section_props.get('J', 0)
+    Cw = section_props.get('Cw', 0)
+    ho = section_props.get('ho', section_props.get('d', 0) - section_props.get('tf', 0))
+    rts = section_props.get('rts', ry)
+    
+    # Convert units if needed (assuming cm to mm)
+    Zx_mm3 = Zx * 1000  # cm³ to mm³
+    Sx_mm3 = Sx * 1000
+    ry_mm = ry * 10
+    Lb_mm = Lb * 1000  # m to mm
+    J_mm4 = J * 10000 if J else 1
+    ho_mm = ho * 10 if ho else 1
+    rts_mm = rts * 10 if rts else ry_mm
+    c = 1.0  # For doubly symmetric I-shapes
+    
+    # Plastic moment
+    Mp = Fy * Zx_mm3 / 1e6  # kN·m
+    
+    # Limiting lengths
+    Lp = 1.76 * ry_mm * math.sqrt(E / Fy)  # mm
+    
+    # Lr calculation
+    try:
+        term1 = (J_mm4 * c) / (Sx_mm3 * ho_mm)
+        term2 = math.sqrt(term1**2 + 6.76 * (0.7 * Fy / E)**2)
+        Lr = 1.95 * rts_mm * (E / (0.7 * Fy)) * math.sqrt(term1 + term2)
+    except Exception:
+        Lr = Lp * 3  # Fallback estimate
+    
+    # Determine limit state
+    if Lb_mm <= Lp:
+        # Case (a): Yielding - Compact section, full plastic moment
+        Mn = Mp
+        limit_state = "Yielding (Lb ≤ Lp)"
+        case = "F2-1"
+        Fcr = Fy  # Not applicable but set for reference
+    elif Lb_mm <= Lr:
+        # Case (b): Inelastic LTB
+        Mn = Cb * (Mp - (Mp - 0.7 * Fy * Sx_mm3 / 1e6) * (Lb_mm - Lp) / (Lr - Lp))
+        Mn = min(Mn, Mp)
+        limit_state = "Inelastic LTB (Lp < Lb ≤ Lr)"
+        case = "F2-2"
+        Fcr = Cb * (Fy - (Fy - 0.7 * Fy) * (Lb_mm - Lp) / (Lr - Lp))
+    else:
+        # Case (c): Elastic LTB
+        try:
+            term_a = (Cb * math.pi**2 * E) / (Lb_mm / rts_mm)**2
+            term_b = math.sqrt(1 + 0.078 * (J_mm4 * c / (Sx_mm3 * ho_mm)) * (Lb_mm / rts_mm)**2)
+            Fcr = term_a * term_b
+        except Exception:
+            Fcr = 0.7 * Fy
+        Mn = Fcr * Sx_mm3 / 1e6
+        Mn = min(Mn, Mp)
+        limit_state = "Elastic LTB (Lb > Lr)"
+        case = "F2-3"
+    
+    # Design strength
+    phi = 0.90
+    phi_Mn = phi * Mn
+    
+    return {
+        'Mp': Mp,
+        'Mn': Mn,
+        'phi': phi,
+        'phi_Mn': phi_Mn,
+        'Lp': Lp / 1000,  # Convert back to m
+        'Lr': Lr / 1000,
+        'Lb': Lb,
+        'Cb': Cb,
+        'Fcr': Fcr,
+        'limit_state': limit_state,
+        'case': case,
+        'Fy': Fy,
+        'Zx': Zx,
+        'Sx': Sx
+    }
+
+# ==================== AXIAL STRENGTH (AISC E3) ====================
+
+def calculate_compression_strength(section_props, KL_x, KL_y, E=200000):
+    """
+    Calculate compression strength per AISC 360-16 Chapter E3
+    Returns dict with all calculation steps
+    """
+    Fy = section_props['Fy']
+    Ag = section_props['Ag']
+    rx = section_props['rx']
+    ry = section_props['ry']
+    
+    # Convert units
+    Ag_mm2 = Ag * 100  # cm² to mm²
+    rx_mm = rx * 10  # cm to mm
+    ry_mm = ry * 10
+    KLx_mm = KL_x * 1000  # m to mm
+    KLy_mm = KL_y * 1000
+    
+    # Slenderness ratios
+    lambda_x = KLx_mm / rx_mm
+    lambda_y = KLy_mm / ry_mm
+    lambda_governing = max(lambda_x, lambda_y)
+    governing_axis = 'x' if lambda_x >= lambda_y else 'y'
+    
+    # Elastic buckling stress
+    Fe = (math.pi**2 * E) / lambda_governing**2
+    
+    # Limiting slenderness: the grade constant for this report's Fy and E (the
+    # SI report uses E = 200000 MPa, so the database row's value would not
+    # match Fe above)
+    lambda_limit = float(grade_constant_arrays(Fy, E)['lambda_e3'])
+    
+    # Critical stress
+    if lambda_governing <= lambda_limit:
+        # Inelastic buckling (E3-2)
+        Fcr = 0.658**(Fy / Fe) * Fy
+        buckling_mode = "Inelastic"
+        equation = "E3-2"
+    else:
+        # Elastic buckling (E3-3)
+        Fcr = 0.877 * Fe
+        buckling_mode = "Elastic"
+        equation = "E3-3"
+    
+    # Nominal and design strength
+    Pn = Fcr * Ag_mm2 / 1000  # kN
+    phi = 0.90
+    phi_Pn = phi * Pn
+    
+    return {
+        'Pn': Pn,
+        'phi': phi,
+        'phi_Pn': phi_Pn,
+        'Fcr': Fcr,
+        'Fe': Fe,
+        'lambda_x': lambda_x,
+        'lambda_y': lambda_y,
+        'lambda_governing': lambda_governing,
+        'lambda_limit': lambda_limit,
+        'governing_axis': governing_axis,
+        'buckling_mode': buckling_mode,
+        'equation': equation,
+        'KL_x': KL_x,
+        'KL_y': KL_y,
+        'Ag': Ag,
+        'Fy': Fy
+    }
+
+def calculate_tension_strength(section_props):
+    """
+    Calculate tension strength per AISC 360-16 Chapter D
+    Returns dict with all calculation steps
+    """
+    Fy = section_props['Fy']
+    Fu = section_props.get('Fu', 1.2 * Fy)  # Estimate if not provided
+    Ag = section_props['Ag']
+    Ae = section_props.get('Ae', 0.85 * Ag)  # Effective area, default 85%
+    
+    # Convert units
+    Ag_mm2 = Ag * 100
+    Ae_mm2 = Ae * 100
+    
+    # Yielding on gross section (D2-1)
+    Pn_yield = Fy * Ag_mm2 / 1000  # kN
+    phi_yield = 0.90
+    
+    # Rupture on net section (D2-2)
+    Pn_rupture = Fu * Ae_mm2 / 1000  # kN
+    phi_rupture = 0.75
+    
+    # Design strength (governing)
+    phi_Pn_yield = phi_yield * Pn_yield
+    phi_Pn_rupture = phi_rupture * Pn_rupture
+    
+    if phi_Pn_yield <= phi_Pn_rupture:
+        governing = "Yielding (D2-1)"
+        phi_Pn = phi_Pn_yield
+        Pn = Pn_yield
+        phi = phi_yield
+    else:
+        governing = "Rupture (D2-2)"
+        phi_Pn = phi_Pn_rupture
+        Pn = Pn_rupture
+        phi = phi_rupture
+    
+    return {
+        'Pn_yield': Pn_yield,
+        'Pn_rupture': Pn_rupture,
+        'phi_yield': phi_yield,
+        'phi_rupture': phi_rupture,
+        'phi_Pn_yield': phi_Pn_yield,
+        'phi_Pn_rupture': phi_Pn_rupture,
+        'Pn': Pn,
+        'phi': phi,
+        'phi_Pn': phi_Pn,
+        'governing': governing,
+        'Ag': Ag,
+        'Ae': Ae,
+        'Fy': Fy,
+        'Fu': Fu
+    }
+
+# ==================== COMBINED FORCES (AISC H1) ====================
+
+def calculate_interaction(Pu, phi_Pn, Mux, phi_Mnx, Muy=0, phi_Mny=None, is_tension=False):
+    """
+    Calculate combined force interaction per AISC 360-16 Chapter H1
+    Returns dict with all calculation steps
+    """
+    if phi_Mny is None:
+        phi_Mny = phi_Mnx * 0.5  # Estimate for minor axis
+    
+    Pr = abs(Pu)
+    Pc = phi_Pn
+    Mrx = abs(Mux)
+    Mcx = phi_Mnx
+    Mry = abs(Muy)
+    Mcy = phi_Mny
+    
+    # Axial ratio
+    axial_ratio = Pr / Pc if Pc > 0 else 999
+    
+    if is_tension or Pu < 0:
+        # Tension + Bending: Linear interaction
+        moment_ratio_x = Mrx / Mcx if Mcx > 0 else 0
+        moment_ratio_y = Mry / Mcy if Mcy > 0 else 0
+        
+        interaction_ratio = axial_ratio + moment_ratio_x + moment_ratio_y
+        equation_used = "H1-1 (Modified for Tension)"
+        equation_text = "Pu/φPn + Mux/φMnx + Muy/φMny ≤ 1.0"
+    else:
+        # Compression + Bending: AISC H1
+        if axial_ratio >= 0.2:
+            # Equation H1-1a
+            moment_term = (Mrx / Mcx + Mry / Mcy) if Mcx > 0 and Mcy > 0 else 0
+            interaction_ratio = axial_ratio + (8.0 / 9.0) * moment_term
+            equation_used = "H1-1a"
+            equation_text = "Pu/φPn + (8/9)(Mux/φMnx + Muy/φMny) ≤ 1.0"
+        else:
+            # Equation H1-1b
+            moment_term = (Mrx / Mcx + Mry / Mcy) if Mcx > 0 and Mcy > 0 else 0
+            interaction_ratio = axial_ratio / 2.0 + moment_term
+            equation_used = "H1-1b"
+            equation_text = "Pu/(2φPn) + (Mux/φMnx + Muy/φMny) ≤ 1.0"
+    
+    design_ok = interaction_ratio <= 1.0
+    
+    return {
+        'Pu': Pu,
+        'phi_Pn': phi_Pn,
+        'Mux': Mux,
+        'phi_Mnx': phi_Mnx,
+        'Muy': Muy,
+        'phi_Mny': phi_Mny,
+        'axial_ratio': axial_ratio,
+        'interaction_ratio': interaction_ratio,
+        'equation_used': equation_used,
+        'equation_text': equation_text,
+        'design_ok': design_ok,
+        'is_tension': is_tension or Pu < 0
+    }
+
+
+# ==================== HELPER FUNCTIONS ====================
+
+def get_section_properties_from_df(df_sections, df_materials, section_name, material_name):
+    """
+    Extract section properties from dataframes
+    
+    Parameters:
+    - df_sections: DataFrame with section properties
+    - df_materials: DataFrame with material properties
+    - section_name: Name/index of section
+    - material_name: Name/index of material
+    
+    Returns dict with section properties
+    """
+    try:
+        sec = df_sections.loc[section_name]
+        mat = df_materials.loc[material_name]
+        
+        # Map column names (adjust based on your actual column names)
+        props = {
+            'Ag': float(sec.get('A [cm2]', sec.get('Ag', 0))),
+            'Ix': float(sec.get('Ix [cm4]', sec.get('Ix', 0))),
+            'Iy': float(sec.get('Iy [cm4]', sec.get('Iy', 0))),
+            'Sx': float(sec.get('Sx [cm3]', sec.get('Sx', 0))),
+            'Zx': float(sec.get('Zx [cm3]', sec.get('Zx', 0))),
+            'Sy': float(sec.get('Sy [cm3]', sec.get('Sy', 0))),
+            'Zy': float(sec.get('Zy [cm3]', sec.get('Zy', 0))),
+            'rx': float(sec.get('rx [cm]', sec.get('rx', 0))),
+            'ry': float(sec.get('ry [cm]', sec.get('ry', 0))),
+            'J': float(sec.get('j [cm4]', sec.get('J [cm4]', sec.get('J', 1)))),
+            'd': float(sec.get('d [mm]', sec.get('d', 0))) / 10,  # Convert mm to cm
+            'bf': float(sec.get('bf [mm]', sec.get('bf', 0))) / 10,
+            'tf': float(sec.get('tf [mm]', sec.get('tf', 0))) / 10,
+            'tw': float(sec.get('tw [mm]', sec.get('tw', 0))) / 10,
+            'Fy': float(mat.get('Yield Point (ksc)', mat.get('Fy', 2500))) / 10.197,  # ksc to MPa
+            'Fu': float(mat.get('Tensile Strength (ksc)', mat.get('Fu', 4000))) / 10.197,
+        }
+        
+        # Calculate derived properties if needed
+        if props['d'] > 0 and props['tf'] > 0:
+            props['ho'] = props['d'] - props['tf']
+        else:
+            props['ho'] = props['d'] * 0.9
+        
+        # Effective area for tension (assume 85% if not specified)
+        props['Ae'] = props['Ag'] * 0.85
+        
+        # rts and Cw from the completed database, approximated otherwise
+        if pd.notna(sec.get('rts [cm]')):
+            props['rts'] = float(sec['rts [cm]'])
+        else:
+            props['rts'] = props['ry'] * 1.1 if props['ry'] > 0 else 1
+        
+        if pd.notna(sec.get('cw [10^6 cm6]')):
+            props['Cw'] = float(sec['cw [10^6 cm6]']) * 1e6
+        elif props['Iy'] > 0 and props['d'] > 0:
+            props['Cw'] = props['Iy'] * (props['d'] - props['tf'])**2 / 4
+        else:
+            props['Cw'] = 1
+        
+        return props
+        
+    except Exception as e:
+        logger.error("Error extracting section properties: %s", e)
+        return None
+
+
+# ==================== REPORT MEMBER DATA ====================
+
+def create_member_data(member_no, section_name, section_props, member_type, 
+                       length, K, KL, Lb, loads, classification='Compact'):
+    """
+    Create a complete member data dictionary for report generation
+    
+    Parameters:
+    - member_no: Member identifier
+    - section_name: Section designation (e.g., "W14x22")
+    - section_props: Dict with section properties (Ag, Ix, Iy, Sx, Zx, rx, ry, Fy, etc.)
+    - member_type: 'Beam', 'Column', 'Beam-Column', or 'Tension Member'
+    - length: Member length (m)
+    - K: Effective length factor
+    - KL: Effective length (m)
+    - Lb: Unbraced length for flexure (m)
+    - loads: List of dicts with 'LC', 'Pu', 'Mux', 'Muy'
+    - classification: 'Compact', 'Noncompact', or 'Slender'
+    
+    Returns complete member dict with all calculations
+    """
+    
+    member = {
+        'member_no': member_no,
+        'section_name': section_name,
+        'section_props': section_props,
+        'member_type': member_type,
+        'length': length,
+        'K': K,
+        'KL': KL,
+        'Lb': Lb,
+        'loads': loads,
+        'classification': classification
+    }
+    
+    # Calculate flexural strength
+    if member_type in ['Beam', 'Beam-Column']:
+        member['flexural_results'] = calculate_flexural_strength(
+            section_props, Lb, Cb=1.0
+        )
+    
+    # Calculate axial strength
+    if member_type in ['Column', 'Beam-Column']:
+        member['compression_results'] = calculate_compression_strength(
+            section_props, KL, KL
+        )
+    elif member_type == 'Tension Member':
+        member['tension_results'] = calculate_tension_strength(section_props)
+    
+    # Calculate interaction for each load combination
+    interaction_results = []
+    
+    for load in loads:
+        LC = load.get('LC', 1)
+        Pu = load.get('Pu', 0)  # kN
+        Mux = load.get('Mux', 0)  # kN·m
+        Muy = load.get('Muy', 0)  # kN·m
+        
+        # Get capacities
+        if member_type == 'Tension Member':
+            phi_Pn = member.get('tension_results', {}).get('phi_Pn', 1)
+            phi_Mnx = 0
+            phi_Mny = 0
+            is_tension = True
+        else:
+            phi_Pn = member.get('compression_results', {}).get('phi_Pn', 1)
+            phi_Mnx = member.get('flexural_results', {}).get('phi_Mn', 1)
+            phi_Mny = phi_Mnx * 0.5  # Estimate for minor axis
+            is_tension = Pu < 0
+        
+        if member_type in ['Beam-Column', 'Column', 'Tension Member']:
+            inter = calculate_interaction(
+                Pu, phi_Pn, Mux, phi_Mnx, Muy, phi_Mny, is_tension
+            )
+            inter['LC'] = LC
+            interaction_results.append(inter)
+        elif member_type == 'Beam':
+            # Beam only - check moment ratio
+            ratio = abs(Mux) / phi_Mnx if phi_Mnx > 0 else 999
+            interaction_results.append({
+                'LC': LC,
+                'Pu': 0,
+                'phi_Pn': 0,
+                'Mux': Mux,
+                'phi_Mnx': phi_Mnx,
+                'Muy': Muy,
+                'phi_Mny': phi_Mny,
+                'interaction_ratio': ratio,
+                'equation_used': 'Mu/φMn',
+                'equation_text': 'Mu/φMn ≤ 1.0',
+                'design_ok': ratio <= 1.0,
+                'is_tension': False
+            })
+    
+    member['interaction_results'] = interaction_results
+    
+    return member
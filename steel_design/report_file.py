@@ -0,0 +1,57 @@
+"""
+Generated reports held in spooled temporary files.
+
+A ReportFile keeps a report in memory up to SPOOL_MAX_SIZE and on disk
+beyond that, so a large export is not also kept as one big string for as
+long as a session holds on to it. Writers (e.g. DataFrame.to_csv) write
+into it and downloads read the bytes back only when they are needed.
+"""
+
+import tempfile
+import threading
+
+# ==================== REPORT FILES ====================
+# Reports up to this size stay in memory; larger ones roll over to disk
+SPOOL_MAX_SIZE = 1 << 20
+
+class ReportFile:
+    """
+    A report in a SpooledTemporaryFile.
+
+    Text chunks are stored encoded. read() and read_text() return the whole
+    report; they may be called from other threads (a download being served)
+    while the session reads it for a preview.
+    """
+
+    def __init__(self, max_size=SPOOL_MAX_SIZE, encoding="utf-8"):
+        self.encoding = encoding
+        self.size = 0
+        self._file = tempfile.SpooledTemporaryFile(max_size=max_size, prefix="steel_design_report_")
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.size
+
+    def write(self, chunk):
+        """Append a str or bytes chunk; returns the number of bytes written"""
+        if isinstance(chunk, str):
+            chunk = chunk.encode(self.encoding)
+        with self._lock:
+            self._file.seek(0, 2)
+            self._file.write(chunk)
+            self.size += len(chunk)
+        return len(chunk)
+
+    def read(self):
+        """The whole report as bytes"""
+        with self._lock:
+            self._file.seek(0)
+            return self._file.read()
+
+    def read_text(self):
+        """The whole report as text"""
+        return self.read().decode(self.encoding)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,275 @@
+"""
+Background report jobs.
+
+PDF and Excel reports are built by a small thread pool shared by all
+sessions instead of in the session's script thread, so the page stays
+responsive while a report renders. Finished files are written to a job
+directory and kept until they are downloaded or expire. Each
+owner (one browser session) may have only a few jobs queued or running at
+once, so one user's large reports cannot hold up everybody else's.
+
+The pool size, per-owner limit and directory default to the
+STEEL_DESIGN_REPORT_JOBS, STEEL_DESIGN_JOBS_PER_USER and
+STEEL_DESIGN_JOB_DIR environment variables.
+"""
+
+import atexit
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# ==================== JOB STATUS ====================
+QUEUED = "Queued"
+RUNNING = "Running"
+DONE = "Done"
+FAILED = "Failed"
+
+# Finished jobs that are never downloaded are removed after this long; kept
+# jobs (the page's own previews) this long after the page last read them
+JOB_TTL_SECONDS = 3600
+
+# A downloaded job's file stays this long, so a repeated click is still served
+TAKEN_GRACE_SECONDS = 60
+
+class JobLimitError(RuntimeError):
+    """The owner already has the maximum number of jobs queued or running"""
+
+class ReportJob:
+    """One submitted report and, once it has run, its file or error"""
+
+    def __init__(self, owner, label, file_name, mime, keep=False):
+        self.id = uuid.uuid4().hex
+        self.owner = owner
+        self.label = label
+        self.file_name = file_name
+        self.mime = mime
+        self.keep = keep
+        self.status = QUEUED
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.accessed = None
+        self.taken = None
+        self.path = None
+        self.size = 0
+        self.error = None
+
+    @property
+    def active(self):
+        return self.status in (QUEUED, RUNNING)
+
+    @property
+    def elapsed(self):
+        """Seconds spent waiting and running so far"""
+        return (self.finished or time.time()) - self.submitted
+
+def _write_payload(payload, path):
+    """Write a report (bytes, str, a binary file object or an iterable of str/bytes chunks) to path"""
+    partial = path + ".part"
+    try:
+        with open(partial, "wb") as fp:
+            if isinstance(payload, str):
+                fp.write(payload.encode("utf-8"))
+            elif isinstance(payload, (bytes, bytearray, memoryview)):
+                fp.write(payload)
+            elif hasattr(payload, "read"):
+                payload.seek(0)
+                shutil.copyfileobj(payload, fp)
+            else:
+                # Streamed reports are written chunk by chunk as they render
+                for chunk in payload:
+                    fp.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+        os.replace(partial, path)
+    except BaseException:
+        # Do not leave a half-written file behind (e.g. when the disk fills up)
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+        raise
+    return os.path.getsize(path)
+
+# ==================== JOB QUEUE ====================
+def report_job_workers(workers=None):
+    """Number of report job threads to use"""
+    if workers is None:
+        workers = os.environ.get("STEEL_DESIGN_REPORT_JOBS") or min(4, os.cpu_count() or 1)
+    return max(1, int(workers))
+
+class ReportJobQueue:
+    """
+    Thread pool running report jobs, with a status table of every job.
+
+    submit(owner, label, render, *args, file_name=..., mime=...) queues
+    render(*args) and returns the ReportJob; render returns the report as
+    bytes, str, a file object or an iterable of str/bytes chunks (None
+    counts as a failure). keep=True marks a job whose file the page reads
+    again (a preview), so it is downloaded with read() rather than take()
+    and discarded by that page. jobs(owner) lists an owner's jobs for the
+    status table, read(job_id) returns a finished file's bytes and
+    discard(job_id) removes the job and its file. take(job_id) reads the
+    file and drops the job from the list, removing the file
+    TAKEN_GRACE_SECONDS later. read and take raise FileNotFoundError once
+    a job is gone.
+
+    Finished jobs older than ttl seconds (kept jobs: not read for ttl
+    seconds) are purged on every submit and whenever the job list is read,
+    so files nobody downloads are removed even when no new report is
+    started. Job state changes are made under the queue's lock.
+    """
+
+    def __init__(self, workers=None, per_owner=None, directory=None, ttl=JOB_TTL_SECONDS):
+        self.workers = report_job_workers(workers)
+        self.per_owner = max(1, int(per_owner or os.environ.get("STEEL_DESIGN_JOBS_PER_USER") or 2))
+        self.ttl = ttl
+        directory = directory or os.environ.get("STEEL_DESIGN_JOB_DIR")
+        self._owns_directory = directory is None
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="steel_design_jobs_")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="report-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, owner, label, render, *args, file_name, mime, keep=False, **kwargs):
+        """Queue render(*args, **kwargs); raises JobLimitError over the owner's limit"""
+        self.purge_expired()
+        with self._lock:
+            active = sum(1 for job in self._jobs.values() if job.owner == owner and job.active)
+            if active >= self.per_owner:
+                raise JobLimitError(f"{active} report(s) already in progress; "
+                                    f"wait for one to finish before starting another")
+            job = ReportJob(owner, label, file_name, mime, keep)
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, render, args, kwargs)
+        return job
+
+    def _run(self, job, render, args, kwargs):
+        with self._lock:
+            job.status = RUNNING
+            job.started = time.time()
+        try:
+            payload = render(*args, **kwargs)
+            if payload is None:
+                raise RuntimeError("the report could not be generated")
+            stem = re.sub(r"[^\w.-]+", "_", job.file_name)
+            path = os.path.join(self.directory, f"{job.id}_{stem}")
+            size = _write_payload(payload, path)
+            with self._lock:
+                job.size = size
+                job.path = path
+                job.status = DONE
+        except Exception as e:
+            # Logged below ERROR: the page-side handler cannot draw from this thread
+            logger.warning("Report job '%s' failed", job.label, exc_info=True)
+            with self._lock:
+                job.error = str(e) or type(e).__name__
+                job.status = FAILED
+        finally:
+            with self._lock:
+                job.finished = time.time()
+                discarded = job.id not in self._jobs
+            if discarded:
+                self._remove_file(job)
+
+    def jobs(self, owner):
+        """The owner's jobs not yet downloaded, oldest first (expired jobs are purged first)"""
+        self.purge_expired()
+        with self._lock:
+            return [job for job in self._jobs.values() if job.owner == owner and job.taken is None]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def read(self, job_id):
+        """Contents of a finished job's file; FileNotFoundError once the job is gone"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            path = job.path if job is not None else None
+            if path is not None:
+                job.accessed = time.time()
+        if path is None:
+            raise FileNotFoundError(f"report job {job_id} is no longer available")
+        # The file can still be purged before it is opened, which raises the same
+        with open(path, "rb") as fp:
+            return fp.read()
+
+    def take(self, job_id):
+        """Contents of a finished job's file, dropping the job from the list once read"""
+        data = self.read(job_id)
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.taken is None:
+                job.taken = time.time()
+        return data
+
+    def discard(self, job_id):
+        """Forget a job and delete its file (a running job's file is deleted when it finishes)"""
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job is not None:
+            self._remove_file(job)
+
+    def _remove_file(self, job):
+        with self._lock:
+            path, job.path = job.path, None
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _expired(self, job, now):
+        if job.taken is not None:
+            return job.taken < now - TAKEN_GRACE_SECONDS
+        if job.finished is None:
+            return False
+        last_used = max(job.finished, job.accessed or 0) if job.keep else job.finished
+        return last_used < now - self.ttl
+
+    def purge_expired(self):
+        """Discard jobs past their time to live and downloaded jobs past the grace period"""
+        now = time.time()
+        with self._lock:
+            expired = [job.id for job in self._jobs.values() if self._expired(job, now)]
+        for job_id in expired:
+            self.discard(job_id)
+
+    def shutdown(self):
+        """Stop the job threads and delete every job file"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for job_id in list(self._jobs):
+            self.discard(job_id)
+        if self._owns_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+_queue = None
+_queue_lock = threading.Lock()
+
+def get_report_job_queue():
+    """The process-wide report job queue, started on first use"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = ReportJobQueue()
+        return _queue
+
+def shutdown_report_jobs():
+    """Stop the report job queue and delete its files"""
+    global _queue
+    with _queue_lock:
+        if _queue is not None:
+            _queue.shutdown()
+            _queue = None
+
+atexit.register(shutdown_report_jobs)
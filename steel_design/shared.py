@@ -0,0 +1,174 @@
+"""
+Zero-copy sharing of the section and grade tables with report workers.
+
+publish_tables() copies the numeric columns of the database tables into
+one shared memory block and returns its owner, whose small picklable
+descriptor is all a worker needs. attach_tables() maps the block once per
+worker process as read-only NumPy views, and SharedTables.rows() rebuilds
+the df.loc[[name]] frames the calculation sheets read from those views,
+so memory use stays flat as workers are added. Text columns, the index
+and the column order travel in the descriptor, so the rebuilt rows equal
+the originals.
+"""
+
+import sys
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+# ==================== SHARED TABLES ====================
+_ALIGNMENT = 64
+
+def _table_layout(tables):
+    """Per table and column, the block offset of a numeric column or a text column's values"""
+    layout = {}
+    offset = 0
+    for table_name, frame in tables.items():
+        columns = []
+        for column in frame.columns:
+            values = frame[column]
+            if values.dtype.kind in 'biuf':
+                array = values.to_numpy()
+                columns.append((column, 'array', (offset, array.dtype.str)))
+                offset += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+            else:
+                columns.append((column, 'values', (values.tolist(), values.dtype)))
+        layout[table_name] = {
+            'index': frame.index.tolist(),
+            'index_name': frame.index.name,
+            'index_dtype': frame.index.dtype,
+            'columns': columns
+        }
+    return layout, max(offset, 1)
+
+class SharedTables:
+    """
+    Database tables in one shared memory block.
+
+    The publishing process owns the block: keep the object alive while
+    workers use it and call close() (or use it as a context manager),
+    which also unlinks it. Attached copies in workers only detach.
+    rows(table, names) returns table.loc[names] as a DataFrame.
+    """
+
+    def __init__(self, descriptor, shm, owner=False):
+        self.descriptor = descriptor
+        self._shm = shm
+        self._owner = owner
+        self._columns = {}
+        self._positions = {}
+        for table_name, table in descriptor['tables'].items():
+            columns = {}
+            for column, kind, payload in table['columns']:
+                if kind == 'array':
+                    offset, dtype = payload
+                    view = np.ndarray((len(table['index']),), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+                    view.flags.writeable = False
+                    columns[column] = view
+                else:
+                    columns[column] = payload
+            self._columns[table_name] = columns
+            self._positions[table_name] = {name: i for i, name in enumerate(table['index'])}
+
+    def rows(self, table_name, names):
+        """The rows of names as a DataFrame, copied out of the shared block"""
+        table = self.descriptor['tables'][table_name]
+        positions = self._positions[table_name]
+        taken = np.array([positions[name] for name in names], dtype=np.intp)
+
+        data = {}
+        for column, kind, _ in table['columns']:
+            source = self._columns[table_name][column]
+            if kind == 'array':
+                data[column] = source[taken]
+            else:
+                values, dtype = source
+                data[column] = pd.array([values[i] for i in taken], dtype=dtype)
+        index = pd.Index(list(names), dtype=table['index_dtype'], name=table['index_name'])
+        return pd.DataFrame(data, index=index, columns=[column for column, _, _ in table['columns']])
+
+    def close(self):
+        """Detach, and unlink the block when this process published it"""
+        if self._shm is None:
+            return
+        self._columns = {}
+        with _attach_lock:
+            if _attached.get(self._shm.name) is self:
+                del _attached[self._shm.name]
+        try:
+            self._shm.close()
+        except BufferError:
+            pass  # views still referenced elsewhere; unmapped with them
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+_attached = {}
+_attach_lock = threading.Lock()
+
+def publish_tables(**tables):
+    """
+    Publish DataFrames (e.g. section=df, material=df_mat) to shared memory.
+
+    Returns the owning SharedTables; pass its descriptor to the workers.
+    Raises OSError when shared memory is not available.
+    """
+    layout, size = _table_layout(tables)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        for table_name, frame in tables.items():
+            for column, kind, payload in layout[table_name]['columns']:
+                if kind == 'array':
+                    offset, dtype = payload
+                    target = np.ndarray((len(frame),), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+                    target[...] = frame[column].to_numpy()
+                    del target
+        published = SharedTables({'name': shm.name, 'size': size, 'tables': layout}, shm, owner=True)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+
+    # Renders that fall back to this process read the owner's own views
+    with _attach_lock:
+        _attached[shm.name] = published
+    return published
+
+def _attach_shared_memory(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Report workers are spawned by the publishing process and share its
+    # resource tracker, where attaching only repeats the publisher's own
+    # registration; unregistering here would drop the publisher's entry
+    return shared_memory.SharedMemory(name=name)
+
+def attach_tables(descriptor):
+    """
+    The SharedTables of a descriptor, attached once per process.
+
+    A worker keeps only the latest block attached: attaching a new one
+    detaches the previous, whose publisher has usually closed it already.
+    """
+    name = descriptor['name']
+    with _attach_lock:
+        tables = _attached.get(name)
+        if tables is not None:
+            return tables
+        stale = [attached for attached in _attached.values() if not attached._owner]
+    for attached in stale:
+        attached.close()
+
+    tables = SharedTables(descriptor, _attach_shared_memory(name))
+    with _attach_lock:
+        attached = _attached.setdefault(name, tables)
+    if attached is not tables:
+        tables.close()
+    return attached
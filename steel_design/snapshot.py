@@ -0,0 +1,154 @@
+"""
+Hot-reloadable database snapshots.
+
+A DatabaseSnapshot is one consistent generation of the section and
+material tables together with everything derived from them (catalog, name
+indexes, per-grade constants, property and classification arrays).
+DatabaseWatcher polls the database files and, when their contents change,
+builds the next snapshot on a background thread and swaps it in only once
+it is complete; readers keep using the previous snapshot until then.
+"""
+
+import logging
+import os
+import threading
+import time
+
+from .aisc import material_property_arrays, section_property_arrays
+from .catalog import DESIGN_FAMILIES, SHAPE_FAMILIES, load_catalog
+from .data import DATA_CACHE_FILE, DATA_DIR, MATERIAL_DB_FILE, _file_checksum, _file_stat, load_databases
+from .names import NameIndex
+
+logger = logging.getLogger(__name__)
+
+# ==================== DATABASE SNAPSHOTS ====================
+def _resolve_source(source):
+    return source or os.environ.get("STEEL_DESIGN_DATA_SOURCE") or DATA_DIR
+
+def database_files(source=None):
+    """Local database files a snapshot is built from (empty for http sources)"""
+    source = _resolve_source(source)
+    if source.startswith(("http://", "https://")):
+        return []
+    names = [filename for _, filename in SHAPE_FAMILIES.values()] + [MATERIAL_DB_FILE]
+    return [os.path.join(source, name) for name in names]
+
+def _stat_or_none(path):
+    try:
+        return _file_stat(path)
+    except OSError:
+        return None
+
+def _checksum_or_none(path):
+    try:
+        return _file_checksum(path)
+    except OSError:
+        return None
+
+class DatabaseSnapshot:
+    """
+    One generation of the databases and their derived tables.
+
+    Treat every attribute as read-only: a snapshot is shared by all
+    sessions. version increases by one with every reload.
+    """
+
+    def __init__(self, df, df_mat, catalog, version=1, checksums=None):
+        self.df = df
+        self.df_mat = df_mat
+        self.catalog = catalog
+        self.version = version
+        self.checksums = checksums or {}
+        self.loaded_at = time.time()
+
+        self.section_index = catalog.name_index(DESIGN_FAMILIES)
+        self.material_index = NameIndex(df_mat.index)
+        self.section_arrays = section_property_arrays(df)
+        self.grade_arrays = material_property_arrays(df_mat)
+
+def build_snapshot(source=None, version=1, cache_path=DATA_CACHE_FILE):
+    """Load the databases and build every derived table for a new snapshot"""
+    checksums = {path: _checksum_or_none(path) for path in database_files(source)}
+    df, df_mat = load_databases(source, cache_path=cache_path)
+    catalog = load_catalog(source, df=df)
+    return DatabaseSnapshot(df, df_mat, catalog, version=version, checksums=checksums)
+
+class DatabaseWatcher:
+    """
+    Serve the current DatabaseSnapshot and rebuild it when the files change.
+
+    The first snapshot is built synchronously. A daemon thread then stats
+    the database files every interval seconds (check() does the same on
+    demand). A size/mtime change whose contents differ starts one
+    background rebuild; snapshot keeps returning the old generation until
+    the new one has been built. A failed rebuild is logged, kept in
+    last_error and retried on the next change.
+    """
+
+    def __init__(self, source=None, interval=2.0, cache_path=DATA_CACHE_FILE, start=True):
+        self.source = source
+        self.interval = interval
+        self.cache_path = cache_path
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._rebuilding = False
+        self._stop = threading.Event()
+        self._paths = database_files(source)
+        self._stats = self._current_stats()
+        self._snapshot = build_snapshot(source, cache_path=cache_path)
+        self._thread = None
+        if start and self._paths:
+            self._thread = threading.Thread(target=self._poll, name="steel-design-db-watcher", daemon=True)
+            self._thread.start()
+
+    @property
+    def snapshot(self):
+        """The newest fully built snapshot"""
+        return self._snapshot
+
+    @property
+    def rebuilding(self):
+        return self._rebuilding
+
+    def _current_stats(self):
+        return {path: _stat_or_none(path) for path in self._paths}
+
+    def check(self):
+        """Start a background rebuild if the files changed; True when one was started"""
+        stats = self._current_stats()
+        with self._lock:
+            if stats == self._stats or self._rebuilding:
+                return False
+            self._stats = stats
+            self._rebuilding = True
+        threading.Thread(target=self._rebuild, name="steel-design-db-rebuild", daemon=True).start()
+        return True
+
+    def _rebuild(self):
+        try:
+            current = self._snapshot
+            checksums = {path: _checksum_or_none(path) for path in self._paths}
+            if checksums != current.checksums:
+                snapshot = build_snapshot(self.source, version=current.version + 1, cache_path=self.cache_path)
+                self._snapshot = snapshot
+                logger.info("Section databases reloaded (version %d)", snapshot.version)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = e
+            logger.warning("Database reload failed, keeping version %d: %s", self._snapshot.version, e)
+        finally:
+            with self._lock:
+                self._rebuilding = False
+            # Files edited again while rebuilding are picked up right away
+            self.check()
+
+    def _poll(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.warning("Database watcher error: %s", e)
+
+    def stop(self):
+        """Stop the polling thread"""
+        self._stop.set()
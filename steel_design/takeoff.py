@@ -0,0 +1,124 @@
+"""Steel quantity takeoff of Tab 5 member models."""
+
+import numpy as np
+import pandas as pd
+
+from .aisc import _numeric_column
+
+# ==================== QUANTITY TAKEOFF ====================
+def member_length(config):
+    """Member length (m) for quantities; Lb when no length is configured"""
+    return float(config.get('length', config.get('Lb', 0.0)))
+
+TAKEOFF_KEYS = {
+    'section': 'Section',
+    'material': 'Material',
+    'member_type': 'Type',
+    'group': 'Group'
+}
+
+def _grouped_sum(keys, columns):
+    """Sum each column per unique key with np.bincount; returns (unique keys, counts, sums)"""
+    inverse, unique = pd.factorize(keys, sort=True)
+    counts = np.bincount(inverse, minlength=len(unique))
+    sums = {name: np.bincount(inverse, weights=values, minlength=len(unique))
+            for name, values in columns.items()}
+    return unique, counts, sums
+
+def quantity_takeoff(df, member_groups, members=None, prices=None):
+    """
+    Steel quantity takeoff of a member model.
+
+    Joins each member's length and section with w [kg/m] from the section
+    database and rolls the tonnage (and cost, when prices maps grade ->
+    price per kg) up by section, grade, member type and group with grouped
+    NumPy reductions.
+
+    Returns a dict with 'members' (one row per member), one rollup table per
+    key in TAKEOFF_KEYS and 'totals'.
+    """
+    members = [m for m in (member_groups if members is None else members) if m in member_groups]
+    configs = [member_groups[m] for m in members]
+
+    sections = np.array([str(c.get('section')) for c in configs], dtype=object)
+    materials = np.array([str(c.get('material')) for c in configs], dtype=object)
+    lengths = np.array([member_length(c) for c in configs], dtype=float)
+
+    w_all = _numeric_column(df, 'w [kg/m]')
+    sec_pos = df.index.astype(str).get_indexer(sections)
+    w = np.where(sec_pos >= 0, w_all[sec_pos], np.nan)
+    weight_kg = np.nan_to_num(w * lengths)
+
+    if prices:
+        price = np.array([float(prices.get(m, np.nan)) for m in materials], dtype=float)
+    else:
+        price = np.full(len(members), np.nan)
+    cost = weight_kg * price
+
+    key_values = {
+        'section': sections,
+        'material': materials,
+        'member_type': np.array([str(c.get('member_type')) for c in configs], dtype=object),
+        'group': np.array([str(c.get('group') or "Ungrouped") for c in configs], dtype=object)
+    }
+
+    takeoff = {
+        'members': pd.DataFrame({
+            'Member': members,
+            'Group': key_values['group'],
+            'Type': key_values['member_type'],
+            'Section': sections,
+            'Material': materials,
+            'Length (m)': lengths,
+            'w [kg/m]': w,
+            'Weight (kg)': weight_kg,
+            'Cost': cost
+        })
+    }
+
+    for key, label in TAKEOFF_KEYS.items():
+        unique, counts, sums = _grouped_sum(
+            key_values[key].astype(str), {'length': lengths, 'weight': weight_kg, 'cost': np.nan_to_num(cost)}
+        )
+        takeoff[key] = pd.DataFrame({
+            label: unique,
+            'Members': counts,
+            'Total Length (m)': sums['length'],
+            'Tonnage (t)': sums['weight'] / 1000.0,
+            'Cost': sums['cost'] if prices else np.nan
+        }).sort_values('Tonnage (t)', ascending=False, ignore_index=True)
+
+    takeoff['totals'] = {
+        'members': len(members),
+        'length': float(lengths.sum()),
+        'tonnage': float(weight_kg.sum() / 1000.0),
+        'cost': float(np.nansum(cost)) if prices else None,
+        'unmatched': int((sec_pos < 0).sum())
+    }
+    return takeoff
+
+def takeoff_delta(current, alternative, key='member_type'):
+    """
+    Tonnage of two takeoffs side by side for one rollup key.
+
+    Returns a table with current and alternative tonnage and the difference
+    per group, plus a 'Total' row.
+    """
+    label = TAKEOFF_KEYS[key]
+    merged = pd.merge(
+        current[key][[label, 'Tonnage (t)']].rename(columns={'Tonnage (t)': 'Current (t)'}),
+        alternative[key][[label, 'Tonnage (t)']].rename(columns={'Tonnage (t)': 'Alternative (t)'}),
+        on=label, how='outer'
+    ).fillna(0.0)
+
+    total = pd.DataFrame({
+        label: ['Total'],
+        'Current (t)': [current['totals']['tonnage']],
+        'Alternative (t)': [alternative['totals']['tonnage']]
+    })
+    merged = pd.concat([merged, total], ignore_index=True)
+    merged['Δ (t)'] = merged['Alternative (t)'] - merged['Current (t)']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        merged['Δ (%)'] = np.where(merged['Current (t)'] > 0,
+                                   merged['Δ (t)'] / merged['Current (t)'] * 100.0, np.nan)
+    return merged
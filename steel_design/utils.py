@@ -0,0 +1,45 @@
+"""Small numeric and formatting helpers shared by the engine and reports."""
+
+import math
+
+# ==================== HELPER FUNCTIONS ====================
+
+def safe_scalar(value):
+    """
+    Standardized helper to extract a single float from pandas Series,
+    numpy arrays, or lists.
+    """
+    try:
+        if hasattr(value, 'iloc'):  # Handle Pandas Series
+            return float(value.iloc[0])
+        elif hasattr(value, 'item'):  # Handle Numpy scalars
+            return float(value.item())
+        elif hasattr(value, '__iter__') and not isinstance(value, (str, bytes)):
+            return float(value[0])
+        else:
+            return float(value)
+    except (ValueError, TypeError, IndexError):
+        return 0.0
+
+def format_number(value, decimals=2):
+    """Format number with specified decimal places"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "—"
+    try:
+        if decimals == 0:
+            return f"{int(round(value)):,}"
+        return f"{value:,.{decimals}f}"
+    except (ValueError, TypeError):
+        return str(value)
+
+def format_equation_result(value, decimals=2, unit=""):
+    """Format equation result with unit"""
+    formatted = format_number(value, decimals)
+    if unit:
+        return f"{formatted} {unit}"
+    return formatted
+
+def safe_sqrt(value):
+    """Safe square root that ensures non-negative input"""
+    val = safe_scalar(value)
+    return math.sqrt(abs(val)) if val >= 0 else 0.0